@@ -0,0 +1 @@
+"""Throughput benchmarks run against a local fake Looker API."""
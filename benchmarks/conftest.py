@@ -0,0 +1,104 @@
+"""Pytest configuration for the storage micro-benchmarks.
+
+The benchmarks use pytest-benchmark's ``benchmark`` fixture. When the plugin
+is not installed, a minimal stand-in with the same calling convention
+(``benchmark(fn, *args)``, ``benchmark.pedantic(...)``, ``extra_info``) is
+provided instead, and a timing summary is printed at the end of the run.
+
+Usage:
+    pytest benchmarks/ --no-cov
+"""
+
+import statistics
+import time
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+
+try:
+    import pytest_benchmark  # noqa: F401
+except ImportError:
+    HAS_PYTEST_BENCHMARK = False
+else:
+    HAS_PYTEST_BENCHMARK = True
+
+# Rounds run by benchmark(fn) when the plugin is not installed
+DEFAULT_ROUNDS = 5
+
+_results: list[dict[str, Any]] = []
+
+
+class FallbackBenchmark:
+    """Subset of pytest-benchmark's fixture: times rounds of a callable."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.extra_info: dict[str, Any] = {}
+        self.timings: list[float] = []
+
+    def __call__(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        return self.pedantic(fn, args=args, kwargs=kwargs, rounds=DEFAULT_ROUNDS)
+
+    def pedantic(
+        self,
+        target: Callable[..., Any],
+        args: tuple[Any, ...] = (),
+        kwargs: dict[str, Any] | None = None,
+        setup: Callable[[], tuple[tuple[Any, ...], dict[str, Any]] | None] | None = None,
+        rounds: int = 1,
+        iterations: int = 1,
+        warmup_rounds: int = 0,
+    ) -> Any:
+        """Run target for rounds x iterations and record the time per iteration.
+
+        Returns:
+            The last call's return value
+        """
+        result = None
+        for round_number in range(warmup_rounds + rounds):
+            call_args, call_kwargs = args, kwargs or {}
+            if setup is not None:
+                prepared = setup()
+                if prepared is not None:
+                    call_args, call_kwargs = prepared
+            start = time.perf_counter()
+            for _ in range(iterations):
+                result = target(*call_args, **call_kwargs)
+            elapsed = (time.perf_counter() - start) / iterations
+            if round_number >= warmup_rounds:
+                self.timings.append(elapsed)
+        return result
+
+
+if not HAS_PYTEST_BENCHMARK:
+
+    @pytest.fixture
+    def benchmark(request):
+        """Time a callable like pytest-benchmark's fixture does."""
+        fixture = FallbackBenchmark(request.node.name)
+        yield fixture
+        if fixture.timings:
+            _results.append(
+                {
+                    "name": fixture.name,
+                    "min": min(fixture.timings),
+                    "median": statistics.median(fixture.timings),
+                    "rounds": len(fixture.timings),
+                    "extra_info": fixture.extra_info,
+                }
+            )
+
+    def pytest_terminal_summary(terminalreporter):
+        """Print the recorded timings."""
+        if not _results:
+            return
+        terminalreporter.section("benchmarks")
+        terminalreporter.write_line(f"{'name':<50}{'min ms':>10}{'median ms':>12}{'rounds':>8}")
+        for r in _results:
+            terminalreporter.write_line(
+                f"{r['name']:<50}{r['min'] * 1000:>10.2f}{r['median'] * 1000:>12.2f}"
+                f"{r['rounds']:>8}"
+            )
+            for key, value in r["extra_info"].items():
+                terminalreporter.write_line(f"    {key}: {value}")
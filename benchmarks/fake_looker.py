@@ -0,0 +1,565 @@
+"""Local stand-in for the Looker API 4.0, serving a synthetic instance.
+
+FakeLookerServer implements the endpoints lookervault uses for extraction and
+restoration: login, /user and /versions, paginated dashboard, look, user, group
+and role listings, single-item GETs, create/update/delete of top-level content,
+and the dashboard filter, element, layout and layout-component sub-resources.
+Content is generated deterministically from a seed, with payload sizes close to
+real instances (dashboards carry elements with queries and vis configs).
+
+Every request except login can be slowed down (latency plus uniform jitter)
+and fail at configurable 429 and 5xx rates, so throughput can be measured
+under realistic conditions without a Looker instance.
+
+Examples:
+    >>> with FakeLookerServer(FakeLookerConfig(dashboards=100, latency_ms=50)) as server:
+    ...     client = LookerClient(server.url, "id", "secret", verify_ssl=False)
+    ...     client.sdk.search_dashboards(limit=10)
+    ...     print(server.request_count())
+"""
+
+import json
+import random
+import re
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import parse_qs, urlparse
+
+API_PREFIX = "/api/4.0"
+
+# Collections served under /api/4.0/<collection>
+COLLECTIONS = (
+    "dashboards",
+    "looks",
+    "users",
+    "groups",
+    "roles",
+    "folders",
+    "dashboard_filters",
+    "dashboard_elements",
+    "dashboard_layouts",
+    "dashboard_layout_components",
+)
+
+# Sub-resource collections embedded in dashboard responses
+DASHBOARD_SUBRESOURCES = ("dashboard_filters", "dashboard_elements", "dashboard_layouts")
+
+_ITEM_PATH = re.compile(r"^/(?P<collection>[a-z_]+)(?:/(?P<item_id>[^/]+))?(?:/(?P<sub>[a-z_]+))?$")
+
+
+@dataclass
+class FakeLookerConfig:
+    """Size of the synthetic instance and injected faults."""
+
+    dashboards: int = 100
+    looks: int = 100
+    users: int = 100
+    groups: int = 10
+    roles: int = 5
+    folders: int = 20
+    elements_per_dashboard: int = 8
+    filters_per_dashboard: int = 3
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    rate_429: float = 0.0
+    rate_5xx: float = 0.0
+    seed: int = 42
+
+
+class FakeLookerInstance:
+    """Thread-safe in-memory content store of a synthetic Looker instance."""
+
+    def __init__(self, config: FakeLookerConfig, populate: bool = True):
+        """Initialize the store, optionally generating the synthetic content.
+
+        Args:
+            config: Instance size and seed
+            populate: Generate content (False = empty destination instance)
+        """
+        self.config = config
+        self._lock = threading.Lock()
+        self._next_id = 1
+        self.items: dict[str, dict[str, dict[str, Any]]] = {name: {} for name in COLLECTIONS}
+        if populate:
+            self._populate(random.Random(config.seed))  # noqa: S311 - seeded synthetic data, not security
+
+    def _new_id(self) -> str:
+        new_id = str(self._next_id)
+        self._next_id += 1
+        return new_id
+
+    def _populate(self, rng: random.Random) -> None:
+        config = self.config
+        epoch = datetime(2024, 1, 1, tzinfo=UTC)
+
+        def timestamp() -> str:
+            moment = epoch + timedelta(minutes=rng.randrange(500_000))
+            return moment.strftime("%Y-%m-%dT%H:%M:%S.%f%z")
+
+        folder_ids = [self._add("folders", _folder(i)) for i in range(config.folders)]
+        group_ids = [self._add("groups", _group(i)) for i in range(config.groups)]
+        role_ids = [self._add("roles", _role(i)) for i in range(config.roles)]
+        user_ids = [
+            self._add("users", _user(i, rng, group_ids, role_ids, timestamp()))
+            for i in range(config.users)
+        ]
+        for i in range(config.looks):
+            self._add("looks", _look(i, rng, folder_ids, user_ids, timestamp()))
+
+        for i in range(config.dashboards):
+            dashboard_id = self._add(
+                "dashboards", _dashboard(i, rng, folder_ids, user_ids, timestamp())
+            )
+            for f in range(config.filters_per_dashboard):
+                self._add("dashboard_filters", _dashboard_filter(dashboard_id, f))
+            element_ids = [
+                self._add("dashboard_elements", _dashboard_element(dashboard_id, e, rng))
+                for e in range(config.elements_per_dashboard)
+            ]
+            layout_id = self._add(
+                "dashboard_layouts",
+                {"dashboard_id": dashboard_id, "type": "newspaper", "active": True, "width": 24},
+            )
+            for position, element_id in enumerate(element_ids):
+                self._add(
+                    "dashboard_layout_components",
+                    {
+                        "dashboard_layout_id": layout_id,
+                        "dashboard_element_id": element_id,
+                        "row": position // 2 * 6,
+                        "column": position % 2 * 12,
+                        "width": 12,
+                        "height": 6,
+                    },
+                )
+
+    def _add(self, collection: str, item: dict[str, Any]) -> str:
+        item_id = self._new_id()
+        self.items[collection][item_id] = {"id": item_id, **item}
+        return item_id
+
+    def page(self, collection: str, offset: int, limit: int | None) -> list[dict[str, Any]]:
+        """Page of a collection in id order."""
+        with self._lock:
+            items = list(self.items[collection].values())
+        end = None if limit is None else offset + limit
+        return [self.render(collection, item) for item in items[offset:end]]
+
+    def get(self, collection: str, item_id: str) -> dict[str, Any] | None:
+        """Single item, with nested sub-resources for dashboards."""
+        with self._lock:
+            item = self.items[collection].get(item_id)
+        return None if item is None else self.render(collection, item)
+
+    def children(self, collection: str, parent_key: str, parent_id: str) -> list[dict[str, Any]]:
+        """Items of a collection belonging to a parent (e.g. a dashboard's elements)."""
+        with self._lock:
+            items = [
+                item
+                for item in self.items[collection].values()
+                if str(item.get(parent_key)) == parent_id
+            ]
+        return [self.render(collection, item) for item in items]
+
+    def create(self, collection: str, body: dict[str, Any]) -> dict[str, Any]:
+        """Create an item from a request body; nested sub-resource lists are ignored."""
+        body = {k: v for k, v in body.items() if k not in DASHBOARD_SUBRESOURCES}
+        body.pop("id", None)
+        with self._lock:
+            item_id = self._add(collection, body)
+            item = self.items[collection][item_id]
+        return self.render(collection, item)
+
+    def update(self, collection: str, item_id: str, body: dict[str, Any]) -> dict[str, Any] | None:
+        """Apply a PATCH body to an item."""
+        body = {k: v for k, v in body.items() if k not in DASHBOARD_SUBRESOURCES and k != "id"}
+        with self._lock:
+            item = self.items[collection].get(item_id)
+            if item is None:
+                return None
+            item.update(body)
+        return self.render(collection, item)
+
+    def delete(self, collection: str, item_id: str) -> bool:
+        """Delete an item; returns whether it existed."""
+        with self._lock:
+            return self.items[collection].pop(item_id, None) is not None
+
+    def render(self, collection: str, item: dict[str, Any]) -> dict[str, Any]:
+        """Item as the API returns it (dashboards embed their sub-resources)."""
+        if collection == "dashboards":
+            dashboard_id = item["id"]
+            rendered = dict(item)
+            for sub in DASHBOARD_SUBRESOURCES:
+                rendered[sub] = self.children(sub, "dashboard_id", dashboard_id)
+            return rendered
+        if collection == "dashboard_layouts":
+            return {
+                **item,
+                "dashboard_layout_components": self.children(
+                    "dashboard_layout_components", "dashboard_layout_id", item["id"]
+                ),
+            }
+        return dict(item)
+
+
+def _folder(i: int) -> dict[str, Any]:
+    return {"name": f"Folder {i}", "parent_id": "1" if i else None, "content_metadata_id": str(i)}
+
+
+def _group(i: int) -> dict[str, Any]:
+    return {"name": f"Group {i}", "can_add_to_content_metadata": True, "externally_managed": False}
+
+
+def _role(i: int) -> dict[str, Any]:
+    return {"name": f"Role {i}", "permission_set_id": "1", "model_set_id": "1"}
+
+
+def _user(
+    i: int, rng: random.Random, group_ids: list[str], role_ids: list[str], created_at: str
+) -> dict[str, Any]:
+    return {
+        "first_name": f"First{i}",
+        "last_name": f"Last{i}",
+        "email": f"user{i}@example.com",
+        "is_disabled": rng.random() < 0.05,
+        "locale": "en",
+        "group_ids": rng.sample(group_ids, k=min(2, len(group_ids))),
+        "role_ids": rng.sample(role_ids, k=min(1, len(role_ids))),
+        "created_at": created_at,
+        "ui_state": {"homepageGroupIdPreference": "1"},
+    }
+
+
+def _query(rng: random.Random) -> dict[str, Any]:
+    fields = [f"orders.field_{n}" for n in rng.sample(range(200), k=6)]
+    return {
+        "model": "ecommerce",
+        "view": "orders",
+        "fields": fields,
+        "filters": {"orders.created_date": "30 days", "orders.status": "complete"},
+        "sorts": [f"{fields[0]} desc"],
+        "limit": "500",
+        "vis_config": {
+            "type": rng.choice(["looker_line", "looker_column", "looker_grid", "single_value"]),
+            "show_value_labels": True,
+            "series_colors": {field: f"#{rng.randrange(0xFFFFFF):06x}" for field in fields},
+            "x_axis_label": "Created Date",
+            "y_axes": [{"label": "Orders", "orientation": "left", "showLabels": True}],
+        },
+    }
+
+
+def _look(
+    i: int, rng: random.Random, folder_ids: list[str], user_ids: list[str], updated_at: str
+) -> dict[str, Any]:
+    return {
+        "title": f"Look {i}",
+        "description": "Synthetic look for benchmarks. " * 4,
+        "folder_id": rng.choice(folder_ids) if folder_ids else None,
+        "user_id": rng.choice(user_ids) if user_ids else None,
+        "query_id": str(10_000 + i),
+        "query": _query(rng),
+        "is_run_on_load": False,
+        "public": False,
+        "created_at": updated_at,
+        "updated_at": updated_at,
+    }
+
+
+def _dashboard(
+    i: int, rng: random.Random, folder_ids: list[str], user_ids: list[str], updated_at: str
+) -> dict[str, Any]:
+    return {
+        "title": f"Dashboard {i}",
+        "description": "Synthetic dashboard for benchmarks. " * 4,
+        "folder_id": rng.choice(folder_ids) if folder_ids else None,
+        "user_id": rng.choice(user_ids) if user_ids else None,
+        "hidden": False,
+        "refresh_interval": "1 hour",
+        "load_configuration": "wait",
+        "preferred_viewer": "dashboards-next",
+        "crossfilter_enabled": True,
+        "created_at": updated_at,
+        "updated_at": updated_at,
+    }
+
+
+def _dashboard_filter(dashboard_id: str, f: int) -> dict[str, Any]:
+    return {
+        "dashboard_id": dashboard_id,
+        "name": f"Filter {f}",
+        "title": f"Filter {f}",
+        "type": "field_filter",
+        "default_value": "30 days",
+        "model": "ecommerce",
+        "explore": "orders",
+        "dimension": f"orders.dimension_{f}",
+        "row": f,
+        "allow_multiple_values": True,
+        "required": False,
+    }
+
+
+def _dashboard_element(dashboard_id: str, e: int, rng: random.Random) -> dict[str, Any]:
+    return {
+        "dashboard_id": dashboard_id,
+        "title": f"Tile {e}",
+        "type": "vis",
+        "query": _query(rng),
+        "note_display": "hover",
+        "note_text": "Synthetic tile",
+        "result_maker": {"filterables": [{"model": "ecommerce", "view": "orders"}]},
+    }
+
+
+def _project_fields(item: dict[str, Any], fields: str | None) -> dict[str, Any]:
+    """Keep only the top-level fields named in a Looker ``fields`` parameter."""
+    if not fields:
+        return item
+    names: set[str] = set()
+    depth = 0
+    token = ""
+    for char in fields + ",":
+        if char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif char == "," and depth == 0:
+            names.add(token.strip())
+            token = ""
+            continue
+        if depth == 0 and char not in "()":
+            token += char
+    return {k: v for k, v in item.items() if k in names}
+
+
+def _error_body(status: int, message: str, method: str, path: str) -> dict[str, str]:
+    """Error payload in Looker's format (the status code is in the documentation URL)."""
+    return {
+        "message": message,
+        "documentation_url": (
+            f"https://cloud.google.com/looker/docs/r/err/4.0/{status}/{method.lower()}{path}"
+        ),
+    }
+
+
+class FakeLookerServer:
+    """Threaded HTTP server serving a FakeLookerInstance as the Looker API.
+
+    Thread-safe: requests are handled on their own threads; the instance store
+    and request counters are lock-protected.
+    """
+
+    def __init__(
+        self,
+        config: FakeLookerConfig | None = None,
+        populate: bool = True,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        """Initialize the server (call start() or use it as a context manager).
+
+        Args:
+            config: Instance size and injected faults
+            populate: Generate synthetic content (False = empty destination)
+            host: Interface to bind
+            port: Port to bind (0 = any free port)
+        """
+        self.config = config or FakeLookerConfig()
+        self.instance = FakeLookerInstance(self.config, populate=populate)
+        self._rng = random.Random(self.config.seed)  # noqa: S311 - fault injection, not security
+        self._rng_lock = threading.Lock()
+        self._counts: Counter[str] = Counter()
+        self._counts_lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self._httpd.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        """Base URL to configure LookerClient with."""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def request_count(self) -> int:
+        """API requests served since the last reset (login excluded)."""
+        with self._counts_lock:
+            return sum(self._counts.values())
+
+    def request_counts(self) -> dict[str, int]:
+        """API requests served since the last reset, by "METHOD /collection"."""
+        with self._counts_lock:
+            return dict(self._counts)
+
+    def reset_counts(self) -> None:
+        """Reset request counters."""
+        with self._counts_lock:
+            self._counts.clear()
+
+    def start(self) -> "FakeLookerServer":
+        """Serve requests on a background thread."""
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, name="fake-looker", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and release the port."""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> "FakeLookerServer":
+        return self.start()
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
+
+    def _fault(self) -> tuple[float, int | None]:
+        """Delay to apply and injected status code (None = serve normally)."""
+        config = self.config
+        with self._rng_lock:
+            delay = config.latency_ms + self._rng.uniform(-1, 1) * config.jitter_ms
+            roll = self._rng.random()
+        if roll < config.rate_429:
+            return delay, 429
+        if roll < config.rate_429 + config.rate_5xx:
+            return delay, 503
+        return delay, None
+
+    def _count(self, method: str, collection: str) -> None:
+        with self._counts_lock:
+            self._counts[f"{method} /{collection}"] += 1
+
+    def _handler_class(self) -> type[BaseHTTPRequestHandler]:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Headers and body are separate writes; avoid Nagle/delayed-ACK stalls
+            disable_nagle_algorithm = True
+
+            def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+                pass
+
+            def _send(self, status: int, payload: Any = None) -> None:
+                body = b"" if payload is None else json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                if status == 429:
+                    self.send_header("Retry-After", "1")
+                self.end_headers()
+                self.wfile.write(body)
+
+            def _body(self) -> dict[str, Any]:
+                length = int(self.headers.get("Content-Length") or 0)
+                raw = self.rfile.read(length) if length else b""
+                return json.loads(raw) if raw else {}
+
+            def _handle(self, method: str) -> None:
+                parsed = urlparse(self.path)
+                path = parsed.path.removeprefix(API_PREFIX)
+                if path == "/login":
+                    self._body_discard()
+                    self._send(
+                        200,
+                        {"access_token": "fake-token", "token_type": "Bearer", "expires_in": 3600},
+                    )
+                    return
+
+                delay_ms, fault = server._fault()
+                if delay_ms > 0:
+                    time.sleep(delay_ms / 1000)
+
+                match = _ITEM_PATH.match(path)
+                collection = match["collection"] if match else path
+                server._count(method, collection)
+                if fault is not None:
+                    self._body_discard()
+                    message = "Too Many Requests" if fault == 429 else "Service Unavailable"
+                    self._send(fault, _error_body(fault, message, method, path))
+                    return
+
+                query = {k: v[-1] for k, v in parse_qs(parsed.query).items()}
+                status, payload = self._route(method, path, match, query)
+                self._send(status, payload)
+
+            def _body_discard(self) -> None:
+                length = int(self.headers.get("Content-Length") or 0)
+                if length:
+                    self.rfile.read(length)
+
+            def _route(
+                self,
+                method: str,
+                path: str,
+                match: re.Match[str] | None,
+                query: dict[str, str],
+            ) -> tuple[int, Any]:
+                instance = server.instance
+                not_found = (404, _error_body(404, "Not found", method, path))
+                if path == "/user" and method == "GET":
+                    return 200, {"id": "1", "email": "benchmark@example.com"}
+                if path == "/versions" and method == "GET":
+                    return 200, {
+                        "looker_release_version": "24.0.0",
+                        "current_version": {"version": "4.0", "full_version": "4.0.24.0"},
+                    }
+                if match is None or match["collection"] not in COLLECTIONS:
+                    return not_found
+
+                collection, item_id, sub = match["collection"], match["item_id"], match["sub"]
+                fields = query.get("fields")
+
+                if method == "GET" and (item_id is None or item_id == "search"):
+                    offset = int(query.get("offset") or 0)
+                    limit = int(query["limit"]) if query.get("limit") else None
+                    return 200, [
+                        _project_fields(item, fields)
+                        for item in instance.page(collection, offset, limit)
+                    ]
+                if item_id is None:
+                    if method == "POST":
+                        return 200, instance.create(collection, self._body())
+                    return not_found
+                if sub is not None:
+                    parent_key = (
+                        "dashboard_id" if collection == "dashboards" else "dashboard_layout_id"
+                    )
+                    if method != "GET" or sub not in COLLECTIONS:
+                        return not_found
+                    return 200, instance.children(sub, parent_key, item_id)
+
+                if method == "GET":
+                    item = instance.get(collection, item_id)
+                    return not_found if item is None else (200, _project_fields(item, fields))
+                if method == "PATCH":
+                    item = instance.update(collection, item_id, self._body())
+                    return not_found if item is None else (200, item)
+                if method == "DELETE":
+                    return (204, None) if instance.delete(collection, item_id) else not_found
+                return not_found
+
+            def do_GET(self) -> None:  # noqa: N802
+                self._handle("GET")
+
+            def do_POST(self) -> None:  # noqa: N802
+                self._handle("POST")
+
+            def do_PATCH(self) -> None:  # noqa: N802
+                self._handle("PATCH")
+
+            def do_DELETE(self) -> None:  # noqa: N802
+                self._handle("DELETE")
+
+        return Handler
@@ -0,0 +1,320 @@
+"""End-to-end throughput benchmarks against a local fake Looker API.
+
+Runs extraction (ParallelOrchestrator) and restoration
+(ParallelRestorationOrchestrator) at several worker counts against
+FakeLookerServer and records, per scenario, items/sec, API calls per item and
+the scenario's peak RSS. Results are written as JSON. Passing a previous
+results file as ``--baseline`` flags throughput regressions and makes the run
+exit non-zero.
+
+Each scenario runs in a fresh spawned process, so peak RSS is measured per
+scenario. The fake server runs in the parent process, and every restore writes
+to a fresh, empty destination instance.
+
+Usage:
+    python -m benchmarks.run_benchmarks --workers 1,4,8 --latency-ms 50 \\
+        --output benchmarks/results/latest.json --baseline benchmarks/results/main.json
+"""
+
+import argparse
+import json
+import logging
+import multiprocessing
+import platform
+import sys
+import tempfile
+import time
+from dataclasses import asdict
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any, cast
+
+from benchmarks.fake_looker import FakeLookerConfig, FakeLookerServer
+
+# Content types extracted by the benchmarks (ContentType names)
+BENCHMARK_TYPES = ("DASHBOARD", "LOOK", "USER")
+
+# Content types restored by the benchmarks. Looks are left out: search_looks
+# returns Look models without their query, which restore validation requires.
+RESTORE_TYPES = ("DASHBOARD", "USER")
+
+# Rate limits high enough that the limiter never bounds a benchmark
+UNLIMITED_PER_MINUTE = 1_000_000
+UNLIMITED_PER_SECOND = 100_000
+
+# Relative items/sec drop beyond which a scenario counts as a regression
+DEFAULT_REGRESSION_THRESHOLD = 0.10
+
+
+def run_extraction(url: str, db_path: str, workers: int) -> dict[str, Any]:
+    """Extract every benchmark content type from the instance at url into db_path.
+
+    Returns:
+        Dict with items, errors and seconds
+    """
+    from lookervault.config.models import ParallelConfig
+    from lookervault.extraction.orchestrator import ExtractionConfig
+    from lookervault.extraction.parallel_orchestrator import ParallelOrchestrator
+    from lookervault.extraction.progress import RichProgressTracker
+    from lookervault.looker.client import LookerClient
+    from lookervault.looker.extractor import LookerContentExtractor
+    from lookervault.storage.models import ContentType
+    from lookervault.storage.repository import SQLiteContentRepository
+    from lookervault.storage.serializer import MsgpackSerializer
+
+    client = LookerClient(url, "benchmark", "benchmark", verify_ssl=False)
+    repository = SQLiteContentRepository(db_path=db_path)
+    try:
+        orchestrator = ParallelOrchestrator(
+            extractor=LookerContentExtractor(client=client),
+            repository=repository,
+            serializer=MsgpackSerializer(),
+            progress=RichProgressTracker(disable=True),
+            config=ExtractionConfig(
+                content_types=[ContentType[name].value for name in BENCHMARK_TYPES],
+                resume=False,
+                output_mode="json",
+            ),
+            parallel_config=ParallelConfig(
+                workers=workers,
+                queue_size=max(10, workers * 100),
+                rate_limit_per_minute=UNLIMITED_PER_MINUTE,
+                rate_limit_per_second=UNLIMITED_PER_SECOND,
+            ),
+        )
+        start = time.perf_counter()
+        result = orchestrator.extract()
+        seconds = time.perf_counter() - start
+    finally:
+        repository.close()
+    return {"items": result.total_items, "errors": result.errors, "seconds": seconds}
+
+
+def run_restoration(url: str, db_path: str, workers: int) -> dict[str, Any]:
+    """Restore the RESTORE_TYPES content from db_path to the instance at url.
+
+    Returns:
+        Dict with items, errors and seconds
+    """
+    from lookervault.config.models import RestorationConfig
+    from lookervault.extraction.metrics import ThreadSafeMetrics
+    from lookervault.extraction.rate_limiter import AdaptiveRateLimiter
+    from lookervault.looker.client import LookerClient
+    from lookervault.restoration.dependency_graph import DependencyGraph
+    from lookervault.restoration.parallel_orchestrator import (
+        ParallelRestorationOrchestrator,
+        SupportsDeadLetterQueue,
+    )
+    from lookervault.restoration.restorer import LookerContentRestorer
+    from lookervault.storage.models import ContentType
+    from lookervault.storage.repository import SQLiteContentRepository
+
+    client = LookerClient(url, "benchmark", "benchmark", verify_ssl=False)
+    repository = SQLiteContentRepository(db_path=db_path)
+    try:
+        rate_limiter = AdaptiveRateLimiter(
+            requests_per_minute=UNLIMITED_PER_MINUTE,
+            requests_per_second=UNLIMITED_PER_SECOND,
+        )
+        config = RestorationConfig(
+            destination_instance=url,
+            workers=workers,
+            rate_limit_per_minute=UNLIMITED_PER_MINUTE,
+            rate_limit_per_second=UNLIMITED_PER_SECOND,
+        )
+        orchestrator = ParallelRestorationOrchestrator(
+            restorer=LookerContentRestorer(
+                client=client, repository=repository, rate_limiter=rate_limiter
+            ),
+            repository=repository,
+            config=config,
+            rate_limiter=rate_limiter,
+            metrics=ThreadSafeMetrics(),
+            dlq=cast(SupportsDeadLetterQueue, repository),
+        )
+        requested = {ContentType[name] for name in RESTORE_TYPES}
+        ordered = [ct for ct in DependencyGraph().get_restoration_order() if ct in requested]
+        start = time.perf_counter()
+        summary = orchestrator.restore_all(requested_types=ordered)
+        seconds = time.perf_counter() - start
+    finally:
+        repository.close()
+    return {"items": summary.total_items, "errors": summary.error_count, "seconds": seconds}
+
+
+SCENARIOS = {"extract": run_extraction, "restore": run_restoration}
+
+
+def _scenario_process(scenario: str, url: str, db_path: str, workers: int, conn: Any) -> None:
+    """Spawned process entry point: run one scenario and send back its result."""
+    from lookervault.extraction.memory_monitor import read_process_memory
+
+    logging.basicConfig(level=logging.ERROR)
+    try:
+        result = SCENARIOS[scenario](url, db_path, workers)
+        result["peak_rss_mb"] = read_process_memory()[1] / (1024 * 1024)
+        conn.send(result)
+    except BaseException as e:
+        conn.send({"error": f"{type(e).__name__}: {e}"})
+        raise
+    finally:
+        conn.close()
+
+
+def run_scenario(
+    scenario: str, server: FakeLookerServer, db_path: str, workers: int
+) -> dict[str, Any]:
+    """Run one scenario in a spawned process and derive its throughput metrics.
+
+    Returns:
+        Result dict (scenario, workers, items, errors, seconds, items_per_second,
+        api_calls, api_calls_per_item, peak_rss_mb)
+
+    Raises:
+        RuntimeError: If the scenario process fails
+    """
+    context = multiprocessing.get_context("spawn")
+    receiver, sender = context.Pipe(duplex=False)
+    server.reset_counts()
+    process = context.Process(
+        target=_scenario_process, args=(scenario, server.url, db_path, workers, sender)
+    )
+    process.start()
+    sender.close()
+    try:
+        result = receiver.recv()
+    except EOFError:
+        result = {"error": f"process exited with code {process.exitcode}"}
+    process.join()
+    if "error" in result:
+        raise RuntimeError(f"{scenario} with {workers} workers failed: {result['error']}")
+
+    api_calls = server.request_count()
+    items = result["items"]
+    return {
+        "scenario": scenario,
+        "workers": workers,
+        "items": items,
+        "errors": result["errors"],
+        "seconds": round(result["seconds"], 3),
+        "items_per_second": round(items / result["seconds"], 2) if result["seconds"] else 0.0,
+        "api_calls": api_calls,
+        "api_calls_per_item": round(api_calls / items, 3) if items else 0.0,
+        "peak_rss_mb": round(result["peak_rss_mb"], 1),
+    }
+
+
+def run_suite(
+    fake_config: FakeLookerConfig, worker_counts: list[int], work_dir: Path
+) -> list[dict[str, Any]]:
+    """Run extraction then restoration at each worker count.
+
+    Returns:
+        One result dict per (scenario, workers)
+    """
+    results = []
+    with FakeLookerServer(fake_config) as source:
+        for workers in worker_counts:
+            db_path = str(work_dir / f"bench_{workers}.db")
+            results.append(run_scenario("extract", source, db_path, workers))
+            with FakeLookerServer(fake_config, populate=False) as destination:
+                results.append(run_scenario("restore", destination, db_path, workers))
+    return results
+
+
+def compare(
+    results: list[dict[str, Any]], baseline: list[dict[str, Any]], threshold: float
+) -> list[str]:
+    """Compare results with a baseline run.
+
+    Returns:
+        One message per scenario whose items/sec dropped by more than threshold
+    """
+    previous = {(r["scenario"], r["workers"]): r for r in baseline}
+    regressions = []
+    for result in results:
+        before = previous.get((result["scenario"], result["workers"]))
+        if not before or not before["items_per_second"]:
+            continue
+        change = result["items_per_second"] / before["items_per_second"] - 1
+        result["baseline_items_per_second"] = before["items_per_second"]
+        result["change"] = round(change, 3)
+        if change < -threshold:
+            regressions.append(
+                f"{result['scenario']} x{result['workers']}: "
+                f"{before['items_per_second']:.1f} -> {result['items_per_second']:.1f} items/s "
+                f"({change:+.0%})"
+            )
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Command-line entry point; returns the process exit code."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--dashboards", type=int, default=200)
+    parser.add_argument("--looks", type=int, default=200)
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--elements-per-dashboard", type=int, default=8)
+    parser.add_argument("--workers", default="1,4,8", help="Comma-separated worker counts")
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    parser.add_argument("--jitter-ms", type=float, default=5.0)
+    parser.add_argument("--rate-429", type=float, default=0.0, help="Fraction of 429 responses")
+    parser.add_argument("--rate-5xx", type=float, default=0.0, help="Fraction of 503 responses")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", type=Path, help="Write results JSON here")
+    parser.add_argument("--baseline", type=Path, help="Previous results JSON to compare with")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_REGRESSION_THRESHOLD,
+        help="Relative items/sec drop reported as a regression",
+    )
+    args = parser.parse_args(argv)
+
+    fake_config = FakeLookerConfig(
+        dashboards=args.dashboards,
+        looks=args.looks,
+        users=args.users,
+        elements_per_dashboard=args.elements_per_dashboard,
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        rate_429=args.rate_429,
+        rate_5xx=args.rate_5xx,
+        seed=args.seed,
+    )
+    worker_counts = [int(w) for w in args.workers.split(",") if w.strip()]
+
+    with tempfile.TemporaryDirectory(prefix="lookervault-bench-") as work_dir:
+        results = run_suite(fake_config, worker_counts, Path(work_dir))
+
+    regressions: list[str] = []
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text())
+        if baseline.get("instance") != asdict(fake_config):
+            print("warning: baseline was run against a different instance", file=sys.stderr)
+        regressions = compare(results, baseline["results"], args.threshold)
+
+    report = {
+        "timestamp": datetime.now(UTC).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "instance": asdict(fake_config),
+        "results": results,
+    }
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(report, indent=2) + "\n")
+
+    print(f"{'scenario':<10}{'workers':>8}{'items':>8}{'items/s':>10}{'calls/item':>12}{'MB':>8}")
+    for r in results:
+        print(
+            f"{r['scenario']:<10}{r['workers']:>8}{r['items']:>8}{r['items_per_second']:>10.1f}"
+            f"{r['api_calls_per_item']:>12.2f}{r['peak_rss_mb']:>8.1f}"
+        )
+    for message in regressions:
+        print(f"REGRESSION {message}", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
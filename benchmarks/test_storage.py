@@ -0,0 +1,219 @@
+"""Micro-benchmarks for SQLiteContentRepository hot paths.
+
+Covers content upserts (one transaction per item vs one per batch), full-type
+reads (list_content vs iter_content_data), folder-filtered ID lookups over
+10k folders, ID mapping lookups, checkpoint saves and write throughput under
+1-32 concurrent writer threads.
+
+The contention benchmarks assert that storage alone sustains at least the
+throughput ParallelOrchestrator documents for a whole extraction
+(MIN_WRITES_PER_SECOND), so that SQLite writes never become its bottleneck.
+Index usage of the same hot paths is asserted by
+tests/unit/storage/test_query_plans.py, which runs with the regular suite.
+
+Usage:
+    pytest benchmarks/test_storage.py --no-cov
+"""
+
+import itertools
+import threading
+import time
+from datetime import datetime
+
+import pytest
+
+from lookervault.storage.models import Checkpoint, ContentItem, ContentType, IDMapping
+from lookervault.storage.repository import SQLiteContentRepository
+
+# Items per upsert round
+UPSERT_BATCH = 500
+
+# Dashboards in the read benchmarks, spread over FOLDER_COUNT folders
+READ_ITEMS = 20_000
+FOLDER_COUNT = 10_000
+
+# Serialized size of one synthetic content item
+PAYLOAD = b"x" * 2048
+
+# Upper end of "400-600 items/second with 8 workers" (parallel_orchestrator)
+MIN_WRITES_PER_SECOND = 600
+
+SOURCE = "https://source.looker.com"
+
+_ids = itertools.count()
+
+
+def make_item(item_id: str, folder_id: str | None = None) -> ContentItem:
+    """Build a dashboard ContentItem with a fixed-size payload."""
+    now = datetime.now()
+    return ContentItem(
+        id=item_id,
+        content_type=ContentType.DASHBOARD.value,
+        name=f"Dashboard {item_id}",
+        owner_id=1,
+        created_at=now,
+        updated_at=now,
+        synced_at=now,
+        content_data=PAYLOAD,
+        folder_id=folder_id,
+    )
+
+
+def fresh_items(count: int) -> list[ContentItem]:
+    """Build count items with IDs never used before in this run."""
+    return [make_item(str(next(_ids))) for _ in range(count)]
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """Create an empty repository."""
+    repository = SQLiteContentRepository(tmp_path / "bench.db")
+    yield repository
+    repository.close()
+
+
+@pytest.fixture(scope="module")
+def populated_repo(tmp_path_factory):
+    """Repository holding READ_ITEMS dashboards spread over FOLDER_COUNT folders."""
+    repository = SQLiteContentRepository(tmp_path_factory.mktemp("bench") / "read.db")
+    repository.save_contents(
+        [make_item(str(i), folder_id=str(i % FOLDER_COUNT)) for i in range(READ_ITEMS)]
+    )
+    yield repository
+    repository.close()
+
+
+class TestContentUpsert:
+    """Single-item vs batched content upserts."""
+
+    def test_save_content_per_item(self, benchmark, repo):
+        """UPSERT_BATCH items, one transaction each."""
+
+        def save_each(items):
+            for item in items:
+                repo.save_content(item)
+
+        benchmark.pedantic(save_each, setup=lambda: ((fresh_items(UPSERT_BATCH),), {}), rounds=5)
+        benchmark.extra_info["items"] = UPSERT_BATCH
+
+    def test_save_contents_batch(self, benchmark, repo):
+        """UPSERT_BATCH items in one transaction."""
+        benchmark.pedantic(
+            repo.save_contents, setup=lambda: ((fresh_items(UPSERT_BATCH),), {}), rounds=5
+        )
+        benchmark.extra_info["items"] = UPSERT_BATCH
+
+
+class TestContentReads:
+    """Reading every item of a type, and folder-filtered lookups."""
+
+    def test_list_content(self, benchmark, populated_repo):
+        """Materialize every dashboard as ContentItems."""
+        items = benchmark(populated_repo.list_content, ContentType.DASHBOARD.value)
+        assert len(items) == READ_ITEMS
+
+    def test_iter_content_data(self, benchmark, populated_repo):
+        """Stream every dashboard payload in pages."""
+
+        def stream() -> int:
+            pages = populated_repo.iter_content_data(ContentType.DASHBOARD.value)
+            return sum(len(page) for page in pages)
+
+        assert benchmark(stream) == READ_ITEMS
+
+    @pytest.mark.parametrize("folders", [10, 1_000, FOLDER_COUNT])
+    def test_get_content_ids_in_folders(self, benchmark, populated_repo, folders):
+        """IDs of active dashboards in a subset of the folders."""
+        folder_ids = {str(i) for i in range(folders)}
+        ids = benchmark(
+            populated_repo.get_content_ids_in_folders, ContentType.DASHBOARD.value, folder_ids
+        )
+        assert len(ids) == READ_ITEMS * folders // FOLDER_COUNT
+
+
+class TestIDMappings:
+    """Source-to-destination ID lookups used while restoring."""
+
+    MAPPINGS = 5_000
+
+    @pytest.fixture
+    def mapped_repo(self, repo):
+        repo.save_id_mappings(
+            [
+                IDMapping(SOURCE, ContentType.DASHBOARD.value, str(i), f"dest-{i}")
+                for i in range(self.MAPPINGS)
+            ]
+        )
+        return repo
+
+    def test_get_destination_id_each(self, benchmark, mapped_repo):
+        """500 single-ID lookups."""
+
+        def lookup_each():
+            for i in range(0, self.MAPPINGS, 10):
+                mapped_repo.get_destination_id(SOURCE, ContentType.DASHBOARD.value, str(i))
+
+        benchmark(lookup_each)
+
+    def test_batch_get_mappings(self, benchmark, mapped_repo):
+        """The same 500 IDs in one batch lookup."""
+        source_ids = [str(i) for i in range(0, self.MAPPINGS, 10)]
+        mappings = benchmark(
+            mapped_repo.batch_get_mappings, SOURCE, ContentType.DASHBOARD.value, source_ids
+        )
+        assert len(mappings) == len(source_ids)
+
+
+class TestCheckpoints:
+    """Checkpoint writes issued once per extracted page."""
+
+    def test_save_checkpoint(self, benchmark, repo):
+        """100 checkpoint upserts for one session and type."""
+
+        def save_checkpoints():
+            for offset in range(100):
+                repo.save_checkpoint(
+                    Checkpoint(
+                        session_id="bench",
+                        content_type=ContentType.DASHBOARD.value,
+                        checkpoint_data={"offset": offset * 100},
+                        item_count=offset * 100,
+                    )
+                )
+
+        benchmark(save_checkpoints)
+
+
+class TestWriterContention:
+    """save_content throughput with concurrent writer threads."""
+
+    WRITES = 2_000
+
+    @pytest.mark.parametrize("threads", [1, 4, 8, 16, 32])
+    def test_concurrent_save_content(self, benchmark, repo, threads):
+        """WRITES single-item upserts split across writer threads."""
+        per_thread = self.WRITES // threads
+
+        def write(items):
+            for item in items:
+                repo.save_content(item)
+            repo.close_thread_connection()
+
+        def run():
+            workers = [
+                threading.Thread(target=write, args=(fresh_items(per_thread),))
+                for _ in range(threads)
+            ]
+            start = time.perf_counter()
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join()
+            return time.perf_counter() - start
+
+        seconds = benchmark.pedantic(run, rounds=3)
+        writes_per_second = per_thread * threads / seconds
+        benchmark.extra_info["writes_per_second"] = round(writes_per_second)
+
+        assert repo.count_content(ContentType.DASHBOARD.value) == per_thread * threads * 3
+        assert writes_per_second >= MIN_WRITES_PER_SECOND
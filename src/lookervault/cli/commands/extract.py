@@ -11,31 +11,50 @@ from lookervault.cli.types import parse_content_types
 from lookervault.config.loader import load_config
 from lookervault.config.models import ParallelConfig
 from lookervault.exceptions import ConfigError, OrchestrationError
+from lookervault.extraction.memory_monitor import AllocationProfiler
+from lookervault.extraction.metrics_exporter import DEFAULT_METRICS_HOST, MetricsExporter
 from lookervault.extraction.orchestrator import ExtractionConfig, ExtractionOrchestrator
 from lookervault.extraction.parallel_orchestrator import ParallelOrchestrator
-from lookervault.extraction.performance import PerformanceTuner
+from lookervault.extraction.performance import AutoTuner, PerformanceTuner
 from lookervault.extraction.progress import (
     JsonProgressTracker,
     RichProgressTracker,
 )
 from lookervault.looker.client import LookerClient
 from lookervault.looker.extractor import LookerContentExtractor
+from lookervault.looker.field_profiles import FieldProfile
 from lookervault.storage.models import ContentType
 from lookervault.storage.repository import SQLiteContentRepository
 from lookervault.storage.serializer import MsgpackSerializer
+from lookervault.utils.profiling import RunProfiler
+from lookervault.utils.tracing import start_tracing, stop_tracing
 
 logger = logging.getLogger(__name__)
 
 # Default worker count: conservative default based on CPU cores
 DEFAULT_WORKERS = min(os.cpu_count() or 1, 8)
 
+# Default items per page when --batch-size is not given
+DEFAULT_BATCH_SIZE = 100
+
+
+def _count_stored(db: str, content_types: list[int]) -> int:
+    """Count active items of the given types already stored in db (0 if db doesn't exist)."""
+    if not Path(db).exists():
+        return 0
+    repository = SQLiteContentRepository(db_path=db)
+    try:
+        return sum(repository.count_content(content_type) for content_type in content_types)
+    finally:
+        repository.close()
+
 
 def run(
     config: Path | None = None,
     output: str = "table",
     db: str = "looker.db",
     types: str | None = None,
-    batch_size: int = 100,
+    batch_size: int | None = None,
     resume: bool = True,
     incremental: bool = False,
     workers: int = DEFAULT_WORKERS,
@@ -45,6 +64,21 @@ def run(
     debug: bool = False,
     folder_ids: str | None = None,
     recursive: bool = False,
+    field_profile: str | None = None,
+    two_phase: bool = False,
+    adaptive_page_size: bool = False,
+    profile_memory: bool = False,
+    trace: Path | None = None,
+    metrics_port: int | None = None,
+    metrics_host: str = DEFAULT_METRICS_HOST,
+    metrics_textfile: Path | None = None,
+    auto_tune: bool = False,
+    dynamic_workers: bool = False,
+    max_workers: int | None = None,
+    profile: bool = False,
+    memory_warning_mb: float | None = None,
+    memory_critical_mb: float | None = None,
+    allow_index_overwrite: bool = False,
 ) -> None:
     """Run content extraction from Looker instance.
 
@@ -53,7 +87,7 @@ def run(
         output: Output format ("table" or "json")
         db: Database path for storage
         types: Comma-separated content types to extract (default: all)
-        batch_size: Items per batch for memory management
+        batch_size: Items per batch for memory management (default: 100)
         resume: Resume incomplete extraction
         incremental: Extract only new/changed content since last extraction
         workers: Number of worker threads for parallel extraction (1-50, default: min(cpu_count, 8))
@@ -63,6 +97,23 @@ def run(
         debug: Enable debug logging
         folder_ids: Comma-separated folder IDs to filter extraction (only dashboard, look, board, folder)
         recursive: Include subfolders when using folder_ids
+        field_profile: Field projection profile ("index", "restore-complete", "full")
+        two_phase: Index sweep + targeted detail fetch for dashboards and looks
+        adaptive_page_size: Tune page size from observed latency/payload/errors
+        profile_memory: Trace allocations and report the top allocation sites
+        trace: Write a span trace of the run to this path (Chrome trace JSON or .jsonl)
+        metrics_port: Serve live Prometheus metrics on this port
+        metrics_host: Interface the metrics port binds to (default: loopback only)
+        metrics_textfile: Rewrite this node-exporter textfile with live Prometheus metrics
+        auto_tune: Choose workers, batch size and rate limits not given explicitly from the
+            telemetry of previous runs
+        dynamic_workers: Grow or shrink the active worker count during the run
+        max_workers: Upper bound for dynamic worker scaling (default: twice workers)
+        profile: Sample every thread's stack and write a merged pstats profile and
+            collapsed-stack flamegraph file next to the database
+        memory_warning_mb: RSS (MB) above which elevated memory use is logged
+        memory_critical_mb: RSS (MB) above which fetch workers pause while memory keeps rising
+        allow_index_overwrite: Let the 'index' profile replace content already stored in db
     """
     # Configure rich logging - default to INFO for extraction to show progress
     log_level = logging.DEBUG if debug else logging.INFO
@@ -74,6 +125,23 @@ def run(
     )
 
     try:
+        # Settings given explicitly are never overridden by --auto-tune
+        workers_given = workers != 0
+        batch_size_given = batch_size is not None
+        if batch_size is None:
+            batch_size = DEFAULT_BATCH_SIZE
+
+        warning_mb = memory_warning_mb or ParallelConfig.model_fields["memory_warning_mb"].default
+        critical_mb = (
+            memory_critical_mb or ParallelConfig.model_fields["memory_critical_mb"].default
+        )
+        if warning_mb > critical_mb:
+            console.print(
+                f"[red]✗ --memory-warning-mb ({warning_mb:g}) must not exceed "
+                f"--memory-critical-mb ({critical_mb:g})[/red]"
+            )
+            raise typer.Exit(2)
+
         # Auto-detect workers if not specified (workers=0)
         if workers == 0:
             workers = DEFAULT_WORKERS
@@ -129,6 +197,35 @@ def run(
                     f"(recursive={recursive})[/dim]"
                 )
 
+        # Validate field profile
+        if field_profile is not None:
+            valid_profiles = [profile.value for profile in FieldProfile]
+            if field_profile not in valid_profiles:
+                console.print(
+                    f"[red]✗ Invalid --field-profile: {field_profile} "
+                    f"(must be one of: {', '.join(valid_profiles)})[/red]"
+                )
+                raise typer.Exit(2)
+            if field_profile == FieldProfile.INDEX:
+                # Index records replace stored blobs, so an existing backup of the
+                # same types would lose its restorable content
+                existing = 0 if allow_index_overwrite else _count_stored(db, content_types)
+                if existing:
+                    console.print(
+                        f"[red]✗ {db} already holds {existing} items of the requested types. "
+                        "The 'index' profile would overwrite them with metadata-only "
+                        "records.[/red]"
+                    )
+                    console.print(
+                        "Use a separate --db for inventory scans, or pass "
+                        "--allow-index-overwrite to replace the stored content"
+                    )
+                    raise typer.Exit(2)
+                console.print(
+                    "[yellow]⚠ Warning: 'index' profile stores metadata only. "
+                    "Items extracted this way cannot be restored.[/yellow]"
+                )
+
         # Create components
         looker_client = LookerClient(
             api_url=str(cfg.looker.api_url),
@@ -140,6 +237,35 @@ def run(
 
         repository = SQLiteContentRepository(db_path=db)
         serializer = MsgpackSerializer()
+
+        if auto_tune:
+            defaults = ParallelConfig()
+            decision = AutoTuner.from_repository(
+                repository, "extract", str(cfg.looker.api_url)
+            ).recommend(
+                workers=workers,
+                batch_size=batch_size,
+                rate_limit_per_minute=rate_limit_per_minute or defaults.rate_limit_per_minute,
+                rate_limit_per_second=rate_limit_per_second or defaults.rate_limit_per_second,
+            )
+            if not workers_given:
+                workers = decision.workers
+            if not batch_size_given and decision.batch_size is not None:
+                batch_size = decision.batch_size
+            if rate_limit_per_minute is None:
+                rate_limit_per_minute = decision.rate_limit_per_minute
+            if rate_limit_per_second is None:
+                rate_limit_per_second = decision.rate_limit_per_second
+            summary = (
+                f"Auto-tune ({decision.runs_considered} previous runs): {workers} workers, "
+                f"batch_size={batch_size}, {rate_limit_per_minute} req/min, "
+                f"{rate_limit_per_second} req/sec"
+            )
+            logger.info(summary + "; " + "; ".join(decision.notes))
+            if output != "json":
+                console.print(f"[cyan]{summary}[/cyan]")
+                for note in decision.notes:
+                    console.print(f"  [dim]{note}[/dim]")
         extractor = LookerContentExtractor(client=looker_client)
 
         # Test connection first
@@ -197,10 +323,13 @@ def run(
             output_mode=output,
             folder_ids=parsed_folder_ids,
             recursive_folders=recursive,
+            field_profile=field_profile,
+            two_phase=two_phase,
         )
 
         # Choose orchestrator based on worker count
-        if workers == 1:
+        # (two-phase extraction is implemented by the parallel orchestrator only)
+        if workers == 1 and not two_phase:
             # Sequential extraction (existing behavior)
             orchestrator = ExtractionOrchestrator(
                 extractor=extractor,
@@ -261,6 +390,12 @@ def run(
                 rpm=rate_limit_per_minute,
                 rps=rate_limit_per_second,
             )
+            parallel_config.adaptive_page_size = adaptive_page_size
+            parallel_config.dynamic_workers = dynamic_workers
+            if max_workers is not None:
+                parallel_config.max_workers = max(max_workers, workers)
+            parallel_config.memory_warning_mb = warning_mb
+            parallel_config.memory_critical_mb = critical_mb
             orchestrator = ParallelOrchestrator(
                 extractor=extractor,
                 repository=repository,
@@ -282,8 +417,64 @@ def run(
         if output != "json":
             console.print("[cyan]Starting extraction...[/cyan]")
 
-        with progress_tracker:
-            result = orchestrator.extract()
+        profiler = AllocationProfiler() if profile_memory else None
+        if profiler is not None:
+            profiler.start()
+        if trace is not None:
+            start_tracing()
+        run_profiler = RunProfiler() if profile else None
+        if run_profiler is not None:
+            run_profiler.start()
+        exporter = None
+        if metrics_port is not None or metrics_textfile is not None:
+            exporter = MetricsExporter(
+                metrics=getattr(orchestrator, "metrics", None),
+                job="extract",
+                rate_limiter=getattr(orchestrator, "rate_limiter", None),
+                repository=repository,
+                port=metrics_port,
+                host=metrics_host,
+                textfile=metrics_textfile,
+            )
+            exporter.start()
+
+        try:
+            with progress_tracker:
+                result = orchestrator.extract()
+        finally:
+            if exporter is not None:
+                exporter.stop()
+            tracer = stop_tracing() if trace is not None else None
+            if tracer is not None:
+                trace_path = tracer.write(trace)
+                message = f"Wrote {len(tracer)} spans to {trace_path}"
+                if tracer.dropped:
+                    message += f" ({tracer.dropped} oldest spans dropped)"
+                if output == "json":
+                    logger.info(message)
+                else:
+                    console.print(f"\n[cyan]{message}[/cyan]")
+            if run_profiler is not None:
+                run_profiler.stop()
+                pstats_path, collapsed_path = run_profiler.write_next_to(db, "extract")
+                message = (
+                    f"Wrote CPU profile ({run_profiler.samples} samples) to {pstats_path} "
+                    f"and {collapsed_path}"
+                )
+                if output == "json":
+                    logger.info(message)
+                else:
+                    console.print(f"\n[cyan]{message}[/cyan]")
+                    for line in run_profiler.top_functions():
+                        console.print(f"  {line}", markup=False, highlight=False)
+            if profiler is not None:
+                report = profiler.stop()
+                if output == "json":
+                    logger.info("Allocation profile:\n" + "\n".join(report))
+                else:
+                    console.print("\n[cyan]Allocation profile (top sites by growth):[/cyan]")
+                    for line in report:
+                        console.print(f"  {line}", markup=False, highlight=False)
 
         # Display summary (if not in JSON mode)
         if output != "json":
@@ -310,6 +501,18 @@ def run(
                 if result.errors > 0:
                     console.print(f"  [yellow]Errors: {result.errors}[/yellow]")
 
+            if result.latency:
+                console.print("\n[cyan]Latency (p50 / p95 / p99):[/cyan]")
+                latencies = {
+                    **result.latency,
+                    **{f"api {name}": s for name, s in result.endpoint_latency.items()},
+                }
+                for name, summary in latencies.items():
+                    console.print(
+                        f"  {name}: {summary['p50_ms']:.1f} / {summary['p95_ms']:.1f} / "
+                        f"{summary['p99_ms']:.1f} ms ({summary['count']:.0f} samples)"
+                    )
+
             # Show incremental stats if available
             if incremental and (result.new_items or result.updated_items or result.deleted_items):
                 console.print("\n[cyan]Incremental summary:[/cyan]")
@@ -0,0 +1,216 @@
+"""Perf command implementation for run history and regression detection."""
+
+import logging
+from pathlib import Path
+from typing import Any
+
+import typer
+from rich.table import Table
+
+from lookervault.cli.output import format_json
+from lookervault.cli.rich_logging import configure_rich_logging, console, print_error
+from lookervault.extraction.perf_history import (
+    DEFAULT_MIN_BASELINE_RUNS,
+    DEFAULT_REGRESSION_THRESHOLD,
+    DEFAULT_WINDOW_DAYS,
+    RunComparison,
+    compare_runs,
+)
+from lookervault.storage.models import ContentType, RunTelemetry
+from lookervault.storage.repository import SQLiteContentRepository
+
+logger = logging.getLogger(__name__)
+
+# Exit codes
+EXIT_SUCCESS = 0
+EXIT_GENERAL_ERROR = 1
+EXIT_NOT_FOUND = 2
+EXIT_REGRESSION = 3
+
+OPERATIONS = ("extract", "restore")
+
+# Rows read per operation to build baselines from
+HISTORY_ROWS = 1000
+
+
+def _run_to_dict(run: RunTelemetry) -> dict[str, Any]:
+    return {
+        "id": run.id,
+        "operation": run.operation,
+        "instance": run.instance,
+        "session_id": run.session_id,
+        "recorded_at": run.recorded_at.isoformat(),
+        "workers": run.workers,
+        "duration_seconds": round(run.duration_seconds, 3),
+        "total_items": run.total_items,
+        "items_per_second": round(run.items_per_second, 3),
+        "items_per_second_by_type": {
+            ContentType(ct).name.lower(): round(rate, 3)
+            for ct, rate in run.items_per_second_by_type().items()
+        },
+        "api_calls": run.api_calls,
+        "bytes_transferred": run.bytes_transferred,
+        "rate_limit_429s": run.rate_limit_429s,
+        "rate_limit_wait_seconds": round(run.rate_limit_wait_seconds, 3),
+        "peak_rss_bytes": run.peak_rss_bytes,
+        "error_count": run.error_count,
+    }
+
+
+def _format_bytes(value: int) -> str:
+    return f"{value / (1024 * 1024):.1f} MB" if value else "-"
+
+
+def _print_history(
+    runs: list[RunTelemetry], comparisons: list[RunComparison], window_days: int
+) -> None:
+    table = Table(title="Recent Runs")
+    table.add_column("Recorded")
+    table.add_column("Operation", style="cyan")
+    table.add_column("Types")
+    table.add_column("Workers", justify="right")
+    table.add_column("Duration", justify="right")
+    table.add_column("Items", justify="right")
+    table.add_column("Items/s", justify="right")
+    table.add_column("Transferred", justify="right")
+    table.add_column("API Calls", justify="right")
+    table.add_column("RL Wait", justify="right")
+    table.add_column("Peak RSS", justify="right")
+
+    for run in runs:
+        types = ", ".join(ContentType(ct).name.lower() for ct in sorted(run.items_by_type))
+        table.add_row(
+            run.recorded_at.strftime("%Y-%m-%d %H:%M"),
+            run.operation,
+            types or "-",
+            str(run.workers),
+            f"{run.duration_seconds:.1f}s",
+            str(run.total_items),
+            f"{run.items_per_second:.1f}",
+            _format_bytes(run.bytes_transferred),
+            str(run.api_calls),
+            f"{run.rate_limit_wait_seconds:.1f}s",
+            _format_bytes(run.peak_rss_bytes),
+        )
+    console.print(table)
+
+    for comparison in comparisons:
+        run = comparison.run
+        label = f"{run.operation} {run.recorded_at.strftime('%Y-%m-%d %H:%M')}"
+        if not comparison.metrics:
+            console.print(
+                f"[dim]{label}: {comparison.baseline_runs} runs in the last {window_days} days, "
+                f"not enough for a baseline[/dim]"
+            )
+        elif comparison.regressions:
+            console.print(f"[red]✗ {label}: performance regressed[/red]")
+            for metric in comparison.regressions:
+                console.print(f"  [red]{metric.describe()}[/red]")
+        else:
+            console.print(
+                f"[green]✓ {label}: within threshold of the {window_days}-day median "
+                f"({comparison.baseline_runs} runs)[/green]"
+            )
+
+
+def history(
+    db_path: str = "looker.db",
+    operation: str | None = None,
+    instance: str | None = None,
+    days: int = DEFAULT_WINDOW_DAYS,
+    threshold: float = DEFAULT_REGRESSION_THRESHOLD * 100,
+    min_runs: int = DEFAULT_MIN_BASELINE_RUNS,
+    limit: int = 10,
+    json_output: bool = False,
+    fail_on_regression: bool = False,
+    verbose: bool = False,
+    debug: bool = False,
+) -> None:
+    """Show recorded run performance and flag regressions.
+
+    Compares the latest run of every workload (operation, instance and set of
+    content types) against the median of its runs over the previous days.
+
+    Args:
+        db_path: Path to SQLite backup database
+        operation: Only "extract" or "restore" runs (None = both)
+        instance: Only runs against this Looker instance URL (None = any)
+        days: Baseline window in days
+        threshold: Percent change in the bad direction that counts as a regression
+        min_runs: Fewest baseline runs needed to compare a workload
+        limit: Number of recent runs listed
+        json_output: Output results in JSON format
+        fail_on_regression: Exit with EXIT_REGRESSION if any regression is found
+        verbose: Enable verbose logging
+        debug: Enable debug logging
+
+    Exit codes:
+        0: Success (no regressions, or --fail-on-regression not set)
+        1: General error
+        2: Database not found
+        3: Regression found with --fail-on-regression
+    """
+    log_level = logging.DEBUG if debug else (logging.INFO if verbose else logging.WARNING)
+    configure_rich_logging(level=log_level, show_time=debug, show_path=debug)
+
+    if operation is not None and operation not in OPERATIONS:
+        print_error(f"Invalid operation '{operation}'. Choose from: {', '.join(OPERATIONS)}")
+        raise typer.Exit(EXIT_GENERAL_ERROR)
+
+    if not Path(db_path).exists():
+        if json_output:
+            print(
+                format_json(
+                    {
+                        "status": "error",
+                        "error_type": "NotFoundError",
+                        "error_message": f"Database not found: {db_path}",
+                    }
+                )
+            )
+        else:
+            print_error(f"Database not found: {db_path}")
+        raise typer.Exit(EXIT_NOT_FOUND)
+
+    try:
+        repository = SQLiteContentRepository(db_path=db_path)
+        try:
+            runs: list[RunTelemetry] = []
+            for op in (operation,) if operation else OPERATIONS:
+                runs.extend(repository.list_run_telemetry(op, instance, limit=HISTORY_ROWS))
+        finally:
+            repository.close()
+    except Exception as e:
+        if not json_output:
+            print_error(f"Failed to read run history: {e}")
+        logger.exception("Failed to read run history")
+        raise typer.Exit(EXIT_GENERAL_ERROR) from None
+
+    runs.sort(key=lambda run: (run.recorded_at, run.id or 0), reverse=True)
+    comparisons = compare_runs(runs, days, threshold / 100, min_runs)
+    regressions = [
+        f"{comparison.run.operation}: {metric.describe()}"
+        for comparison in comparisons
+        for metric in comparison.regressions
+    ]
+
+    if json_output:
+        print(
+            format_json(
+                {
+                    "window_days": days,
+                    "threshold_percent": threshold,
+                    "runs": [_run_to_dict(run) for run in runs[:limit]],
+                    "comparisons": [comparison.to_dict() for comparison in comparisons],
+                    "regressions": regressions,
+                }
+            )
+        )
+    elif not runs:
+        console.print("[yellow]No run history recorded yet[/yellow]")
+        console.print("Run 'lookervault extract' or 'lookervault restore all' first")
+    else:
+        _print_history(runs[:limit], comparisons, days)
+
+    if regressions and fail_on_regression:
+        raise typer.Exit(EXIT_REGRESSION)
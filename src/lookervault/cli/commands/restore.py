@@ -25,7 +25,7 @@ from rich.table import Table
 from lookervault.cli.rich_logging import configure_rich_logging, console, print_error
 from lookervault.cli.types import parse_content_type
 from lookervault.config.loader import get_db_path, load_config
-from lookervault.config.models import RestorationConfig
+from lookervault.config.models import RestorationConfig, RestoreDefaults
 from lookervault.exceptions import (
     ConfigError,
     DeserializationError,
@@ -70,6 +70,8 @@ def restore_single(
     debug: bool = False,
     folder_ids: str | None = None,
     recursive: bool = False,
+    skip_unchanged: bool = False,
+    recheck_destination: bool = False,
 ) -> None:
     """Restore a single content item by type and ID.
 
@@ -86,6 +88,10 @@ def restore_single(
         debug: Enable debug logging
         folder_ids: Comma-separated folder IDs to filter restoration (only dashboard, look, board, folder)
         recursive: Include subfolders when using folder_ids
+        skip_unchanged: Skip items whose destination copy already matches the backup
+            (items that matched on a previous run are skipped from a local cache)
+        recheck_destination: With skip_unchanged, compare against the live destination
+            instead of trusting fingerprints cached by previous runs
 
     Environment Variables:
         LOOKERVAULT_DB_PATH: Default database path
@@ -342,6 +348,9 @@ def restore_single(
             client=looker_client,
             repository=repository,
             rate_limiter=rate_limiter,
+            subresource_concurrency=cfg.restore.subresource_concurrency,
+            skip_unchanged=skip_unchanged or cfg.restore.skip_unchanged,
+            recheck_destination=recheck_destination,
         )
 
         # Display start message (human-readable mode)
@@ -385,8 +394,9 @@ def restore_single(
         if not json_output:
             console.print("Deserializing content...", end="")
 
-        content_dict = deserializer.deserialize(
-            content_item.content_data, content_type_enum, as_dict=True
+        # Schema validation happens while decoding; errors are reported in step 3
+        content_dict, validation_errors = deserializer.deserialize_writable(
+            content_item.content_data, content_type_enum
         )
 
         if not json_output:
@@ -396,7 +406,6 @@ def restore_single(
         if not json_output:
             console.print("Validating content schema...", end="")
 
-        validation_errors = deserializer.validate_schema(content_dict, content_type_enum)
         if validation_errors:
             if not json_output:
                 console.print(" [red]✗[/red]")
@@ -539,7 +548,7 @@ def restore_single(
         result = restorer.restore_single(content_id, content_type_enum, dry_run=False)
 
         # Check result and display appropriate output
-        if result.status in ["created", "updated"]:
+        if result.status in ["created", "updated", "skipped"]:
             # Success!
             if not json_output:
                 console.print(" [green]✓[/green]")
@@ -872,6 +881,8 @@ def restore_bulk(
             client=looker_client,
             repository=repository,
             rate_limiter=rate_limiter,
+            subresource_concurrency=cfg.restore.subresource_concurrency,
+            skip_unchanged=cfg.restore.skip_unchanged,
         )
 
         # Create RestorationConfig
@@ -1159,13 +1170,22 @@ def restore_resume(
                 )
             raise typer.Exit(EXIT_VALIDATION_ERROR)
         content_type_name = content_type_enum.name.lower()
-        completed_ids = checkpoint.checkpoint_data.get("completed_ids", [])
+        # Legacy checkpoints carry completed_ids; newer runs record per-item progress
+        completed_ids = checkpoint.checkpoint_data.get("completed_ids")
+        if completed_ids is not None:
+            previously_completed = len(completed_ids)
+        elif checkpoint.session_id:
+            previously_completed = repository.count_restoration_progress(
+                checkpoint.session_id, content_type_int
+            )
+        else:
+            previously_completed = checkpoint.item_count
 
         if not json_output:
             console.print("\n[bold]Resuming restoration from checkpoint...[/bold]")
             console.print(f"  Session ID: [cyan]{checkpoint.session_id}[/cyan]")
             console.print(f"  Content Type: [cyan]{content_type_name.title()}[/cyan]")
-            console.print(f"  Already completed: [cyan]{len(completed_ids)} items[/cyan]\n")
+            console.print(f"  Already completed: [cyan]{previously_completed} items[/cyan]\n")
             if workers > 1:
                 console.print(
                     f"[dim]Using {workers} worker threads for parallel restoration[/dim]\n"
@@ -1189,6 +1209,8 @@ def restore_resume(
             client=looker_client,
             repository=repository,
             rate_limiter=rate_limiter,
+            subresource_concurrency=cfg.restore.subresource_concurrency,
+            skip_unchanged=cfg.restore.skip_unchanged,
         )
 
         # Create RestorationConfig
@@ -1257,7 +1279,7 @@ def restore_resume(
                 "session_id": checkpoint.session_id,
                 "content_type": content_type_name,
                 "resumed_from_checkpoint": True,
-                "previously_completed": len(completed_ids),
+                "previously_completed": previously_completed,
                 "summary": {
                     "total_items": summary.total_items,
                     "success_count": summary.success_count,
@@ -1567,6 +1589,8 @@ def restore_dlq_retry(
             client=looker_client,
             repository=repository,
             rate_limiter=rate_limiter,
+            subresource_concurrency=cfg.restore.subresource_concurrency,
+            skip_unchanged=cfg.restore.skip_unchanged,
         )
 
         # Display start message
@@ -1590,7 +1614,7 @@ def restore_dlq_retry(
             raise typer.Exit(EXIT_NOT_FOUND) from e
 
         # Check result
-        if result.status in ["created", "updated"]:
+        if result.status in ["created", "updated", "skipped"]:
             if not json_output:
                 console.print(
                     f"[bold green]✓ Retry successful! ({result.status.upper()})[/bold green]"
@@ -1637,6 +1661,146 @@ def restore_dlq_retry(
         raise typer.Exit(EXIT_GENERAL_ERROR) from None
 
 
+def restore_dlq_replay(
+    session_id: str | None = None,
+    content_type: str | None = None,
+    error_types: list[str] | None = None,
+    workers: int | None = None,
+    config: Path | None = None,
+    db_path: str = "looker.db",
+    json_output: bool = False,
+    verbose: bool = False,
+    debug: bool = False,
+) -> None:
+    """Replay all matching DLQ entries in parallel.
+
+    Args:
+        session_id: Optional session ID filter
+        content_type: Optional content type filter
+        error_types: Optional error type filter (e.g. ["RateLimitError"])
+        workers: Number of concurrent replays (default: restore.workers from config)
+        config: Optional path to config file
+        db_path: Path to SQLite backup database
+        json_output: Output results in JSON format
+        verbose: Enable verbose logging
+        debug: Enable debug logging
+
+    Exit codes:
+        0: All replayed entries recovered (or nothing to replay)
+        1: Some entries still failing, or replay stopped early
+        3: Validation error (missing credentials, bad config)
+    """
+    # Configure logging
+    log_level = logging.DEBUG if debug else (logging.INFO if verbose else logging.WARNING)
+    configure_rich_logging(
+        level=log_level,
+        show_time=debug,
+        show_path=debug,
+        enable_link_path=debug,
+    )
+
+    try:
+        # Load configuration
+        cfg = load_config(config)
+
+        # Validate credentials
+        if not cfg.looker.client_id or not cfg.looker.client_secret:
+            if not json_output:
+                console.print("[red]✗ Missing credentials[/red]")
+                console.print(
+                    "Set LOOKERVAULT_CLIENT_ID and LOOKERVAULT_CLIENT_SECRET environment variables"
+                )
+            raise typer.Exit(EXIT_VALIDATION_ERROR)
+
+        content_type_enum = None
+        if content_type:
+            content_type_enum = ContentType(parse_content_type(content_type))
+
+        final_workers = workers if workers is not None else cfg.restore.workers
+
+        # Create components
+        repository = SQLiteContentRepository(db_path=db_path)
+        dlq = DeadLetterQueue(repository)
+
+        looker_client = LookerClient(
+            api_url=str(cfg.looker.api_url),
+            client_id=cfg.looker.client_id,
+            client_secret=cfg.looker.client_secret,
+            timeout=cfg.looker.timeout,
+            verify_ssl=cfg.looker.verify_ssl,
+        )
+
+        # One limiter shared by every replay worker
+        rate_limiter = AdaptiveRateLimiter(
+            requests_per_minute=cfg.restore.rate_limit_per_minute,
+            requests_per_second=cfg.restore.rate_limit_per_second,
+        )
+
+        restorer = LookerContentRestorer(
+            client=looker_client,
+            repository=repository,
+            rate_limiter=rate_limiter,
+            subresource_concurrency=cfg.restore.subresource_concurrency,
+            skip_unchanged=cfg.restore.skip_unchanged,
+        )
+
+        if not json_output:
+            console.print(f"\nReplaying DLQ entries with [cyan]{final_workers}[/cyan] workers...")
+
+        summary = dlq.replay(
+            restorer,
+            session_id=session_id,
+            content_type=content_type_enum,
+            error_types=error_types or None,
+            workers=final_workers,
+        )
+        repository.close()
+
+        if json_output:
+            output = {
+                "status": "success" if summary.failed == 0 and not summary.aborted else "error",
+                "attempted": summary.attempted,
+                "succeeded": summary.succeeded,
+                "failed": summary.failed,
+                "skipped": summary.skipped,
+                "aborted": summary.aborted,
+                "abort_reason": summary.abort_reason,
+                "error_breakdown": summary.error_breakdown,
+                "duration_seconds": round(summary.duration_seconds, 2),
+            }
+            console.print(json_module.dumps(output, indent=2))
+        else:
+            console.print(f"  Recovered: [green]{summary.succeeded}[/green] / {summary.attempted}")
+            if summary.failed:
+                console.print(f"  Still failing: [red]{summary.failed}[/red]")
+                for error_type, count in sorted(summary.error_breakdown.items()):
+                    console.print(f"    {error_type}: {count}")
+            if summary.skipped:
+                console.print(f"  Skipped (non-retryable): [yellow]{summary.skipped}[/yellow]")
+            if summary.aborted:
+                console.print(
+                    f"[bold red]✗ Replay stopped early: {summary.abort_reason}[/bold red]"
+                )
+            console.print(f"  Duration: [cyan]{summary.duration_seconds:.1f}s[/cyan]")
+
+        if summary.failed or summary.aborted:
+            raise typer.Exit(EXIT_GENERAL_ERROR)
+        raise typer.Exit(EXIT_SUCCESS)
+
+    except typer.Exit:
+        raise
+    except ConfigError as e:
+        if not json_output:
+            print_error(f"Configuration error: {e}")
+        logger.error(f"Configuration error: {e}")
+        raise typer.Exit(EXIT_VALIDATION_ERROR) from None
+    except Exception as e:
+        if not json_output:
+            print_error(f"Unexpected error: {e}")
+        logger.exception("Unexpected error replaying DLQ entries")
+        raise typer.Exit(EXIT_GENERAL_ERROR) from None
+
+
 def restore_dlq_clear(
     session_id: str | None = None,
     content_type: str | None = None,
@@ -1759,6 +1923,309 @@ def restore_dlq_clear(
         raise typer.Exit(EXIT_GENERAL_ERROR) from None
 
 
+def restore_validate(
+    content_types: list[str] | None = None,
+    workers: int | None = None,
+    check_dependencies: bool = True,
+    db_path: str | None = None,
+    json_output: bool = False,
+    verbose: bool = False,
+    debug: bool = False,
+) -> None:
+    """Validate backup content for restoration across a process pool.
+
+    Runs offline: no credentials or API calls are needed. Dependencies are
+    checked against the content IDs present in the backup.
+
+    Args:
+        content_types: Content types to validate (default: all, in dependency order)
+        workers: Worker processes (default: CPU count)
+        check_dependencies: Check foreign keys against the backup's content IDs
+        db_path: Path to SQLite backup database (default: LOOKERVAULT_DB_PATH or "looker.db")
+        json_output: Output results in JSON format
+        verbose: Enable verbose logging
+        debug: Enable debug logging
+
+    Exit codes:
+        0: All content valid
+        1: General error
+        3: Validation errors found
+    """
+    from lookervault.restoration.dependency_graph import DependencyGraph
+    from lookervault.restoration.preflight import PreflightValidator
+
+    # Configure logging
+    log_level = logging.DEBUG if debug else (logging.INFO if verbose else logging.WARNING)
+    configure_rich_logging(
+        level=log_level,
+        show_time=debug,
+        show_path=debug,
+        enable_link_path=debug,
+    )
+
+    try:
+        requested_types = (
+            [ContentType(parse_content_type(ct)) for ct in content_types] if content_types else None
+        )
+        ordered_types = DependencyGraph().get_restoration_order(requested_types)
+
+        repository = SQLiteContentRepository(db_path=get_db_path(db_path))
+        validator = PreflightValidator(
+            repository, workers=workers, check_dependencies=check_dependencies
+        )
+
+        if not json_output:
+            console.print(
+                f"Validating {len(ordered_types)} content types with "
+                f"[cyan]{validator.workers}[/cyan] worker processes..."
+            )
+
+        report = validator.run(ordered_types)
+        repository.close()
+
+        if json_output:
+            output = {
+                "status": "success" if report.passed else "error",
+                "checked": report.total_checked,
+                "failed": report.total_failed,
+                "workers": report.workers,
+                "duration_seconds": round(report.duration_seconds, 2),
+                "content_types": {
+                    name: {
+                        "checked": stats.checked,
+                        "failed": stats.failed,
+                        "error_counts": stats.error_counts,
+                        "samples": [
+                            {"content_id": content_id, "errors": errors}
+                            for content_id, errors in stats.samples
+                        ],
+                    }
+                    for name, stats in report.types.items()
+                },
+            }
+            console.print(json_module.dumps(output, indent=2))
+        else:
+            table = Table(title="Pre-flight Validation")
+            table.add_column("Content Type", style="cyan")
+            table.add_column("Checked", justify="right")
+            table.add_column("Failed", justify="right", style="red")
+            table.add_column("Errors")
+            for name, stats in report.types.items():
+                top_errors = sorted(stats.error_counts.items(), key=lambda kv: -kv[1])[:3]
+                table.add_row(
+                    name,
+                    str(stats.checked),
+                    str(stats.failed),
+                    "\n".join(f"{error} ({count})" for error, count in top_errors),
+                )
+            console.print(table)
+
+            if verbose:
+                for name, stats in report.types.items():
+                    for content_id, errors in stats.samples:
+                        console.print(f"  {name} {content_id}: {'; '.join(errors)}")
+
+            status = (
+                "[bold green]✓ All content valid[/bold green]"
+                if report.passed
+                else f"[bold red]✗ {report.total_failed} invalid items[/bold red]"
+            )
+            console.print(
+                f"{status} ({report.total_checked} checked in {report.duration_seconds:.1f}s)"
+            )
+
+        raise typer.Exit(EXIT_SUCCESS if report.passed else EXIT_VALIDATION_ERROR)
+
+    except typer.Exit:
+        raise
+    except ValueError as e:
+        if not json_output:
+            print_error(f"Invalid content type: {e}")
+        raise typer.Exit(EXIT_VALIDATION_ERROR) from None
+    except Exception as e:
+        if not json_output:
+            print_error(f"Unexpected error: {e}")
+        logger.exception("Unexpected error during pre-flight validation")
+        raise typer.Exit(EXIT_GENERAL_ERROR) from None
+
+
+def restore_plan(
+    content_types: list[str] | None = None,
+    workers: int | None = None,
+    rate_limit_per_minute: int | None = None,
+    rate_limit_per_second: int | None = None,
+    config: Path | None = None,
+    db_path: str | None = None,
+    json_output: bool = False,
+    verbose: bool = False,
+    debug: bool = False,
+) -> None:
+    """Preview a restore's execution plan, API call count and ETA without calling Looker.
+
+    Rate limits and workers default to the config file's restore settings. The
+    config is optional: without Looker credentials the built-in defaults are
+    used and latency history from every destination is considered.
+
+    Args:
+        content_types: Content types to plan (default: all, in dependency order)
+        workers: Worker count to estimate the ETA for (default: config file or 8)
+        rate_limit_per_minute: API rate limit per minute (default: config file or 120)
+        rate_limit_per_second: Burst rate limit per second (default: config file or 10)
+        config: Optional path to config file
+        db_path: Path to SQLite backup database (default: LOOKERVAULT_DB_PATH or "looker.db")
+        json_output: Output results in JSON format
+        verbose: Enable verbose logging
+        debug: Enable debug logging
+
+    Exit codes:
+        0: Plan built
+        1: General error
+        3: Invalid content type
+    """
+    from lookervault.cli.commands.restore_all import format_duration
+    from lookervault.restoration.dependency_graph import DependencyGraph
+    from lookervault.restoration.planner import RestorePlanner
+
+    # Configure logging
+    log_level = logging.DEBUG if debug else (logging.INFO if verbose else logging.WARNING)
+    configure_rich_logging(
+        level=log_level,
+        show_time=debug,
+        show_path=debug,
+        enable_link_path=debug,
+    )
+
+    try:
+        requested_types = (
+            [ContentType(parse_content_type(ct)) for ct in content_types] if content_types else None
+        )
+        ordered_types = DependencyGraph().get_restoration_order(requested_types)
+
+        # Planning is offline, so a config without credentials is not an error
+        destination: str | None
+        try:
+            cfg = load_config(config)
+            defaults = cfg.restore
+            destination = str(cfg.looker.api_url)
+        except ConfigError as e:
+            logger.debug(f"Using default restore settings: {e}")
+            defaults = RestoreDefaults()
+            destination = None
+
+        final_workers = workers if workers is not None else defaults.workers
+        planner = RestorePlanner(
+            SQLiteContentRepository(db_path=get_db_path(db_path)),
+            rate_limit_per_minute=(
+                rate_limit_per_minute
+                if rate_limit_per_minute is not None
+                else defaults.rate_limit_per_minute
+            ),
+            rate_limit_per_second=(
+                rate_limit_per_second
+                if rate_limit_per_second is not None
+                else defaults.rate_limit_per_second
+            ),
+            destination=destination,
+        )
+        plan = planner.build(ordered_types)
+        planner.repository.close()
+
+        worker_options = sorted({1, 2, 4, 8, 16, 32, final_workers})
+        recommended = plan.recommended_workers()
+
+        if json_output:
+            output = {
+                "workers": final_workers,
+                "calls_per_second": plan.calls_per_second,
+                "total_items": plan.total_items,
+                "total_api_calls": plan.total_api_calls,
+                "estimated_seconds": round(plan.estimate_seconds(final_workers), 1),
+                "recommended_workers": recommended,
+                "estimates_by_workers": {
+                    str(count): round(plan.estimate_seconds(count), 1) for count in worker_options
+                },
+                "steps": [
+                    {
+                        "content_type": step.content_type,
+                        "items": step.items,
+                        "api_calls": step.api_calls,
+                        "subresource_calls": step.subresource_calls,
+                        "item_latency_ms": round(step.item_latency_ms, 1),
+                        "latency_from_history": step.latency_from_history,
+                        "estimated_seconds": round(
+                            step.estimate_seconds(final_workers, plan.calls_per_second), 1
+                        ),
+                    }
+                    for step in plan.types
+                ],
+            }
+            console.print(json_module.dumps(output, indent=2))
+            raise typer.Exit(EXIT_SUCCESS)
+
+        if not plan.types:
+            console.print("[yellow]No content to restore in the backup[/yellow]")
+            raise typer.Exit(EXIT_SUCCESS)
+
+        table = Table(title=f"Restore Plan ({final_workers} workers)")
+        table.add_column("#", justify="right", style="dim")
+        table.add_column("Content Type", style="cyan")
+        table.add_column("Items", justify="right")
+        table.add_column("API Calls", justify="right")
+        table.add_column("Sub-resource Calls", justify="right")
+        table.add_column("Latency/Item", justify="right")
+        table.add_column("ETA", justify="right", style="green")
+        for position, step in enumerate(plan.types, start=1):
+            latency = f"{step.item_latency_ms:.0f}ms"
+            table.add_row(
+                str(position),
+                step.content_type,
+                f"{step.items:,}",
+                f"{step.api_calls:,}",
+                f"{step.subresource_calls:,}",
+                latency if step.latency_from_history else f"~{latency}",
+                format_duration(step.estimate_seconds(final_workers, plan.calls_per_second)),
+            )
+        console.print(table)
+        if not all(step.latency_from_history for step in plan.types):
+            console.print("[dim]~ = no latency history, assumed per-call latency[/dim]")
+
+        console.print(
+            f"\nTotal: [cyan]{plan.total_items:,}[/cyan] items, "
+            f"[cyan]{plan.total_api_calls:,}[/cyan] API calls at "
+            f"{plan.calls_per_second:g} calls/s"
+        )
+        console.print(
+            f"Estimated duration: [bold green]"
+            f"{format_duration(plan.estimate_seconds(final_workers))}[/bold green] "
+            f"with {final_workers} workers"
+        )
+        console.print(
+            "By workers: "
+            + ", ".join(
+                f"{count}: {format_duration(plan.estimate_seconds(count))}"
+                for count in worker_options
+            )
+        )
+        console.print(
+            f"Recommended workers: [bold]{recommended}[/bold] "
+            "(more workers would not beat the rate limit)"
+        )
+
+        raise typer.Exit(EXIT_SUCCESS)
+
+    except typer.Exit:
+        raise
+    except ValueError as e:
+        if not json_output:
+            print_error(f"Invalid content type: {e}")
+        raise typer.Exit(EXIT_VALIDATION_ERROR) from None
+    except Exception as e:
+        if not json_output:
+            print_error(f"Unexpected error: {e}")
+        logger.exception("Unexpected error during restore planning")
+        raise typer.Exit(EXIT_GENERAL_ERROR) from None
+
+
 def restore_status(
     session_id: str | None = None,
     all_sessions: bool = False,
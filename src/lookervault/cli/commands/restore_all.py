@@ -23,16 +23,22 @@ from lookervault.exceptions import (
     ValidationError,
 )
 from lookervault.extraction.metrics import ThreadSafeMetrics
+from lookervault.extraction.metrics_exporter import DEFAULT_METRICS_HOST, MetricsExporter
+from lookervault.extraction.performance import AutoTuner
 from lookervault.extraction.rate_limiter import AdaptiveRateLimiter
 from lookervault.looker.client import LookerClient
 from lookervault.restoration.dependency_graph import DependencyGraph
+from lookervault.restoration.id_mapping_cache import IDMappingCache
 from lookervault.restoration.parallel_orchestrator import (
     ParallelRestorationOrchestrator,
     SupportsDeadLetterQueue,
 )
+from lookervault.restoration.reference_translation import ReferenceTranslator
 from lookervault.restoration.restorer import LookerContentRestorer
 from lookervault.storage.models import ContentType
 from lookervault.storage.repository import SQLiteContentRepository
+from lookervault.utils.profiling import RunProfiler
+from lookervault.utils.tracing import start_tracing, stop_tracing
 
 logger = logging.getLogger(__name__)
 
@@ -120,6 +126,47 @@ def output_error_message(
             console.print(f"\nTroubleshooting:\n  {troubleshooting}")
 
 
+def write_trace(trace: Path, json_output: bool, quiet: bool) -> None:
+    """Stop span tracing and write the recorded spans to trace.
+
+    Args:
+        trace: Output path (Chrome trace JSON, or JSONL for a .jsonl suffix)
+        json_output: Whether output is in JSON format
+        quiet: Whether quiet mode is enabled
+    """
+    tracer = stop_tracing()
+    if tracer is None:
+        return
+    trace_path = tracer.write(trace)
+    message = f"Wrote {len(tracer)} spans to {trace_path}"
+    if tracer.dropped:
+        message += f" ({tracer.dropped} oldest spans dropped)"
+    logger.info(message)
+    if should_show_progress(json_output, quiet):
+        console.print(f"\n[cyan]{message}[/cyan]")
+
+
+def write_profile(profiler: RunProfiler, db_path: Path, json_output: bool, quiet: bool) -> None:
+    """Stop CPU profiling and write pstats and collapsed-stack files beside db_path.
+
+    Args:
+        profiler: Running profiler
+        db_path: Database the run used
+        json_output: Whether output is in JSON format
+        quiet: Whether quiet mode is enabled
+    """
+    profiler.stop()
+    pstats_path, collapsed_path = profiler.write_next_to(db_path, "restore")
+    message = (
+        f"Wrote CPU profile ({profiler.samples} samples) to {pstats_path} and {collapsed_path}"
+    )
+    logger.info(message)
+    if should_show_progress(json_output, quiet):
+        console.print(f"\n[cyan]{message}[/cyan]")
+        for line in profiler.top_functions():
+            console.print(f"  {line}", markup=False, highlight=False)
+
+
 def calculate_success_rate(success_count: int, total_count: int) -> float:
     """Calculate success rate as a percentage.
 
@@ -226,6 +273,17 @@ def restore_all(
     debug: bool = False,
     folder_ids: str | None = None,
     recursive: bool = False,
+    skip_unchanged: bool = False,
+    trace: Path | None = None,
+    metrics_port: int | None = None,
+    metrics_host: str = DEFAULT_METRICS_HOST,
+    metrics_textfile: Path | None = None,
+    auto_tune: bool = False,
+    dynamic_workers: bool = False,
+    max_workers: int | None = None,
+    profile: bool = False,
+    source_instance: str | None = None,
+    recheck_destination: bool = False,
 ) -> None:
     """Restore all content types in dependency order.
 
@@ -248,6 +306,22 @@ def restore_all(
         debug: Enable debug logging
         folder_ids: Comma-separated folder IDs to filter restoration (only dashboard, look, board, folder)
         recursive: Include subfolders when using folder_ids
+        skip_unchanged: Skip items whose destination copy already matches the backup
+            (items that matched on a previous run are skipped from a local cache)
+        trace: Write a span trace of the restoration to this path (Chrome trace JSON or .jsonl)
+        metrics_port: Serve live Prometheus metrics on this port
+        metrics_host: Interface the metrics port binds to (default: loopback only)
+        metrics_textfile: Rewrite this node-exporter textfile with live Prometheus metrics
+        auto_tune: Choose workers and rate limits not given explicitly from the telemetry
+            of previous runs
+        dynamic_workers: Grow or shrink the active worker count during the run
+        max_workers: Upper bound for dynamic worker scaling (default: twice workers, max 32)
+        profile: Sample every thread's stack and write a merged pstats profile and
+            collapsed-stack flamegraph file next to the database
+        source_instance: Source Looker instance URL of the backup; enables ID mapping
+            and reference translation for cross-instance restores
+        recheck_destination: With skip_unchanged, compare every item against the live
+            destination instead of trusting fingerprints cached by previous runs
 
     Environment Variables:
         LOOKERVAULT_DB_PATH: Default database path
@@ -265,6 +339,8 @@ def restore_all(
     # Handle snapshot download if --from-snapshot provided
     temp_snapshot_path = None
     snapshot_metadata = None
+    exporter: MetricsExporter | None = None
+    run_profiler: RunProfiler | None = None
 
     if from_snapshot:
         try:
@@ -482,17 +558,55 @@ def restore_all(
                         f"{', '.join(t.name.lower() for t in folder_filterable_types)}[/dim]"
                     )
 
+        if auto_tune:
+            decision = AutoTuner.from_repository(
+                repository, "restore", str(cfg.looker.api_url)
+            ).recommend(
+                workers=final_workers,
+                batch_size=None,
+                rate_limit_per_minute=final_rate_limit_per_minute,
+                rate_limit_per_second=final_rate_limit_per_second,
+            )
+            if workers is None:
+                final_workers = decision.workers
+            if rate_limit_per_minute is None:
+                final_rate_limit_per_minute = decision.rate_limit_per_minute
+            if rate_limit_per_second is None:
+                final_rate_limit_per_second = decision.rate_limit_per_second
+            summary = (
+                f"Auto-tune ({decision.runs_considered} previous runs): {final_workers} workers, "
+                f"{final_rate_limit_per_minute} req/min, {final_rate_limit_per_second} req/sec"
+            )
+            logger.info(summary + "; " + "; ".join(decision.notes))
+            if should_show_progress(json_output, quiet):
+                console.print(f"[cyan]{summary}[/cyan]")
+                for note in decision.notes:
+                    console.print(f"  [dim]{note}[/dim]")
+
         # Create rate limiter
         rate_limiter = AdaptiveRateLimiter(
             requests_per_minute=final_rate_limit_per_minute,
             requests_per_second=final_rate_limit_per_second,
         )
 
+        # Cross-instance restores map source IDs to destination IDs: mappings are
+        # cached in memory, persisted write-behind and used to rewrite references
+        session_id = str(uuid.uuid4())
+        id_mapper = (
+            ReferenceTranslator(IDMappingCache(repository, source_instance, session_id))
+            if source_instance
+            else None
+        )
+
         # Create restorer
         restorer = LookerContentRestorer(
             client=looker_client,
             repository=repository,
             rate_limiter=rate_limiter,
+            id_mapper=id_mapper,
+            subresource_concurrency=cfg.restore.subresource_concurrency,
+            skip_unchanged=skip_unchanged or cfg.restore.skip_unchanged,
+            recheck_destination=recheck_destination,
         )
 
         # Step 1: Use DependencyGraph to get restoration order
@@ -555,7 +669,6 @@ def restore_all(
                 )
 
         # Step 2: Create RestorationConfig
-        session_id = str(uuid.uuid4())
         restoration_config = RestorationConfig(
             workers=final_workers,
             rate_limit_per_minute=final_rate_limit_per_minute,
@@ -565,16 +678,36 @@ def restore_all(
             dry_run=dry_run,
             folder_ids=parsed_folder_ids,
             destination_instance=str(cfg.looker.api_url),
+            dynamic_workers=dynamic_workers,
+            max_workers=max(max_workers, final_workers) if max_workers is not None else None,
         )
 
         # Add session_id to config (if not already present)
         if not hasattr(restoration_config, "session_id"):
             restoration_config.session_id = session_id  # type: ignore
 
+        if trace is not None:
+            start_tracing()
+        if profile:
+            run_profiler = RunProfiler()
+            run_profiler.start()
+        metrics = ThreadSafeMetrics()
+        if metrics_port is not None or metrics_textfile is not None:
+            exporter = MetricsExporter(
+                # Sequential restores don't report per-item metrics
+                metrics=metrics if final_workers > 1 else None,
+                job="restore",
+                rate_limiter=rate_limiter,
+                repository=repository,
+                port=metrics_port,
+                host=metrics_host,
+                textfile=metrics_textfile,
+            )
+            exporter.start()
+
         # Step 3: Choose parallel or sequential restoration based on worker count
         if final_workers > 1:
             # Use parallel orchestrator for restore_all
-            metrics = ThreadSafeMetrics()
 
             # Create orchestrator
             # Note: repository implements DeadLetterQueue Protocol (save_dead_letter_item)
@@ -587,6 +720,7 @@ def restore_all(
                 dlq=cast(
                     SupportsDeadLetterQueue, repository
                 ),  # Repository implements the DLQ Protocol
+                id_mapper=id_mapper,
             )
 
             # Call orchestrator.restore_all() with the ordered types
@@ -823,3 +957,14 @@ def restore_all(
         # Cleanup temporary snapshot on unexpected error
         cleanup_snapshot_if_needed(temp_snapshot_path)
         raise typer.Exit(EXIT_GENERAL_ERROR) from None
+    finally:
+        if exporter is not None:
+            exporter.stop()
+        if trace is not None:
+            write_trace(trace, json_output, quiet)
+        if run_profiler is not None:
+            # A downloaded snapshot lives in a temporary directory: profile into the cwd
+            profile_db_path = Path(resolved_db_path)
+            if temp_snapshot_path is not None:
+                profile_db_path = Path(profile_db_path.name)
+            write_profile(run_profiler, profile_db_path, json_output, quiet)
@@ -15,6 +15,7 @@ from lookervault.export.unpacker import ContentUnpacker
 from lookervault.export.yaml_serializer import YamlSerializer
 from lookervault.storage.models import ContentType
 from lookervault.storage.repository import SQLiteContentRepository
+from lookervault.utils.profiling import RunProfiler
 
 
 def validate_content_types(value: str | None) -> list[str]:
@@ -97,6 +98,13 @@ def run(
         bool,
         typer.Option("--debug", help="Enable debug logging"),
     ] = False,
+    profile: Annotated[
+        bool,
+        typer.Option(
+            "--profile",
+            help="Write a CPU profile (pstats + collapsed stacks) next to the database",
+        ),
+    ] = False,
 ) -> None:
     """Unpack Looker content from database to YAML files.
 
@@ -109,6 +117,8 @@ def run(
         json_output: Output results in JSON format
         verbose: Enable verbose logging
         debug: Enable debug logging
+        profile: Sample every thread's stack and write a merged pstats profile and
+            collapsed-stack flamegraph file next to the database
     """
     # Configure rich logging
     log_level = logging.DEBUG if debug else (logging.INFO if verbose else logging.WARNING)
@@ -155,17 +165,27 @@ def run(
                 )
                 raise typer.Exit(code=4)
 
-            result = unpacker.unpack_folder(
-                db_path=db_path_obj,
-                output_dir=output_dir,
-                content_types=parsed_content_types,
-            )
-        else:
-            result = unpacker.unpack_full(
-                db_path=db_path_obj,
-                output_dir=output_dir,
-                content_types=parsed_content_types,
-            )
+        run_profiler = RunProfiler() if profile else None
+        if run_profiler is not None:
+            run_profiler.start()
+        try:
+            if strategy == "folder":
+                result = unpacker.unpack_folder(
+                    db_path=db_path_obj,
+                    output_dir=output_dir,
+                    content_types=parsed_content_types,
+                )
+            else:
+                result = unpacker.unpack_full(
+                    db_path=db_path_obj,
+                    output_dir=output_dir,
+                    content_types=parsed_content_types,
+                )
+        finally:
+            profile_paths = None
+            if run_profiler is not None:
+                run_profiler.stop()
+                profile_paths = run_profiler.write_next_to(db_path_obj, "unpack")
 
         # Output results
         if json_output:
@@ -194,6 +214,12 @@ def run(
                         ),
                     }
 
+            if profile_paths is not None:
+                export_summary["profile"] = {
+                    "pstats": str(profile_paths[0]),
+                    "collapsed": str(profile_paths[1]),
+                }
+
             console.print(export_summary)
         else:
             # Human-readable output
@@ -207,6 +233,14 @@ def run(
             console.print(f"\nTotal: {result['total_items']} items")
             console.print(f"Metadata written to {output_dir}/metadata.json")
 
+            if run_profiler is not None and profile_paths is not None:
+                console.print(
+                    f"\nCPU profile ({run_profiler.samples} samples) written to "
+                    f"{profile_paths[0]} and {profile_paths[1]}"
+                )
+                for line in run_profiler.top_functions():
+                    console.print(f"  {line}", markup=False, highlight=False)
+
         sys.exit(0)
 
     except Exception as e:
@@ -99,9 +99,11 @@ def extract(
         ),
     ] = None,
     batch_size: Annotated[
-        int,
-        typer.Option("--batch-size", "-b", help="Items per batch for memory management"),
-    ] = 100,
+        int | None,
+        typer.Option(
+            "--batch-size", "-b", help="Items per batch for memory management (default: 100)"
+        ),
+    ] = None,
     resume: Annotated[
         bool,
         typer.Option("--resume", help="Resume incomplete extraction"),
@@ -159,6 +161,125 @@ def extract(
             help="Include all subfolders when using --folder-ids",
         ),
     ] = False,
+    field_profile: Annotated[
+        str | None,
+        typer.Option(
+            "--field-profile",
+            help="Field projection profile: 'full' (all fields, default), 'restore-complete' "
+            "(only fields needed for restoration) or 'index' (ids, names, folder, timestamps; "
+            "inventory scans only, not restorable)",
+        ),
+    ] = None,
+    two_phase: Annotated[
+        bool,
+        typer.Option(
+            "--two-phase",
+            help="For dashboards and looks: sweep ids/updated_at first, then fetch full detail "
+            "only for new or changed items and mark removed items as deleted",
+        ),
+    ] = False,
+    adaptive_page_size: Annotated[
+        bool,
+        typer.Option(
+            "--adaptive-page-size",
+            help="Tune page size per content type from observed latency, payload size and "
+            "errors (parallel mode; starts from --batch-size or the last recorded size)",
+        ),
+    ] = False,
+    profile_memory: Annotated[
+        bool,
+        typer.Option(
+            "--profile-memory",
+            help="Trace allocations with tracemalloc and report the top allocation sites "
+            "(slow; for diagnosing memory growth)",
+        ),
+    ] = False,
+    trace: Annotated[
+        Path | None,
+        typer.Option(
+            "--trace",
+            help="Record spans (API calls, DB writes, rate-limit waits) and write them to "
+            "this file: Chrome trace JSON for Perfetto, or JSONL if the name ends in .jsonl",
+        ),
+    ] = None,
+    metrics_port: Annotated[
+        int | None,
+        typer.Option(
+            "--metrics-port",
+            help="Serve live Prometheus metrics on http://HOST:PORT/metrics during the run",
+        ),
+    ] = None,
+    metrics_host: Annotated[
+        str,
+        typer.Option(
+            "--metrics-host",
+            help="Interface --metrics-port binds to (use 0.0.0.0 for scraping from other "
+            "hosts, e.g. a Kubernetes pod)",
+        ),
+    ] = "127.0.0.1",
+    metrics_textfile: Annotated[
+        Path | None,
+        typer.Option(
+            "--metrics-textfile",
+            help="Rewrite this node-exporter textfile (*.prom) with live Prometheus metrics",
+        ),
+    ] = None,
+    auto_tune: Annotated[
+        bool,
+        typer.Option(
+            "--auto-tune",
+            help="Choose workers, batch size and rate limits not given explicitly from the "
+            "recorded performance of previous runs against the same instance",
+        ),
+    ] = False,
+    dynamic_workers: Annotated[
+        bool,
+        typer.Option(
+            "--dynamic-workers",
+            help="Grow or shrink the active worker count during the run from observed "
+            "throughput, 429s and SQLite lock waits",
+        ),
+    ] = False,
+    max_workers: Annotated[
+        int | None,
+        typer.Option(
+            "--max-workers",
+            help="Upper bound for --dynamic-workers (default: twice --workers)",
+        ),
+    ] = None,
+    profile: Annotated[
+        bool,
+        typer.Option(
+            "--profile",
+            help="Sample every thread and write a merged pstats profile and collapsed-stack "
+            "flamegraph file next to the database",
+        ),
+    ] = False,
+    memory_warning_mb: Annotated[
+        float | None,
+        typer.Option(
+            "--memory-warning-mb",
+            min=1,
+            help="Process RSS (MB) above which elevated memory use is logged (default: 500)",
+        ),
+    ] = None,
+    memory_critical_mb: Annotated[
+        float | None,
+        typer.Option(
+            "--memory-critical-mb",
+            min=1,
+            help="Process RSS (MB) above which fetch workers briefly pause while memory "
+            "keeps rising (default: 1000)",
+        ),
+    ] = None,
+    allow_index_overwrite: Annotated[
+        bool,
+        typer.Option(
+            "--allow-index-overwrite",
+            help="Let --field-profile index replace content already stored in --db "
+            "(the replaced items can no longer be restored)",
+        ),
+    ] = False,
 ) -> None:
     """Extract all content from Looker instance to local database."""
     from .commands import extract as extract_module
@@ -178,6 +299,21 @@ def extract(
         debug,
         folder_ids,
         recursive,
+        field_profile,
+        two_phase,
+        adaptive_page_size,
+        profile_memory,
+        trace,
+        metrics_port,
+        metrics_host,
+        metrics_textfile,
+        auto_tune,
+        dynamic_workers,
+        max_workers,
+        profile,
+        memory_warning_mb,
+        memory_critical_mb,
+        allow_index_overwrite,
     )
 
 
@@ -349,6 +485,23 @@ def restore_single_cmd(
             help="Include all subfolders when using --folder-ids",
         ),
     ] = False,
+    skip_unchanged: Annotated[
+        bool,
+        typer.Option(
+            "--skip-unchanged",
+            help="Skip items whose destination copy already matches the backup. Items that "
+            "matched on a previous run are skipped from a local cache, not verified live "
+            "(see --recheck-destination)",
+        ),
+    ] = False,
+    recheck_destination: Annotated[
+        bool,
+        typer.Option(
+            "--recheck-destination",
+            help="With --skip-unchanged, ignore results cached by previous runs and compare "
+            "every item against the live destination (e.g. after content was edited in Looker)",
+        ),
+    ] = False,
 ) -> None:
     """Restore a single content item by type and ID."""
     from .commands import restore as restore_module
@@ -366,6 +519,8 @@ def restore_single_cmd(
         debug,
         folder_ids,
         recursive,
+        skip_unchanged,
+        recheck_destination,
     )
 
 
@@ -472,6 +627,93 @@ def restore_all_cmd(
             help="Include all subfolders when using --folder-ids",
         ),
     ] = False,
+    skip_unchanged: Annotated[
+        bool,
+        typer.Option(
+            "--skip-unchanged",
+            help="Skip items whose destination copy already matches the backup. Items that "
+            "matched on a previous run are skipped from a local cache, not verified live "
+            "(see --recheck-destination)",
+        ),
+    ] = False,
+    recheck_destination: Annotated[
+        bool,
+        typer.Option(
+            "--recheck-destination",
+            help="With --skip-unchanged, ignore results cached by previous runs and compare "
+            "every item against the live destination (e.g. after content was edited in Looker)",
+        ),
+    ] = False,
+    trace: Annotated[
+        Path | None,
+        typer.Option(
+            "--trace",
+            help="Record spans (API calls, sub-resource phases, DB writes) and write them to "
+            "this file: Chrome trace JSON for Perfetto, or JSONL if the name ends in .jsonl",
+        ),
+    ] = None,
+    metrics_port: Annotated[
+        int | None,
+        typer.Option(
+            "--metrics-port",
+            help="Serve live Prometheus metrics on http://HOST:PORT/metrics during the run",
+        ),
+    ] = None,
+    metrics_host: Annotated[
+        str,
+        typer.Option(
+            "--metrics-host",
+            help="Interface --metrics-port binds to (use 0.0.0.0 for scraping from other "
+            "hosts, e.g. a Kubernetes pod)",
+        ),
+    ] = "127.0.0.1",
+    metrics_textfile: Annotated[
+        Path | None,
+        typer.Option(
+            "--metrics-textfile",
+            help="Rewrite this node-exporter textfile (*.prom) with live Prometheus metrics",
+        ),
+    ] = None,
+    auto_tune: Annotated[
+        bool,
+        typer.Option(
+            "--auto-tune",
+            help="Choose workers, batch size and rate limits not given explicitly from the "
+            "recorded performance of previous runs against the same instance",
+        ),
+    ] = False,
+    dynamic_workers: Annotated[
+        bool,
+        typer.Option(
+            "--dynamic-workers",
+            help="Grow or shrink the active worker count during the run from observed "
+            "throughput, 429s and SQLite lock waits",
+        ),
+    ] = False,
+    max_workers: Annotated[
+        int | None,
+        typer.Option(
+            "--max-workers",
+            help="Upper bound for --dynamic-workers (default: twice --workers)",
+        ),
+    ] = None,
+    profile: Annotated[
+        bool,
+        typer.Option(
+            "--profile",
+            help="Sample every thread and write a merged pstats profile and collapsed-stack "
+            "flamegraph file next to the database",
+        ),
+    ] = False,
+    source_instance: Annotated[
+        str | None,
+        typer.Option(
+            "--source-instance",
+            help="URL of the Looker instance the backup was taken from. Restoring into a "
+            "different instance then records source-to-destination ID mappings and "
+            "rewrites references (folders, looks in tiles, roles, ...) through them",
+        ),
+    ] = None,
 ) -> None:
     """Restore all content types in dependency order.
 
@@ -499,6 +741,126 @@ def restore_all_cmd(
         debug,
         folder_ids,
         recursive,
+        skip_unchanged,
+        trace,
+        metrics_port,
+        metrics_host,
+        metrics_textfile,
+        auto_tune,
+        dynamic_workers,
+        max_workers,
+        profile,
+        source_instance,
+        recheck_destination,
+    )
+
+
+@restore_app.command("validate")
+def restore_validate_cmd(
+    content_types: Annotated[
+        list[str] | None,
+        typer.Option("--type", "-t", help="Content type to validate (repeatable, default: all)"),
+    ] = None,
+    workers: Annotated[
+        int | None,
+        typer.Option("--workers", "-w", help="Worker processes (default: CPU count)"),
+    ] = None,
+    check_dependencies: Annotated[
+        bool,
+        typer.Option(
+            "--dependencies/--no-dependencies",
+            help="Check references against the content IDs in the backup",
+        ),
+    ] = True,
+    db_path: Annotated[
+        str | None,
+        typer.Option(
+            "--db-path",
+            help="Path to SQLite backup database (default: LOOKERVAULT_DB_PATH or 'looker.db')",
+        ),
+    ] = None,
+    json_output: Annotated[
+        bool,
+        typer.Option("--json", help="Output results in JSON format"),
+    ] = False,
+    verbose: Annotated[
+        bool,
+        typer.Option("--verbose", "-v", help="Enable verbose logging"),
+    ] = False,
+    debug: Annotated[
+        bool,
+        typer.Option("--debug", help="Enable debug logging"),
+    ] = False,
+) -> None:
+    """Validate backup content offline using all CPU cores (pre-flight check)."""
+    from .commands import restore as restore_module
+
+    restore_module.restore_validate(
+        content_types,
+        workers,
+        check_dependencies,
+        db_path,
+        json_output,
+        verbose,
+        debug,
+    )
+
+
+@restore_app.command("plan")
+def restore_plan_cmd(
+    content_types: Annotated[
+        list[str] | None,
+        typer.Option("--type", "-t", help="Content type to plan (repeatable, default: all)"),
+    ] = None,
+    workers: Annotated[
+        int | None,
+        typer.Option("--workers", "-w", help="Worker count to estimate for (default: config)"),
+    ] = None,
+    rate_limit_per_minute: Annotated[
+        int | None,
+        typer.Option("--rate-limit-per-minute", help="API rate limit per minute"),
+    ] = None,
+    rate_limit_per_second: Annotated[
+        int | None,
+        typer.Option("--rate-limit-per-second", help="API burst limit per second"),
+    ] = None,
+    config: Annotated[
+        Path | None,
+        typer.Option("--config", "-c", help="Path to configuration file"),
+    ] = None,
+    db_path: Annotated[
+        str | None,
+        typer.Option(
+            "--db-path",
+            help="Path to SQLite backup database (default: LOOKERVAULT_DB_PATH or 'looker.db')",
+        ),
+    ] = None,
+    json_output: Annotated[
+        bool,
+        typer.Option("--json", help="Output results in JSON format"),
+    ] = False,
+    verbose: Annotated[
+        bool,
+        typer.Option("--verbose", "-v", help="Enable verbose logging"),
+    ] = False,
+    debug: Annotated[
+        bool,
+        typer.Option("--debug", help="Enable debug logging"),
+    ] = False,
+) -> None:
+    """Preview restore order, API call count and ETA without calling Looker."""
+    from .commands import restore as restore_module
+
+    restore_module.restore_plan(
+        content_types,
+        workers,
+        rate_limit_per_minute,
+        rate_limit_per_second,
+        config,
+        db_path,
+        json_output,
+        verbose,
+        debug,
     )
 
 
@@ -580,6 +942,14 @@ def unpack(
         bool,
         typer.Option("--debug", help="Enable debug logging"),
     ] = False,
+    profile: Annotated[
+        bool,
+        typer.Option(
+            "--profile",
+            help="Sample every thread and write a merged pstats profile and collapsed-stack "
+            "flamegraph file next to the database",
+        ),
+    ] = False,
 ) -> None:
     """Unpack Looker content from database to YAML files."""
     unpack_module(
@@ -591,6 +961,7 @@ def unpack(
         json_output,
         verbose,
         debug,
+        profile,
     )
 
 
@@ -770,6 +1141,64 @@ def dlq_retry_cmd(
     )
 
 
+@dlq_app.command("replay")
+def dlq_replay_cmd(
+    session_id: Annotated[
+        str | None,
+        typer.Option("--session-id", help="Replay entries for session"),
+    ] = None,
+    content_type: Annotated[
+        str | None,
+        typer.Option("--type", "-t", help="Replay entries for content type"),
+    ] = None,
+    error_types: Annotated[
+        list[str] | None,
+        typer.Option(
+            "--error-type",
+            help="Replay entries with this error type (repeatable, e.g. RateLimitError)",
+        ),
+    ] = None,
+    workers: Annotated[
+        int | None,
+        typer.Option("--workers", "-w", help="Concurrent replays (default: restore.workers)"),
+    ] = None,
+    config: Annotated[
+        Path | None,
+        typer.Option("--config", "-c", help="Path to configuration file"),
+    ] = None,
+    db_path: Annotated[
+        str,
+        typer.Option("--db-path", help="Path to SQLite backup database"),
+    ] = "looker.db",
+    json_output: Annotated[
+        bool,
+        typer.Option("--json", help="Output results in JSON format"),
+    ] = False,
+    verbose: Annotated[
+        bool,
+        typer.Option("--verbose", "-v", help="Enable verbose logging"),
+    ] = False,
+    debug: Annotated[
+        bool,
+        typer.Option("--debug", help="Enable debug logging"),
+    ] = False,
+) -> None:
+    """Replay DLQ entries in parallel, removing those that now succeed."""
+    from .commands import restore as restore_module
+
+    restore_module.restore_dlq_replay(
+        session_id,
+        content_type,
+        error_types,
+        workers,
+        config,
+        db_path,
+        json_output,
+        verbose,
+        debug,
+    )
+
+
 @dlq_app.command("clear")
 def dlq_clear_cmd(
     session_id: Annotated[
@@ -820,5 +1249,82 @@ def dlq_clear_cmd(
     )
 
 
+# Perf command group
+perf_app = typer.Typer(
+    help="Inspect recorded run performance",
+    no_args_is_help=True,
+)
+app.add_typer(perf_app, name="perf")
+
+
+@perf_app.command("history")
+def perf_history_cmd(
+    db_path: Annotated[
+        str,
+        typer.Option("--db-path", help="Path to SQLite backup database"),
+    ] = "looker.db",
+    operation: Annotated[
+        str | None,
+        typer.Option("--operation", help="Only 'extract' or 'restore' runs (default: both)"),
+    ] = None,
+    instance: Annotated[
+        str | None,
+        typer.Option("--instance", help="Only runs against this Looker instance URL"),
+    ] = None,
+    days: Annotated[
+        int,
+        typer.Option("--days", min=1, help="Baseline window in days"),
+    ] = 7,
+    threshold: Annotated[
+        float,
+        typer.Option(
+            "--threshold",
+            min=0.0,
+            help="Percent change in the bad direction that counts as a regression",
+        ),
+    ] = 20.0,
+    min_runs: Annotated[
+        int,
+        typer.Option("--min-runs", min=1, help="Fewest baseline runs needed to compare"),
+    ] = 3,
+    limit: Annotated[
+        int,
+        typer.Option("--limit", min=1, help="Number of recent runs listed"),
+    ] = 10,
+    json_output: Annotated[
+        bool,
+        typer.Option("--json", help="Output results in JSON format"),
+    ] = False,
+    fail_on_regression: Annotated[
+        bool,
+        typer.Option("--fail-on-regression", help="Exit with code 3 if a regression is found"),
+    ] = False,
+    verbose: Annotated[
+        bool,
+        typer.Option("--verbose", "-v", help="Enable verbose logging"),
+    ] = False,
+    debug: Annotated[
+        bool,
+        typer.Option("--debug", help="Enable debug logging"),
+    ] = False,
+) -> None:
+    """Show run history and flag regressions against a rolling baseline."""
+    from .commands import perf as perf_module
+
+    perf_module.history(
+        db_path,
+        operation,
+        instance,
+        days,
+        threshold,
+        min_runs,
+        limit,
+        json_output,
+        fail_on_regression,
+        verbose,
+        debug,
+    )
+
+
 if __name__ == "__main__":
     app()
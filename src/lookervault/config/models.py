@@ -31,6 +31,17 @@ class RestoreDefaults(BaseModel):
     )
     checkpoint_interval: int = Field(default=100, ge=1, description="Default checkpoint interval")
     max_retries: int = Field(default=5, ge=0, le=10, description="Default max retries")
+    subresource_concurrency: int = Field(
+        default=4,
+        ge=1,
+        le=16,
+        description="Concurrent sub-resource API calls per dashboard (1 = sequential)",
+    )
+    skip_unchanged: bool = Field(
+        default=False,
+        description="Skip items whose destination copy already matches the backup "
+        "(items that matched on a previous run are skipped without re-checking)",
+    )
 
 
 class Configuration(BaseModel):
@@ -134,6 +145,114 @@ class ParallelConfig(BaseModel):
         description="Enable adaptive backoff when HTTP 429 detected",
     )
 
+    adaptive_page_size: bool = Field(
+        default=False,
+        description="Tune page size per content type from observed latency, payload and errors",
+    )
+
+    min_page_size: int = Field(
+        default=10,
+        ge=1,
+        le=1000,
+        description="Smallest page size the adaptive controller may choose",
+    )
+
+    max_page_size: int = Field(
+        default=1000,
+        ge=1,
+        le=1000,
+        description="Largest page size the adaptive controller may choose",
+    )
+
+    target_page_latency_seconds: float = Field(
+        default=5.0,
+        gt=0,
+        description="Desired wall-clock time per page request for adaptive page sizing",
+    )
+
+    probe_total_count: bool = Field(
+        default=True,
+        description="Probe the item count up front (full runs) so workers stop at the end "
+        "of data without one empty request each",
+    )
+
+    dynamic_workers: bool = Field(
+        default=False,
+        description="Grow or shrink the active worker count at runtime from observed "
+        "throughput, 429s and SQLite lock waits",
+    )
+
+    max_workers: int | None = Field(
+        default=None,
+        ge=1,
+        le=50,
+        description="Upper bound for dynamic worker scaling (default: twice workers, max 50)",
+    )
+
+    memory_warning_mb: float = Field(
+        default=500,
+        gt=0,
+        description="Process RSS (MB) above which elevated memory use is logged",
+    )
+
+    memory_critical_mb: float = Field(
+        default=1000,
+        gt=0,
+        description="Process RSS (MB) above which fetch workers pause while memory keeps rising",
+    )
+
+    @model_validator(mode="after")
+    def validate_max_workers(self) -> "ParallelConfig":
+        """Default max_workers to twice workers and ensure it is not below workers.
+
+        Returns:
+            Validated ParallelConfig instance
+
+        Raises:
+            ValueError: If max_workers < workers
+        """
+        if self.max_workers is None:
+            self.max_workers = min(self.workers * 2, 50)
+        if self.max_workers < self.workers:
+            raise ValueError(
+                f"max_workers ({self.max_workers}) must be at least workers ({self.workers})"
+            )
+        return self
+
+    @model_validator(mode="after")
+    def validate_memory_thresholds(self) -> "ParallelConfig":
+        """Ensure the memory warning threshold is not above the critical one.
+
+        Returns:
+            Validated ParallelConfig instance
+
+        Raises:
+            ValueError: If memory_warning_mb > memory_critical_mb
+        """
+        if self.memory_warning_mb > self.memory_critical_mb:
+            raise ValueError(
+                f"memory_warning_mb ({self.memory_warning_mb}) must not exceed "
+                f"memory_critical_mb ({self.memory_critical_mb})"
+            )
+        return self
+
+    @model_validator(mode="after")
+    def validate_page_size_bounds(self) -> "ParallelConfig":
+        """Ensure adaptive page size bounds are ordered.
+
+        Returns:
+            Validated ParallelConfig instance
+
+        Raises:
+            ValueError: If min_page_size > max_page_size
+        """
+        if self.min_page_size > self.max_page_size:
+            raise ValueError(
+                f"min_page_size ({self.min_page_size}) must not exceed "
+                f"max_page_size ({self.max_page_size})"
+            )
+        return self
+
     @model_validator(mode="after")
     def validate_queue_size(self) -> "ParallelConfig":
         """Ensure queue_size is appropriate for worker count.
@@ -220,6 +339,17 @@ class RestorationConfig(BaseModel):
     checkpoint_interval: int = Field(default=100, ge=1, description="Save checkpoint every N items")
     max_retries: int = Field(default=5, ge=0, le=10, description="Maximum retry attempts per item")
     dry_run: bool = Field(default=False, description="Preview mode - no actual API calls")
+    dynamic_workers: bool = Field(
+        default=False,
+        description="Grow or shrink the active worker count at runtime from observed "
+        "throughput, 429s and SQLite lock waits",
+    )
+    max_workers: int | None = Field(
+        default=None,
+        ge=1,
+        le=32,
+        description="Upper bound for dynamic worker scaling (default: twice workers, max 32)",
+    )
 
     # Filtering
     content_types: list[int] | None = Field(
@@ -240,6 +370,24 @@ class RestorationConfig(BaseModel):
             pass
         return self
 
+    @model_validator(mode="after")
+    def validate_max_workers(self) -> "RestorationConfig":
+        """Default max_workers to twice workers and ensure it is not below workers.
+
+        Returns:
+            Validated RestorationConfig instance
+
+        Raises:
+            ValueError: If max_workers < workers
+        """
+        if self.max_workers is None:
+            self.max_workers = min(self.workers * 2, 32)
+        if self.max_workers < self.workers:
+            raise ValueError(
+                f"max_workers ({self.max_workers}) must be at least workers ({self.workers})"
+            )
+        return self
+
     @model_validator(mode="after")
     def validate_rate_limits(self) -> "RestorationConfig":
         """Ensure rate limits are consistent.
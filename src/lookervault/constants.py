@@ -41,6 +41,7 @@ GCS_TOTAL_TIMEOUT_SECONDS = 600  # 10 minutes total operation timeout
 # Checkpoint and batch constants
 DEFAULT_CHECKPOINT_INTERVAL = 100
 DEFAULT_BATCH_SIZE = 100
+INDEX_SWEEP_BATCH_SIZE = 1000  # Index rows are tiny, so sweeps use larger pages
 
 # Progress logging interval
 PROGRESS_LOGGING_INTERVAL = 100
@@ -4,6 +4,8 @@ from lookervault.extraction.batch_processor import (
     BatchProcessor,
     MemoryAwareBatchProcessor,
 )
+from lookervault.extraction.memory_monitor import AllocationProfiler, MemorySampler
+from lookervault.extraction.metrics_exporter import MetricsExporter
 from lookervault.extraction.orchestrator import (
     ExtractionConfig,
     ExtractionOrchestrator,
@@ -18,12 +20,15 @@ from lookervault.extraction.progress import (
 from lookervault.extraction.retry import retry_on_rate_limit, with_retry
 
 __all__ = [
+    "AllocationProfiler",
     "BatchProcessor",
     "ExtractionConfig",
     "ExtractionOrchestrator",
     "ExtractionResult",
     "JsonProgressTracker",
     "MemoryAwareBatchProcessor",
+    "MemorySampler",
+    "MetricsExporter",
     "OutputMode",
     "ProgressTracker",
     "RichProgressTracker",
@@ -1,11 +1,11 @@
 """Memory-efficient batch processing."""
 
 import logging
-import tracemalloc
 from collections.abc import Callable, Iterator
 from typing import Protocol, TypeVar
 
 from lookervault.exceptions import ProcessingError
+from lookervault.extraction.memory_monitor import MemorySampler
 
 logger = logging.getLogger(__name__)
 
@@ -47,22 +47,47 @@ class BatchProcessor(Protocol[T, R]):
 
 
 class MemoryAwareBatchProcessor:
-    """Batch processor with memory monitoring."""
+    """Batch processor with memory monitoring.
 
-    # Memory thresholds in bytes
+    Memory is monitored through a MemorySampler, which reads the process RSS
+    rather than tracing allocations, so monitoring adds no per-allocation
+    overhead. Without start_monitoring() the RSS is read on demand (once per
+    batch); with it, a background thread samples at sample_interval and
+    producers can apply backpressure through wait_for_memory_relief().
+    """
+
+    # Default memory thresholds in megabytes (process RSS)
     WARNING_THRESHOLD_MB = 500  # Warn when memory exceeds 500MB
     CRITICAL_THRESHOLD_MB = 1000  # Critical warning at 1GB
 
-    def __init__(self, enable_monitoring: bool = True):
+    def __init__(
+        self,
+        enable_monitoring: bool = True,
+        sample_interval: float = 1.0,
+        warning_mb: float = WARNING_THRESHOLD_MB,
+        critical_mb: float = CRITICAL_THRESHOLD_MB,
+    ):
         """Initialize batch processor.
 
         Args:
             enable_monitoring: If True, enable memory monitoring
+            sample_interval: Seconds between background samples once monitoring is started
+            warning_mb: RSS in MB above which memory use is logged as elevated
+            critical_mb: RSS in MB above which memory is critical (backpressure threshold)
         """
         self.enable_monitoring = enable_monitoring
+        self.warning_mb = warning_mb
+        self.critical_mb = critical_mb
         self._warned_at_level: set[str] = set()  # Track which warnings we've already issued
-        if enable_monitoring:
-            tracemalloc.start()
+        self.sampler: MemorySampler | None = (
+            MemorySampler(
+                interval_seconds=sample_interval,
+                warning_mb=warning_mb,
+                critical_mb=critical_mb,
+            )
+            if enable_monitoring
+            else None
+        )
 
     def process_batches(
         self,
@@ -123,14 +148,14 @@ class MemoryAwareBatchProcessor:
         current_mb = current / (1024 * 1024)
         peak_mb = peak / (1024 * 1024)
 
-        if current_mb > self.CRITICAL_THRESHOLD_MB and "critical" not in self._warned_at_level:
+        if current_mb > self.critical_mb and "critical" not in self._warned_at_level:
             logger.warning(
                 f"CRITICAL: Memory usage is very high: {current_mb:.1f} MB "
                 f"(peak: {peak_mb:.1f} MB). Consider reducing batch size."
             )
             self._warned_at_level.add("critical")
 
-        elif current_mb > self.WARNING_THRESHOLD_MB and "warning" not in self._warned_at_level:
+        elif current_mb > self.warning_mb and "warning" not in self._warned_at_level:
             logger.warning(
                 f"Memory usage is elevated: {current_mb:.1f} MB "
                 f"(peak: {peak_mb:.1f} MB). Monitoring for further increases."
@@ -141,14 +166,34 @@ class MemoryAwareBatchProcessor:
         """Get current memory usage.
 
         Returns:
-            Tuple of (current_bytes, peak_bytes)
+            Tuple of (current_bytes, peak_bytes) of process RSS; (0, 0) when
+            monitoring is disabled
         """
-        if self.enable_monitoring:
-            current, peak = tracemalloc.get_traced_memory()
-            return (current, peak)
-        return (0, 0)
+        if self.sampler is None:
+            return (0, 0)
+        if self.sampler.running:
+            return self.sampler.usage()
+        return self.sampler.sample()
+
+    def start_monitoring(self) -> None:
+        """Start background memory sampling (no-op when monitoring is disabled)."""
+        if self.sampler is not None:
+            self.sampler.start()
+
+    def wait_for_memory_relief(self, timeout: float) -> bool:
+        """Backpressure hook: wait up to timeout seconds while critical memory is rising.
+
+        Args:
+            timeout: Maximum seconds to wait
+
+        Returns:
+            True if memory is not critical and rising, False if the wait timed out
+        """
+        if self.sampler is None:
+            return True
+        return self.sampler.wait_for_relief(timeout)
 
     def stop_monitoring(self) -> None:
         """Stop memory monitoring."""
-        if self.enable_monitoring:
-            tracemalloc.stop()
+        if self.sampler is not None:
+            self.sampler.stop()
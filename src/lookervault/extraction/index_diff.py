@@ -0,0 +1,91 @@
+"""Change detection between a live index sweep and the stored content index."""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+
+from lookervault.utils.datetime_parsing import parse_timestamp
+
+
+@dataclass
+class IndexDiff:
+    """Result of comparing live content identities against stored content.
+
+    Attributes:
+        new_ids: IDs present in Looker but not in the vault
+        changed_ids: IDs whose updated_at differs from the stored value
+        deleted_ids: IDs stored in the vault but no longer present in Looker
+        unchanged_count: Number of IDs whose updated_at matches the stored value
+    """
+
+    new_ids: list[str] = field(default_factory=list)
+    changed_ids: list[str] = field(default_factory=list)
+    deleted_ids: list[str] = field(default_factory=list)
+    unchanged_count: int = 0
+
+    @property
+    def fetch_ids(self) -> list[str]:
+        """IDs that need a full detail fetch (new + changed)."""
+        return self.new_ids + self.changed_ids
+
+    @property
+    def live_count(self) -> int:
+        """Number of items seen in the live sweep."""
+        return len(self.new_ids) + len(self.changed_ids) + self.unchanged_count
+
+
+def diff_index(
+    live_items: list[dict[str, Any]],
+    stored_index: dict[str, datetime],
+) -> IndexDiff:
+    """Diff index-sweep results against the stored id -> updated_at index.
+
+    Items without a parseable updated_at are always treated as changed, so a
+    missing timestamp can never hide a modification.
+
+    Args:
+        live_items: Item dicts from an index sweep (must contain "id")
+        stored_index: Stored id -> updated_at mapping from the repository
+
+    Returns:
+        IndexDiff with new, changed and deleted IDs
+
+    Examples:
+        >>> stored = {"1": datetime(2024, 1, 1, tzinfo=UTC), "2": datetime(2024, 1, 1, tzinfo=UTC)}
+        >>> live = [{"id": "1", "updated_at": "2024-01-01T00:00:00+00:00"}, {"id": "3"}]
+        >>> diff = diff_index(live, stored)
+        >>> diff.new_ids, diff.changed_ids, diff.deleted_ids
+        (['3'], [], ['2'])
+    """
+    diff = IndexDiff()
+    live_ids: set[str] = set()
+
+    for item in live_items:
+        raw_id = item.get("id")
+        if raw_id is None:
+            continue
+        item_id = str(raw_id)
+        if item_id in live_ids:
+            # Offset pagination can return an item twice if content shifts mid-sweep
+            continue
+        live_ids.add(item_id)
+
+        stored_updated_at = stored_index.get(item_id)
+        if stored_updated_at is None:
+            diff.new_ids.append(item_id)
+            continue
+
+        live_updated_at = item.get("updated_at")
+        if not live_updated_at:
+            diff.changed_ids.append(item_id)
+            continue
+
+        # Sentinel default: unparseable timestamps compare unequal and force a refetch
+        parsed = parse_timestamp(live_updated_at, "updated_at", item_id, default=datetime.min)
+        if parsed == stored_updated_at:
+            diff.unchanged_count += 1
+        else:
+            diff.changed_ids.append(item_id)
+
+    diff.deleted_ids = sorted(set(stored_index) - live_ids)
+    return diff
@@ -0,0 +1,289 @@
+"""Low-overhead process memory sampling and opt-in allocation profiling.
+
+MemorySampler reads the process's resident set size (VmRSS) and high-water
+mark (VmHWM) from /proc/self/status on a background thread at a fixed
+interval. This costs one small file read per interval, unlike tracemalloc,
+which hooks every allocation. The sampler classifies memory pressure against
+warning and critical thresholds, notifies listeners when the level changes,
+and lets producers wait briefly while critical memory is still growing
+(backpressure).
+
+AllocationProfiler wraps tracemalloc for explicit profiling runs
+(``--profile-memory``). It diffs a snapshot taken at the end against one
+taken at the start and reports the allocation sites that grew the most.
+"""
+
+import logging
+import sys
+import threading
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+PROC_STATUS_PATH = Path("/proc/self/status")
+
+# Memory pressure levels, in increasing order of severity
+PRESSURE_NORMAL = "normal"
+PRESSURE_WARNING = "warning"
+PRESSURE_CRITICAL = "critical"
+
+# RSS growth between samples below which memory counts as flat, not rising
+RSS_GROWTH_TOLERANCE_BYTES = 1024 * 1024
+
+PressureListener = Callable[[str, int], None]
+
+
+def read_process_memory(status_path: Path = PROC_STATUS_PATH) -> tuple[int, int]:
+    """Read the process's current and peak resident memory.
+
+    Uses /proc/self/status where available (Linux). Elsewhere falls back to
+    getrusage(), which only reports the peak, so the peak doubles as the
+    current value.
+
+    Args:
+        status_path: Path of the proc status file
+
+    Returns:
+        Tuple of (rss_bytes, peak_rss_bytes); (0, 0) if unavailable
+    """
+    try:
+        rss = hwm = 0
+        with status_path.open("rb") as f:
+            for line in f:
+                if line.startswith(b"VmRSS:"):
+                    rss = int(line.split()[1]) * 1024
+                elif line.startswith(b"VmHWM:"):
+                    hwm = int(line.split()[1]) * 1024
+        return rss, max(hwm, rss)
+    except (OSError, ValueError, IndexError):
+        pass
+
+    try:
+        import resource
+    except ImportError:
+        return 0, 0
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+    peak = max_rss if sys.platform == "darwin" else max_rss * 1024
+    return peak, peak
+
+
+class MemorySampler:
+    """Background sampler of process RSS with memory-pressure notifications.
+
+    Thread-safe: the sampler thread is the only writer of the sampled values;
+    readers get the latest sample without any system call.
+
+    Examples:
+        >>> sampler = MemorySampler(interval_seconds=1.0, warning_mb=500, critical_mb=1000)
+        >>> sampler.add_listener(lambda level, rss: print(f"memory {level}: {rss} bytes"))
+        >>> with sampler:
+        ...     run_extraction()
+        >>> current_bytes, peak_bytes = sampler.usage()
+    """
+
+    def __init__(
+        self,
+        interval_seconds: float = 1.0,
+        warning_mb: float = 500,
+        critical_mb: float = 1000,
+        reader: Callable[[], tuple[int, int]] = read_process_memory,
+    ):
+        """Initialize MemorySampler.
+
+        Args:
+            interval_seconds: Time between samples
+            warning_mb: RSS above which pressure is "warning"
+            critical_mb: RSS above which pressure is "critical"
+            reader: Function returning (rss_bytes, peak_rss_bytes)
+        """
+        self.interval_seconds = interval_seconds
+        self.warning_bytes = int(warning_mb * 1024 * 1024)
+        self.critical_bytes = int(critical_mb * 1024 * 1024)
+        self._reader = reader
+        self._listeners: list[PressureListener] = []
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._relieved = threading.Condition(self._lock)
+        self._thread: threading.Thread | None = None
+        self._current = 0
+        self._peak = 0
+        self._level = PRESSURE_NORMAL
+        self._rising = False
+
+    @property
+    def level(self) -> str:
+        """Memory pressure level of the latest sample."""
+        return self._level
+
+    @property
+    def running(self) -> bool:
+        """Whether the background sampling thread is running."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def usage(self) -> tuple[int, int]:
+        """Latest sampled memory usage.
+
+        Returns:
+            Tuple of (rss_bytes, peak_rss_bytes)
+        """
+        return self._current, self._peak
+
+    def add_listener(self, listener: PressureListener) -> None:
+        """Register a callback invoked as listener(level, rss_bytes) on level changes.
+
+        Listeners run on the sampler thread and must not block.
+        """
+        with self._lock:
+            self._listeners.append(listener)
+
+    def sample(self) -> tuple[int, int]:
+        """Take a sample now, updating the pressure level and notifying listeners.
+
+        Returns:
+            Tuple of (rss_bytes, peak_rss_bytes)
+        """
+        rss, peak = self._reader()
+        if rss >= self.critical_bytes:
+            level = PRESSURE_CRITICAL
+        elif rss >= self.warning_bytes:
+            level = PRESSURE_WARNING
+        else:
+            level = PRESSURE_NORMAL
+
+        with self._lock:
+            self._rising = rss > self._current + RSS_GROWTH_TOLERANCE_BYTES
+            self._current = rss
+            self._peak = max(self._peak, peak)
+            changed = level != self._level
+            self._level = level
+            listeners = list(self._listeners) if changed else []
+            if not self._under_pressure():
+                self._relieved.notify_all()
+
+        for listener in listeners:
+            try:
+                listener(level, rss)
+            except Exception as e:
+                logger.warning(f"Memory pressure listener failed: {e}")
+
+        return rss, self._peak
+
+    def _under_pressure(self) -> bool:
+        # Caller holds self._lock
+        return self._level == PRESSURE_CRITICAL and self._rising
+
+    def wait_for_relief(self, timeout: float) -> bool:
+        """Block while memory is critical and still rising, for at most timeout seconds.
+
+        Producers call this before taking on more work so in-flight work can
+        drain. Only growth is waited out: RSS often stays high after memory is
+        freed (the allocator keeps it), so a critical but flat RSS doesn't
+        pause anyone. The wait is bounded because stalling forever would be
+        worse than proceeding.
+
+        Args:
+            timeout: Maximum seconds to wait
+
+        Returns:
+            True if memory is not critical and rising, False if the wait timed out
+        """
+        with self._lock:
+            if not self._under_pressure() or not self.running:
+                return True
+            return self._relieved.wait_for(
+                lambda: not self._under_pressure() or self._stop.is_set(),
+                timeout=timeout,
+            )
+
+    def start(self) -> None:
+        """Start sampling on a daemon thread (no-op if already running)."""
+        if self.running:
+            return
+        self._stop.clear()
+        self.sample()
+        self._thread = threading.Thread(target=self._run, name="memory-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the sampling thread, waking any producer waiting for relief."""
+        self._stop.set()
+        with self._lock:
+            self._relieved.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout=self.interval_seconds + 1)
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval_seconds):
+            try:
+                self.sample()
+            except Exception as e:
+                logger.debug(f"Memory sample failed: {e}")
+
+    def __enter__(self) -> "MemorySampler":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
+
+
+class AllocationProfiler:
+    """Opt-in tracemalloc profiling that reports the allocation sites that grew most.
+
+    tracemalloc hooks every allocation and slows the process down noticeably,
+    so it only runs when explicitly requested (``--profile-memory``).
+
+    Examples:
+        >>> profiler = AllocationProfiler(frames=10)
+        >>> profiler.start()
+        >>> run_extraction()
+        >>> print("\\n".join(profiler.stop(top=20)))
+    """
+
+    def __init__(self, frames: int = 10):
+        """Initialize AllocationProfiler.
+
+        Args:
+            frames: Stack frames stored per allocation (more frames cost more memory)
+        """
+        self.frames = frames
+        self._baseline: tracemalloc.Snapshot | None = None
+
+    def start(self) -> None:
+        """Start tracing allocations and take the baseline snapshot."""
+        tracemalloc.start(self.frames)
+        self._baseline = tracemalloc.take_snapshot()
+
+    def stop(self, top: int = 25) -> list[str]:
+        """Stop tracing and diff the final snapshot against the baseline.
+
+        Args:
+            top: Number of allocation sites to report
+
+        Returns:
+            Report lines: traced peak, then the top allocation sites by size growth
+        """
+        if self._baseline is None:
+            return []
+
+        _, peak = tracemalloc.get_traced_memory()
+        snapshot = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+
+        ignored = [
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+        ]
+        stats = snapshot.filter_traces(ignored).compare_to(
+            self._baseline.filter_traces(ignored), "lineno"
+        )
+        self._baseline = None
+
+        lines = [f"Traced peak: {peak / (1024 * 1024):.1f} MB"]
+        lines.extend(str(stat) for stat in stats[:top])
+        return lines
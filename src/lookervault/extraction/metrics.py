@@ -3,20 +3,142 @@
 import threading
 from dataclasses import dataclass, field
 from datetime import datetime
+from enum import Enum
 from typing import Any
 
+# Sub-buckets per power of two in LatencyHistogram; relative error is at most
+# 1 / (HISTOGRAM_SUB_BUCKETS / 2), i.e. ~1.6%
+HISTOGRAM_SUB_BUCKETS = 128
+_SUB_BUCKET_BITS = HISTOGRAM_SUB_BUCKETS.bit_length() - 1
+_HALF_SUB_BUCKETS = HISTOGRAM_SUB_BUCKETS // 2
+
+# Percentiles reported by LatencyHistogram.summary()
+REPORTED_PERCENTILES = (50, 95, 99)
+
+
+class LatencyPhase(str, Enum):
+    """Timed phases of extracting one item."""
+
+    RATE_LIMIT_WAIT = "rate_limit_wait"
+    API_FETCH = "api_fetch"
+    SDK_TO_DICT = "sdk_to_dict"
+    SERIALIZE = "serialize"
+    DB_WRITE = "db_write"
+
+
+class LatencyHistogram:
+    """HDR-style log-linear latency histogram.
+
+    Values are recorded in microseconds into buckets that are exact below
+    HISTOGRAM_SUB_BUCKETS us and then split every power of two into
+    HISTOGRAM_SUB_BUCKETS / 2 linear sub-buckets, so any percentile is
+    reported within ~1.6% of the true value at constant memory per
+    magnitude. Not thread-safe: each thread records into its own histogram
+    and histograms are combined with merge().
+
+    Example:
+        >>> histogram = LatencyHistogram()
+        >>> histogram.record(0.012)
+        >>> histogram.percentile(50)  # seconds
+    """
+
+    __slots__ = ("counts", "count", "total_us", "max_us")
+
+    def __init__(self) -> None:
+        self.counts: dict[int, int] = {}
+        self.count = 0
+        self.total_us = 0
+        self.max_us = 0
+
+    @staticmethod
+    def _bucket(value_us: int) -> int:
+        if value_us < HISTOGRAM_SUB_BUCKETS:
+            return value_us
+        shift = value_us.bit_length() - _SUB_BUCKET_BITS
+        return (
+            HISTOGRAM_SUB_BUCKETS
+            + (shift - 1) * _HALF_SUB_BUCKETS
+            + ((value_us >> shift) - _HALF_SUB_BUCKETS)
+        )
+
+    @staticmethod
+    def _bucket_value(bucket: int) -> int:
+        """Midpoint (in microseconds) of the values a bucket holds."""
+        if bucket < HISTOGRAM_SUB_BUCKETS:
+            return bucket
+        shift, sub = divmod(bucket - HISTOGRAM_SUB_BUCKETS, _HALF_SUB_BUCKETS)
+        shift += 1
+        return ((sub + _HALF_SUB_BUCKETS) << shift) + (1 << shift) // 2
+
+    def record(self, seconds: float) -> None:
+        """Record one latency.
+
+        Args:
+            seconds: Measured duration in seconds (negative values count as 0)
+        """
+        value_us = max(int(seconds * 1_000_000), 0)
+        bucket = self._bucket(value_us)
+        self.counts[bucket] = self.counts.get(bucket, 0) + 1
+        self.count += 1
+        self.total_us += value_us
+        if value_us > self.max_us:
+            self.max_us = value_us
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """Add every value recorded in other to this histogram."""
+        for bucket, count in list(other.counts.items()):
+            self.counts[bucket] = self.counts.get(bucket, 0) + count
+        self.count += other.count
+        self.total_us += other.total_us
+        self.max_us = max(self.max_us, other.max_us)
+
+    def percentile(self, percent: float) -> float:
+        """Return the latency (seconds) below which percent of the values fall.
+
+        Returns:
+            Latency in seconds, or 0.0 if nothing was recorded
+        """
+        if not self.count:
+            return 0.0
+        rank = max(1, round(self.count * percent / 100))
+        seen = 0
+        for bucket in sorted(self.counts):
+            seen += self.counts[bucket]
+            if seen >= rank:
+                return min(self._bucket_value(bucket), self.max_us) / 1_000_000
+        return self.max_us / 1_000_000
+
+    def summary(self) -> dict[str, float]:
+        """Return count, mean, reported percentiles and max (milliseconds)."""
+        mean_ms = self.total_us / self.count / 1000 if self.count else 0.0
+        result: dict[str, float] = {"count": self.count, "mean_ms": round(mean_ms, 3)}
+        for percent in REPORTED_PERCENTILES:
+            result[f"p{percent}_ms"] = round(self.percentile(percent) * 1000, 3)
+        result["max_ms"] = round(self.max_us / 1000, 3)
+        return result
+
+
+@dataclass
+class _MetricsShard:
+    """Counters and histograms written by a single thread."""
+
+    items_processed: int = 0
+    bytes_processed: int = 0
+    items_by_type: dict[int, int] = field(default_factory=dict)
+    phases: dict[str, LatencyHistogram] = field(default_factory=dict)
+    endpoints: dict[str, LatencyHistogram] = field(default_factory=dict)
+
 
 @dataclass
 class ThreadSafeMetrics:
     """Thread-safe metrics aggregation for parallel worker threads.
 
-    All methods use threading.Lock to ensure safe concurrent access from
-    multiple worker threads. Use this class to aggregate statistics across
-    all workers without data races.
+    Per-item counters and latency histograms are sharded per thread: each
+    worker writes only to its own shard without taking a lock, and shards are
+    merged on snapshot(). Rarely updated state (totals, batches, errors) stays
+    behind threading.Lock.
 
     Attributes:
-        items_processed: Total items processed across all workers
-        items_by_type: Breakdown of items processed per content type
         total_by_type: Expected total items per content type (for progress %)
         batches_completed: Number of batches completed (for granular progress)
         errors: Total error count across all workers
@@ -30,30 +152,90 @@ class ThreadSafeMetrics:
         >>> metrics.set_total(content_type=1, total=1000)
         >>> # From worker thread:
         >>> metrics.increment_processed(content_type=1, count=10)
+        >>> metrics.record_latency(LatencyPhase.DB_WRITE, 0.002)
         >>> # From main thread:
         >>> snapshot = metrics.snapshot()
         >>> print(f"Progress: {snapshot['progress_by_type'][1]:.1f}%")
+        >>> print(f"DB write p99: {snapshot['latency']['db_write']['p99_ms']} ms")
     """
 
-    items_processed: int = 0
-    items_by_type: dict[int, int] = field(default_factory=dict)
     total_by_type: dict[int, int] = field(default_factory=dict)
     batches_completed: int = 0
     errors: int = 0
     worker_errors: dict[str, list[str]] = field(default_factory=dict)
     start_time: datetime = field(default_factory=datetime.now)
     _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+    _shards: list[_MetricsShard] = field(default_factory=list, repr=False)
+    _local: threading.local = field(default_factory=threading.local, repr=False)
+
+    def _shard(self) -> _MetricsShard:
+        """Return the calling thread's shard, creating it on first use."""
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = _MetricsShard()
+            self._local.shard = shard
+            with self._lock:
+                self._shards.append(shard)
+        return shard
+
+    @property
+    def items_processed(self) -> int:
+        """Total items processed across all workers."""
+        return sum(shard.items_processed for shard in list(self._shards))
+
+    @property
+    def bytes_processed(self) -> int:
+        """Total serialized payload bytes processed across all workers."""
+        return sum(shard.bytes_processed for shard in list(self._shards))
 
-    def increment_processed(self, content_type: int, count: int = 1) -> None:
-        """Thread-safe increment of processed item counters.
+    @property
+    def items_by_type(self) -> dict[int, int]:
+        """Breakdown of items processed per content type."""
+        merged: dict[int, int] = {}
+        for shard in list(self._shards):
+            for content_type, count in list(shard.items_by_type.items()):
+                merged[content_type] = merged.get(content_type, 0) + count
+        return merged
+
+    def increment_processed(self, content_type: int, count: int = 1, nbytes: int = 0) -> None:
+        """Increment processed item counters in the calling thread's shard.
 
         Args:
             content_type: ContentType enum value (e.g., 1=dashboard, 2=look)
             count: Number of items to increment (default: 1)
+            nbytes: Serialized payload bytes of those items (default: 0)
         """
-        with self._lock:
-            self.items_processed += count
-            self.items_by_type[content_type] = self.items_by_type.get(content_type, 0) + count
+        shard = self._shard()
+        shard.items_processed += count
+        shard.bytes_processed += nbytes
+        shard.items_by_type[content_type] = shard.items_by_type.get(content_type, 0) + count
+
+    def record_latency(self, phase: LatencyPhase | str, seconds: float) -> None:
+        """Record the duration of one phase in the calling thread's shard.
+
+        Args:
+            phase: Timed phase (see LatencyPhase)
+            seconds: Measured duration in seconds
+        """
+        name = phase.value if isinstance(phase, LatencyPhase) else phase
+        phases = self._shard().phases
+        histogram = phases.get(name)
+        if histogram is None:
+            histogram = phases[name] = LatencyHistogram()
+        histogram.record(seconds)
+
+    def record_endpoint_latency(self, endpoint: str, seconds: float) -> None:
+        """Record the duration of one API call in the calling thread's shard.
+
+        Args:
+            endpoint: SDK method name (e.g., "search_dashboards")
+            seconds: Measured duration in seconds
+        """
+        endpoints = self._shard().endpoints
+        histogram = endpoints.get(endpoint)
+        if histogram is None:
+            histogram = endpoints[endpoint] = LatencyHistogram()
+        histogram.record(seconds)
 
     def increment_batches(self, count: int = 1) -> None:
         """Thread-safe increment of batch completion counter.
@@ -87,15 +269,23 @@ class ThreadSafeMetrics:
                 self.worker_errors[worker_id] = []
             self.worker_errors[worker_id].append(error_msg)
 
+    def _merged_histograms(self, attribute: str) -> dict[str, LatencyHistogram]:
+        merged: dict[str, LatencyHistogram] = {}
+        for shard in list(self._shards):
+            for name, histogram in list(getattr(shard, attribute).items()):
+                merged.setdefault(name, LatencyHistogram()).merge(histogram)
+        return merged
+
     def snapshot(self) -> dict[str, Any]:
-        """Thread-safe atomic read of all metrics.
+        """Merge all shards into a snapshot of every metric.
 
-        Returns a consistent snapshot of all metrics at a single point in time.
-        Safe to call from any thread without risking partial reads.
+        Safe to call from any thread. Counters are read without stopping the
+        workers, so a snapshot taken mid-run may be a few items behind.
 
         Returns:
             Dictionary with keys:
                 - total: Total items processed
+                - bytes: Total serialized payload bytes processed
                 - by_type: Dict of items per content type
                 - total_by_type: Expected totals per content type
                 - progress_by_type: Progress percentage per content type (0-100)
@@ -104,21 +294,36 @@ class ThreadSafeMetrics:
                 - duration_seconds: Elapsed time since start
                 - items_per_second: Throughput rate
                 - worker_errors: Error messages by worker
+                - latency: Histogram summary (ms) per LatencyPhase value
+                - endpoint_latency: Histogram summary (ms) per API endpoint
         """
+        items_processed = self.items_processed
+        bytes_processed = self.bytes_processed
+        items_by_type = self.items_by_type
+        latency = {
+            name: histogram.summary()
+            for name, histogram in self._merged_histograms("phases").items()
+        }
+        endpoint_latency = {
+            name: histogram.summary()
+            for name, histogram in self._merged_histograms("endpoints").items()
+        }
+
         with self._lock:
             duration = (datetime.now() - self.start_time).total_seconds()
-            items_per_second = self.items_processed / duration if duration > 0 else 0.0
+            items_per_second = items_processed / duration if duration > 0 else 0.0
 
             # Calculate progress percentages per content type
             progress_by_type = {}
             for content_type, total in self.total_by_type.items():
-                processed = self.items_by_type.get(content_type, 0)
+                processed = items_by_type.get(content_type, 0)
                 progress_pct = (processed / total * 100.0) if total > 0 else 0.0
                 progress_by_type[content_type] = min(progress_pct, 100.0)  # Cap at 100%
 
             return {
-                "total": self.items_processed,
-                "by_type": dict(self.items_by_type),  # Copy to avoid external mutation
+                "total": items_processed,
+                "bytes": bytes_processed,
+                "by_type": items_by_type,
                 "total_by_type": dict(self.total_by_type),  # Copy
                 "progress_by_type": progress_by_type,
                 "batches_completed": self.batches_completed,
@@ -126,6 +331,8 @@ class ThreadSafeMetrics:
                 "duration_seconds": duration,
                 "items_per_second": items_per_second,
                 "worker_errors": dict(self.worker_errors),  # Copy
+                "latency": latency,
+                "endpoint_latency": endpoint_latency,
             }
 
     def __str__(self) -> str:
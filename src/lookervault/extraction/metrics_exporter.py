@@ -0,0 +1,350 @@
+"""Prometheus exporter for long-running extraction and restoration jobs.
+
+MetricsExporter publishes a live view of a run in the Prometheus text
+exposition format, either from a local HTTP ``/metrics`` endpoint (for
+Kubernetes pods scraped directly) or as a node-exporter textfile rewritten
+every few seconds (for cron jobs on hosts running node_exporter's textfile
+collector).
+
+Nothing is added to the worker hot path: every value is read at collection
+time from state the run already maintains (ThreadSafeMetrics shards,
+AdaptiveRateLimiter.get_stats(), the repository's busy-retry counter, the WAL
+file size and /proc/self/status). Collection happens on the exporter's own
+thread, once per scrape or textfile interval.
+
+Example:
+    >>> exporter = MetricsExporter(
+    ...     metrics, job="extract", rate_limiter=limiter, repository=repository, port=9464
+    ... )
+    >>> with exporter:
+    ...     orchestrator.extract()
+"""
+
+import logging
+import os
+import threading
+from collections.abc import Iterable
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from pathlib import Path
+from typing import Any
+
+from lookervault.extraction.memory_monitor import read_process_memory
+from lookervault.extraction.metrics import ThreadSafeMetrics
+from lookervault.extraction.rate_limiter import AdaptiveRateLimiter
+from lookervault.storage.models import ContentType
+from lookervault.storage.repository import SQLiteContentRepository
+
+logger = logging.getLogger(__name__)
+
+# Seconds between textfile rewrites
+DEFAULT_TEXTFILE_INTERVAL = 5.0
+
+# Interface the HTTP endpoint binds to unless told otherwise (loopback only)
+DEFAULT_METRICS_HOST = "127.0.0.1"
+
+# Prefix of every exported metric name
+METRIC_PREFIX = "lookervault"
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _escape(value: str) -> str:
+    """Escape a label value for the text exposition format."""
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: dict[str, str]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items()) + "}"
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value, keeping integers exact."""
+    if isinstance(value, int) or float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _content_type_name(content_type: int) -> str:
+    try:
+        return ContentType(content_type).name.lower()
+    except ValueError:
+        return str(content_type)
+
+
+class _Family:
+    """One metric family (HELP/TYPE header plus samples)."""
+
+    def __init__(self, name: str, metric_type: str, help_text: str):
+        self.name = f"{METRIC_PREFIX}_{name}"
+        self.metric_type = metric_type
+        self.help_text = help_text
+        self.samples: list[tuple[str, dict[str, str], float]] = []
+
+    def add(self, value: float, suffix: str = "", **labels: str) -> "_Family":
+        self.samples.append((suffix, labels, value))
+        return self
+
+    def render(self, base_labels: dict[str, str]) -> Iterable[str]:
+        yield f"# HELP {self.name} {self.help_text}"
+        yield f"# TYPE {self.name} {self.metric_type}"
+        for suffix, labels, value in self.samples:
+            label_text = _format_labels({**base_labels, **labels})
+            yield f"{self.name}{suffix}{label_text} {_format_value(value)}"
+
+
+class MetricsExporter:
+    """Publish run metrics over HTTP and/or as a node-exporter textfile.
+
+    Attributes:
+        job: Value of the ``job`` label on every sample (e.g., "extract")
+        port: HTTP port serving /metrics, or None for no HTTP endpoint
+        textfile: Path of the textfile to rewrite, or None for no textfile
+        interval: Seconds between textfile rewrites
+    """
+
+    def __init__(
+        self,
+        metrics: ThreadSafeMetrics | None,
+        job: str,
+        rate_limiter: AdaptiveRateLimiter | None = None,
+        repository: SQLiteContentRepository | None = None,
+        port: int | None = None,
+        host: str = DEFAULT_METRICS_HOST,
+        textfile: str | Path | None = None,
+        interval: float = DEFAULT_TEXTFILE_INTERVAL,
+    ):
+        """Initialize the exporter (nothing is started until start()).
+
+        Args:
+            metrics: Run metrics shared with the workers (None for sequential runs)
+            job: Value of the ``job`` label (e.g., "extract", "restore")
+            rate_limiter: Rate limiter whose stats are exported
+            repository: Repository providing busy-retry count, WAL size and DLQ depth
+            port: HTTP port to serve /metrics on (0 picks a free port)
+            host: Interface to bind the HTTP endpoint to ("0.0.0.0" for all interfaces)
+            textfile: Path of a node-exporter textfile (should end in .prom)
+            interval: Seconds between textfile rewrites
+        """
+        self.metrics = metrics
+        self.job = job
+        self.rate_limiter = rate_limiter
+        self.repository = repository
+        self.port = port
+        self.host = host
+        self.textfile = Path(textfile) if textfile is not None else None
+        self.interval = interval
+        self._server: HTTPServer | None = None
+        self._threads: list[threading.Thread] = []
+        self._stop = threading.Event()
+        self._collect_lock = threading.Lock()
+
+    def collect(self) -> str:
+        """Render every metric in the Prometheus text exposition format.
+
+        Returns:
+            Exposition text ending in a newline
+        """
+        # One collection at a time: the HTTP server and textfile writer share
+        # the repository connection of whichever thread collects
+        with self._collect_lock:
+            families = self._collect_run() + self._collect_rate_limiter()
+            families += self._collect_storage() + self._collect_process()
+        base_labels = {"job": self.job}
+        lines = [line for family in families for line in family.render(base_labels)]
+        return "\n".join(lines) + "\n"
+
+    def _collect_run(self) -> list[_Family]:
+        if self.metrics is None:
+            return []
+        snapshot = self.metrics.snapshot()
+        processed = _Family("items_processed_total", "counter", "Items processed by content type")
+        for content_type, count in sorted(snapshot["by_type"].items()):
+            processed.add(count, content_type=_content_type_name(content_type))
+        expected = _Family("items_expected", "gauge", "Expected items by content type")
+        for content_type, total in sorted(snapshot["total_by_type"].items()):
+            expected.add(total, content_type=_content_type_name(content_type))
+
+        latency = _Family("phase_latency_seconds", "summary", "Latency of each work phase")
+        for phase, summary in sorted(snapshot["latency"].items()):
+            self._add_summary(latency, summary, phase=phase)
+        endpoint_latency = _Family(
+            "api_latency_seconds", "summary", "Latency of each Looker API endpoint"
+        )
+        for endpoint, summary in sorted(snapshot["endpoint_latency"].items()):
+            self._add_summary(endpoint_latency, summary, endpoint=endpoint)
+
+        return [
+            processed,
+            expected,
+            _Family("errors_total", "counter", "Errors recorded by workers").add(
+                snapshot["errors"]
+            ),
+            _Family("batches_completed_total", "counter", "Batches completed").add(
+                snapshot["batches_completed"]
+            ),
+            _Family("items_per_second", "gauge", "Throughput since the run started").add(
+                snapshot["items_per_second"]
+            ),
+            _Family("run_duration_seconds", "gauge", "Seconds since the run started").add(
+                snapshot["duration_seconds"]
+            ),
+            latency,
+            endpoint_latency,
+        ]
+
+    @staticmethod
+    def _add_summary(family: _Family, summary: dict[str, float], **labels: str) -> None:
+        for key, value in summary.items():
+            if key.startswith("p") and key.endswith("_ms"):
+                quantile = str(int(key[1:-3]) / 100)
+                family.add(value / 1000, quantile=quantile, **labels)
+        family.add(summary["mean_ms"] * summary["count"] / 1000, "_sum", **labels)
+        family.add(summary["count"], "_count", **labels)
+
+    def _collect_rate_limiter(self) -> list[_Family]:
+        if self.rate_limiter is None:
+            return []
+        stats: dict[str, Any] = self.rate_limiter.get_stats()
+        families = [
+            _Family(
+                "rate_limit_requests_per_minute", "gauge", "Configured requests per minute"
+            ).add(stats["requests_per_minute"]),
+            _Family(
+                "rate_limit_requests_per_second", "gauge", "Configured burst requests per second"
+            ).add(stats["requests_per_second"]),
+            _Family("rate_limit_requests_total", "counter", "Requests admitted by the limiter").add(
+                stats["total_requests"]
+            ),
+            _Family(
+                "rate_limit_wait_seconds_total", "counter", "Time spent waiting on the limiter"
+            ).add(stats["total_wait_seconds"]),
+        ]
+        if stats.get("adaptive_enabled"):
+            families += [
+                _Family("rate_limit_429_total", "counter", "HTTP 429 responses received").add(
+                    stats["total_429_count"]
+                ),
+                _Family(
+                    "rate_limit_backoff_multiplier", "gauge", "Current adaptive backoff multiplier"
+                ).add(stats["backoff_multiplier"]),
+            ]
+        return families
+
+    def _collect_storage(self) -> list[_Family]:
+        if self.repository is None:
+            return []
+        families = [
+            _Family("sqlite_busy_retries_total", "counter", "SQLITE_BUSY retries").add(
+                self.repository.busy_retry_count
+            ),
+            _Family("sqlite_wal_bytes", "gauge", "Size of the SQLite write-ahead log").add(
+                self.repository.wal_size_bytes()
+            ),
+        ]
+        try:
+            dead_letters = self.repository.count_dead_letter_items()
+        except Exception as e:
+            logger.debug(f"Could not count dead letter items: {e}")
+        else:
+            families.append(
+                _Family("dead_letter_items", "gauge", "Items in the dead letter queue").add(
+                    dead_letters
+                )
+            )
+        finally:
+            # Collection threads come and go; don't leave their connections open
+            self.repository.close_thread_connection()
+        return families
+
+    @staticmethod
+    def _collect_process() -> list[_Family]:
+        rss, peak = read_process_memory()
+        return [
+            _Family("process_resident_memory_bytes", "gauge", "Resident set size").add(rss),
+            _Family("process_peak_resident_memory_bytes", "gauge", "Peak resident set size").add(
+                peak
+            ),
+        ]
+
+    def write_textfile(self) -> None:
+        """Atomically rewrite the textfile with the current metrics.
+
+        Writes to a temporary file in the same directory and renames it over
+        the target, so node_exporter never reads a partial file.
+        """
+        if self.textfile is None:
+            return
+        self.textfile.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.textfile.with_name(f".{self.textfile.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(self.collect())
+        tmp_path.replace(self.textfile)
+
+    def start(self) -> None:
+        """Start the HTTP endpoint and/or textfile writer on daemon threads."""
+        self._stop.clear()
+        if self.port is not None:
+            self._server = HTTPServer((self.host, self.port), self._handler_class())
+            self.port = self._server.server_address[1]
+            self._threads.append(
+                threading.Thread(
+                    target=self._server.serve_forever, name="metrics-http", daemon=True
+                )
+            )
+            logger.info(f"Serving Prometheus metrics on http://{self.host}:{self.port}/metrics")
+        if self.textfile is not None:
+            self._threads.append(
+                threading.Thread(target=self._run_textfile, name="metrics-textfile", daemon=True)
+            )
+            logger.info(f"Writing Prometheus metrics to {self.textfile}")
+        for thread in self._threads:
+            thread.start()
+
+    def stop(self) -> None:
+        """Stop publishing; the textfile is rewritten once more with final values."""
+        self._stop.set()
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        for thread in self._threads:
+            thread.join(timeout=self.interval + 1)
+        self._threads = []
+
+    def _run_textfile(self) -> None:
+        while True:
+            try:
+                self.write_textfile()
+            except Exception as e:
+                logger.warning(f"Failed to write metrics textfile {self.textfile}: {e}")
+            if self._stop.is_set():
+                return
+            self._stop.wait(self.interval)
+
+    def _handler_class(self) -> type[BaseHTTPRequestHandler]:
+        exporter = self
+
+        class _MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:  # noqa: N802 - http.server naming
+                if self.path.split("?", 1)[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = exporter.collect().encode()
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: Any) -> None:
+                logger.debug(f"metrics scrape: {format % args}")
+
+        return _MetricsHandler
+
+    def __enter__(self) -> "MetricsExporter":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
@@ -28,6 +28,10 @@ Architecture:
 import logging
 import threading
 from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from lookervault.extraction.page_size_controller import AdaptivePageSizeController
 
 logger = logging.getLogger(__name__)
 
@@ -51,12 +55,15 @@ class FolderRange:
         current_offset: Next offset to claim for this folder (starts at 0, increments by stride)
         workers_done: Number of workers that hit end-of-data for this folder
         total_claimed: Total number of ranges claimed for this folder (metrics only)
+        end_offset: First offset known to be past the end of data (None until a
+            worker sees an empty or short page)
     """
 
     folder_id: str
     current_offset: int = 0
     workers_done: int = 0
     total_claimed: int = 0
+    end_offset: int | None = None
 
 
 @dataclass
@@ -76,7 +83,7 @@ class MultiFolderOffsetCoordinator:
         1. Worker calls claim_range()
         2. Coordinator selects next folder using round-robin
         3. If folder exhausted (workers_done >= total_workers), skip to next
-        4. Claim offset range for folder, increment offset by stride
+        4. Claim offset range for folder, increment offset by the claimed limit
         5. Return (folder_id, offset, limit) tuple
         6. Worker fetches data with SDK filtering: extract_range(folder_id=X)
         7. If empty results, worker calls mark_folder_complete(folder_id)
@@ -90,6 +97,7 @@ class MultiFolderOffsetCoordinator:
 
     folder_ids: list[str]
     stride: int
+    page_size_controller: "AdaptivePageSizeController | None" = None
     _folder_ranges: dict[str, FolderRange] = field(default_factory=dict, init=False)
     _lock: threading.Lock = field(default_factory=threading.Lock, init=False)
     _next_folder_idx: int = field(default=0, init=False)
@@ -143,6 +151,13 @@ class MultiFolderOffsetCoordinator:
         Thread Safety:
             Protected by self._lock for safe concurrent access
         """
+        # Read outside our lock: the controller has its own lock
+        limit = (
+            self.page_size_controller.current_size
+            if self.page_size_controller is not None
+            else self.stride
+        )
+
         with self._lock:
             attempts = 0
             max_attempts = len(self.folder_ids)
@@ -179,6 +194,15 @@ class MultiFolderOffsetCoordinator:
                     attempts += 1
                     continue
 
+                # A folder is also exhausted once its end offset is known and every
+                # range before it has been claimed - no empty probes needed
+                if (
+                    folder_range.end_offset is not None
+                    and folder_range.current_offset >= folder_range.end_offset
+                ):
+                    attempts += 1
+                    continue
+
                 # Claim range for this folder
                 #
                 # Each folder maintains its own independent offset counter.
@@ -189,15 +213,15 @@ class MultiFolderOffsetCoordinator:
                 # This allows parallel workers to fetch different pages
                 # of the same folder simultaneously.
                 offset = folder_range.current_offset
-                folder_range.current_offset += self.stride
+                folder_range.current_offset += limit
                 folder_range.total_claimed += 1
 
                 logger.debug(
                     f"Claimed range: folder_id={folder_id}, offset={offset}, "
-                    f"limit={self.stride} (claimed={folder_range.total_claimed})"
+                    f"limit={limit} (claimed={folder_range.total_claimed})"
                 )
 
-                return (folder_id, offset, self.stride)
+                return (folder_id, offset, limit)
 
             # All folders exhausted
             #
@@ -206,11 +230,14 @@ class MultiFolderOffsetCoordinator:
             logger.info("All folders exhausted - no more work to claim")
             return None
 
-    def mark_folder_complete(self, folder_id: str) -> None:
+    def mark_folder_complete(self, folder_id: str, end_offset: int | None = None) -> None:
         """Mark that a worker hit end-of-data for a folder.
 
         Args:
             folder_id: Folder ID that reached end of data
+            end_offset: Offset just past the last item seen (offset of the empty page,
+                or offset + items of the short page). Once known, ranges at or beyond
+                it are no longer handed out for this folder.
 
         Thread Safety:
             Protected by self._lock for safe concurrent access
@@ -236,6 +263,12 @@ class MultiFolderOffsetCoordinator:
         with self._lock:
             folder_range = self._folder_ranges[folder_id]
             folder_range.workers_done += 1
+            if end_offset is not None:
+                folder_range.end_offset = (
+                    end_offset
+                    if folder_range.end_offset is None
+                    else min(folder_range.end_offset, end_offset)
+                )
 
             logger.info(
                 f"Folder {folder_id} marked complete by worker "
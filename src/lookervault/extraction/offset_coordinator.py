@@ -1,6 +1,11 @@
 """Thread-safe coordinator for parallel offset-based pagination."""
 
+import math
 import threading
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from lookervault.extraction.page_size_controller import AdaptivePageSizeController
 
 
 class OffsetCoordinator:
@@ -33,11 +38,17 @@ class OffsetCoordinator:
         All methods are thread-safe and use a mutex lock for synchronization.
     """
 
-    def __init__(self, stride: int):
+    def __init__(
+        self,
+        stride: int,
+        page_size_controller: "AdaptivePageSizeController | None" = None,
+    ):
         """Initialize offset coordinator.
 
         Args:
             stride: Number of items per offset range (batch size)
+            page_size_controller: Optional adaptive controller; when set, each claim
+                uses its current page size instead of the fixed stride
 
         Example:
             Create a coordinator that fetches 100 items at a time:
@@ -46,11 +57,16 @@ class OffsetCoordinator:
         """
         self._current_offset = 0
         self._stride = stride
+        self.page_size_controller = page_size_controller
         self._lock = threading.Lock()
         self._workers_done = 0
         self._total_workers = 0
+        # First offset past the end of data, once known (probed or observed)
+        self._end_offset: int | None = None
+        # True while _end_offset comes from a probe rather than an observed short page
+        self._end_is_estimate = False
 
-    def claim_range(self) -> tuple[int, int]:
+    def claim_range(self) -> tuple[int, int] | None:
         """Atomically claim next offset range.
 
         Thread-safe method that returns the next available offset range
@@ -60,6 +76,8 @@ class OffsetCoordinator:
             Tuple of (start_offset, limit) where:
             - start_offset: Starting offset for this range (0-based)
             - limit: Number of items to fetch
+            or None once the end of data is known and every range before it
+            has been claimed
 
         Example:
             Sequential calls return increasing offset ranges:
@@ -82,10 +100,99 @@ class OffsetCoordinator:
             ...             break
             ...         process(items)
         """
+        # Read outside our lock: the controller has its own lock
+        adaptive_size = (
+            self.page_size_controller.current_size
+            if self.page_size_controller is not None
+            else None
+        )
         with self._lock:
+            if self._end_offset is not None and self._current_offset >= self._end_offset:
+                return None
+
+            # Advance by the claimed limit so offsets stay contiguous when the size changes
             start = self._current_offset
-            self._current_offset += self._stride
-            return (start, self._stride)
+            limit = adaptive_size if adaptive_size is not None else self._stride
+            self._current_offset += limit
+            return (start, limit)
+
+    def set_total_count(self, total: int) -> None:
+        """Bound claims by a probed total item count and balance page sizes.
+
+        Claims stop once the offset reaches ``total``, so workers no longer burn
+        one empty request each to discover the end. With a fixed stride, the
+        range is also split into equal pages (e.g. 1010 items at stride 100
+        become 11 pages of 92 instead of 10 full pages plus a 10-item tail),
+        keeping the page count unchanged.
+
+        The bound is treated as an estimate: content created mid-run can push the
+        real end past it, which workers report via record_full_page().
+
+        Args:
+            total: Probed number of items
+
+        Example:
+            >>> coordinator = OffsetCoordinator(stride=100)
+            >>> coordinator.set_total_count(150)
+            >>> coordinator.claim_range(), coordinator.claim_range(), coordinator.claim_range()
+            ((0, 75), (75, 75), None)
+        """
+        with self._lock:
+            self._end_offset = total
+            self._end_is_estimate = True
+            if self.page_size_controller is None and total > 0:
+                pages = math.ceil(total / self._stride)
+                self._stride = math.ceil(total / pages)
+
+    def mark_end_of_data(self, end_offset: int) -> None:
+        """Record that no items exist at or beyond ``end_offset``.
+
+        Called by a worker that received an empty page (end_offset = page offset)
+        or a short page (end_offset = offset + items received). Outstanding claims
+        past the end are cancelled: claim_range() returns None from now on.
+
+        Args:
+            end_offset: First offset known to be past the end of data
+
+        Example:
+            >>> coordinator = OffsetCoordinator(stride=100)
+            >>> coordinator.claim_range()
+            (0, 100)
+            >>> coordinator.mark_end_of_data(40)
+            >>> coordinator.claim_range() is None
+            True
+        """
+        with self._lock:
+            if self._end_offset is None or self._end_is_estimate:
+                self._end_offset = end_offset
+            else:
+                self._end_offset = min(self._end_offset, end_offset)
+            self._end_is_estimate = False
+
+    def record_full_page(self, end_offset: int) -> None:
+        """Drop a probed bound that a full page has proven too low.
+
+        Args:
+            end_offset: Offset just past the last item of a full page
+        """
+        with self._lock:
+            if (
+                self._end_is_estimate
+                and self._end_offset is not None
+                and end_offset >= self._end_offset
+            ):
+                # More items than probed: fall back to end-of-data detection
+                self._end_offset = None
+                self._end_is_estimate = False
+
+    def get_end_offset(self) -> int | None:
+        """Get the known (or probed) end offset, if any.
+
+        Returns:
+            First offset past the end of data, or None if unknown
+        """
+        with self._lock:
+            return self._end_offset
 
     def mark_worker_complete(self) -> None:
         """Mark a worker as complete (hit end-of-data).
@@ -106,8 +213,13 @@ class OffsetCoordinator:
     def all_workers_done(self) -> bool:
         """Check if all workers have completed.
 
+        Once the end of data is observed (mark_end_of_data) and every range before
+        it has been claimed, no worker can receive more work, so this is True
+        without waiting for each worker to hit an empty page.
+
         Returns:
-            True if all workers have called mark_worker_complete()
+            True if all workers have called mark_worker_complete() or no ranges
+            remain before the observed end of data
 
         Example:
             >>> coordinator = OffsetCoordinator(stride=100)
@@ -120,7 +232,12 @@ class OffsetCoordinator:
             True
         """
         with self._lock:
-            return self._workers_done >= self._total_workers
+            end_reached = (
+                self._end_offset is not None
+                and not self._end_is_estimate
+                and self._current_offset >= self._end_offset
+            )
+            return self._workers_done >= self._total_workers or end_reached
 
     def set_total_workers(self, count: int) -> None:
         """Set expected number of workers.
@@ -6,9 +6,11 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
+from lookervault.constants import INDEX_SWEEP_BATCH_SIZE
 from lookervault.exceptions import OrchestrationError
 from lookervault.extraction.batch_processor import MemoryAwareBatchProcessor
 from lookervault.extraction.progress import ProgressTracker
+from lookervault.looker.field_profiles import FieldProfile, get_profile_fields, resolve_fields
 from lookervault.storage.models import (
     Checkpoint,
     ContentItem,
@@ -39,6 +41,8 @@ class ExtractionConfig:
     output_mode: str = "table"
     folder_ids: set[str] | None = None
     recursive_folders: bool = False
+    field_profile: str | None = None  # "index", "restore-complete" or "full" (None = all fields)
+    two_phase: bool = False  # Index sweep + targeted detail fetch (dashboards/looks)
 
 
 @dataclass
@@ -54,6 +58,9 @@ class ExtractionResult:
     new_items: int = 0
     updated_items: int = 0
     deleted_items: int = 0
+    # Latency summaries (ms percentiles) per phase and per API endpoint (parallel only)
+    latency: dict[str, dict[str, float]] = field(default_factory=dict)
+    endpoint_latency: dict[str, dict[str, float]] = field(default_factory=dict)
 
 
 class ExtractionOrchestrator:
@@ -82,6 +89,7 @@ class ExtractionOrchestrator:
         self.progress = progress
         self.config = config
         self.batch_processor = MemoryAwareBatchProcessor()
+        self._deleted_items = 0
 
     def extract(self) -> ExtractionResult:
         """Execute extraction workflow.
@@ -101,6 +109,7 @@ class ExtractionOrchestrator:
                 "content_types": self.config.content_types,
                 "batch_size": self.config.batch_size,
                 "fields": self.config.fields,
+                "field_profile": self.config.field_profile,
             },
         )
         self.repository.create_session(session)
@@ -108,6 +117,7 @@ class ExtractionOrchestrator:
         logger.info(f"Starting extraction session {session.id}")
 
         result = ExtractionResult(session_id=session.id, total_items=0)
+        self._deleted_items = 0
 
         try:
             # Expand folder hierarchy BEFORE any content type extraction
@@ -119,6 +129,7 @@ class ExtractionOrchestrator:
                 items_extracted = self._extract_content_type(content_type, session.id)
                 result.items_by_type[content_type] = items_extracted
                 result.total_items += items_extracted
+            result.deleted_items = self._deleted_items
 
             # Mark session as complete
             session.status = SessionStatus.COMPLETED
@@ -196,6 +207,9 @@ class ExtractionOrchestrator:
             # Extract items from Looker API
             # Handle folder-level filtering for dashboards and looks
             content_type_enum = ContentType(content_type)
+            fields = resolve_fields(
+                content_type_enum, self.config.fields, self.config.field_profile
+            )
             supports_folder_filtering = content_type_enum in [
                 ContentType.DASHBOARD,
                 ContentType.LOOK,
@@ -214,7 +228,7 @@ class ExtractionOrchestrator:
                 iterators = [
                     self.extractor.extract_all(
                         content_type_enum,
-                        fields=self.config.fields,
+                        fields=fields,
                         batch_size=self.config.batch_size,
                         updated_after=updated_after,
                         folder_id=folder_id,
@@ -234,7 +248,7 @@ class ExtractionOrchestrator:
                 )
                 items_iterator = self.extractor.extract_all(
                     content_type_enum,
-                    fields=self.config.fields,
+                    fields=fields,
                     batch_size=self.config.batch_size,
                     updated_after=updated_after,
                     folder_id=folder_id,
@@ -243,17 +257,11 @@ class ExtractionOrchestrator:
                 # No folder filtering or content type doesn't support it
                 items_iterator = self.extractor.extract_all(
                     content_type_enum,
-                    fields=self.config.fields,
+                    fields=fields,
                     batch_size=self.config.batch_size,
                     updated_after=updated_after,
                 )
 
-            # For incremental mode, get existing IDs for soft delete detection
-            existing_ids = set()
-            extracted_ids = set()
-            if self.config.incremental:
-                existing_ids = self.repository.get_content_ids(content_type)
-
             # Count items first to show progress (if we can)
             # For now, start with unknown total
             self.progress.start_task(task_id, f"Extracting {content_type_name}", total=None)
@@ -263,10 +271,6 @@ class ExtractionOrchestrator:
                 # Create ContentItem
                 content_item = self._dict_to_content_item(item_dict, content_type)
 
-                # Track extracted IDs for soft delete detection
-                if self.config.incremental:
-                    extracted_ids.add(content_item.id)
-
                 # Save to repository
                 self.repository.save_content(content_item)
 
@@ -274,16 +278,12 @@ class ExtractionOrchestrator:
                 items_count += 1
                 self.progress.update_task(task_id, advance=1)
 
-            # Handle soft deletes in incremental mode
+            # Incremental runs only see changed items; reconcile deletions against
+            # a full index sweep of the live ids
             deleted_count = 0
             if self.config.incremental and updated_after:
-                deleted_ids = existing_ids - extracted_ids
-                for deleted_id in deleted_ids:
-                    self.repository.delete_content(deleted_id, soft=True)
-                    deleted_count += 1
-
-                if deleted_count > 0:
-                    logger.info(f"Marked {deleted_count} {content_type_name} as deleted")
+                deleted_count = self._reconcile_deletions(content_type_enum)
+                self._deleted_items += deleted_count
 
             # Complete checkpoint
             checkpoint.completed_at = datetime.now()
@@ -304,6 +304,53 @@ class ExtractionOrchestrator:
             logger.error(f"Failed to extract {content_type_name}: {e}")
             raise OrchestrationError(f"Failed to extract {content_type_name}: {e}") from e
 
+    def _reconcile_deletions(self, content_type: ContentType) -> int:
+        """Soft-delete stored items that no longer exist in Looker.
+
+        Sweeps the complete live id set with the "index" field profile (scoped to
+        the configured folders for dashboards and looks) and lets the repository
+        compute the set difference in SQL.
+
+        A failed sweep skips reconciliation with a warning, since an incomplete id
+        set must never be used for deletion.
+
+        Args:
+            content_type: ContentType enum value
+
+        Returns:
+            Number of items soft-deleted
+        """
+        content_type_name = content_type.name.lower()
+        folder_scope = (
+            self.config.folder_ids
+            if content_type in (ContentType.DASHBOARD, ContentType.LOOK)
+            else None
+        )
+        index_fields = get_profile_fields(content_type, FieldProfile.INDEX)
+
+        live_ids: set[str] = set()
+        try:
+            for folder_id in sorted(folder_scope) if folder_scope else [None]:
+                for item_dict in self.extractor.extract_all(
+                    content_type,
+                    fields=index_fields,
+                    batch_size=INDEX_SWEEP_BATCH_SIZE,
+                    folder_id=folder_id,
+                ):
+                    item_id = self._get_item_id(item_dict, content_type)
+                    if item_id:
+                        live_ids.add(f"{content_type_name}::{item_id}")
+        except Exception as e:
+            logger.warning(f"Skipping deletion reconciliation for {content_type_name}: {e}")
+            return 0
+
+        deleted_count = self.repository.reconcile_deleted_content(
+            content_type.value, live_ids, folder_ids=folder_scope
+        )
+        if deleted_count > 0:
+            logger.info(f"Marked {deleted_count} {content_type_name} as deleted")
+        return deleted_count
+
     def _resume_extraction(self, content_type: int, checkpoint: Checkpoint) -> int:
         """Resume extraction from checkpoint.
 
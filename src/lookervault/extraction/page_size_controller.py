@@ -0,0 +1,172 @@
+"""Adaptive page-size controller for offset-based parallel extraction."""
+
+import logging
+import threading
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class AdaptivePageSizeController:
+    """Thread-safe controller that tunes API page size from observed page costs.
+
+    Workers report every page fetch (latency, payload bytes, items received) or
+    failure. The controller keeps exponentially weighted averages of per-item
+    latency, per-item payload size and error rate, and derives the page size that
+    keeps a single request under the latency and payload targets:
+
+    - Errors halve the page size immediately (multiplicative decrease)
+    - Pages over the latency/payload target shrink toward the target (at most halving)
+    - Healthy full pages grow toward the target by at most 1.5x per observation
+    - The size is always clamped to [min_size, max_size]
+
+    The controller only decides the size of *future* claims. Offset coordinators
+    advance offsets by the limit actually claimed, so offsets stay contiguous and
+    no items are skipped when the size changes mid-run.
+
+    Example:
+        >>> controller = AdaptivePageSizeController(initial_size=100, min_size=10, max_size=500)
+        >>> controller.record_error()
+        >>> controller.current_size
+        50
+    """
+
+    def __init__(
+        self,
+        initial_size: int,
+        min_size: int,
+        max_size: int,
+        target_latency_seconds: float = 5.0,
+        max_page_bytes: int = 8 * 1024 * 1024,
+        smoothing: float = 0.3,
+        max_error_rate: float = 0.1,
+    ):
+        """Initialize page-size controller.
+
+        Args:
+            initial_size: Starting page size (clamped to bounds)
+            min_size: Smallest page size the controller may choose
+            max_size: Largest page size the controller may choose
+            target_latency_seconds: Desired wall-clock time per page request
+            max_page_bytes: Desired upper bound on serialized bytes per page
+            smoothing: EWMA weight given to each new observation (0-1)
+            max_error_rate: Error rate above which the page size never grows
+
+        Raises:
+            ValueError: If bounds are invalid
+        """
+        if min_size < 1 or max_size < min_size:
+            raise ValueError(f"Invalid page size bounds: min={min_size}, max={max_size}")
+
+        self.min_size = min_size
+        self.max_size = max_size
+        self.target_latency_seconds = target_latency_seconds
+        self.max_page_bytes = max_page_bytes
+        self.smoothing = smoothing
+        self.max_error_rate = max_error_rate
+
+        self._size = self._clamp(initial_size)
+        self._lock = threading.Lock()
+        self._item_latency: float | None = None
+        self._item_bytes: float | None = None
+        self._error_rate = 0.0
+        self._adjustments = 0
+
+    @property
+    def current_size(self) -> int:
+        """Page size to use for the next claimed range."""
+        with self._lock:
+            return self._size
+
+    def record_page(
+        self,
+        requested: int,
+        received: int,
+        latency_seconds: float,
+        payload_bytes: int | None = None,
+    ) -> None:
+        """Record a successful page fetch and retune the page size.
+
+        Args:
+            requested: Page size (limit) that was requested
+            received: Number of items returned
+            latency_seconds: Wall-clock time for the request
+            payload_bytes: Serialized size of the returned items (None if unknown)
+        """
+        with self._lock:
+            self._error_rate = self._ewma(self._error_rate, 0.0)
+
+            # Empty pages carry no usable per-item cost signal
+            if received <= 0:
+                return
+
+            self._item_latency = self._ewma(self._item_latency, latency_seconds / received)
+            if payload_bytes is not None:
+                self._item_bytes = self._ewma(self._item_bytes, payload_bytes / received)
+
+            target = self._target_size()
+            if target < self._size:
+                self._resize(max(target, self._size // 2), "page cost over target")
+            elif (
+                target > self._size
+                and received >= requested
+                and self._error_rate <= self.max_error_rate
+            ):
+                self._resize(min(target, int(self._size * 1.5)), "page cost under target")
+
+    def record_error(self) -> None:
+        """Record a failed page fetch (timeout, 5xx) and halve the page size."""
+        with self._lock:
+            self._error_rate = self._ewma(self._error_rate, 1.0)
+            self._resize(self._size // 2, "fetch error")
+
+    def snapshot(self) -> dict[str, Any]:
+        """Get controller state for checkpoint_data.
+
+        Returns:
+            Dictionary with the current page size and observed averages
+        """
+        with self._lock:
+            return {
+                "page_size": self._size,
+                "page_size_min": self.min_size,
+                "page_size_max": self.max_size,
+                "page_size_adjustments": self._adjustments,
+                "page_error_rate": round(self._error_rate, 4),
+                "page_item_latency_ms": (
+                    round(self._item_latency * 1000, 3) if self._item_latency is not None else None
+                ),
+                "page_item_bytes": (
+                    round(self._item_bytes) if self._item_bytes is not None else None
+                ),
+            }
+
+    def _target_size(self) -> int:
+        """Page size that meets both latency and payload targets (lock held)."""
+        by_latency = (
+            self.target_latency_seconds / self._item_latency
+            if self._item_latency
+            else self.max_size
+        )
+        by_bytes = self.max_page_bytes / self._item_bytes if self._item_bytes else self.max_size
+        return self._clamp(int(min(by_latency, by_bytes)))
+
+    def _resize(self, new_size: int, reason: str) -> None:
+        """Apply a new page size (lock held)."""
+        new_size = self._clamp(new_size)
+        if new_size == self._size:
+            return
+
+        logger.debug(f"Page size {self._size} -> {new_size} ({reason})")
+        self._size = new_size
+        self._adjustments += 1
+
+    def _ewma(self, current: float | None, observation: float) -> float:
+        """Exponentially weighted moving average update."""
+        if current is None:
+            return observation
+        return self.smoothing * observation + (1 - self.smoothing) * current
+
+    def _clamp(self, size: int) -> int:
+        """Clamp size to configured bounds."""
+        return max(self.min_size, min(self.max_size, size))
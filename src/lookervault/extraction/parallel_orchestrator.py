@@ -12,7 +12,7 @@ Thread-Safety Guarantees
 1. **Shared State Protection**
    - All shared mutable state is protected by locks
    - OffsetCoordinator/MultiFolderOffsetCoordinator: atomic offset range claiming
-   - ThreadSafeMetrics: atomic counter updates and snapshots
+   - ThreadSafeMetrics: per-thread counter/histogram shards merged on snapshot
    - AdaptiveRateLimiter: atomic backoff state changes
 
 2. **SQLite Access Synchronization**
@@ -37,7 +37,8 @@ Thread-Safety Mechanisms
 |-----------|-----------|---------------------|
 | OffsetCoordinator | threading.Lock | claim_range(), mark_worker_complete() |
 | MultiFolderOffsetCoordinator | threading.Lock | claim_range(), mark_folder_complete() |
-| ThreadSafeMetrics | threading.Lock | increment_processed(), record_error(), snapshot() |
+| ThreadSafeMetrics | per-thread shards | increment_processed(), record_latency() |
+| ThreadSafeMetrics | threading.Lock | record_error(), snapshot() |
 | AdaptiveRateLimiter | threading.Lock | acquire(), on_429_detected(), on_success() |
 | SQLiteContentRepository | threading.local + BEGIN IMMEDIATE | save_content(), save_checkpoint() |
 
@@ -84,35 +85,51 @@ Performance Considerations
 
 import logging
 import threading
+import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any
 
 from lookervault.config.models import ParallelConfig
+from lookervault.constants import INDEX_SWEEP_BATCH_SIZE
 from lookervault.exceptions import OrchestrationError
 from lookervault.extraction.batch_processor import MemoryAwareBatchProcessor
-from lookervault.extraction.metrics import ThreadSafeMetrics
+from lookervault.extraction.index_diff import diff_index
+from lookervault.extraction.memory_monitor import read_process_memory
+from lookervault.extraction.metrics import LatencyPhase, ThreadSafeMetrics
 from lookervault.extraction.multi_folder_coordinator import MultiFolderOffsetCoordinator
 from lookervault.extraction.offset_coordinator import OffsetCoordinator
 from lookervault.extraction.orchestrator import ExtractionConfig, ExtractionResult
+from lookervault.extraction.page_size_controller import AdaptivePageSizeController
 from lookervault.extraction.progress import ProgressTracker
 from lookervault.extraction.rate_limiter import AdaptiveRateLimiter
+from lookervault.extraction.worker_scaler import DynamicWorkerScaler
+from lookervault.looker.field_profiles import FieldProfile, get_profile_fields, resolve_fields
 from lookervault.storage.models import (
     Checkpoint,
     ContentItem,
     ContentType,
     ExtractionSession,
+    RunTelemetry,
     SessionStatus,
 )
 from lookervault.storage.repository import ContentRepository, SQLiteContentRepository
 from lookervault.storage.serializer import ContentSerializer
 from lookervault.utils.datetime_parsing import parse_timestamp
+from lookervault.utils.tracing import span
 
 if TYPE_CHECKING:
     from lookervault.looker.extractor import ContentExtractor
 
 logger = logging.getLogger(__name__)
 
+# Content types eligible for two-phase extraction (index sweep + targeted detail fetch)
+TWO_PHASE_TYPES = {ContentType.DASHBOARD.value, ContentType.LOOK.value}
+
+# Longest a fetch worker pauses before claiming more work while critical memory is
+# still rising (short next to a page fetch, so a plateaued RSS costs little)
+MEMORY_BACKPRESSURE_WAIT_SECONDS = 0.5
+
 
 class ParallelOrchestrator:
     """Parallel orchestrator using dynamic work stealing pattern.
@@ -146,7 +163,8 @@ class ParallelOrchestrator:
             before parallel execution begins. It sets up thread-safe components:
 
             1. ThreadSafeMetrics (self.metrics):
-               - All operations protected by internal lock
+               - Item counters and latency histograms are per-thread shards (no lock)
+               - Errors and totals protected by internal lock
                - Safe for concurrent increments and snapshots from workers
 
             2. AdaptiveRateLimiter (self.rate_limiter):
@@ -181,14 +199,26 @@ class ParallelOrchestrator:
         self.progress = progress
         self.config = config
         self.parallel_config = parallel_config
-        self.batch_processor = MemoryAwareBatchProcessor()
+        self.batch_processor = MemoryAwareBatchProcessor(
+            warning_mb=parallel_config.memory_warning_mb,
+            critical_mb=parallel_config.memory_critical_mb,
+        )
 
         # Parallel execution state
-        # Thread-safe: metrics uses internal lock for all operations
+        # Thread-safe: metrics shards per-item counters per thread, locks the rest
         self.metrics = ThreadSafeMetrics()
+        # Extractor records API, rate-limit wait and conversion latencies into it
+        if hasattr(extractor, "metrics"):
+            extractor.metrics = self.metrics  # type: ignore[attr-defined]
         self._last_progress_print = (
             0  # Track when we last printed progress (single-writer: main thread only)
         )
+        # New/updated/deleted counts from two-phase extraction (single-writer: main thread only)
+        self._change_counts = {"new": 0, "updated": 0, "deleted": 0}
+        # Repository SQLITE_BUSY retry count when extract() started (for run telemetry)
+        self._busy_retries_at_start = 0
+        # Wall-clock seconds spent per content type (single-writer: main thread only)
+        self._seconds_by_type: dict[int, float] = {}
 
         # Create shared rate limiter for all workers
         # Thread-safe: rate_limiter uses internal lock for sliding window updates
@@ -260,9 +290,11 @@ class ParallelOrchestrator:
             OrchestrationError: If extraction fails
         """
         start_time = datetime.now()
+        self._busy_retries_at_start = getattr(self.repository, "busy_retry_count", 0)
         session = self._initialize_or_resume_session()
 
         result = ExtractionResult(session_id=session.id, total_items=0)
+        self.batch_processor.start_monitoring()
 
         try:
             self._prepare_folder_hierarchy(session)
@@ -272,6 +304,8 @@ class ParallelOrchestrator:
         except Exception as e:
             self._handle_extraction_failure(session, result, e)
             raise
+        finally:
+            self.batch_processor.stop_monitoring()
 
     def _initialize_or_resume_session(self) -> ExtractionSession:
         """Initialize new session or resume existing session.
@@ -326,6 +360,7 @@ class ParallelOrchestrator:
                 "content_types": self.config.content_types,
                 "batch_size": self.config.batch_size,
                 "fields": self.config.fields,
+                "field_profile": self.config.field_profile,
                 "workers": self.parallel_config.workers,
                 "queue_size": self.parallel_config.queue_size,
             },
@@ -394,6 +429,7 @@ class ParallelOrchestrator:
         # Skip if checkpoint already complete
         if self._should_skip_content_type(content_type, content_type_name, session.id):
             return
+        type_start = time.monotonic()
 
         # Determine extraction strategy
         is_paginated = self._is_paginated_type(content_type)
@@ -404,6 +440,14 @@ class ParallelOrchestrator:
             content_type, content_type_name, is_paginated, session.id, updated_after
         )
 
+        # Incremental runs only see changed items; reconcile deletions against a full
+        # index sweep (two-phase extraction already reconciles as part of its diff)
+        uses_two_phase = self.config.two_phase and content_type in TWO_PHASE_TYPES
+        if updated_after is not None and not uses_two_phase:
+            self._reconcile_deletions(content_type, content_type_name, is_paginated)
+
+        self._seconds_by_type[content_type] = time.monotonic() - type_start
+
     def _should_skip_content_type(
         self, content_type: int, content_type_name: str, session_id: str
     ) -> bool:
@@ -496,6 +540,16 @@ class ParallelOrchestrator:
             session_id: Current session ID
             updated_after: Timestamp for incremental filtering
         """
+        if self.config.two_phase and content_type in TWO_PHASE_TYPES:
+            logger.info(f"Using two-phase strategy for {content_type_name} (index sweep + detail)")
+            self._extract_two_phase(content_type=content_type, session_id=session_id)
+            return
+
+        # Explicit --fields wins over the named field profile
+        fields = resolve_fields(
+            ContentType(content_type), self.config.fields, self.config.field_profile
+        )
+
         if is_paginated and self.parallel_config.workers > 1:
             logger.info(
                 f"Using parallel fetch strategy for {content_type_name} "
@@ -504,7 +558,7 @@ class ParallelOrchestrator:
             self._extract_parallel(
                 content_type=content_type,
                 session_id=session_id,
-                fields=self.config.fields,
+                fields=fields,
                 updated_after=updated_after,
             )
         else:
@@ -513,7 +567,7 @@ class ParallelOrchestrator:
             self._extract_sequential(
                 content_type=content_type,
                 session_id=session_id,
-                fields=self.config.fields,
+                fields=fields,
                 updated_after=updated_after,
             )
 
@@ -535,6 +589,18 @@ class ParallelOrchestrator:
         result.total_items = final_metrics["total"]
         result.items_by_type = final_metrics["by_type"]
         result.errors = final_metrics["errors"]
+        result.new_items = self._change_counts["new"]
+        result.updated_items = self._change_counts["updated"]
+        result.deleted_items = self._change_counts["deleted"]
+        result.latency = final_metrics["latency"]
+        result.endpoint_latency = final_metrics["endpoint_latency"]
+        self.progress.emit_event(
+            "extraction_metrics",
+            total=result.total_items,
+            items_per_second=round(final_metrics["items_per_second"], 2),
+            latency=result.latency,
+            endpoint_latency=result.endpoint_latency,
+        )
 
         # Mark session as complete
         session.status = SessionStatus.COMPLETED
@@ -547,9 +613,56 @@ class ParallelOrchestrator:
         result.duration_seconds = (datetime.now() - start_time).total_seconds()
 
         self._log_completion_summary(result, final_metrics)
+        self._record_telemetry(session, result, final_metrics)
 
         return result
 
+    def _record_telemetry(
+        self, session: ExtractionSession, result: ExtractionResult, final_metrics: dict
+    ) -> None:
+        """Save this run's performance telemetry for auto-tuning later runs.
+
+        Telemetry is best-effort: a failed write is logged, never raised.
+        Content types skipped on resume have no entry in seconds_by_type.
+
+        Args:
+            session: Completed extraction session
+            result: Completed extraction result
+            final_metrics: Final metrics snapshot
+        """
+        limiter_stats: dict[str, Any] = self.rate_limiter.get_stats() if self.rate_limiter else {}
+        api_calls = limiter_stats.get("total_requests") or sum(
+            summary["count"] for summary in final_metrics["endpoint_latency"].values()
+        )
+        client = getattr(self.extractor, "client", None)
+        try:
+            self.repository.save_run_telemetry(
+                RunTelemetry(
+                    operation="extract",
+                    instance=str(getattr(client, "api_url", "") or ""),
+                    session_id=session.id,
+                    workers=self.parallel_config.workers,
+                    batch_size=self.config.batch_size,
+                    rate_limit_per_minute=limiter_stats.get("requests_per_minute"),
+                    rate_limit_per_second=limiter_stats.get("requests_per_second"),
+                    duration_seconds=result.duration_seconds,
+                    total_items=result.total_items,
+                    api_calls=api_calls,
+                    rate_limit_429s=limiter_stats.get("total_429_count", 0),
+                    rate_limit_wait_seconds=limiter_stats.get("total_wait_seconds", 0.0),
+                    busy_retries=getattr(self.repository, "busy_retry_count", 0)
+                    - self._busy_retries_at_start,
+                    error_count=result.errors,
+                    items_by_type=dict(result.items_by_type),
+                    avg_payload_bytes=self.repository.get_average_content_sizes(),
+                    seconds_by_type=dict(self._seconds_by_type),
+                    bytes_transferred=final_metrics.get("bytes", 0),
+                    peak_rss_bytes=read_process_memory()[1],
+                )
+            )
+        except Exception as e:
+            logger.warning(f"Failed to record run telemetry: {e}")
+
     def _log_completion_summary(self, result: ExtractionResult, final_metrics: dict) -> None:
         """Log extraction completion summary.
 
@@ -562,13 +675,21 @@ class ParallelOrchestrator:
             f"in {result.duration_seconds:.1f}s "
             f"({final_metrics['items_per_second']:.1f} items/sec)"
         )
+        for name, summary in {
+            **final_metrics["latency"],
+            **{f"api {e}": v for e, v in final_metrics["endpoint_latency"].items()},
+        }.items():
+            logger.info(
+                f"Latency {name}: p50={summary['p50_ms']:.1f}ms p95={summary['p95_ms']:.1f}ms "
+                f"p99={summary['p99_ms']:.1f}ms (n={summary['count']})"
+            )
 
         current_mem, peak_mem = self.batch_processor.get_memory_usage()
         if self.batch_processor.enable_monitoring and current_mem > 0:
             current_mb = current_mem / (1024 * 1024)
             peak_mb = peak_mem / (1024 * 1024)
             logger.info(
-                f"Memory usage: {current_mb:.1f} MB current, {peak_mb:.1f} MB peak "
+                f"Memory usage (RSS): {current_mb:.1f} MB current, {peak_mb:.1f} MB peak "
                 f"({self.parallel_config.workers} workers, "
                 f"queue_size={self.parallel_config.queue_size})"
             )
@@ -648,18 +769,34 @@ class ParallelOrchestrator:
         )
 
         # Choose coordinator based on folder configuration
-        coordinator = self._create_coordinator(content_type_name, is_multi_folder)
+        page_size_controller = self._create_page_size_controller(content_type, content_type_name)
+        coordinator = self._create_coordinator(
+            content_type_name, is_multi_folder, page_size_controller=page_size_controller
+        )
+        if isinstance(coordinator, OffsetCoordinator):
+            self._apply_total_count_probe(
+                content_type, content_type_name, coordinator, checkpoint, updated_after
+            )
 
         # Launch workers and collect results
-        total_items = self._launch_parallel_workers(
-            content_type=content_type,
-            coordinator=coordinator,
-            fields=fields,
-            updated_after=updated_after,
-            content_type_name=content_type_name,
-        )
+        try:
+            total_items = self._launch_parallel_workers(
+                content_type=content_type,
+                coordinator=coordinator,
+                fields=fields,
+                updated_after=updated_after,
+                content_type_name=content_type_name,
+            )
+        except BaseException:
+            # Persist tuned page size so a resumed run starts from it
+            if page_size_controller is not None:
+                checkpoint.checkpoint_data.update(page_size_controller.snapshot())
+                self.repository.update_checkpoint(checkpoint)
+            raise
 
         # Mark checkpoint complete
+        if page_size_controller is not None:
+            checkpoint.checkpoint_data.update(page_size_controller.snapshot())
         self._complete_parallel_checkpoint(checkpoint, total_items, content_type_name)
 
     def _is_multi_folder_extraction(self, content_type: int) -> bool:
@@ -712,27 +849,170 @@ class ParallelOrchestrator:
         checkpoint.id = checkpoint_id
         return checkpoint
 
+    def _apply_total_count_probe(
+        self,
+        content_type: int,
+        content_type_name: str,
+        coordinator: OffsetCoordinator,
+        checkpoint: Checkpoint,
+        updated_after: datetime | None,
+    ) -> None:
+        """Probe the total item count and bound the coordinator by it.
+
+        Skipped for incremental runs (the changed set is usually smaller than one
+        page, so probing would cost more than it saves) and in single-worker mode.
+
+        Args:
+            content_type: ContentType enum value
+            content_type_name: Human-readable content type name
+            coordinator: Single-folder offset coordinator to bound
+            checkpoint: Checkpoint to record the probed total in
+            updated_after: Incremental filter timestamp
+        """
+        if (
+            not self.parallel_config.probe_total_count
+            or self.parallel_config.workers <= 1
+            or updated_after is not None
+        ):
+            return
+
+        # The stored count is usually within a few items of the live count
+        hint = (
+            self.repository.count_content(content_type)
+            if not self.config.folder_ids
+            else self.config.batch_size
+        )
+        total = self._probe_total_count(content_type, hint or self.config.batch_size)
+        if total is None:
+            return
+
+        logger.info(f"Probed {total} {content_type_name} (hint {hint})")
+        coordinator.set_total_count(total)
+        self.metrics.set_total(content_type, total)
+        checkpoint.checkpoint_data["probed_total"] = total
+
+    def _probe_total_count(self, content_type: int, hint: int) -> int | None:
+        """Find the total item count by searching offsets with 1-item pages.
+
+        Brackets the end of data by galloping outward from ``hint`` (doubling the
+        step each time), then binary-searches the bracket. When the hint is exact
+        this costs three requests; in general about 2 * log2(|total - hint|).
+
+        Args:
+            content_type: ContentType enum value
+            hint: Expected item count (e.g. the stored count)
+
+        Returns:
+            Total item count, or None if probing failed
+        """
+        folder_id = (
+            list(self.config.folder_ids)[0]
+            if self.config.folder_ids and len(self.config.folder_ids) == 1
+            else None
+        )
+
+        def has_item_at(offset: int) -> bool:
+            items = self.extractor.extract_range(  # type: ignore[attr-defined]
+                ContentType(content_type),
+                offset=offset,
+                limit=1,
+                fields="id",
+                folder_id=folder_id,
+            )
+            return bool(items)
+
+        try:
+            if not has_item_at(0):
+                return 0
+
+            # Bracket the end: item at lo, nothing at hi
+            hint = max(hint, 1)
+            step = 1
+            if has_item_at(hint - 1):
+                lo, hi = hint - 1, hint
+                while has_item_at(hi):
+                    lo = hi
+                    step *= 2
+                    hi = lo + step
+            else:
+                lo, hi = max(hint - 1 - step, 0), hint - 1
+                while not has_item_at(lo):
+                    hi = lo
+                    step *= 2
+                    lo = max(hi - step, 0)
+
+            while hi - lo > 1:
+                mid = (lo + hi) // 2
+                if has_item_at(mid):
+                    lo = mid
+                else:
+                    hi = mid
+
+            return hi
+        except Exception as e:
+            logger.warning(f"Total count probe failed, using end-of-data detection: {e}")
+            return None
+
+    def _create_page_size_controller(
+        self, content_type: int, content_type_name: str
+    ) -> AdaptivePageSizeController | None:
+        """Create adaptive page-size controller if enabled.
+
+        Starts from the last page size recorded in sync_checkpoints for this content
+        type (so resumes and later runs reuse tuned sizes), falling back to batch_size.
+
+        Args:
+            content_type: ContentType enum value
+            content_type_name: Human-readable content type name
+
+        Returns:
+            Controller instance, or None if adaptive page sizing is disabled
+        """
+        if not self.parallel_config.adaptive_page_size:
+            return None
+
+        last_page_size = self.repository.get_last_page_size(content_type)
+        initial_size = last_page_size or self.config.batch_size
+        logger.info(
+            f"Adaptive page size for {content_type_name}: starting at {initial_size} "
+            f"(bounds {self.parallel_config.min_page_size}-{self.parallel_config.max_page_size}"
+            + (", from previous checkpoint)" if last_page_size else ")")
+        )
+
+        return AdaptivePageSizeController(
+            initial_size=initial_size,
+            min_size=self.parallel_config.min_page_size,
+            max_size=self.parallel_config.max_page_size,
+            target_latency_seconds=self.parallel_config.target_page_latency_seconds,
+        )
+
     def _create_coordinator(
         self,
         content_type_name: str,
         is_multi_folder: bool,
+        stride: int | None = None,
+        page_size_controller: AdaptivePageSizeController | None = None,
     ) -> "OffsetCoordinator | MultiFolderOffsetCoordinator":
         """Create appropriate coordinator for parallel extraction.
 
         Args:
             content_type_name: Human-readable content type name
             is_multi_folder: Whether to create multi-folder coordinator
+            stride: Page size override (defaults to config.batch_size)
+            page_size_controller: Optional adaptive page-size controller
 
         Returns:
             Configured coordinator instance
         """
+        stride = stride or self.config.batch_size
         if is_multi_folder:
             # Multi-folder: Use MultiFolderOffsetCoordinator for parallel SDK calls
             if self.config.folder_ids is None:
                 raise ValueError("folder_ids must be set for multi-folder coordination")
             coordinator = MultiFolderOffsetCoordinator(
                 folder_ids=list(self.config.folder_ids),
-                stride=self.config.batch_size,
+                stride=stride,
+                page_size_controller=page_size_controller,
             )
             coordinator.set_total_workers(self.parallel_config.workers)
             logger.info(
@@ -741,7 +1021,9 @@ class ParallelOrchestrator:
             )
         else:
             # Single-folder or no-folder: Use standard OffsetCoordinator
-            coordinator = OffsetCoordinator(stride=self.config.batch_size)
+            coordinator = OffsetCoordinator(
+                stride=stride, page_size_controller=page_size_controller
+            )
             coordinator.set_total_workers(self.parallel_config.workers)
             if self.config.folder_ids and len(self.config.folder_ids) == 1:
                 logger.info(
@@ -773,13 +1055,15 @@ class ParallelOrchestrator:
         Returns:
             Total items processed by all workers
         """
+        scaler = self._create_worker_scaler()
+        pool_size = scaler.max_workers if scaler else self.parallel_config.workers
         logger.info(
             f"Launching {self.parallel_config.workers} parallel fetch workers "
-            f"for {content_type_name}"
+            f"for {content_type_name}" + (f" (scaling up to {pool_size})" if scaler else "")
         )
 
-        with ThreadPoolExecutor(max_workers=self.parallel_config.workers) as executor:
-            # Submit parallel fetch workers
+        with ThreadPoolExecutor(max_workers=pool_size) as executor:
+            # Submit parallel fetch workers (beyond the active count they park)
             futures = [
                 executor.submit(
                     self._parallel_fetch_worker,
@@ -788,12 +1072,39 @@ class ParallelOrchestrator:
                     coordinator=coordinator,
                     fields=fields,
                     updated_after=updated_after,
+                    scaler=scaler,
                 )
-                for i in range(self.parallel_config.workers)
+                for i in range(pool_size)
             ]
 
             # Wait for all workers to complete and aggregate results
-            return self._aggregate_worker_results(futures)
+            if scaler is None:
+                return self._aggregate_worker_results(futures)
+            scaler.start()
+            try:
+                return self._aggregate_worker_results(futures)
+            finally:
+                scaler.stop()
+                logger.info(
+                    f"Dynamic scaling for {content_type_name}: {scaler.adjustments} "
+                    f"adjustments, ended with {scaler.active_workers} active workers"
+                )
+
+    def _create_worker_scaler(self) -> DynamicWorkerScaler | None:
+        """Create the online worker-count controller if dynamic scaling is enabled.
+
+        Returns:
+            DynamicWorkerScaler bounded by parallel_config, or None when disabled
+        """
+        if not self.parallel_config.dynamic_workers:
+            return None
+        return DynamicWorkerScaler(
+            initial_workers=self.parallel_config.workers,
+            max_workers=self.parallel_config.max_workers or self.parallel_config.workers,
+            metrics=self.metrics,
+            rate_limiter=self.rate_limiter,
+            repository=self.repository,
+        )
 
     def _aggregate_worker_results(self, futures: list) -> int:
         """Aggregate results from parallel workers.
@@ -836,6 +1147,296 @@ class ParallelOrchestrator:
 
         logger.info(f"Parallel extraction of {content_type_name} complete: {total_items} items")
 
+    def _extract_two_phase(self, content_type: int, session_id: str) -> None:
+        """Extract content type with an index sweep followed by targeted detail fetches.
+
+        Phase 1 sweeps ids and updated_at using the "index" field profile and diffs
+        the result against the stored content index. Phase 2 fetches full detail via
+        extract_one only for new and changed items, in parallel. Items that are
+        stored but no longer present in Looker are soft-deleted.
+
+        Deletion tracking requires a complete sweep, so any sweep failure aborts the
+        content type instead of risking false tombstones.
+
+        Args:
+            content_type: ContentType enum value (dashboard or look)
+            session_id: Extraction session ID for checkpoint
+
+        Raises:
+            OrchestrationError: If the index sweep fails
+        """
+        content_type_name = ContentType(content_type).name.lower()
+
+        checkpoint = Checkpoint(
+            session_id=session_id,
+            content_type=content_type,
+            checkpoint_data={
+                "content_type": content_type_name,
+                "batch_size": self.config.batch_size,
+                "incremental": self.config.incremental,
+                "parallel": self.parallel_config.workers > 1,
+                "workers": self.parallel_config.workers,
+                "strategy": "two_phase",
+                "folder_count": len(self.config.folder_ids) if self.config.folder_ids else 0,
+            },
+        )
+        checkpoint.id = self.repository.save_checkpoint(checkpoint)
+
+        # Phase 1: cheap index sweep and local diff
+        live_items = self._sweep_index(content_type, content_type_name)
+        stored_index = self.repository.get_content_index(
+            content_type, folder_ids=self.config.folder_ids
+        )
+        diff = diff_index(live_items, stored_index)
+        logger.info(
+            f"Index sweep for {content_type_name}: {diff.live_count} live, "
+            f"{len(diff.new_ids)} new, {len(diff.changed_ids)} changed, "
+            f"{diff.unchanged_count} unchanged, {len(diff.deleted_ids)} deleted"
+        )
+
+        # Phase 2: full detail only for the changed set
+        self.metrics.set_total(content_type, len(diff.fetch_ids))
+        fetched = self._fetch_details(content_type, diff.fetch_ids)
+        live_ids = {self._extract_item_id(item, content_type) for item in live_items}
+        deleted = self._apply_deletions(content_type, content_type_name, live_ids)
+
+        self._change_counts["new"] += len(diff.new_ids)
+        self._change_counts["updated"] += len(diff.changed_ids)
+
+        checkpoint.checkpoint_data.update(
+            {
+                "swept_items": diff.live_count,
+                "new_items": len(diff.new_ids),
+                "changed_items": len(diff.changed_ids),
+                "unchanged_items": diff.unchanged_count,
+                "deleted_items": deleted,
+            }
+        )
+        self._complete_parallel_checkpoint(checkpoint, fetched, content_type_name)
+
+    def _sweep_index(self, content_type: int, content_type_name: str) -> list[dict[str, Any]]:
+        """Sweep all ids and updated_at timestamps using the "index" field profile.
+
+        Reuses the offset coordinators so the sweep honours folder scoping and
+        runs across the configured worker count.
+
+        Args:
+            content_type: ContentType enum value
+            content_type_name: Human-readable content type name
+
+        Returns:
+            List of index item dicts (id, title, folder_id, updated_at, ...)
+
+        Raises:
+            OrchestrationError: If any sweep worker fails
+        """
+        coordinator = self._create_coordinator(
+            content_type_name,
+            self._is_multi_folder_extraction(content_type),
+            stride=max(self.config.batch_size, INDEX_SWEEP_BATCH_SIZE),
+        )
+
+        live_items: list[dict[str, Any]] = []
+        with ThreadPoolExecutor(max_workers=self.parallel_config.workers) as executor:
+            futures = [
+                executor.submit(self._index_sweep_worker, i, content_type, coordinator)
+                for i in range(self.parallel_config.workers)
+            ]
+            for future in as_completed(futures):
+                try:
+                    live_items.extend(future.result())
+                except Exception as e:
+                    # Partial sweep would turn missing pages into false deletions
+                    raise OrchestrationError(
+                        f"Index sweep failed for {content_type_name}: {e}"
+                    ) from e
+
+        return live_items
+
+    def _index_sweep_worker(
+        self,
+        worker_id: int,
+        content_type: int,
+        coordinator: "OffsetCoordinator | MultiFolderOffsetCoordinator",
+    ) -> list[dict[str, Any]]:
+        """Index sweep worker: claim offset ranges and collect index rows.
+
+        Unlike _parallel_fetch_worker, API errors propagate so the sweep is
+        never silently incomplete. Nothing is written to the database.
+
+        Args:
+            worker_id: Worker thread identifier (0-based index)
+            content_type: ContentType enum value
+            coordinator: Shared offset coordinator (single or multi-folder)
+
+        Returns:
+            Index item dicts fetched by this worker
+        """
+        swept: list[dict[str, Any]] = []
+
+        while True:
+            claimed_range = coordinator.claim_range()
+            if claimed_range is None:
+                break
+
+            folder_id, offset, limit = self._parse_claimed_range(
+                claimed_range, coordinator, worker_id
+            )
+            items = self.extractor.extract_range(  # type: ignore[attr-defined]
+                ContentType(content_type),
+                offset=offset,
+                limit=limit,
+                folder_id=folder_id,
+                field_profile=FieldProfile.INDEX,
+            )
+
+            if not items:
+                if self._check_end_of_data(
+                    coordinator, folder_id, worker_id, offset, "empty response"
+                ):
+                    break
+                continue
+
+            swept.extend(items)
+
+            if len(items) < limit:
+                if self._check_end_of_data(
+                    coordinator,
+                    folder_id,
+                    worker_id,
+                    offset,
+                    f"received {len(items)} < {limit} items",
+                    end_offset=offset + len(items),
+                ):
+                    break
+
+        return swept
+
+    def _fetch_details(self, content_type: int, content_ids: list[str]) -> int:
+        """Fetch full detail for specific items in parallel via extract_one.
+
+        Args:
+            content_type: ContentType enum value
+            content_ids: IDs to fetch and save
+
+        Returns:
+            Number of items fetched and saved
+        """
+        if not content_ids:
+            return 0
+
+        workers = min(self.parallel_config.workers, len(content_ids))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # Strided partitioning: each worker gets an even share of the IDs
+            futures = [
+                executor.submit(self._detail_fetch_worker, i, content_type, content_ids[i::workers])
+                for i in range(workers)
+            ]
+            return self._aggregate_worker_results(futures)
+
+    def _detail_fetch_worker(
+        self, worker_id: int, content_type: int, content_ids: list[str]
+    ) -> int:
+        """Detail fetch worker: fetch, convert and save a list of items.
+
+        Args:
+            worker_id: Worker thread identifier (0-based index)
+            content_type: ContentType enum value
+            content_ids: IDs assigned to this worker
+
+        Returns:
+            Number of items saved by this worker
+        """
+        thread_name = threading.current_thread().name
+        items_processed = 0
+
+        try:
+            for content_id in content_ids:
+                try:
+                    item_dict = self.extractor.extract_one(ContentType(content_type), content_id)
+                except Exception as e:
+                    logger.error(f"Worker {worker_id} detail fetch failed for {content_id}: {e}")
+                    self.metrics.record_error(thread_name, f"Detail fetch error: {e}")
+                    continue
+
+                saved, _ = self._process_items_batch(
+                    items=[item_dict],
+                    content_type=content_type,
+                    worker_id=worker_id,
+                    thread_name=thread_name,
+                )
+                items_processed += saved
+                self._log_worker_progress(worker_id, items_processed)
+        finally:
+            # CRITICAL: Close thread-local database connection
+            self.repository.close_thread_connection()
+
+        return items_processed
+
+    def _reconcile_deletions(
+        self, content_type: int, content_type_name: str, is_paginated: bool
+    ) -> None:
+        """Detect content deleted in Looker after an incremental run.
+
+        Incremental extraction only returns items updated since the last sync, so
+        deletions are invisible to it. This sweeps the complete live id set with
+        the "index" field profile and soft-deletes stored items missing from it.
+
+        A failed sweep skips reconciliation (with a warning) rather than failing
+        the run: the extracted content is already saved, and an incomplete id set
+        must never be used for deletion.
+
+        Args:
+            content_type: ContentType enum value
+            content_type_name: Human-readable content type name
+            is_paginated: Whether content type supports offset pagination
+        """
+        try:
+            if is_paginated:
+                live_items = self._sweep_index(content_type, content_type_name)
+            else:
+                live_items = list(
+                    self.extractor.extract_all(
+                        ContentType(content_type),
+                        fields=get_profile_fields(ContentType(content_type), FieldProfile.INDEX),
+                        batch_size=INDEX_SWEEP_BATCH_SIZE,
+                    )
+                )
+        except Exception as e:
+            logger.warning(f"Skipping deletion reconciliation for {content_type_name}: {e}")
+            return
+
+        live_ids = {self._extract_item_id(item, content_type) for item in live_items}
+        self._apply_deletions(content_type, content_type_name, live_ids)
+
+    def _apply_deletions(
+        self, content_type: int, content_type_name: str, live_ids: set[str]
+    ) -> int:
+        """Soft-delete stored items absent from the live id set.
+
+        Args:
+            content_type: ContentType enum value
+            content_type_name: Human-readable content type name
+            live_ids: Complete set of IDs currently present in Looker
+
+        Returns:
+            Number of items soft-deleted
+        """
+        # Sweeps of dashboards/looks are folder-scoped, so reconciliation must be too
+        folder_scope = (
+            self.config.folder_ids
+            if content_type in (ContentType.DASHBOARD.value, ContentType.LOOK.value)
+            else None
+        )
+        deleted = self.repository.reconcile_deleted_content(
+            content_type, live_ids, folder_ids=folder_scope
+        )
+        self._change_counts["deleted"] += deleted
+
+        if deleted:
+            logger.info(f"Marked {deleted} {content_type_name} as deleted")
+        return deleted
+
     def _extract_sequential(
         self,
         content_type: int,
@@ -898,10 +1499,16 @@ class ParallelOrchestrator:
                 content_item = self._dict_to_content_item(item_dict, content_type)
 
                 # Save to database
+                write_start = time.perf_counter()
                 self.repository.save_content(content_item)
+                self.metrics.record_latency(
+                    LatencyPhase.DB_WRITE, time.perf_counter() - write_start
+                )
 
                 # Update metrics
-                self.metrics.increment_processed(content_type, count=1)
+                self.metrics.increment_processed(
+                    content_type, count=1, nbytes=content_item.content_size or 0
+                )
                 items_processed += 1
 
             except Exception as e:
@@ -940,15 +1547,20 @@ class ParallelOrchestrator:
         worker_id: int,
         offset: int,
         reason: str,
+        end_offset: int | None = None,
     ) -> tuple[bool, bool]:
         """Handle end-of-data condition for a worker/folder.
 
+        The observed end offset is shared with the coordinator so that ranges past
+        it are no longer handed out to other workers.
+
         Args:
             coordinator: Shared offset coordinator (single or multi-folder)
             folder_id: Folder ID (if multi-folder mode)
             worker_id: Worker thread identifier
             offset: Current offset for logging
             reason: Reason for end-of-data (e.g., "empty response", "fewer items than requested")
+            end_offset: First offset past the end of data (defaults to offset)
 
         Returns:
             Tuple of (should_break, should_continue) for control flow:
@@ -960,7 +1572,9 @@ class ParallelOrchestrator:
                 f"Worker {worker_id} hit end-of-data ({reason}) "
                 f"for folder {folder_id} at offset {offset}, marking folder complete"
             )
-            coordinator.mark_folder_complete(folder_id)
+            coordinator.mark_folder_complete(
+                folder_id, end_offset=offset if end_offset is None else end_offset
+            )
             return False, True  # Continue to next folder
         else:
             logger.info(
@@ -969,6 +1583,7 @@ class ParallelOrchestrator:
             )
             # At this point, coordinator must be OffsetCoordinator (not MultiFolderOffsetCoordinator)
             if isinstance(coordinator, OffsetCoordinator):
+                coordinator.mark_end_of_data(offset if end_offset is None else end_offset)
                 coordinator.mark_worker_complete()
             return True, False  # Break from main loop
 
@@ -979,6 +1594,7 @@ class ParallelOrchestrator:
         coordinator: "OffsetCoordinator | MultiFolderOffsetCoordinator",
         fields: str | None,
         updated_after: datetime | None,
+        scaler: DynamicWorkerScaler | None = None,
     ) -> int:
         """Parallel fetch worker: Claim offset ranges and fetch from API.
 
@@ -1005,7 +1621,7 @@ class ParallelOrchestrator:
                - Automatic retry on SQLITE_BUSY with exponential backoff
 
             3. Metrics Access:
-               - self.metrics.increment_processed(): Thread-safe (uses internal lock)
+               - self.metrics.increment_processed(): Thread-safe (per-thread shard)
                - self.metrics.record_error(): Thread-safe (uses internal lock)
                - self.metrics.snapshot(): Thread-safe (uses internal lock)
 
@@ -1036,6 +1652,9 @@ class ParallelOrchestrator:
             6. Closes thread-local database connection
             7. Returns total items processed
 
+            With dynamic scaling, the worker parks before step 1 while it is
+            outside the active set, so it never holds a claimed range while parked.
+
         Error Handling:
             - Item-level errors: Logged, metrics updated, processing continues
             - API fetch errors: Logged, metrics updated, skips to next range
@@ -1048,6 +1667,7 @@ class ParallelOrchestrator:
             coordinator: Shared offset coordinator (single or multi-folder)
             fields: Fields to retrieve (optional)
             updated_after: Only items updated after this timestamp (optional)
+            scaler: Dynamic worker scaler deciding whether this worker is active
 
         Returns:
             Number of items processed by this worker
@@ -1062,11 +1682,23 @@ class ParallelOrchestrator:
         )
 
         items_processed = 0
+        page_size_controller = coordinator.page_size_controller
 
         try:
             while True:
+                # Backpressure: let in-flight pages drain while critical memory is rising
+                if not self.batch_processor.wait_for_memory_relief(
+                    MEMORY_BACKPRESSURE_WAIT_SECONDS
+                ):
+                    logger.debug(f"Worker {worker_id} resuming under critical memory pressure")
+
+                # Park here (holding no claimed range) while outside the active set
+                if scaler is not None:
+                    scaler.checkpoint(worker_id)
+
                 # Atomically claim next offset range
-                claimed_range = coordinator.claim_range()
+                with span("claim_range", "extraction"):
+                    claimed_range = coordinator.claim_range()
 
                 # Check if all work is done
                 if claimed_range is None:
@@ -1081,16 +1713,39 @@ class ParallelOrchestrator:
                 )
 
                 # Fetch data from Looker API
-                items = self._fetch_items_from_api(
-                    worker_id=worker_id,
-                    thread_name=thread_name,
-                    content_type=content_type,
-                    offset=offset,
-                    limit=limit,
-                    folder_id=folder_id,
-                    fields=fields,
-                    updated_after=updated_after,
-                )
+                fetch_start = time.monotonic()
+                with span(
+                    "fetch_page", "extraction", offset=offset, limit=limit, folder_id=folder_id
+                ):
+                    items = self._fetch_items_from_api(
+                        worker_id=worker_id,
+                        thread_name=thread_name,
+                        content_type=content_type,
+                        offset=offset,
+                        limit=limit,
+                        folder_id=folder_id,
+                        fields=fields,
+                        updated_after=updated_after,
+                    )
+                fetch_seconds = time.monotonic() - fetch_start
+
+                # Oversized pages often fail where smaller ones succeed: retry the
+                # claimed range in smaller pages so no items are skipped
+                refetched = False
+                if items is None and page_size_controller is not None:
+                    page_size_controller.record_error()
+                    refetched = True
+                    items = self._refetch_in_smaller_pages(
+                        worker_id=worker_id,
+                        thread_name=thread_name,
+                        content_type=content_type,
+                        offset=offset,
+                        limit=limit,
+                        folder_id=folder_id,
+                        fields=fields,
+                        updated_after=updated_after,
+                        page_size_controller=page_size_controller,
+                    )
 
                 # Return early if fetch failed
                 if items is None:
@@ -1105,14 +1760,24 @@ class ParallelOrchestrator:
                     continue
 
                 # Process items: convert and save to database
-                items_in_batch = self._process_items_batch(
-                    items=items,
-                    content_type=content_type,
-                    worker_id=worker_id,
-                    thread_name=thread_name,
-                )
+                with span("save_page", "extraction", items=len(items)):
+                    items_in_batch, bytes_in_batch = self._process_items_batch(
+                        items=items,
+                        content_type=content_type,
+                        worker_id=worker_id,
+                        thread_name=thread_name,
+                    )
                 items_processed += items_in_batch
 
+                # Sub-pages of a re-fetched range were already reported individually
+                if page_size_controller is not None and not refetched:
+                    page_size_controller.record_page(
+                        requested=limit,
+                        received=len(items),
+                        latency_seconds=fetch_seconds,
+                        payload_bytes=bytes_in_batch,
+                    )
+
                 # Check if we got fewer items than requested (end of data)
                 if len(items) < limit:
                     if self._check_end_of_data(
@@ -1121,18 +1786,27 @@ class ParallelOrchestrator:
                         worker_id,
                         offset,
                         f"received {len(items)} < {limit} items",
+                        end_offset=offset + len(items),
                     ):
                         break
+                elif isinstance(coordinator, OffsetCoordinator):
+                    # Full page: a probed end bound below this point was too low
+                    coordinator.record_full_page(offset + len(items))
 
                 # Periodic progress update
                 self._log_worker_progress(worker_id, items_processed)
 
+            # Out of work: wake parked workers so they can exit too
+            if scaler is not None:
+                scaler.release()
             logger.info(f"Worker {worker_id} completed: {items_processed} items processed")
 
         except Exception as e:
-            # Worker-level error - log and propagate
+            # Worker-level error - log and propagate; a parked worker takes the slot
             logger.error(f"Worker {worker_id} fatal error: {e}")
             self.metrics.record_error(thread_name, f"Fatal worker error: {e}")
+            if scaler is not None:
+                scaler.retire(worker_id)
             raise
 
         finally:
@@ -1225,6 +1899,78 @@ class ParallelOrchestrator:
             self.metrics.record_error(thread_name, f"API fetch error: {e}")
             return None  # Signal to skip this range
 
+    def _refetch_in_smaller_pages(
+        self,
+        worker_id: int,
+        thread_name: str,
+        content_type: int,
+        offset: int,
+        limit: int,
+        folder_id: str | None,
+        fields: str | None,
+        updated_after: datetime | None,
+        page_size_controller: AdaptivePageSizeController,
+    ) -> list[dict[str, Any]] | None:
+        """Re-fetch a failed range as consecutive smaller pages.
+
+        Uses the controller's (already reduced) page size. Stops early on a short
+        page (end of data), so the combined result keeps the usual end-of-data
+        semantics for the original range.
+
+        Args:
+            worker_id: Worker ID for logging
+            thread_name: Thread name for error recording
+            content_type: ContentType enum value
+            offset: Start offset of the failed range
+            limit: Size of the failed range
+            folder_id: Folder ID for filtering
+            fields: Fields to retrieve
+            updated_after: Incremental filter timestamp
+            page_size_controller: Controller to read sizes from and report to
+
+        Returns:
+            Items for the whole range, or None if any sub-page failed
+        """
+        sub_size = page_size_controller.current_size
+        if sub_size >= limit:
+            return None
+
+        logger.info(
+            f"Worker {worker_id} retrying range offset={offset} limit={limit} "
+            f"as pages of {sub_size}"
+        )
+
+        items: list[dict[str, Any]] = []
+        end = offset + limit
+        for sub_offset in range(offset, end, sub_size):
+            sub_limit = min(sub_size, end - sub_offset)
+            fetch_start = time.monotonic()
+            sub_items = self._fetch_items_from_api(
+                worker_id=worker_id,
+                thread_name=thread_name,
+                content_type=content_type,
+                offset=sub_offset,
+                limit=sub_limit,
+                folder_id=folder_id,
+                fields=fields,
+                updated_after=updated_after,
+            )
+            if sub_items is None:
+                page_size_controller.record_error()
+                return None
+
+            # Payload bytes are unknown before serialization; latency alone drives tuning
+            page_size_controller.record_page(
+                requested=sub_limit,
+                received=len(sub_items),
+                latency_seconds=time.monotonic() - fetch_start,
+            )
+            items.extend(sub_items)
+            if len(sub_items) < sub_limit:
+                break
+
+        return items
+
     def _check_end_of_data(
         self,
         coordinator: "OffsetCoordinator | MultiFolderOffsetCoordinator",
@@ -1232,6 +1978,7 @@ class ParallelOrchestrator:
         worker_id: int,
         offset: int,
         reason: str,
+        end_offset: int | None = None,
     ) -> bool:
         """Check if we've reached end of data.
 
@@ -1241,6 +1988,7 @@ class ParallelOrchestrator:
             worker_id: Worker ID for logging
             offset: Current offset for logging
             reason: Reason for reaching end
+            end_offset: First offset past the end of data (defaults to offset)
 
         Returns:
             True if should break from main loop
@@ -1251,6 +1999,7 @@ class ParallelOrchestrator:
             worker_id=worker_id,
             offset=offset,
             reason=reason,
+            end_offset=end_offset,
         )
         return should_break
 
@@ -1260,7 +2009,7 @@ class ParallelOrchestrator:
         content_type: int,
         worker_id: int,
         thread_name: str,
-    ) -> int:
+    ) -> tuple[int, int]:
         """Process a batch of items and save to database.
 
         Args:
@@ -1270,9 +2019,10 @@ class ParallelOrchestrator:
             thread_name: Thread name for error recording
 
         Returns:
-            Number of items successfully processed
+            Tuple of (items successfully processed, serialized bytes saved)
         """
         items_processed = 0
+        bytes_processed = 0
 
         for item_dict in items:
             try:
@@ -1280,17 +2030,24 @@ class ParallelOrchestrator:
                 content_item = self._dict_to_content_item(item_dict, content_type)
 
                 # Save to database (uses thread-local connection)
+                write_start = time.perf_counter()
                 self.repository.save_content(content_item)
+                self.metrics.record_latency(
+                    LatencyPhase.DB_WRITE, time.perf_counter() - write_start
+                )
 
                 # Update metrics
-                self.metrics.increment_processed(content_type, count=1)
+                self.metrics.increment_processed(
+                    content_type, count=1, nbytes=content_item.content_size or 0
+                )
                 items_processed += 1
+                bytes_processed += content_item.content_size or 0
 
             except Exception as e:
                 # Item-level error - log and continue
                 self._log_item_error(item_dict, content_type, worker_id, thread_name, e)
 
-        return items_processed
+        return items_processed, bytes_processed
 
     def _log_item_error(
         self,
@@ -1338,6 +2095,12 @@ class ParallelOrchestrator:
                 f"Worker {worker_id}: {items_processed} items processed, "
                 f"total: {snapshot['total']} ({snapshot['items_per_second']:.1f} items/sec)"
             )
+            self.progress.emit_event(
+                "extraction_progress",
+                total=snapshot["total"],
+                items_per_second=round(snapshot["items_per_second"], 2),
+                latency=snapshot["latency"],
+            )
 
     @staticmethod
     def _get_item_id(item_dict: dict[str, Any], content_type: int) -> str | None:
@@ -1408,7 +2171,9 @@ class ParallelOrchestrator:
         name = self._extract_item_name(item_dict, item_id)
 
         # Serialize content data
+        serialize_start = time.perf_counter()
         content_data = self.serializer.serialize(item_dict)
+        self.metrics.record_latency(LatencyPhase.SERIALIZE, time.perf_counter() - serialize_start)
 
         # Extract metadata
         owner_id, owner_email = self._extract_owner_info(item_dict, item_id)
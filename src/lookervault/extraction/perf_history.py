@@ -0,0 +1,270 @@
+"""Performance regression detection over recorded run telemetry.
+
+Every parallel extraction and restoration run appends a RunTelemetry row.
+compare_runs() takes those rows and compares the newest run of each workload
+against the median of that workload's earlier runs inside a rolling window.
+A workload is one operation against one Looker instance for one set of
+content types, so a dashboards-only restore is never compared against a
+full extraction.
+
+Throughput metrics regress when they fall by the threshold; cost metrics
+(API calls and rate-limit waits per item, peak memory) regress when they rise
+by it. Metrics without a baseline (e.g. bytes on runs recorded before byte
+counting existed) are skipped rather than reported as changes.
+
+Example:
+    >>> runs = repository.list_run_telemetry("extract", limit=200)
+    >>> for comparison in compare_runs(runs, window_days=7):
+    ...     for metric in comparison.regressions:
+    ...         print(metric.describe())
+    dashboards items/sec down 35% vs 7-day median (12.1 vs 18.6)
+"""
+
+import statistics
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+from datetime import timedelta
+from typing import Any
+
+from lookervault.storage.models import ContentType, RunTelemetry
+
+# Days of earlier runs forming the baseline
+DEFAULT_WINDOW_DAYS = 7
+
+# Relative change (20%) in the bad direction that counts as a regression
+DEFAULT_REGRESSION_THRESHOLD = 0.20
+
+# Fewest earlier runs a median baseline is computed from
+DEFAULT_MIN_BASELINE_RUNS = 3
+
+_MB = 1024 * 1024
+
+
+@dataclass
+class MetricComparison:
+    """One metric of the latest run compared with its baseline.
+
+    Attributes:
+        metric: Metric name including its unit (e.g., "dashboards items/sec")
+        latest: Value in the latest run
+        baseline: Median value over the baseline runs
+        higher_is_better: True for throughput, False for costs
+        regression: Whether the change crosses the threshold in the bad direction
+        window_days: Length of the baseline window
+    """
+
+    metric: str
+    latest: float
+    baseline: float
+    higher_is_better: bool
+    regression: bool
+    window_days: int
+
+    @property
+    def change(self) -> float:
+        """Relative change from the baseline (-0.35 = down 35%)."""
+        return (self.latest - self.baseline) / self.baseline
+
+    def describe(self) -> str:
+        """One-line summary such as "items/sec down 35% vs 7-day median (12.1 vs 18.6)"."""
+        direction = "up" if self.change >= 0 else "down"
+        return (
+            f"{self.metric} {direction} {abs(self.change):.0%} vs {self.window_days}-day median "
+            f"({self.latest:,.4g} vs {self.baseline:,.4g})"
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize for JSON output."""
+        return {
+            "metric": self.metric,
+            "latest": self.latest,
+            "baseline": self.baseline,
+            "change": round(self.change, 4),
+            "higher_is_better": self.higher_is_better,
+            "regression": self.regression,
+            "message": self.describe(),
+        }
+
+
+@dataclass
+class RunComparison:
+    """The latest run of one workload compared with its rolling baseline.
+
+    Attributes:
+        run: Latest run of the workload
+        baseline_runs: Number of earlier runs inside the window
+        metrics: Compared metrics (empty when the baseline is too small)
+    """
+
+    run: RunTelemetry
+    baseline_runs: int
+    metrics: list[MetricComparison] = field(default_factory=list)
+
+    @property
+    def regressions(self) -> list[MetricComparison]:
+        """Metrics that regressed past the threshold."""
+        return [metric for metric in self.metrics if metric.regression]
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize for JSON output."""
+        return {
+            "operation": self.run.operation,
+            "instance": self.run.instance,
+            "session_id": self.run.session_id,
+            "recorded_at": self.run.recorded_at.isoformat(),
+            "content_types": [_type_name(ct) for ct in sorted(self.run.items_by_type)],
+            "baseline_runs": self.baseline_runs,
+            "metrics": [metric.to_dict() for metric in self.metrics],
+            "regressions": [metric.describe() for metric in self.regressions],
+        }
+
+
+def _type_name(content_type: int) -> str:
+    try:
+        return ContentType(content_type).name.lower()
+    except ValueError:
+        return str(content_type)
+
+
+def _throughput_name(content_type: int) -> str:
+    return f"{_type_name(content_type)}s items/sec"
+
+
+def _per_item(value: float, run: RunTelemetry) -> float | None:
+    return value / run.total_items if run.total_items else None
+
+
+def _nonzero(value: float) -> float | None:
+    return value or None
+
+
+# Metric name -> (value of a run or None when not recorded, higher is better)
+_RUN_METRICS: dict[str, tuple[Callable[[RunTelemetry], float | None], bool]] = {
+    "items/sec": (lambda run: _nonzero(run.items_per_second), True),
+    "MB/sec": (
+        lambda run: (
+            _nonzero(run.bytes_transferred / _MB / run.duration_seconds)
+            if run.duration_seconds > 0
+            else None
+        ),
+        True,
+    ),
+    "API calls/item": (lambda run: _per_item(run.api_calls, run), False),
+    "rate-limit wait sec/item": (
+        lambda run: _per_item(run.rate_limit_wait_seconds, run),
+        False,
+    ),
+    "peak RSS MB": (lambda run: _nonzero(run.peak_rss_bytes / _MB), False),
+}
+
+
+def run_metrics(run: RunTelemetry) -> dict[str, tuple[float, bool]]:
+    """Comparable metrics of one run.
+
+    Args:
+        run: Recorded run
+
+    Returns:
+        Metric name -> (value, higher_is_better); metrics the run didn't record are omitted
+    """
+    metrics: dict[str, tuple[float, bool]] = {}
+    for name, (read, higher_is_better) in _RUN_METRICS.items():
+        value = read(run)
+        if value is not None:
+            metrics[name] = (value, higher_is_better)
+    if len(run.items_by_type) == 1:
+        # A single-type run's throughput is that type's throughput
+        (content_type,) = run.items_by_type
+        metrics = {
+            (_throughput_name(content_type) if name == "items/sec" else name): value
+            for name, value in metrics.items()
+        }
+    else:
+        for content_type, rate in run.items_per_second_by_type().items():
+            if rate > 0:
+                metrics[_throughput_name(content_type)] = (rate, True)
+    return metrics
+
+
+def _workload(run: RunTelemetry) -> tuple[str, str, frozenset[int]]:
+    return (run.operation, run.instance, frozenset(run.items_by_type))
+
+
+def compare_run(
+    run: RunTelemetry,
+    baseline: Sequence[RunTelemetry],
+    window_days: int = DEFAULT_WINDOW_DAYS,
+    threshold: float = DEFAULT_REGRESSION_THRESHOLD,
+    min_baseline_runs: int = DEFAULT_MIN_BASELINE_RUNS,
+) -> RunComparison:
+    """Compare one run against the median of baseline runs.
+
+    Args:
+        run: Run to check
+        baseline: Earlier runs of the same workload
+        window_days: Baseline window length (used in descriptions)
+        threshold: Relative change in the bad direction that counts as a regression
+        min_baseline_runs: Fewest baseline runs needed to compare at all
+
+    Returns:
+        RunComparison; metrics is empty if the baseline is smaller than min_baseline_runs
+    """
+    comparison = RunComparison(run=run, baseline_runs=len(baseline))
+    if len(baseline) < max(min_baseline_runs, 1):
+        return comparison
+
+    baseline_metrics = [run_metrics(earlier) for earlier in baseline]
+    for name, (latest, higher_is_better) in run_metrics(run).items():
+        values = [metrics[name][0] for metrics in baseline_metrics if name in metrics]
+        if len(values) < max(min_baseline_runs, 1):
+            continue
+        median = statistics.median(values)
+        if median <= 0:
+            continue
+        change = (latest - median) / median
+        regression = change <= -threshold if higher_is_better else change >= threshold
+        comparison.metrics.append(
+            MetricComparison(
+                metric=name,
+                latest=latest,
+                baseline=median,
+                higher_is_better=higher_is_better,
+                regression=regression,
+                window_days=window_days,
+            )
+        )
+    return comparison
+
+
+def compare_runs(
+    runs: Sequence[RunTelemetry],
+    window_days: int = DEFAULT_WINDOW_DAYS,
+    threshold: float = DEFAULT_REGRESSION_THRESHOLD,
+    min_baseline_runs: int = DEFAULT_MIN_BASELINE_RUNS,
+) -> list[RunComparison]:
+    """Compare the latest run of every workload against its rolling baseline.
+
+    The baseline of a workload's latest run is its earlier runs recorded
+    within window_days before it. Runs that failed every item (no items
+    processed) are ignored.
+
+    Args:
+        runs: Recorded runs in any order (typically list_run_telemetry() output)
+        window_days: Baseline window length in days
+        threshold: Relative change in the bad direction that counts as a regression
+        min_baseline_runs: Fewest baseline runs needed to compare a workload
+
+    Returns:
+        One RunComparison per workload, most recent run first
+    """
+    by_workload: dict[tuple[str, str, frozenset[int]], list[RunTelemetry]] = {}
+    for run in sorted(runs, key=lambda r: (r.recorded_at, r.id or 0), reverse=True):
+        if run.total_items > 0:
+            by_workload.setdefault(_workload(run), []).append(run)
+
+    comparisons = []
+    for latest, *earlier in by_workload.values():
+        window_start = latest.recorded_at - timedelta(days=window_days)
+        baseline = [run for run in earlier if run.recorded_at >= window_start]
+        comparisons.append(compare_run(latest, baseline, window_days, threshold, min_baseline_runs))
+    return comparisons
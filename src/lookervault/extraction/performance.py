@@ -1,12 +1,22 @@
-"""Performance tuning utilities for parallel extraction.
+"""Performance tuning utilities for parallel extraction and restoration.
 
-Provides recommendations for optimal worker counts, queue sizes, and batch sizes
-based on system resources and extraction characteristics.
+PerformanceTuner provides static recommendations for worker counts, queue
+sizes and batch sizes from system resources and extraction characteristics.
+AutoTuner replaces those guesses with measurements: it picks workers, batch
+size and rate limits for the next run from the telemetry of previous runs
+(see RunTelemetry).
 """
 
 import logging
+import math
 import os
-from dataclasses import dataclass
+import statistics
+from collections import defaultdict
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+
+from lookervault.storage.models import RunTelemetry
+from lookervault.storage.repository import ContentRepository
 
 logger = logging.getLogger(__name__)
 
@@ -297,6 +307,230 @@ class PerformanceTuner:
         return warnings
 
 
+@dataclass
+class TuningDecision:
+    """Settings chosen by AutoTuner for the next run.
+
+    Attributes:
+        workers: Worker thread count
+        batch_size: Items per page (None for restorations)
+        rate_limit_per_minute: Limiter requests per minute
+        rate_limit_per_second: Limiter burst requests per second
+        runs_considered: Number of historical runs the decision is based on
+        notes: Why each setting was chosen
+    """
+
+    workers: int
+    batch_size: int | None
+    rate_limit_per_minute: int
+    rate_limit_per_second: int
+    runs_considered: int = 0
+    notes: list[str] = field(default_factory=list)
+
+
+class AutoTuner:
+    """Choose workers, batch size and rate limits from previous runs' telemetry.
+
+    Workers are tuned by hill climbing across runs: runs are grouped by worker
+    count, and the count with the best median throughput among runs that were
+    neither throttled (HTTP 429s) nor contended (SQLITE_BUSY retries) wins. If
+    the winner is also the largest count tried and still scaled, the next run
+    probes a larger count; if every count tried was throttled or contended,
+    the next run steps down.
+
+    Rate limits follow the latest run: they are cut to just below the rate the
+    server accepted when it answered with 429s, and raised when workers spent
+    much of their time waiting on the limiter without any 429s. Batch size is
+    derived from the average stored payload size per item.
+
+    Examples:
+        >>> history = repository.list_run_telemetry("extract", instance=api_url)
+        >>> decision = AutoTuner(history).recommend(
+        ...     workers=8, batch_size=100, rate_limit_per_minute=100, rate_limit_per_second=10
+        ... )
+        >>> print(decision.workers, decision.notes)
+    """
+
+    # A run is throttled above this fraction of API calls answered with 429
+    MAX_429_RATIO = 0.01
+    # A run is contended above this many SQLITE_BUSY retries per 1,000 items
+    MAX_BUSY_RETRIES_PER_1000 = 1.0
+    # A larger worker count must beat the next smaller one by this factor to keep climbing
+    MIN_SCALING_GAIN = 1.05
+    # Worker count multiplier when probing upwards
+    PROBE_FACTOR = 1.5
+    # Limiter-bound: workers spent more than this fraction of their time waiting on it
+    LIMITER_BOUND_WAIT_FRACTION = 0.25
+    # Rate limit multiplier when the limiter, not the server, was the bottleneck
+    RATE_STEP_UP = 1.25
+    # Rate limit as a fraction of the rate the server accepted when it throttled
+    RATE_HEADROOM = 0.9
+    # Most recent runs considered by from_repository()
+    HISTORY_RUNS = 20
+
+    def __init__(
+        self,
+        history: Sequence[RunTelemetry],
+        max_workers: int = PerformanceTuner.SQLITE_WRITE_LIMIT,
+    ):
+        """Initialize with run history.
+
+        Args:
+            history: Previous runs of the same operation and instance, newest first
+            max_workers: Upper bound for probed worker counts
+        """
+        self.history = [run for run in history if run.duration_seconds > 0 and run.total_items]
+        self.max_workers = max_workers
+
+    @classmethod
+    def from_repository(
+        cls, repository: ContentRepository, operation: str, instance: str
+    ) -> "AutoTuner":
+        """Create a tuner from the recent runs recorded in a repository.
+
+        Args:
+            repository: Repository holding the run telemetry
+            operation: "extract" or "restore"
+            instance: Looker instance URL of the upcoming run
+
+        Returns:
+            AutoTuner over the last HISTORY_RUNS runs of that operation and instance
+        """
+        return cls(repository.list_run_telemetry(operation, instance, limit=cls.HISTORY_RUNS))
+
+    def recommend(
+        self,
+        workers: int,
+        batch_size: int | None,
+        rate_limit_per_minute: int,
+        rate_limit_per_second: int,
+    ) -> TuningDecision:
+        """Choose settings for the next run.
+
+        Args:
+            workers: Worker count to use without history
+            batch_size: Batch size to use without history (None for restorations)
+            rate_limit_per_minute: Requests per minute to use without history
+            rate_limit_per_second: Burst requests per second to use without history
+
+        Returns:
+            TuningDecision with the chosen settings and the reasoning
+        """
+        decision = TuningDecision(
+            workers=workers,
+            batch_size=batch_size,
+            rate_limit_per_minute=rate_limit_per_minute,
+            rate_limit_per_second=rate_limit_per_second,
+            runs_considered=len(self.history),
+        )
+        if not self.history:
+            decision.notes.append("No run history yet: using the configured settings")
+            return decision
+
+        latest = self.history[0]
+        limiter_bound = self._limiter_bound(latest)
+        decision.workers = self._tune_workers(limiter_bound, decision.notes)
+        self._tune_rate_limits(latest, limiter_bound, decision)
+        if batch_size is not None:
+            decision.batch_size = self._tune_batch_size(latest, batch_size, decision.notes)
+        return decision
+
+    def _healthy(self, run: RunTelemetry) -> bool:
+        busy_per_1000 = run.busy_retries * 1000 / run.total_items
+        return (
+            run.rate_limit_429_ratio <= self.MAX_429_RATIO
+            and busy_per_1000 <= self.MAX_BUSY_RETRIES_PER_1000
+        )
+
+    def _limiter_bound(self, run: RunTelemetry) -> bool:
+        worker_seconds = run.duration_seconds * run.workers
+        return (
+            run.rate_limit_429s == 0
+            and run.rate_limit_wait_seconds / worker_seconds > self.LIMITER_BOUND_WAIT_FRACTION
+        )
+
+    def _tune_workers(self, limiter_bound: bool, notes: list[str]) -> int:
+        runs_by_workers: dict[int, list[RunTelemetry]] = defaultdict(list)
+        for run in self.history:
+            runs_by_workers[run.workers].append(run)
+
+        throughput = {
+            count: statistics.median(run.items_per_second for run in runs)
+            for count, runs in runs_by_workers.items()
+            if all(self._healthy(run) for run in runs)
+        }
+        if not throughput:
+            smallest = min(runs_by_workers)
+            workers = max(smallest // 2, 1)
+            notes.append(
+                f"Every worker count tried (smallest {smallest}) was throttled or hit "
+                f"SQLITE_BUSY retries: stepping down to {workers} workers"
+            )
+            return workers
+
+        best = max(throughput, key=lambda count: throughput[count])
+        notes.append(
+            f"{best} workers had the best healthy median throughput "
+            f"({throughput[best]:.1f} items/sec over {len(runs_by_workers[best])} runs)"
+        )
+        if best != max(runs_by_workers) or limiter_bound:
+            return best
+
+        smaller = [count for count in throughput if count < best]
+        still_scaling = not smaller or (
+            throughput[best] >= throughput[max(smaller)] * self.MIN_SCALING_GAIN
+        )
+        probe = min(math.ceil(best * self.PROBE_FACTOR), self.max_workers)
+        if still_scaling and probe > best:
+            notes.append(f"Throughput still scaling at {best} workers: probing {probe} workers")
+            return probe
+        return best
+
+    def _tune_rate_limits(
+        self, latest: RunTelemetry, limiter_bound: bool, decision: TuningDecision
+    ) -> None:
+        per_minute = latest.rate_limit_per_minute or decision.rate_limit_per_minute
+        per_second = latest.rate_limit_per_second or decision.rate_limit_per_second
+
+        if latest.rate_limit_429_ratio > self.MAX_429_RATIO:
+            accepted_per_minute = latest.api_calls / latest.duration_seconds * 60
+            new_per_minute = max(int(min(per_minute, accepted_per_minute) * self.RATE_HEADROOM), 1)
+            decision.notes.append(
+                f"Last run got {latest.rate_limit_429s} HTTP 429s "
+                f"({latest.rate_limit_429_ratio:.1%} of calls): lowering rate limit "
+                f"from {per_minute} to {new_per_minute} requests/min"
+            )
+            per_second = max(math.floor(per_second * new_per_minute / per_minute), 1)
+            per_minute = new_per_minute
+        elif limiter_bound:
+            new_per_minute = math.ceil(per_minute * self.RATE_STEP_UP)
+            decision.notes.append(
+                "Last run spent "
+                f"{latest.rate_limit_wait_seconds:.0f}s waiting on the rate limiter without "
+                f"any HTTP 429s: raising rate limit from {per_minute} to {new_per_minute} "
+                "requests/min"
+            )
+            per_second = math.ceil(per_second * self.RATE_STEP_UP)
+            per_minute = new_per_minute
+
+        decision.rate_limit_per_minute = per_minute
+        decision.rate_limit_per_second = per_second
+
+    def _tune_batch_size(self, latest: RunTelemetry, batch_size: int, notes: list[str]) -> int:
+        weights = {
+            content_type: latest.items_by_type.get(content_type, 0)
+            for content_type in latest.avg_payload_bytes
+        }
+        total_weight = sum(weights.values())
+        if not total_weight:
+            return batch_size
+        avg_bytes = (
+            sum(latest.avg_payload_bytes[ct] * weight for ct, weight in weights.items())
+            / total_weight
+        )
+        return PerformanceTuner()._recommend_batch_size(avg_bytes / 1024, notes)
+
+
 def log_performance_recommendations(
     total_items: int | None = None,
     avg_item_size_kb: float = 5.0,
@@ -48,6 +48,7 @@ from lookervault.constants import (
     RATE_LIMIT_SUCCESS_THRESHOLD,
     SECONDS_PER_MINUTE,
 )
+from lookervault.utils.tracing import span
 
 logger = logging.getLogger(__name__)
 
@@ -311,6 +312,10 @@ class AdaptiveRateLimiter:
         self._minute_window: deque[float] = deque()  # Timestamps of requests in past minute
         self._second_window: deque[float] = deque()  # Timestamps of requests in past second
 
+        # Run totals, updated under _lock on the accept path
+        self.total_requests = 0
+        self.total_wait_seconds = 0.0
+
         # Adaptive state (shared across workers)
         self.state = RateLimiterState()
 
@@ -362,6 +367,7 @@ class AdaptiveRateLimiter:
         - Minimal lock contention (short critical sections)
         - Fair ordering (FIFO via timestamp order)
         """
+        waited = 0.0
         while True:
             with self._lock:
                 now = time.time()
@@ -388,6 +394,8 @@ class AdaptiveRateLimiter:
                     # Accept request - add timestamps to both windows
                     self._minute_window.append(now)
                     self._second_window.append(now)
+                    self.total_requests += 1
+                    self.total_wait_seconds += waited
                     return
 
                 # Rate limit exceeded - calculate sleep time
@@ -409,7 +417,9 @@ class AdaptiveRateLimiter:
             # The 10ms buffer ensures the window has actually aged out
             # when we wake up (accounts for scheduler granularity)
             if sleep_time > 0:
-                time.sleep(sleep_time + 0.01)  # Add 10ms buffer
+                with span("rate_limit_wait", "rate_limit", seconds=round(sleep_time, 3)):
+                    time.sleep(sleep_time + 0.01)  # Add 10ms buffer
+                waited += sleep_time + 0.01
 
     def on_429_detected(self) -> None:
         """Handle HTTP 429 rate limit response.
@@ -443,6 +453,8 @@ class AdaptiveRateLimiter:
             "requests_per_minute": self.requests_per_minute,
             "requests_per_second": self.requests_per_second,
             "adaptive_enabled": self.adaptive,
+            "total_requests": self.total_requests,
+            "total_wait_seconds": round(self.total_wait_seconds, 3),
         }
 
         if self.adaptive:
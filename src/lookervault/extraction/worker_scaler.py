@@ -0,0 +1,304 @@
+"""Online worker-count controller for parallel extraction and restoration."""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any
+
+from lookervault.extraction.metrics import ThreadSafeMetrics
+from lookervault.extraction.rate_limiter import AdaptiveRateLimiter
+
+logger = logging.getLogger(__name__)
+
+# Seconds between scaling decisions
+DEFAULT_SCALING_INTERVAL = 10.0
+
+
+@dataclass
+class ScalingSample:
+    """Counter deltas observed over one scaling interval.
+
+    Attributes:
+        elapsed_seconds: Length of the interval
+        items: Items processed during the interval
+        requests: API requests admitted by the rate limiter
+        throttled: HTTP 429 responses received
+        busy_seconds: Seconds workers spent waiting on the SQLite write lock
+    """
+
+    elapsed_seconds: float
+    items: int
+    requests: int = 0
+    throttled: int = 0
+    busy_seconds: float = 0.0
+
+    @property
+    def throughput(self) -> float:
+        """Items per second over the interval."""
+        return self.items / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+
+class DynamicWorkerScaler:
+    """Thread-safe controller that grows or shrinks the active worker set at runtime.
+
+    The thread pool is sized for max_workers up front; workers whose index is
+    at or above the current active count park in checkpoint() until they are
+    needed again. Workers only call checkpoint() between units of work (before
+    claiming an offset range or taking the next queued item), so a parked
+    worker never holds claimed work and nothing is lost or repeated. A worker
+    that dies on an error is retired and its slot passes to the next parked
+    worker, so failures neither shrink nor grow the active set.
+
+    Every interval the controller compares counter deltas and hill climbs:
+
+    - More than 1% of requests throttled (429) or more than 10% of worker time
+      spent waiting on the SQLite write lock: shed a quarter of the workers and
+      hold for a few intervals (multiplicative decrease)
+    - Otherwise probe one step up, keep the step if throughput rose by at least
+      5%, and revert it (then hold) if it did not
+    - Intervals without processed items (startup, tail of the run) make no change
+
+    Example:
+        >>> scaler = DynamicWorkerScaler(initial_workers=4, max_workers=16, metrics=metrics)
+        >>> scaler.decide(ScalingSample(elapsed_seconds=10, items=500))
+        5
+    """
+
+    # Highest 429 share of requests before workers are shed
+    MAX_429_RATIO = 0.01
+    # Highest share of worker time spent waiting on the SQLite write lock
+    MAX_BUSY_FRACTION = 0.10
+    # Smallest throughput gain that keeps a probed step
+    MIN_SCALING_GAIN = 1.05
+    # Share of active workers shed under pressure
+    SHED_FRACTION = 0.25
+    # Intervals to hold after shedding or a failed probe
+    HOLD_INTERVALS = 3
+
+    def __init__(
+        self,
+        initial_workers: int,
+        max_workers: int,
+        min_workers: int = 1,
+        metrics: ThreadSafeMetrics | None = None,
+        rate_limiter: AdaptiveRateLimiter | None = None,
+        repository: Any = None,
+        interval: float = DEFAULT_SCALING_INTERVAL,
+    ):
+        """Initialize worker scaler (the control loop starts with start()).
+
+        Args:
+            initial_workers: Workers active at the start of the run
+            max_workers: Size of the thread pool (upper bound on active workers)
+            min_workers: Lower bound on active workers
+            metrics: Run metrics providing processed item counts
+            rate_limiter: Rate limiter providing request and 429 counts
+            repository: Repository providing busy_wait_seconds
+            interval: Seconds between scaling decisions
+
+        Raises:
+            ValueError: If bounds are invalid
+        """
+        if min_workers < 1 or max_workers < min_workers:
+            raise ValueError(f"Invalid worker bounds: min={min_workers}, max={max_workers}")
+
+        self.min_workers = min_workers
+        self.max_workers = max_workers
+        self.metrics = metrics
+        self.rate_limiter = rate_limiter
+        self.repository = repository
+        self.interval = interval
+
+        self._active = max(min_workers, min(initial_workers, max_workers))
+        self._condition = threading.Condition()
+        self._released = False
+        self._retired: set[int] = set()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+        # Hill-climbing state (only touched by decide())
+        self._probe_from: int | None = None
+        self._probe_baseline = 0.0
+        self._hold = 0
+        self._adjustments = 0
+        self._last_counters: dict[str, float] | None = None
+        self._last_sample_time = time.monotonic()
+
+    @property
+    def active_workers(self) -> int:
+        """Number of workers currently allowed to take work."""
+        with self._condition:
+            return self._active
+
+    @property
+    def adjustments(self) -> int:
+        """Number of times the active worker count changed."""
+        return self._adjustments
+
+    def checkpoint(self, worker_id: int) -> None:
+        """Park the calling worker while it is outside the active set.
+
+        Must only be called between units of work, while the worker holds no
+        claimed range or queued item.
+
+        Args:
+            worker_id: Worker index (0-based) within the thread pool
+        """
+        with self._condition:
+            if not self._is_active(worker_id):
+                logger.debug(f"Worker {worker_id} parked ({self._active} active)")
+                self._condition.wait_for(lambda: self._is_active(worker_id))
+                logger.debug(f"Worker {worker_id} unparked")
+
+    def _is_active(self, worker_id: int) -> bool:
+        # Rank among workers still alive: retired workers give up their slot
+        rank = worker_id - sum(1 for retired in self._retired if retired < worker_id)
+        return self._released or rank < self._active
+
+    def retire(self, worker_id: int) -> None:
+        """Remove a worker that exited on an error from the pool.
+
+        The active count is kept: the next parked worker takes over the slot,
+        and the control loop keeps running for the remaining workers.
+
+        Args:
+            worker_id: Worker index (0-based) within the thread pool
+        """
+        with self._condition:
+            self._retired.add(worker_id)
+            self._condition.notify_all()
+
+    def release(self) -> None:
+        """Unpark every worker for the rest of the run.
+
+        Called when a worker finds no more work, so parked workers wake, see the
+        same end of work and exit instead of waiting forever. Not called on
+        worker errors (see retire()), which would undo any shedding.
+        """
+        with self._condition:
+            self._released = True
+            self._condition.notify_all()
+        self._stop.set()
+
+    def decide(self, sample: ScalingSample) -> int:
+        """Apply one scaling decision from an interval's counter deltas.
+
+        Args:
+            sample: Counter deltas observed over the interval
+
+        Returns:
+            Active worker count after the decision
+        """
+        active = self.active_workers
+        throttle_ratio = sample.throttled / max(sample.requests, 1)
+        worker_seconds = sample.elapsed_seconds * active
+        busy_fraction = sample.busy_seconds / worker_seconds if worker_seconds > 0 else 0.0
+
+        if throttle_ratio > self.MAX_429_RATIO or busy_fraction > self.MAX_BUSY_FRACTION:
+            self._probe_from = None
+            self._hold = self.HOLD_INTERVALS
+            shed = max(1, int(active * self.SHED_FRACTION))
+            return self._set_active(
+                active - shed,
+                f"{sample.throttled} 429s in {sample.requests} requests, "
+                f"{busy_fraction:.0%} of worker time waiting on SQLite",
+            )
+
+        if sample.items == 0:
+            return active
+
+        if self._probe_from is not None:
+            probe_from, self._probe_from = self._probe_from, None
+            if sample.throughput < self._probe_baseline * self.MIN_SCALING_GAIN:
+                self._hold = self.HOLD_INTERVALS
+                return self._set_active(
+                    probe_from,
+                    f"{active} workers gave {sample.throughput:.1f} items/s vs "
+                    f"{self._probe_baseline:.1f} with {probe_from}",
+                )
+
+        if self._hold > 0:
+            self._hold -= 1
+            return active
+
+        if active < self.max_workers:
+            self._probe_from = active
+            self._probe_baseline = sample.throughput
+            return self._set_active(
+                active + 1, f"probing at {sample.throughput:.1f} items/s with {active}"
+            )
+        return active
+
+    def _set_active(self, workers: int, reason: str) -> int:
+        workers = max(self.min_workers, min(workers, self.max_workers))
+        with self._condition:
+            if workers == self._active:
+                return workers
+            logger.info(f"Active workers {self._active} -> {workers} ({reason})")
+            self._active = workers
+            self._adjustments += 1
+            self._condition.notify_all()
+        return workers
+
+    def _read_counters(self) -> dict[str, float]:
+        stats: dict[str, Any] = self.rate_limiter.get_stats() if self.rate_limiter else {}
+        return {
+            "items": self.metrics.items_processed if self.metrics else 0,
+            "requests": stats.get("total_requests", 0),
+            "throttled": stats.get("total_429_count", 0),
+            "busy_seconds": getattr(self.repository, "busy_wait_seconds", 0.0),
+        }
+
+    def sample(self) -> ScalingSample:
+        """Read counters and return their deltas since the previous sample.
+
+        Returns:
+            ScalingSample for the interval
+        """
+        now = time.monotonic()
+        counters = self._read_counters()
+        previous = self._last_counters or counters
+        elapsed = now - self._last_sample_time
+        self._last_counters = counters
+        self._last_sample_time = now
+        return ScalingSample(
+            elapsed_seconds=elapsed,
+            items=int(counters["items"] - previous["items"]),
+            requests=int(counters["requests"] - previous["requests"]),
+            throttled=int(counters["throttled"] - previous["throttled"]),
+            busy_seconds=counters["busy_seconds"] - previous["busy_seconds"],
+        )
+
+    def start(self) -> None:
+        """Start the control loop on a daemon thread."""
+        self._stop.clear()
+        self._last_counters = self._read_counters()
+        self._last_sample_time = time.monotonic()
+        self._thread = threading.Thread(target=self._run, name="worker-scaler", daemon=True)
+        self._thread.start()
+        logger.info(
+            f"Dynamic worker scaling: {self._active} active, "
+            f"bounds {self.min_workers}-{self.max_workers}"
+        )
+
+    def stop(self) -> None:
+        """Stop the control loop and unpark every worker."""
+        self.release()
+        if self._thread is not None:
+            self._thread.join(timeout=self.interval + 1)
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.decide(self.sample())
+            except Exception as e:
+                logger.warning(f"Worker scaling decision failed: {e}")
+
+    def __enter__(self) -> "DynamicWorkerScaler":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
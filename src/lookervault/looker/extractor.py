@@ -22,6 +22,7 @@ Multi-Folder Optimization:
 - See MultiFolderOffsetCoordinator for implementation details
 """
 
+import time
 from collections.abc import Iterator
 from datetime import datetime
 from typing import TYPE_CHECKING, Any, Protocol, TypeVar
@@ -29,11 +30,15 @@ from typing import TYPE_CHECKING, Any, Protocol, TypeVar
 from looker_sdk import error as looker_error
 
 from lookervault.exceptions import ExtractionError, RateLimitError
+from lookervault.extraction.metrics import LatencyPhase
 from lookervault.extraction.retry import retry_on_rate_limit
 from lookervault.looker.client import LookerClient
+from lookervault.looker.field_profiles import FieldProfile, resolve_fields
 from lookervault.storage.models import ContentType
+from lookervault.utils.tracing import span
 
 if TYPE_CHECKING:
+    from lookervault.extraction.metrics import ThreadSafeMetrics
     from lookervault.extraction.rate_limiter import AdaptiveRateLimiter
 
 # Content types that support SDK-level folder filtering
@@ -152,17 +157,27 @@ class LookerContentExtractor:
     Supports two-layer rate limiting:
     1. Proactive: Token bucket (if rate_limiter provided)
     2. Reactive: tenacity retry with exponential backoff (always enabled)
+
+    When metrics is set, rate-limit waits, API calls (per SDK method) and
+    SDK-object-to-dict conversions are recorded as latencies.
     """
 
-    def __init__(self, client: LookerClient, rate_limiter: "AdaptiveRateLimiter | None" = None):
+    def __init__(
+        self,
+        client: LookerClient,
+        rate_limiter: "AdaptiveRateLimiter | None" = None,
+        metrics: "ThreadSafeMetrics | None" = None,
+    ):
         """Initialize extractor with Looker client and optional rate limiter.
 
         Args:
             client: LookerClient instance
             rate_limiter: Optional adaptive rate limiter for coordinated throttling
+            metrics: Optional metrics receiving per-phase and per-endpoint latencies
         """
         self.client = client
         self.rate_limiter = rate_limiter
+        self.metrics = metrics
 
     @retry_on_rate_limit
     def _call_api(self, method_name: str, *args, **kwargs) -> Any:
@@ -184,13 +199,26 @@ class LookerContentExtractor:
             RateLimitError: If rate limited (after retries exhausted)
             ExtractionError: For other API errors
         """
+        metrics = self.metrics
+
         # Layer 1: Proactive rate limiting (blocks if necessary)
         if self.rate_limiter:
+            wait_start = time.perf_counter()
             self.rate_limiter.acquire()
+            if metrics is not None:
+                metrics.record_latency(
+                    LatencyPhase.RATE_LIMIT_WAIT, time.perf_counter() - wait_start
+                )
 
         try:
             method = getattr(self.client.sdk, method_name)
-            result = method(*args, **kwargs)
+            call_start = time.perf_counter()
+            with span(method_name, "api"):
+                result = method(*args, **kwargs)
+            if metrics is not None:
+                elapsed = time.perf_counter() - call_start
+                metrics.record_latency(LatencyPhase.API_FETCH, elapsed)
+                metrics.record_endpoint_latency(method_name, elapsed)
 
             # Success: record for adaptive recovery
             if self.rate_limiter:
@@ -215,15 +243,17 @@ class LookerContentExtractor:
         batch_size: int = 100,
         updated_after: datetime | None = None,
         folder_id: str | None = None,
+        field_profile: FieldProfile | str | None = None,
     ) -> Iterator[dict[str, Any]]:
         """Extract all content of given type.
 
         Args:
             content_type: Type of content to extract
-            fields: Comma-separated field list
+            fields: Comma-separated field list (overrides field_profile)
             batch_size: Items per batch for paginated endpoints
             updated_after: Only return items updated after this timestamp (for incremental)
             folder_id: Folder ID for SDK-level filtering (dashboards/looks only)
+            field_profile: Named field profile ("index", "restore-complete", "full")
 
         Yields:
             Individual content items as dicts
@@ -232,6 +262,8 @@ class LookerContentExtractor:
             ExtractionError: If extraction fails
             RateLimitError: If rate limited
         """
+        fields = resolve_fields(content_type, fields, field_profile)
+
         try:
             if content_type == ContentType.DASHBOARD:
                 # Dashboards require pagination for large instances
@@ -244,21 +276,21 @@ class LookerContentExtractor:
             elif content_type == ContentType.LOOKML_MODEL:
                 models = self._call_api("all_lookml_models", fields=fields)
                 for model in models:
-                    item_dict = self._sdk_object_to_dict(model)
+                    item_dict = self._to_dict(model)
                     if self._should_include(item_dict, updated_after):
                         yield item_dict
 
             elif content_type == ContentType.FOLDER:
                 folders = self._call_api("all_folders", fields=fields)
                 for folder in folders:
-                    item_dict = self._sdk_object_to_dict(folder)
+                    item_dict = self._to_dict(folder)
                     if self._should_include(item_dict, updated_after):
                         yield item_dict
 
             elif content_type == ContentType.BOARD:
                 boards = self._call_api("all_boards", fields=fields)
                 for board in boards:
-                    item_dict = self._sdk_object_to_dict(board)
+                    item_dict = self._to_dict(board)
                     if self._should_include(item_dict, updated_after):
                         yield item_dict
 
@@ -277,21 +309,21 @@ class LookerContentExtractor:
             elif content_type == ContentType.PERMISSION_SET:
                 permission_sets = self._call_api("all_permission_sets", fields=fields)
                 for perm_set in permission_sets:
-                    item_dict = self._sdk_object_to_dict(perm_set)
+                    item_dict = self._to_dict(perm_set)
                     if self._should_include(item_dict, updated_after):
                         yield item_dict
 
             elif content_type == ContentType.MODEL_SET:
                 model_sets = self._call_api("all_model_sets", fields=fields)
                 for model_set in model_sets:
-                    item_dict = self._sdk_object_to_dict(model_set)
+                    item_dict = self._to_dict(model_set)
                     if self._should_include(item_dict, updated_after):
                         yield item_dict
 
             elif content_type == ContentType.SCHEDULED_PLAN:
                 schedules = self._call_api("all_scheduled_plans", all_users=True)
                 for schedule in schedules:
-                    item_dict = self._sdk_object_to_dict(schedule)
+                    item_dict = self._to_dict(schedule)
                     if self._should_include(item_dict, updated_after):
                         yield item_dict
 
@@ -311,19 +343,25 @@ class LookerContentExtractor:
         fields: str | None = None,
         updated_after: datetime | None = None,
         folder_id: str | None = None,
+        field_profile: FieldProfile | str | None = None,
     ) -> list[dict[str, Any]]:
         """Extract a specific offset range of content.
 
         Used by parallel workers to fetch specific offset ranges concurrently.
         Only supports paginated content types (dashboards, looks, users, groups, roles).
 
+        Field projection: an explicit ``fields`` string wins; otherwise the named
+        ``field_profile`` is resolved per content type (see field_profiles module).
+        Index sweeps use the "index" profile to download a fraction of the bytes.
+
         Args:
             content_type: Type of content to extract
             offset: Starting offset (0-based)
             limit: Number of items to fetch
-            fields: Fields to retrieve (optional)
+            fields: Fields to retrieve (optional, overrides field_profile)
             updated_after: Only items updated after this timestamp (optional)
             folder_id: Folder ID for SDK-level filtering (dashboards/looks only)
+            field_profile: Named field profile ("index", "restore-complete", "full")
 
         Returns:
             List of content items (may be fewer than limit if at end)
@@ -356,7 +394,7 @@ class LookerContentExtractor:
 
             # Build API call kwargs
             api_kwargs = {
-                "fields": fields,
+                "fields": resolve_fields(content_type, fields, field_profile),
                 "limit": limit,
                 "offset": offset,
             }
@@ -372,7 +410,7 @@ class LookerContentExtractor:
             filtered_results = []
             if results:
                 for item in results:
-                    item_dict = self._sdk_object_to_dict(item)
+                    item_dict = self._to_dict(item)
                     if self._should_include(item_dict, updated_after):
                         filtered_results.append(item_dict)
 
@@ -415,7 +453,7 @@ class LookerContentExtractor:
                 break
 
             for dashboard in dashboards:
-                item_dict = self._sdk_object_to_dict(dashboard)
+                item_dict = self._to_dict(dashboard)
                 if self._should_include(item_dict, updated_after):
                     yield item_dict
 
@@ -453,7 +491,7 @@ class LookerContentExtractor:
                 break
 
             for look in looks:
-                item_dict = self._sdk_object_to_dict(look)
+                item_dict = self._to_dict(look)
                 if self._should_include(item_dict, updated_after):
                     yield item_dict
 
@@ -483,7 +521,7 @@ class LookerContentExtractor:
                 break
 
             for user in users:
-                item_dict = self._sdk_object_to_dict(user)
+                item_dict = self._to_dict(user)
                 if self._should_include(item_dict, updated_after):
                     yield item_dict
 
@@ -513,7 +551,7 @@ class LookerContentExtractor:
                 break
 
             for group in groups:
-                item_dict = self._sdk_object_to_dict(group)
+                item_dict = self._to_dict(group)
                 if self._should_include(item_dict, updated_after):
                     yield item_dict
 
@@ -542,7 +580,7 @@ class LookerContentExtractor:
                 break
 
             for role in roles:
-                item_dict = self._sdk_object_to_dict(role)
+                item_dict = self._to_dict(role)
                 if self._should_include(item_dict, updated_after):
                     yield item_dict
 
@@ -580,7 +618,7 @@ class LookerContentExtractor:
             else:
                 raise ExtractionError(f"extract_one not supported for {content_type}")
 
-            return self._sdk_object_to_dict(item)
+            return self._to_dict(item)
         except Exception as e:
             raise ExtractionError(f"Failed to extract {content_type} {content_id}: {e}") from e
 
@@ -596,6 +634,15 @@ class LookerContentExtractor:
         except Exception:
             return False
 
+    def _to_dict(self, obj: SDKModel) -> dict[str, Any]:
+        """Convert an SDK object with _sdk_object_to_dict, timing it when metrics is set."""
+        if self.metrics is None:
+            return self._sdk_object_to_dict(obj)
+        start = time.perf_counter()
+        item_dict = self._sdk_object_to_dict(obj)
+        self.metrics.record_latency(LatencyPhase.SDK_TO_DICT, time.perf_counter() - start)
+        return item_dict
+
     @staticmethod
     def _sdk_object_to_dict(obj: SDKModel) -> dict[str, Any]:
         """Convert Looker SDK model object to dictionary.
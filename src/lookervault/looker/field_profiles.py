@@ -0,0 +1,143 @@
+"""Named field projection profiles for Looker API requests.
+
+The Looker API accepts a comma-separated ``fields`` parameter on list and search
+endpoints. Requesting only the fields a workflow actually needs avoids downloading
+large nested payloads (``dashboard_elements``, ``vis_config`` trees, credentials)
+that dominate response size for dashboards and users.
+
+Profiles:
+- index: Identity and change-detection fields only (ids, names, folder, updated_at).
+  Used for inventory scans, incremental probes and deletion detection.
+- restore-complete: Every field the restoration Write* models accept, plus the
+  metadata and sub-resource fields needed to rebuild a ContentItem and restore
+  dashboard children.
+- full: No projection (the API returns every field). This is the default.
+"""
+
+from enum import StrEnum
+from functools import cache
+
+from lookervault.looker.write_models import WRITE_MODEL_MAP
+from lookervault.storage.models import ContentType
+
+
+class FieldProfile(StrEnum):
+    """Named field projection profile for API requests."""
+
+    INDEX = "index"
+    RESTORE_COMPLETE = "restore-complete"
+    FULL = "full"
+
+
+# Fields required to build a ContentItem row (id, name, owner, folder, timestamps)
+_CONTENT_ITEM_FIELDS: tuple[str, ...] = (
+    "id",
+    "title",
+    "name",
+    "user_id",
+    "folder_id",
+    "created_at",
+    "updated_at",
+)
+
+# Identity and change-detection fields per content type
+INDEX_FIELDS: dict[ContentType, tuple[str, ...]] = {
+    ContentType.DASHBOARD: ("id", "title", "folder_id", "user_id", "created_at", "updated_at"),
+    ContentType.LOOK: ("id", "title", "folder_id", "user_id", "created_at", "updated_at"),
+    ContentType.BOARD: ("id", "title", "user_id", "created_at", "updated_at"),
+    ContentType.FOLDER: ("id", "name", "parent_id", "creator_id", "created_at"),
+    ContentType.USER: ("id", "first_name", "last_name", "email", "created_at"),
+    ContentType.GROUP: ("id", "name"),
+    ContentType.ROLE: ("id", "name"),
+    ContentType.PERMISSION_SET: ("id", "name"),
+    ContentType.MODEL_SET: ("id", "name"),
+    ContentType.LOOKML_MODEL: ("name", "project_name"),
+    ContentType.SCHEDULED_PLAN: ("id", "name", "user_id", "created_at", "updated_at"),
+}
+
+# Read-only fields that restoration still consumes from the backup blob.
+# Dashboard children are restored through DashboardSubResourceRestorer.
+_RESTORE_EXTRA_FIELDS: dict[ContentType, tuple[str, ...]] = {
+    ContentType.DASHBOARD: ("dashboard_elements", "dashboard_filters", "dashboard_layouts"),
+    ContentType.ROLE: ("group_ids",),
+    ContentType.BOARD: ("board_sections",),
+}
+
+
+@cache
+def _restore_complete_fields(content_type: ContentType) -> tuple[str, ...] | None:
+    """Compute the restore-complete field set for a content type.
+
+    Args:
+        content_type: ContentType enum value
+
+    Returns:
+        Sorted tuple of field names, or None if the type has no Write* model
+        (in which case all fields are requested)
+    """
+    model_class = WRITE_MODEL_MAP.get(content_type)
+    # Looker SDK models are attrs classes; __attrs_attrs__ lists constructor fields
+    model_attrs = getattr(model_class, "__attrs_attrs__", None)
+    if not model_attrs:
+        return None
+
+    write_fields = {a.name for a in model_attrs}
+    write_fields.update(_CONTENT_ITEM_FIELDS)
+    write_fields.update(_RESTORE_EXTRA_FIELDS.get(content_type, ()))
+    return tuple(sorted(write_fields))
+
+
+def get_profile_fields(content_type: ContentType, profile: FieldProfile | str) -> str | None:
+    """Resolve a field profile to a Looker API ``fields`` parameter.
+
+    Args:
+        content_type: ContentType enum value
+        profile: Profile name ("index", "restore-complete" or "full")
+
+    Returns:
+        Comma-separated field list, or None to request all fields
+
+    Raises:
+        ValueError: If profile name is unknown
+
+    Examples:
+        >>> get_profile_fields(ContentType.GROUP, "index")
+        'id,name'
+        >>> get_profile_fields(ContentType.DASHBOARD, FieldProfile.FULL) is None
+        True
+    """
+    profile = FieldProfile(profile)
+
+    if profile == FieldProfile.FULL:
+        return None
+
+    if profile == FieldProfile.INDEX:
+        index_fields = INDEX_FIELDS.get(content_type)
+        return ",".join(index_fields) if index_fields else None
+
+    restore_fields = _restore_complete_fields(content_type)
+    return ",".join(restore_fields) if restore_fields else None
+
+
+def resolve_fields(
+    content_type: ContentType,
+    fields: str | None,
+    profile: FieldProfile | str | None,
+) -> str | None:
+    """Resolve the effective ``fields`` parameter for an API request.
+
+    An explicit comma-separated ``fields`` string always wins over a profile.
+
+    Args:
+        content_type: ContentType enum value
+        fields: Explicit comma-separated field list (optional)
+        profile: Field profile name (optional)
+
+    Returns:
+        Comma-separated field list, or None to request all fields
+    """
+    if fields:
+        return fields
+    if profile is None:
+        return None
+    return get_profile_fields(content_type, profile)
@@ -0,0 +1,27 @@
+"""Looker SDK Write* models accepted by create/update endpoints, per content type.
+
+Extraction uses them to project restorable fields and restoration to decode
+backups, so the mapping lives here rather than in either package.
+"""
+
+from typing import Any
+
+from looker_sdk import models40 as looker_models
+
+from lookervault.storage.models import ContentType
+
+# Mapping of ContentType to Looker SDK Write* model classes
+WRITE_MODEL_MAP: dict[ContentType, type[Any]] = {
+    ContentType.DASHBOARD: looker_models.WriteDashboard,
+    ContentType.LOOK: looker_models.WriteLookWithQuery,
+    ContentType.FOLDER: looker_models.UpdateFolder,
+    ContentType.USER: looker_models.WriteUser,
+    ContentType.GROUP: looker_models.WriteGroup,
+    ContentType.ROLE: looker_models.WriteRole,
+    ContentType.BOARD: looker_models.WriteBoard,
+    ContentType.SCHEDULED_PLAN: looker_models.WriteScheduledPlan,
+    ContentType.LOOKML_MODEL: looker_models.WriteLookmlModel,
+    ContentType.PERMISSION_SET: looker_models.WritePermissionSet,
+    ContentType.MODEL_SET: looker_models.WriteModelSet,
+    ContentType.EXPLORE: looker_models.WriteQuery,  # Explores are queries
+}
@@ -5,6 +5,7 @@ content items that failed restoration after all retry attempts. The DLQ allows:
 - Recording failed restoration attempts with full error context
 - Querying and filtering failed items by session, content type
 - Manually retrying individual failed items
+- Replaying many failed items in parallel (see dlq_replay.DLQReplayer)
 - Clearing failed items after resolution
 
 The DLQ is backed by SQLite (dead_letter_queue table) for persistence across sessions.
@@ -18,12 +19,50 @@ from lookervault.storage.models import ContentType, DeadLetterItem
 from lookervault.storage.repository import ContentRepository
 
 if TYPE_CHECKING:
+    from lookervault.restoration.dlq_replay import DLQReplaySummary
     from lookervault.restoration.restorer import LookerContentRestorer
     from lookervault.storage.models import RestorationResult
 
 logger = logging.getLogger(__name__)
 
 
+def extract_error_type(error_message: str) -> str:
+    """Extract error type by parsing error message patterns.
+
+    Args:
+        error_message: Error message string to analyze
+
+    Returns:
+        Error type classification string
+
+    Error type hierarchy (most specific first):
+    - NotFoundError: Content or resource not found (404)
+    - ValidationError: Invalid content structure (422)
+    - RateLimitError: API rate limit exceeded (429)
+    - AuthenticationError: Invalid credentials (401)
+    - AuthorizationError: Insufficient permissions (403)
+    - TimeoutError: Request timeout
+    - APIError: Generic API error (default)
+    """
+    error_lower = error_message.lower()
+
+    # Check for specific error types (order matters - most specific first)
+    if "not found" in error_lower or "404" in error_lower:
+        return "NotFoundError"
+    elif "validation" in error_lower or "422" in error_lower:
+        return "ValidationError"
+    elif "rate limit" in error_lower or "429" in error_lower or "too many requests" in error_lower:
+        return "RateLimitError"
+    elif "authentication" in error_lower or "401" in error_lower or "unauthorized" in error_lower:
+        return "AuthenticationError"
+    elif "authorization" in error_lower or "403" in error_lower or "forbidden" in error_lower:
+        return "AuthorizationError"
+    elif "timeout" in error_lower or "timed out" in error_lower:
+        return "TimeoutError"
+    else:
+        return "APIError"
+
+
 class DeadLetterQueue:
     """Manages failed restoration items with retry and query capabilities.
 
@@ -183,46 +222,8 @@ class DeadLetterQueue:
         return dlq_id
 
     def _extract_error_type(self, error_message: str) -> str:
-        """Extract error type by parsing error message patterns.
-
-        Args:
-            error_message: Error message string to analyze
-
-        Returns:
-            Error type classification string
-
-        Error type hierarchy (most specific first):
-        - NotFoundError: Content or resource not found (404)
-        - ValidationError: Invalid content structure (422)
-        - RateLimitError: API rate limit exceeded (429)
-        - AuthenticationError: Invalid credentials (401)
-        - AuthorizationError: Insufficient permissions (403)
-        - TimeoutError: Request timeout
-        - APIError: Generic API error (default)
-        """
-        error_lower = error_message.lower()
-
-        # Check for specific error types (order matters - most specific first)
-        if "not found" in error_lower or "404" in error_lower:
-            return "NotFoundError"
-        elif "validation" in error_lower or "422" in error_lower:
-            return "ValidationError"
-        elif (
-            "rate limit" in error_lower
-            or "429" in error_lower
-            or "too many requests" in error_lower
-        ):
-            return "RateLimitError"
-        elif (
-            "authentication" in error_lower or "401" in error_lower or "unauthorized" in error_lower
-        ):
-            return "AuthenticationError"
-        elif "authorization" in error_lower or "403" in error_lower or "forbidden" in error_lower:
-            return "AuthorizationError"
-        elif "timeout" in error_lower or "timed out" in error_lower:
-            return "TimeoutError"
-        else:
-            return "APIError"
+        """Extract error type by parsing error message patterns (see extract_error_type)."""
+        return extract_error_type(error_message)
 
     def get(self, dlq_id: int) -> DeadLetterItem | None:
         """Retrieve DLQ entry by ID.
@@ -347,7 +348,7 @@ class DeadLetterQueue:
         )
 
         # If successful, delete from DLQ using repository.delete_dead_letter_item()
-        if result.status in ["created", "updated", "success"]:
+        if result.status in ["created", "updated", "success", "skipped"]:
             logger.info(
                 f"DLQ retry successful for {dlq_item.content_id}: {result.status}. "
                 f"Removing from DLQ."
@@ -362,6 +363,38 @@ class DeadLetterQueue:
         # Return RestorationResult
         return result
 
+    def replay(
+        self,
+        restorer: "LookerContentRestorer",
+        session_id: str | None = None,
+        content_type: ContentType | None = None,
+        error_types: Sequence[str] | None = None,
+        workers: int = 8,
+    ) -> "DLQReplaySummary":
+        """Replay all matching DLQ entries in parallel (see DLQReplayer).
+
+        Args:
+            restorer: LookerContentRestorer instance (its rate limiter is shared)
+            session_id: Optional session filter (default: None = all sessions)
+            content_type: Optional ContentType enum filter (default: None = all types)
+            error_types: Optional error type filter (default: None = all error types)
+            workers: Number of concurrent replays
+
+        Returns:
+            DLQReplaySummary with counts and abort status
+
+        Examples:
+            >>> # Drain rate-limited failures after an outage
+            >>> summary = dlq.replay(restorer, error_types=["RateLimitError"], workers=16)
+            >>> print(f"Recovered {summary.succeeded} of {summary.attempted} entries")
+        """
+        from lookervault.restoration.dlq_replay import DLQReplayer
+
+        replayer = DLQReplayer(self.repository, restorer, workers=workers)
+        return replayer.replay(
+            session_id=session_id, content_type=content_type, error_types=error_types
+        )
+
     def clear(
         self,
         session_id: str | None = None,
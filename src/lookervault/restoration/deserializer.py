@@ -1,13 +1,30 @@
 """Content deserialization for restoration from SQLite binary blobs."""
 
+import logging
 from typing import Any
 
 import msgspec
-from looker_sdk import models40 as looker_models
 
 from lookervault.exceptions import DeserializationError
+from lookervault.looker.write_models import WRITE_MODEL_MAP
+from lookervault.restoration.schemas import build_write_schema, write_schema_decoder
 from lookervault.storage.models import ContentType
 
+logger = logging.getLogger(__name__)
+
+
+class _DashboardSubresources(msgspec.Struct):
+    """Nested sub-resource lists of a dashboard blob; other fields are skipped."""
+
+    dashboard_filters: list[dict[str, Any]] | None = None
+    dashboard_elements: list[dict[str, Any]] | None = None
+    dashboard_layouts: list[dict[str, Any]] | None = None
+
+
+_SUBRESOURCE_DECODERS: dict[ContentType, msgspec.msgpack.Decoder[Any]] = {
+    ContentType.DASHBOARD: msgspec.msgpack.Decoder(_DashboardSubresources),
+}
+
 
 class ContentDeserializer:
     """Deserializes content_data blobs to Looker SDK Write* models or dicts.
@@ -27,6 +44,8 @@ class ContentDeserializer:
         >>> content = deserializer.deserialize(blob, ContentType.DASHBOARD, as_dict=True)
         >>> # Or deserialize to SDK model for validation
         >>> model = deserializer.deserialize(blob, ContentType.DASHBOARD, as_dict=False)
+        >>> # Or decode writable fields and validate them in one pass (fastest)
+        >>> content, errors = deserializer.deserialize_writable(blob, ContentType.DASHBOARD)
     """
 
     # Read-only fields that should be filtered before Write* model instantiation.
@@ -174,20 +193,7 @@ class ContentDeserializer:
     }
 
     # Mapping of ContentType to Looker SDK Write* model classes
-    _WRITE_MODEL_MAP: dict[ContentType, type[Any]] = {
-        ContentType.DASHBOARD: looker_models.WriteDashboard,
-        ContentType.LOOK: looker_models.WriteLookWithQuery,
-        ContentType.FOLDER: looker_models.UpdateFolder,
-        ContentType.USER: looker_models.WriteUser,
-        ContentType.GROUP: looker_models.WriteGroup,
-        ContentType.ROLE: looker_models.WriteRole,
-        ContentType.BOARD: looker_models.WriteBoard,
-        ContentType.SCHEDULED_PLAN: looker_models.WriteScheduledPlan,
-        ContentType.LOOKML_MODEL: looker_models.WriteLookmlModel,
-        ContentType.PERMISSION_SET: looker_models.WritePermissionSet,
-        ContentType.MODEL_SET: looker_models.WriteModelSet,
-        ContentType.EXPLORE: looker_models.WriteQuery,  # Explores are queries
-    }
+    _WRITE_MODEL_MAP: dict[ContentType, type[Any]] = WRITE_MODEL_MAP
 
     def _filter_read_only_fields(self, content_dict: dict[str, Any]) -> dict[str, Any]:
         """Remove read-only fields that Write* models don't accept.
@@ -309,6 +315,93 @@ class ContentDeserializer:
                 f"Failed to convert {content_type.name} dict to SDK model {model_class.__name__}: {e}"
             ) from e
 
+    def deserialize_writable(
+        self, content_data: bytes, content_type: ContentType
+    ) -> tuple[dict[str, Any], list[str]]:
+        """Decode the writable fields of a blob and validate them in one pass.
+
+        The blob is decoded straight into the typed msgspec schema of the
+        content type's Write* model (see lookervault.restoration.schemas).
+        Read-only and unknown fields are skipped by the decoder and field types
+        are checked while decoding, so no intermediate dict is filtered and no
+        SDK model is built.
+
+        If the blob does not match the schema (e.g. an ID stored as an integer),
+        decoding falls back to the generic route: deserialize() followed by
+        validate_schema() against the SDK model, restricted to the same fields.
+
+        Args:
+            content_data: Binary blob from SQLite content_items.content_data
+            content_type: ContentType enum value
+
+        Returns:
+            Tuple of (writable content dict, schema validation errors)
+
+        Raises:
+            DeserializationError: If content_data is corrupted or not a dictionary
+            ValueError: If content_type is not supported
+        """
+        if content_type not in self._WRITE_MODEL_MAP:
+            raise ValueError(
+                f"Unsupported content type: {content_type}. "
+                f"Supported types: {list(self._WRITE_MODEL_MAP.keys())}"
+            )
+
+        model_class = self._WRITE_MODEL_MAP[content_type]
+        read_only = frozenset(self.READ_ONLY_FIELDS)
+        try:
+            decoded = write_schema_decoder(model_class, read_only).decode(content_data)
+            return msgspec.to_builtins(decoded), []
+        except msgspec.ValidationError as e:
+            logger.debug(
+                f"{content_type.name} blob does not match {model_class.__name__} schema "
+                f"({e}), falling back to SDK model validation"
+            )
+        except msgspec.DecodeError as e:
+            raise DeserializationError(
+                f"Failed to deserialize {content_type.name} content: {e}"
+            ) from e
+
+        # Fallback: generic decode, then let the SDK model judge the same fields
+        schema_fields = build_write_schema(model_class, read_only).__struct_fields__
+        content_dict = self.deserialize(content_data, content_type, as_dict=True)
+        writable = {k: v for k, v in content_dict.items() if k in schema_fields}
+        return writable, self.validate_schema(writable, content_type)
+
+    def deserialize_subresources(
+        self, content_data: bytes, content_type: ContentType
+    ) -> dict[str, list[dict[str, Any]]]:
+        """Decode only the nested sub-resource lists of a blob.
+
+        deserialize() and deserialize_writable() drop these lists because they
+        are read-only fields of the parent; sub-resource restoration needs them.
+
+        Args:
+            content_data: Binary blob from SQLite content_items.content_data
+            content_type: ContentType enum value
+
+        Returns:
+            Sub-resource field -> list of sub-resource dicts (empty for content
+            types without sub-resources)
+
+        Raises:
+            DeserializationError: If content_data is corrupted or has malformed lists
+        """
+        decoder = _SUBRESOURCE_DECODERS.get(content_type)
+        if decoder is None:
+            return {}
+        try:
+            decoded = decoder.decode(content_data)
+        except msgspec.DecodeError as e:
+            raise DeserializationError(
+                f"Failed to deserialize {content_type.name} sub-resources: {e}"
+            ) from e
+        return {
+            name: getattr(decoded, name)
+            for name in decoded.__struct_fields__
+            if getattr(decoded, name) is not None
+        }
+
     def validate_schema(
         self,
         content_dict: dict[str, Any],
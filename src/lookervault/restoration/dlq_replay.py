@@ -0,0 +1,184 @@
+"""Parallel bulk replay of dead letter queue entries."""
+
+import logging
+import time
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from lookervault.restoration.dead_letter_queue import extract_error_type
+from lookervault.storage.models import ContentType, DeadLetterItem, RestorationResult
+from lookervault.storage.repository import ContentRepository
+
+if TYPE_CHECKING:
+    from lookervault.restoration.restorer import LookerContentRestorer
+
+logger = logging.getLogger(__name__)
+
+# Entries that failed with these errors are not replayed: the backup content
+# itself was rejected, so replaying it unchanged cannot succeed.
+NON_RETRYABLE_ERROR_TYPES: frozenset[str] = frozenset({"ValidationError"})
+
+# A replay failing with one of these stops the whole run: every remaining
+# entry would fail the same way (e.g. revoked or wrong credentials).
+FATAL_ERROR_TYPES: frozenset[str] = frozenset({"AuthenticationError"})
+
+SUCCESS_STATUSES = ("created", "updated", "success", "skipped")
+
+
+@dataclass
+class DLQReplaySummary:
+    """Aggregated outcome of a bulk DLQ replay."""
+
+    attempted: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    skipped: int = 0
+    aborted: bool = False
+    abort_reason: str | None = None
+    duration_seconds: float = 0.0
+    error_breakdown: dict[str, int] = field(default_factory=dict)
+
+
+class DLQReplayer:
+    """Replays DLQ entries across a worker pool with batched bookkeeping.
+
+    Entries are streamed from SQLite a page at a time (keyset pagination), so
+    memory stays bounded however large the queue is. Each page is replayed
+    concurrently through restorer.restore_single(), which acquires the
+    restorer's shared rate limiter for every API call. Once a page finishes,
+    successes are deleted and failures get their retry_count bumped, each in a
+    single transaction written by the calling thread.
+
+    Entries whose last error can never succeed (NON_RETRYABLE_ERROR_TYPES) are
+    skipped, duplicate entries for the same item within a page are replayed
+    once, and the replay stops early when a retry hits a FATAL_ERROR_TYPES error.
+
+    Examples:
+        >>> replayer = DLQReplayer(repository, restorer, workers=8)
+        >>> summary = replayer.replay(session_id="restore-123")
+        >>> print(f"{summary.succeeded}/{summary.attempted} entries recovered")
+    """
+
+    def __init__(
+        self,
+        repository: ContentRepository,
+        restorer: "LookerContentRestorer",
+        workers: int = 8,
+        page_size: int = 200,
+        skip_error_types: frozenset[str] = NON_RETRYABLE_ERROR_TYPES,
+        fatal_error_types: frozenset[str] = FATAL_ERROR_TYPES,
+    ):
+        """Initialize DLQReplayer.
+
+        Args:
+            repository: Repository holding the dead_letter_queue table
+            restorer: Restorer used to replay entries (carries the shared rate limiter)
+            workers: Number of concurrent replays
+            page_size: DLQ entries fetched, replayed and committed per page
+            skip_error_types: Stored error types that are not replayed
+            fatal_error_types: Replay error types that abort the run
+        """
+        self.repository = repository
+        self.restorer = restorer
+        self.workers = max(1, workers)
+        self.page_size = max(1, page_size)
+        self.skip_error_types = skip_error_types
+        self.fatal_error_types = fatal_error_types
+
+    def replay(
+        self,
+        session_id: str | None = None,
+        content_type: ContentType | None = None,
+        error_types: Sequence[str] | None = None,
+    ) -> DLQReplaySummary:
+        """Replay all DLQ entries matching the filters.
+
+        Args:
+            session_id: Optional session filter
+            content_type: Optional content type filter
+            error_types: Optional stored error type filter (e.g. ["RateLimitError"])
+
+        Returns:
+            DLQReplaySummary with counts, error breakdown and abort status
+        """
+        summary = DLQReplaySummary()
+        start_time = time.time()
+
+        def _replay(item: DeadLetterItem) -> RestorationResult:
+            try:
+                return self.restorer.restore_single(
+                    content_id=item.content_id, content_type=ContentType(item.content_type)
+                )
+            except Exception as e:
+                logger.exception(f"Unexpected error replaying DLQ entry {item.id}: {e}")
+                return RestorationResult(
+                    content_id=item.content_id,
+                    content_type=item.content_type,
+                    status="failed",
+                    error_message=str(e),
+                )
+
+        pages = self.repository.iter_dead_letter_pages(
+            session_id=session_id,
+            content_type=content_type.value if content_type is not None else None,
+            error_types=error_types,
+            page_size=self.page_size,
+        )
+
+        with ThreadPoolExecutor(
+            max_workers=self.workers, thread_name_prefix="dlq-replay"
+        ) as executor:
+            for page in pages:
+                # One replay per item; its outcome applies to every entry for it
+                groups: dict[tuple[int, str], list[DeadLetterItem]] = {}
+                for item in page:
+                    if item.error_type in self.skip_error_types:
+                        summary.skipped += 1
+                        continue
+                    groups.setdefault((item.content_type, item.content_id), []).append(item)
+
+                representatives = [entries[0] for entries in groups.values()]
+                results = list(executor.map(_replay, representatives))
+
+                succeeded_ids: list[int] = []
+                failures: list[tuple[int, str, str]] = []
+                for entries, result in zip(groups.values(), results, strict=True):
+                    summary.attempted += len(entries)
+                    if result.status in SUCCESS_STATUSES:
+                        summary.succeeded += len(entries)
+                        succeeded_ids.extend(entry.id for entry in entries if entry.id)
+                        continue
+
+                    error_message = result.error_message or "Unknown error"
+                    error_type = extract_error_type(error_message)
+                    summary.failed += len(entries)
+                    summary.error_breakdown[error_type] = summary.error_breakdown.get(
+                        error_type, 0
+                    ) + len(entries)
+                    failures.extend(
+                        (entry.id, error_message, error_type) for entry in entries if entry.id
+                    )
+                    if error_type in self.fatal_error_types and not summary.aborted:
+                        summary.aborted = True
+                        summary.abort_reason = f"{error_type}: {error_message}"
+
+                self.repository.delete_dead_letter_items(succeeded_ids)
+                self.repository.record_dead_letter_retries(failures)
+                logger.info(
+                    f"DLQ replay page done: {len(succeeded_ids)} recovered, "
+                    f"{len(failures)} still failing"
+                )
+
+                if summary.aborted:
+                    logger.error(f"Stopping DLQ replay early: {summary.abort_reason}")
+                    break
+
+        summary.duration_seconds = time.time() - start_time
+        logger.info(
+            f"DLQ replay complete: attempted={summary.attempted}, "
+            f"succeeded={summary.succeeded}, failed={summary.failed}, "
+            f"skipped={summary.skipped}, aborted={summary.aborted}"
+        )
+        return summary
@@ -0,0 +1,65 @@
+"""Writable-field fingerprints for skipping unchanged content during restoration.
+
+A fingerprint is a hash of the fields a restore would write, normalized so
+that two representations of the same content hash identically regardless of
+key order, unset (None) values, or fields that only one side carries. The
+restorer compares the fingerprint of a backup item with that of the
+destination copy and skips the PATCH when they match.
+"""
+
+import hashlib
+import json
+from collections.abc import Iterable, Mapping
+from typing import Any
+
+# Fields excluded from fingerprints. The ID is not content: it differs between
+# instances (cross-instance restores) and is never sent in a PATCH body.
+_IGNORED_FIELDS = frozenset({"id"})
+
+
+def _normalize(value: Any) -> Any:
+    """Recursively drop None values from dicts so unset and missing compare equal."""
+    if isinstance(value, dict):
+        return {str(k): _normalize(v) for k, v in value.items() if v is not None}
+    if isinstance(value, list | tuple):
+        return [_normalize(v) for v in value]
+    return value
+
+
+def _project(value: Any, template: Any) -> Any:
+    """Restrict nested dicts in value to the keys present at the same place in template."""
+    if isinstance(value, dict) and isinstance(template, dict):
+        return {key: _project(value.get(key), template[key]) for key in template}
+    if isinstance(value, list | tuple) and isinstance(template, list | tuple):
+        if len(value) != len(template):
+            return value
+        return [_project(v, t) for v, t in zip(value, template, strict=True)]
+    return value
+
+
+def content_fingerprint(content_dict: dict[str, Any], fields: Iterable[str] | None = None) -> str:
+    """Compute the fingerprint of a content dict's writable fields.
+
+    Args:
+        content_dict: Content as a dictionary, with read-only fields already
+            removed (as returned by ContentDeserializer.deserialize(as_dict=True))
+        fields: Restrict the fingerprint to these fields. Used to fingerprint a
+            destination response over exactly the fields the backup would write.
+            When fields is the backup dict itself, nested objects are restricted
+            to the backup's keys too, so read-only fields of nested models (e.g.
+            a role's permission_set URL) don't make identical content differ.
+
+    Returns:
+        Hex digest identifying the writable content
+
+    Examples:
+        >>> fingerprint = content_fingerprint({"title": "Sales", "description": None})
+        >>> fingerprint == content_fingerprint({"title": "Sales"})
+        True
+    """
+    keys = content_dict.keys() if fields is None else fields
+    writable = {key: content_dict.get(key) for key in keys if key not in _IGNORED_FIELDS}
+    if isinstance(fields, Mapping):
+        writable = {key: _project(value, fields[key]) for key, value in writable.items()}
+    payload = json.dumps(_normalize(writable), sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
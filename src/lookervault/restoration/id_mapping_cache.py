@@ -0,0 +1,210 @@
+"""Process-wide in-memory ID mapping cache with write-behind persistence."""
+
+import logging
+import threading
+from collections.abc import Iterable
+from datetime import datetime
+
+from lookervault.storage.models import ContentType, IDMapping
+from lookervault.storage.repository import ContentRepository
+
+logger = logging.getLogger(__name__)
+
+
+class IDMappingCache:
+    """Shared source ID → destination ID cache for cross-instance restoration.
+
+    Mappings for a (source_instance, content_type) pair are bulk-loaded from
+    the id_mappings table on first use, after which lookups never touch SQLite.
+    Entries live in lock-striped dicts so worker threads only contend when their
+    IDs hash to the same stripe.
+
+    New mappings are written to the cache immediately and persisted in batches
+    (write-behind): a flush is triggered once batch_size mappings are pending,
+    and flush() writes everything pending. To stay correct on crash-resume,
+    callers must flush() before recording an item as completed (see
+    RestorationProgressWriter's before_flush hook), so every item that resume
+    skips has its mapping on disk.
+
+    Examples:
+        >>> cache = IDMappingCache(repository, "https://source.looker.com")
+        >>> cache.save_mapping(ContentType.DASHBOARD, "42", "1042")
+        >>> cache.get_destination_id(ContentType.DASHBOARD, "42")
+        '1042'
+        >>> cache.close()  # Persists pending mappings
+    """
+
+    def __init__(
+        self,
+        repository: ContentRepository,
+        source_instance: str,
+        session_id: str | None = None,
+        stripes: int = 16,
+        batch_size: int = 500,
+    ):
+        """Initialize IDMappingCache.
+
+        Args:
+            repository: Repository implementing load_id_mappings() and save_id_mappings()
+            source_instance: Source Looker instance URL the mappings belong to
+            session_id: Default restoration session recorded with new mappings
+            stripes: Number of independently locked partitions
+            batch_size: Pending mappings that trigger a write-behind flush
+        """
+        self.repository = repository
+        self.source_instance = source_instance
+        self.session_id = session_id
+        self.batch_size = max(1, batch_size)
+
+        stripe_count = max(1, stripes)
+        self._stripes: list[dict[tuple[int, str], str]] = [{} for _ in range(stripe_count)]
+        self._stripe_locks = [threading.Lock() for _ in range(stripe_count)]
+
+        self._loaded: set[int] = set()
+        self._load_lock = threading.Lock()
+
+        self._pending: list[IDMapping] = []
+        self._pending_lock = threading.Lock()
+        # Serializes flushes so batches reach SQLite in the order they were queued
+        self._flush_lock = threading.Lock()
+
+    @property
+    def pending_count(self) -> int:
+        """Number of mappings not yet persisted."""
+        with self._pending_lock:
+            return len(self._pending)
+
+    def _stripe(self, source_id: str) -> int:
+        return hash(source_id) % len(self._stripes)
+
+    def preload(self, content_type: ContentType) -> int:
+        """Bulk-load all stored mappings for a content type (no-op if already loaded).
+
+        Entries already in the cache take precedence over stored rows, since
+        they may not have been flushed yet.
+
+        Args:
+            content_type: Content type to load
+
+        Returns:
+            Number of mappings loaded (0 if the type was already loaded)
+        """
+        type_value = content_type.value
+        if type_value in self._loaded:
+            return 0
+
+        with self._load_lock:
+            if type_value in self._loaded:
+                return 0
+
+            stored = self.repository.load_id_mappings(self.source_instance, type_value)
+            for source_id, destination_id in stored.items():
+                index = self._stripe(source_id)
+                with self._stripe_locks[index]:
+                    self._stripes[index].setdefault((type_value, source_id), destination_id)
+
+            self._loaded.add(type_value)
+
+        logger.debug(f"Preloaded {len(stored)} {content_type.name} ID mappings")
+        return len(stored)
+
+    def get_destination_id(self, content_type: ContentType, source_id: str) -> str | None:
+        """Get destination ID for a source ID.
+
+        Args:
+            content_type: Content type of the referenced item
+            source_id: Original ID from source instance
+
+        Returns:
+            Destination ID if mapped, None otherwise
+        """
+        self.preload(content_type)
+        index = self._stripe(source_id)
+        with self._stripe_locks[index]:
+            return self._stripes[index].get((content_type.value, source_id))
+
+    def get_destination_ids(
+        self, content_type: ContentType, source_ids: Iterable[str]
+    ) -> dict[str, str]:
+        """Bulk lookup of destination IDs.
+
+        Args:
+            content_type: Content type of the referenced items
+            source_ids: Original IDs from source instance
+
+        Returns:
+            Dictionary mapping source_id -> destination_id (only includes found mappings)
+        """
+        self.preload(content_type)
+        found: dict[str, str] = {}
+        for source_id in source_ids:
+            index = self._stripe(source_id)
+            with self._stripe_locks[index]:
+                destination_id = self._stripes[index].get((content_type.value, source_id))
+            if destination_id is not None:
+                found[source_id] = destination_id
+        return found
+
+    def save_mapping(
+        self,
+        content_type: ContentType,
+        source_id: str,
+        destination_id: str,
+        session_id: str | None = None,
+    ) -> None:
+        """Record a mapping in the cache and queue it for persistence.
+
+        Args:
+            content_type: Content type of the created item
+            source_id: Original ID from source instance
+            destination_id: ID assigned by the destination instance
+            session_id: Restoration session (defaults to the cache's session_id)
+        """
+        index = self._stripe(source_id)
+        with self._stripe_locks[index]:
+            self._stripes[index][(content_type.value, source_id)] = destination_id
+
+        mapping = IDMapping(
+            source_instance=self.source_instance,
+            content_type=content_type.value,
+            source_id=source_id,
+            destination_id=destination_id,
+            created_at=datetime.now(),
+            session_id=session_id or self.session_id,
+        )
+        with self._pending_lock:
+            self._pending.append(mapping)
+            flush_due = len(self._pending) >= self.batch_size
+
+        if flush_due:
+            self.flush()
+
+    def flush(self) -> None:
+        """Persist all pending mappings in one transaction.
+
+        On failure the mappings stay pending for the next flush.
+
+        Raises:
+            StorageError: If the write fails after retries
+        """
+        with self._flush_lock:
+            with self._pending_lock:
+                batch, self._pending = self._pending, []
+            if not batch:
+                return
+
+            try:
+                self.repository.save_id_mappings(batch)
+            except Exception:
+                with self._pending_lock:
+                    self._pending = batch + self._pending
+                raise
+
+        logger.debug(f"Flushed {len(batch)} ID mappings")
+
+    def close(self) -> None:
+        """Flush pending mappings and release this thread's database connection."""
+        try:
+            self.flush()
+        finally:
+            self.repository.close_thread_connection()
@@ -10,6 +10,7 @@ This module provides the ParallelRestorationOrchestrator class that handles:
 - Metrics aggregation across all workers
 """
 
+import dataclasses
 import logging
 import queue
 import threading
@@ -19,15 +20,19 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Protocol
 
 from lookervault.config.models import RestorationConfig
+from lookervault.extraction.memory_monitor import read_process_memory
 from lookervault.extraction.metrics import ThreadSafeMetrics
 from lookervault.extraction.rate_limiter import AdaptiveRateLimiter
+from lookervault.extraction.worker_scaler import DynamicWorkerScaler
 from lookervault.restoration.dependency_graph import DependencyGraph
+from lookervault.restoration.progress_writer import RestorationProgressWriter
 from lookervault.restoration.restorer import IDMapper, LookerContentRestorer
 from lookervault.storage.models import (
     ContentType,
     RestorationCheckpoint,
     RestorationResult,
     RestorationSummary,
+    RunTelemetry,
 )
 from lookervault.storage.repository import ContentRepository
 
@@ -102,7 +107,7 @@ class ParallelRestorationOrchestrator:
         >>> print(f"Resumed: {summary.success_count} additional items restored")
 
         >>> # Cross-instance migration with ID mapping
-        >>> id_mapper = IDMapper(repo, "source.looker.com", "dest.looker.com")
+        >>> id_mapper = ReferenceTranslator(IDMappingCache(repo, "https://source.looker.com"))
         >>> orchestrator = ParallelRestorationOrchestrator(
         ...     restorer=restorer,
         ...     repository=repo,
@@ -135,7 +140,9 @@ class ParallelRestorationOrchestrator:
             rate_limiter: Shared AdaptiveRateLimiter for coordinated API throttling
             metrics: ThreadSafeMetrics for aggregating statistics across workers
             dlq: DeadLetterQueue implementation for failed items (typically repository)
-            id_mapper: Optional ID mapper for cross-instance migration
+            id_mapper: Optional ID mapper for cross-instance migration. The restorer
+                uses it unless it has its own; pending mappings are flushed when each
+                content type finishes or fails.
 
         Examples:
             >>> # Standard configuration
@@ -158,7 +165,9 @@ class ParallelRestorationOrchestrator:
             ...     rate_limiter=AdaptiveRateLimiter(requests_per_minute=200),
             ...     metrics=ThreadSafeMetrics(),
             ...     dlq=repo,
-            ...     id_mapper=IDMapper(repo, "source.looker.com", "dest.looker.com"),
+            ...     id_mapper=ReferenceTranslator(
+            ...         IDMappingCache(repo, "https://source.looker.com")
+            ...     ),
             ... )
         """
         self.restorer = restorer
@@ -168,6 +177,8 @@ class ParallelRestorationOrchestrator:
         self.metrics = metrics
         self.dlq = dlq
         self.id_mapper = id_mapper
+        if id_mapper is not None and restorer.id_mapper is None:
+            restorer.id_mapper = id_mapper
 
         # Initialize dependency graph for restore_all ordering
         self.dependency_graph = DependencyGraph()
@@ -191,7 +202,8 @@ class ParallelRestorationOrchestrator:
         3. Distributing content IDs via thread-safe queue.Queue
         4. Workers call restorer.restore_single() with rate limiting
         5. Aggregating results into RestorationSummary
-        6. Saving checkpoints every config.checkpoint_interval items
+        6. Recording per-item progress through a background batch writer and
+           saving a counts-only checkpoint every config.checkpoint_interval items
         7. Handling worker errors: catch exceptions, add to DLQ after max retries
 
         Args:
@@ -234,6 +246,7 @@ class ParallelRestorationOrchestrator:
             ... )
         """
         start_time = time.time()
+        telemetry_baseline = self._telemetry_counters()
 
         logger.info(
             f"Starting parallel restoration: "
@@ -291,8 +304,27 @@ class ParallelRestorationOrchestrator:
         updated_count = 0
         error_count = 0
         skipped_count = 0
+        processed_count = 0
         error_breakdown: dict[str, int] = {}
-        completed_ids: list[str] = []
+        # Per-item timings of real writes, kept as history for restore planning
+        latency_samples = 0
+        latency_total_ms = 0.0
+
+        # Per-item outcomes go to the append-only progress log via a background
+        # flusher; the checkpoint row only carries counts and is written up front
+        # so resume can always find this session.
+        progress_writer = RestorationProgressWriter(
+            self.repository,
+            batch_size=self.config.checkpoint_interval,
+            # Persist write-behind ID mappings before marking their items completed
+            before_flush=self.id_mapper.flush if self.id_mapper else None,
+        )
+        checkpoint = RestorationCheckpoint(
+            session_id=session_id,
+            content_type=content_type.value,
+            checkpoint_data={"progress_log": True},
+        )
+        self._save_checkpoint(checkpoint, completed_count=0, error_count=0)
 
         # Step 2: Create ThreadPoolExecutor with config.workers threads
         # Step 3: Distribute work via queue
@@ -300,11 +332,31 @@ class ParallelRestorationOrchestrator:
         for content_id in content_ids_to_restore:
             work_queue.put(content_id)
 
-        def worker() -> None:
+        scaler = self._create_worker_scaler()
+        pool_size = scaler.max_workers if scaler else self.config.workers
+
+        def worker(worker_id: int) -> None:
             """Worker function that processes items from the queue."""
+            try:
+                process_items(worker_id)
+            except Exception:
+                # A parked worker takes the failed worker's slot
+                if scaler is not None:
+                    scaler.retire(worker_id)
+                raise
+            # Queue drained: wake parked workers so they can exit too
+            if scaler is not None:
+                scaler.release()
+
+        def process_items(worker_id: int) -> None:
             nonlocal success_count, created_count, updated_count, error_count, skipped_count
+            nonlocal processed_count, latency_samples, latency_total_ms
 
             while True:
+                # Park here (holding no queued item) while outside the active set
+                if scaler is not None:
+                    scaler.checkpoint(worker_id)
+
                 try:
                     # Get next content_id from queue (non-blocking)
                     content_id = work_queue.get_nowait()
@@ -320,21 +372,21 @@ class ParallelRestorationOrchestrator:
 
                     # Aggregate results
                     with results_lock:
+                        if result.status in ("created", "updated") and result.duration_ms:
+                            latency_samples += 1
+                            latency_total_ms += result.duration_ms
+
                         if result.status == "created":
                             success_count += 1
                             created_count += 1
-                            completed_ids.append(content_id)
                         elif result.status == "updated":
                             success_count += 1
                             updated_count += 1
-                            completed_ids.append(content_id)
                         elif result.status == "success":
                             # Dry run success
                             success_count += 1
-                            completed_ids.append(content_id)
                         elif result.status == "skipped":
                             skipped_count += 1
-                            completed_ids.append(content_id)
                         elif result.status == "failed":
                             error_count += 1
 
@@ -355,18 +407,22 @@ class ParallelRestorationOrchestrator:
                         # Update metrics
                         self.metrics.increment_processed(content_type.value, count=1)
 
-                        # Step 5: Save checkpoint every N items
-                        if len(completed_ids) % self.config.checkpoint_interval == 0:
-                            self._save_checkpoint(
-                                session_id=session_id,
-                                content_type=content_type,
-                                completed_ids=completed_ids.copy(),
-                                item_count=len(completed_ids),
-                                error_count=error_count,
-                            )
-                            logger.info(
-                                f"Checkpoint saved: {len(completed_ids)}/{total_items} items processed"
-                            )
+                        processed_count += 1
+                        checkpoint_due = processed_count % self.config.checkpoint_interval == 0
+                        completed_count = success_count + skipped_count
+                        errors_so_far = error_count
+
+                    # Step 5: Record progress and save checkpoint counts outside the lock
+                    progress_writer.record(
+                        session_id, content_type.value, content_id, result.status
+                    )
+                    if checkpoint_due:
+                        self._save_checkpoint(
+                            checkpoint, completed_count=completed_count, error_count=errors_so_far
+                        )
+                        logger.info(
+                            f"Checkpoint saved: {processed_count}/{total_items} items processed"
+                        )
 
                 except Exception as e:
                     # Step 7: Handle worker errors
@@ -386,27 +442,37 @@ class ParallelRestorationOrchestrator:
                     work_queue.task_done()
 
         # Execute workers
-        with ThreadPoolExecutor(max_workers=self.config.workers) as executor:
-            # Submit worker tasks
-            futures = [executor.submit(worker) for _ in range(self.config.workers)]
-
-            # Wait for all workers to complete
-            for future in as_completed(futures):
-                try:
-                    future.result()
-                except Exception as e:
-                    logger.exception(f"Worker thread raised exception: {e}")
+        try:
+            with ThreadPoolExecutor(max_workers=pool_size) as executor:
+                # Submit worker tasks (beyond the active count they park)
+                futures = [executor.submit(worker, i) for i in range(pool_size)]
+                if scaler is not None:
+                    scaler.start()
+
+                # Wait for all workers to complete
+                for future in as_completed(futures):
+                    try:
+                        future.result()
+                    except Exception as e:
+                        logger.exception(f"Worker thread raised exception: {e}")
+        finally:
+            if scaler is not None:
+                scaler.stop()
+                logger.info(
+                    f"Dynamic scaling for {content_type.name}: {scaler.adjustments} "
+                    f"adjustments, ended with {scaler.active_workers} active workers"
+                )
+            # Flush remaining progress entries before the final checkpoint
+            progress_writer.close()
+            # Persist mappings of items that never reached the progress log (e.g.
+            # failed after their create), so the next run updates those copies
+            self._flush_id_mappings()
 
         # Save final checkpoint
-        if completed_ids:
-            self._save_checkpoint(
-                session_id=session_id,
-                content_type=content_type,
-                completed_ids=completed_ids,
-                item_count=len(completed_ids),
-                error_count=error_count,
-            )
-            logger.info(f"Final checkpoint saved: {len(completed_ids)} total items completed")
+        completed_count = success_count + skipped_count
+        self._save_checkpoint(checkpoint, completed_count=completed_count, error_count=error_count)
+        logger.info(f"Final checkpoint saved: {completed_count} total items completed")
+        self._record_latency(content_type, latency_samples, latency_total_ms)
 
         # Calculate duration and throughput
         duration_seconds = time.time() - start_time
@@ -419,7 +485,7 @@ class ParallelRestorationOrchestrator:
         )
 
         # Create and return RestorationSummary
-        return RestorationSummary(
+        summary = RestorationSummary(
             session_id=session_id,
             total_items=total_items,
             success_count=success_count,
@@ -432,6 +498,34 @@ class ParallelRestorationOrchestrator:
             content_type_breakdown={content_type.value: total_items},
             error_breakdown=error_breakdown,
         )
+        if not self.config.dry_run:
+            self._record_telemetry(summary, telemetry_baseline)
+        return summary
+
+    def _flush_id_mappings(self) -> None:
+        """Persist pending write-behind ID mappings, logging (not raising) on failure."""
+        if self.id_mapper is None:
+            return
+        try:
+            self.id_mapper.flush()
+        except Exception as e:
+            logger.exception(f"Failed to persist ID mappings: {e}")
+
+    def _create_worker_scaler(self) -> DynamicWorkerScaler | None:
+        """Create the online worker-count controller if dynamic scaling is enabled.
+
+        Returns:
+            DynamicWorkerScaler bounded by the restoration config, or None when disabled
+        """
+        if not self.config.dynamic_workers:
+            return None
+        return DynamicWorkerScaler(
+            initial_workers=self.config.workers,
+            max_workers=self.config.max_workers or self.config.workers,
+            metrics=self.metrics,
+            rate_limiter=self.rate_limiter,
+            repository=self.repository,
+        )
 
     def restore_all(self, requested_types: list[ContentType] | None = None) -> RestorationSummary:
         """Restore all content types in dependency-aware order.
@@ -560,9 +654,10 @@ class ParallelRestorationOrchestrator:
     def resume(self, content_type: ContentType, session_id: str) -> RestorationSummary:
         """Resume interrupted restoration from latest checkpoint.
 
-        Queries incomplete checkpoints for the specified session and content type,
-        extracts completed_ids from checkpoint_data, filters them out from the
-        full content ID list, and calls restore() with the remaining IDs.
+        Loads the latest incomplete checkpoint for the content type, rebuilds the
+        set of not-yet-completed IDs with a single anti-join against the
+        restoration_progress log (or, for legacy checkpoints, by filtering the
+        checkpoint's completed_ids), and calls restore() with the remaining IDs.
 
         Args:
             content_type: ContentType enum value to resume
@@ -599,44 +694,45 @@ class ParallelRestorationOrchestrator:
             )
             return self.restore(content_type, session_id)
 
-        # Step 2: Extract completed_ids from checkpoint_data
-        completed_ids = set(checkpoint.checkpoint_data.get("completed_ids", []))
+        # Step 2: Rebuild the remaining set
+        legacy_completed_ids = checkpoint.checkpoint_data.get("completed_ids")
+        if legacy_completed_ids is not None:
+            # Checkpoints written before the progress log carry full completed_ids lists
+            completed_ids = set(legacy_completed_ids)
+            all_content_ids = self.repository.get_content_ids(content_type.value)
+            remaining_ids = [cid for cid in all_content_ids if cid not in completed_ids]
+            completed_count = len(completed_ids)
+        else:
+            # Single anti-join of stored content against the session's progress log
+            folder_ids = None
+            if self.config.folder_ids and content_type in [
+                ContentType.DASHBOARD,
+                ContentType.LOOK,
+                ContentType.BOARD,
+            ]:
+                folder_ids = self.config.folder_ids
+            remaining_ids = self.repository.get_remaining_content_ids(
+                session_id, content_type.value, folder_ids=folder_ids
+            )
+            completed_count = self.repository.count_restoration_progress(
+                session_id, content_type.value
+            )
 
         logger.info(
-            f"Found checkpoint for {content_type.name}: "
-            f"{len(completed_ids)} items already completed"
+            f"Found checkpoint for {content_type.name}: {completed_count} items already completed"
         )
 
-        # Step 3: Query all content IDs and filter out completed ones
-        all_content_ids = self.repository.get_content_ids(content_type.value)
-        remaining_ids = [cid for cid in all_content_ids if cid not in completed_ids]
-
         if not remaining_ids:
-            logger.info(
-                f"All {len(all_content_ids)} items already completed for {content_type.name}"
-            )
-            # Return empty summary
-            return RestorationSummary(
-                session_id=session_id,
-                total_items=0,
-                success_count=0,
-                created_count=0,
-                updated_count=0,
-                error_count=0,
-                skipped_count=0,
-                duration_seconds=0.0,
-                average_throughput=0.0,
-                content_type_breakdown={content_type.value: 0},
-                error_breakdown={},
-            )
+            logger.info(f"All items already completed for {content_type.name}")
+            return self._create_empty_summary(session_id, content_type)
 
         logger.info(
             f"Resuming {content_type.name}: "
             f"{len(remaining_ids)} items remaining "
-            f"(skipped {len(completed_ids)} completed)"
+            f"(skipped {completed_count} completed)"
         )
 
-        # Step 4: Call restore() with remaining content IDs
+        # Step 3: Call restore() with remaining content IDs
         summary = self.restore(content_type, session_id, content_ids=remaining_ids)
 
         logger.info(
@@ -700,47 +796,113 @@ class ParallelRestorationOrchestrator:
 
     def _save_checkpoint(
         self,
-        session_id: str,
-        content_type: ContentType,
-        completed_ids: list[str],
-        item_count: int,
+        checkpoint: RestorationCheckpoint,
+        completed_count: int,
         error_count: int,
     ) -> None:
-        """Save restoration checkpoint to enable resume capability.
+        """Save counts-only restoration checkpoint for the current run.
+
+        Per-item progress lives in the restoration_progress table, so the
+        checkpoint row stays constant-size. Every save upserts the same row
+        (same session, content type and started_at).
 
         Args:
-            session_id: Unique restoration session identifier
-            content_type: ContentType enum value being restored
-            completed_ids: List of all completed content IDs (including from previous checkpoint)
-            item_count: Number of items processed in this checkpoint interval
+            checkpoint: Checkpoint created at the start of the run
+            completed_count: Items completed so far (created, updated, success, skipped)
             error_count: Total errors encountered so far
 
         Examples:
             >>> # Save checkpoint every 100 items
-            >>> self._save_checkpoint(
-            ...     session_id="abc-123",
-            ...     content_type=ContentType.DASHBOARD,
-            ...     completed_ids=["1", "2", "3", ..., "100"],
-            ...     item_count=100,
-            ...     error_count=2,
-            ... )
+            >>> self._save_checkpoint(checkpoint, completed_count=100, error_count=2)
         """
-        checkpoint = RestorationCheckpoint(
-            session_id=session_id,
-            content_type=content_type.value,
-            checkpoint_data={"completed_ids": completed_ids},
-            item_count=item_count,
-            error_count=error_count,
+        self.repository.save_restoration_checkpoint(
+            dataclasses.replace(checkpoint, item_count=completed_count, error_count=error_count)
         )
 
-        # Save to repository
-        self.repository.save_restoration_checkpoint(checkpoint)
-
         logger.debug(
-            f"Saved checkpoint for session {session_id}: "
-            f"{len(completed_ids)} total completed, {error_count} errors"
+            f"Saved checkpoint for session {checkpoint.session_id}: "
+            f"{completed_count} total completed, {error_count} errors"
         )
 
+    def _record_latency(self, content_type: ContentType, samples: int, total_ms: float) -> None:
+        """Add this run's per-item timings to the latency history used by restore plans.
+
+        History is best-effort: a failed write is logged, never raised.
+
+        Args:
+            content_type: ContentType enum value that was restored
+            samples: Items created or updated in this run
+            total_ms: Summed restore time of those items in milliseconds
+        """
+        if samples == 0:
+            return
+        try:
+            self.repository.record_restore_latency(
+                self.config.destination_instance, content_type.value, samples, total_ms
+            )
+        except Exception as e:
+            logger.warning(f"Failed to record restore latency for {content_type.name}: {e}")
+
+    def _telemetry_counters(self) -> dict[str, float]:
+        """Read the cumulative counters run telemetry is computed from."""
+        stats = self.rate_limiter.get_stats()
+        return {
+            "api_calls": stats.get("total_requests", 0),
+            "rate_limit_429s": stats.get("total_429_count", 0),
+            "rate_limit_wait_seconds": stats.get("total_wait_seconds", 0.0),
+            "busy_retries": getattr(self.repository, "busy_retry_count", 0),
+        }
+
+    def _record_telemetry(self, summary: RestorationSummary, baseline: dict[str, float]) -> None:
+        """Save this run's performance telemetry for auto-tuning later runs.
+
+        Counters are differences from baseline, because the rate limiter and
+        repository are shared by every content type of a restore_all() run.
+        Bytes transferred are estimated from the average stored payload size,
+        since restorers don't report request sizes. Telemetry is best-effort:
+        a failed write is logged, never raised.
+
+        Args:
+            summary: Summary of the completed run
+            baseline: _telemetry_counters() taken when the run started
+        """
+        if summary.total_items == 0:
+            return
+        try:
+            counters = self._telemetry_counters()
+            deltas = {key: counters[key] - baseline[key] for key in counters}
+            avg_sizes = self.repository.get_average_content_sizes()
+            restored = summary.created_count + summary.updated_count
+            bytes_transferred = sum(
+                int(avg_sizes.get(content_type, 0.0) * restored)
+                for content_type in summary.content_type_breakdown
+            )
+            self.repository.save_run_telemetry(
+                RunTelemetry(
+                    operation="restore",
+                    instance=self.config.destination_instance or "",
+                    session_id=summary.session_id,
+                    workers=self.config.workers,
+                    rate_limit_per_minute=self.rate_limiter.requests_per_minute,
+                    rate_limit_per_second=self.rate_limiter.requests_per_second,
+                    duration_seconds=summary.duration_seconds,
+                    total_items=summary.total_items,
+                    api_calls=int(deltas["api_calls"]),
+                    rate_limit_429s=int(deltas["rate_limit_429s"]),
+                    rate_limit_wait_seconds=deltas["rate_limit_wait_seconds"],
+                    busy_retries=int(deltas["busy_retries"]),
+                    error_count=summary.error_count,
+                    items_by_type=dict(summary.content_type_breakdown),
+                    seconds_by_type=dict.fromkeys(
+                        summary.content_type_breakdown, summary.duration_seconds
+                    ),
+                    bytes_transferred=bytes_transferred,
+                    peak_rss_bytes=read_process_memory()[1],
+                )
+            )
+        except Exception as e:
+            logger.warning(f"Failed to record run telemetry: {e}")
+
     def _add_to_dlq(
         self,
         session_id: str,
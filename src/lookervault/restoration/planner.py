@@ -0,0 +1,233 @@
+"""Restore execution plans and duration estimates built offline from a backup.
+
+RestorePlanner reads the backup without calling Looker. It returns the
+restoration order, the item count of each content type and the number of
+API calls that restoring them takes. Dashboard sub-resource calls are derived
+from each dashboard's filter, element and layout counts. Combined with the
+rate limits and the per-item latencies recorded by earlier restores, the plan
+gives an ETA for any worker count.
+"""
+
+import logging
+import math
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+
+import msgspec
+
+from lookervault.storage.models import ContentType
+from lookervault.storage.repository import ContentRepository
+
+logger = logging.getLogger(__name__)
+
+# Assumed latency of one Looker API call when a content type has no history
+DEFAULT_CALL_LATENCY_MS = 300.0
+
+# Existence check (GET) plus create (POST) or update (PATCH)
+BASE_CALLS_PER_ITEM = 2
+
+# Dashboard sub-resource discovery: filters, elements and layouts are fetched once each
+DASHBOARD_DISCOVERY_CALLS = 3
+
+# Upper bound of the worker count considered when recommending workers
+MAX_PLAN_WORKERS = 32
+
+
+class _LayoutShape(msgspec.Struct):
+    dashboard_layout_components: list[msgspec.Raw] | None = None
+
+
+class _DashboardShape(msgspec.Struct):
+    """Only the sub-resource lists of a dashboard; elements are left undecoded."""
+
+    dashboard_filters: list[msgspec.Raw] | None = None
+    dashboard_elements: list[msgspec.Raw] | None = None
+    dashboard_layouts: list[_LayoutShape] | None = None
+
+
+_dashboard_decoder = msgspec.msgpack.Decoder(_DashboardShape)
+
+
+def dashboard_subresource_calls(content_data: bytes) -> int:
+    """Upper bound of the sub-resource API calls restoring a dashboard makes.
+
+    Assumes the dashboard already exists in the destination and every
+    sub-resource differs: one discovery fetch each for filters, elements and
+    layouts, one component fetch per layout, and one write per filter,
+    element, layout and layout component.
+
+    Args:
+        content_data: Stored msgpack blob of the dashboard
+
+    Returns:
+        Estimated number of sub-resource API calls
+    """
+    shape = _dashboard_decoder.decode(content_data)
+    layouts = shape.dashboard_layouts or []
+    components = sum(len(layout.dashboard_layout_components or []) for layout in layouts)
+    writes = (
+        len(shape.dashboard_filters or [])
+        + len(shape.dashboard_elements or [])
+        + len(layouts)
+        + components
+    )
+    return DASHBOARD_DISCOVERY_CALLS + len(layouts) + writes
+
+
+@dataclass
+class TypePlan:
+    """Planned work and cost for one content type."""
+
+    content_type: str
+    items: int
+    api_calls: int
+    subresource_calls: int
+    item_latency_ms: float
+    latency_from_history: bool
+
+    def estimate_seconds(self, workers: int, calls_per_second: float) -> float:
+        """Estimate the time to restore this content type.
+
+        The type takes as long as the slower of its two bounds: the rate limit
+        (all calls at calls_per_second) and worker latency (items processed by
+        the workers in waves, each item taking item_latency_ms).
+
+        Args:
+            workers: Concurrent restore workers
+            calls_per_second: Sustained API call rate allowed by the rate limiter
+
+        Returns:
+            Estimated duration in seconds
+        """
+        rate_bound = self.api_calls / calls_per_second
+        waves = math.ceil(self.items / max(1, workers))
+        latency_bound = waves * self.item_latency_ms / 1000
+        return max(rate_bound, latency_bound)
+
+
+@dataclass
+class RestorePlan:
+    """Execution plan of a restore: content types in dependency order and their costs."""
+
+    types: list[TypePlan] = field(default_factory=list)
+    calls_per_second: float = 1.0
+
+    @property
+    def total_items(self) -> int:
+        """Number of items to restore across all content types."""
+        return sum(plan.items for plan in self.types)
+
+    @property
+    def total_api_calls(self) -> int:
+        """Estimated API calls across all content types."""
+        return sum(plan.api_calls for plan in self.types)
+
+    def estimate_seconds(self, workers: int) -> float:
+        """Estimate the restore duration with the given worker count.
+
+        Content types are restored one after another, so their durations add up.
+
+        Args:
+            workers: Concurrent restore workers
+
+        Returns:
+            Estimated duration in seconds
+        """
+        return sum(plan.estimate_seconds(workers, self.calls_per_second) for plan in self.types)
+
+    def recommended_workers(self, max_workers: int = MAX_PLAN_WORKERS) -> int:
+        """Smallest worker count within 5% of the fastest estimate.
+
+        Past this point the rate limit, not the worker count, bounds the restore.
+
+        Args:
+            max_workers: Largest worker count considered
+
+        Returns:
+            Recommended worker count
+        """
+        fastest = self.estimate_seconds(max_workers)
+        for workers in range(1, max_workers + 1):
+            if self.estimate_seconds(workers) <= fastest * 1.05:
+                return workers
+        return max_workers
+
+
+class RestorePlanner:
+    """Builds restore plans from a backup without calling Looker.
+
+    Examples:
+        >>> planner = RestorePlanner(repository, rate_limit_per_minute=120)
+        >>> plan = planner.build(DependencyGraph().get_restoration_order())
+        >>> print(f"{plan.total_api_calls} calls, ~{plan.estimate_seconds(8) / 60:.0f} min")
+    """
+
+    def __init__(
+        self,
+        repository: ContentRepository,
+        rate_limit_per_minute: int = 120,
+        rate_limit_per_second: int = 10,
+        destination: str | None = None,
+        default_call_latency_ms: float = DEFAULT_CALL_LATENCY_MS,
+    ):
+        """Initialize RestorePlanner.
+
+        Args:
+            repository: Repository holding the backup and latency history
+            rate_limit_per_minute: Restore rate limit per minute
+            rate_limit_per_second: Restore burst rate limit per second
+            destination: Only use this destination's latency history (default: all)
+            default_call_latency_ms: Per-call latency assumed without history
+        """
+        self.repository = repository
+        self.calls_per_second = min(float(rate_limit_per_second), rate_limit_per_minute / 60)
+        self.destination = destination
+        self.default_call_latency_ms = default_call_latency_ms
+
+    def build(self, content_types: Sequence[ContentType]) -> RestorePlan:
+        """Build the plan for restoring the given content types.
+
+        Args:
+            content_types: Content types in restoration (dependency) order
+
+        Returns:
+            RestorePlan with one TypePlan per content type that has content
+        """
+        latencies = self.repository.get_restore_latencies(self.destination)
+        plan = RestorePlan(calls_per_second=self.calls_per_second)
+
+        for content_type in content_types:
+            items = self.repository.count_content(content_type.value)
+            if items == 0:
+                continue
+
+            subresource_calls = 0
+            if content_type == ContentType.DASHBOARD:
+                for page in self.repository.iter_content_data(content_type.value):
+                    for content_id, content_data in page:
+                        try:
+                            subresource_calls += dashboard_subresource_calls(content_data)
+                        except msgspec.DecodeError as e:
+                            logger.warning(
+                                f"Cannot plan sub-resources of dashboard {content_id}: {e}"
+                            )
+
+            api_calls = items * BASE_CALLS_PER_ITEM + subresource_calls
+            history_ms = latencies.get(content_type.value)
+            item_latency_ms = (
+                history_ms
+                if history_ms is not None
+                else self.default_call_latency_ms * api_calls / items
+            )
+            plan.types.append(
+                TypePlan(
+                    content_type=content_type.name.lower(),
+                    items=items,
+                    api_calls=api_calls,
+                    subresource_calls=subresource_calls,
+                    item_latency_ms=item_latency_ms,
+                    latency_from_history=history_ms is not None,
+                )
+            )
+
+        return plan
@@ -0,0 +1,146 @@
+"""Background batch writer for the restoration progress log."""
+
+import logging
+import queue
+import threading
+import time
+from collections.abc import Callable
+
+from lookervault.storage.repository import ContentRepository
+
+logger = logging.getLogger(__name__)
+
+# Sentinel placed on the queue to stop the flusher thread
+_STOP = object()
+
+
+class RestorationProgressWriter:
+    """Buffers per-item restoration outcomes and flushes them in batches.
+
+    Worker threads call record(), which only enqueues a tuple and never touches
+    SQLite. A single daemon thread drains the queue and writes batches via
+    ContentRepository.record_restoration_progress() whenever batch_size entries
+    are pending or flush_interval_seconds has elapsed since the last write.
+
+    Flush failures are logged and the batch is kept for the next attempt; lost
+    progress rows only mean an item is restored again (idempotently) on resume.
+
+    An optional before_flush callback runs before every batch is written, e.g. to
+    persist write-behind ID mappings first so no item is marked completed while
+    its mapping exists only in memory. If it raises, the batch is not written.
+
+    Examples:
+        >>> writer = RestorationProgressWriter(repository, batch_size=100)
+        >>> writer.record("session-123", ContentType.DASHBOARD.value, "42", "created")
+        >>> writer.close()  # Flushes remaining entries and stops the thread
+    """
+
+    def __init__(
+        self,
+        repository: ContentRepository,
+        batch_size: int = 100,
+        flush_interval_seconds: float = 1.0,
+        before_flush: Callable[[], None] | None = None,
+    ):
+        """Initialize writer and start the flusher thread.
+
+        Args:
+            repository: Repository implementing record_restoration_progress()
+            batch_size: Number of pending entries that triggers a flush
+            flush_interval_seconds: Maximum time entries wait before being flushed
+            before_flush: Optional callback run before each batch is written
+        """
+        self.repository = repository
+        self.batch_size = max(1, batch_size)
+        self.flush_interval_seconds = flush_interval_seconds
+        self.before_flush = before_flush
+
+        self._queue: queue.Queue[tuple[str, int, str, str] | object] = queue.Queue()
+        self._pending: list[tuple[str, int, str, str]] = []
+        self._flushed_count = 0
+        self._flush_failed = False
+        self._closed = False
+        self._thread = threading.Thread(
+            target=self._run, name="restoration-progress-writer", daemon=True
+        )
+        self._thread.start()
+
+    @property
+    def flushed_count(self) -> int:
+        """Number of entries successfully written so far."""
+        return self._flushed_count
+
+    def record(self, session_id: str, content_type: int, content_id: str, status: str) -> None:
+        """Queue one item outcome for the next batch (non-blocking).
+
+        Args:
+            session_id: Restoration session identifier
+            content_type: ContentType enum value
+            content_id: Restored content ID
+            status: RestorationResult status ("created", "updated", "failed", ...)
+        """
+        self._queue.put((session_id, content_type, content_id, status))
+
+    def close(self) -> None:
+        """Flush all queued entries and stop the flusher thread."""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(_STOP)
+        self._thread.join()
+
+    def _run(self) -> None:
+        """Flusher loop: drain the queue and write batches."""
+        last_flush = time.monotonic()
+        try:
+            while True:
+                timeout = max(0.0, self.flush_interval_seconds - (time.monotonic() - last_flush))
+                try:
+                    entry = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    entry = None
+
+                if entry is _STOP:
+                    break
+                if entry is not None:
+                    self._pending.append(entry)  # type: ignore[arg-type]
+
+                # After a failed flush, retry on the interval rather than on every entry
+                size_due = len(self._pending) >= self.batch_size and not self._flush_failed
+                if size_due or (
+                    self._pending and time.monotonic() - last_flush >= self.flush_interval_seconds
+                ):
+                    self._flush()
+                    last_flush = time.monotonic()
+
+            # Drain anything queued before the stop sentinel was processed
+            while True:
+                try:
+                    entry = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if entry is not _STOP:
+                    self._pending.append(entry)  # type: ignore[arg-type]
+            self._flush()
+        finally:
+            self.repository.close_thread_connection()
+
+    def _flush(self) -> None:
+        """Write pending entries in one transaction (flusher thread only)."""
+        if not self._pending:
+            return
+
+        batch = self._pending
+        try:
+            if self.before_flush is not None:
+                self.before_flush()
+            self.repository.record_restoration_progress(batch)
+        except Exception as e:
+            logger.exception(f"Failed to flush {len(batch)} restoration progress entries: {e}")
+            self._flush_failed = True
+            return
+
+        self._flush_failed = False
+        self._flushed_count += len(batch)
+        self._pending = []
+        logger.debug(f"Flushed {len(batch)} restoration progress entries")
@@ -0,0 +1,310 @@
+"""Compiled foreign-key reference translation for cross-instance restoration.
+
+Every content type declares where it references other content (folder IDs,
+look IDs inside dashboard tiles, role IDs on users, ...) as a path such as
+``dashboard_elements[].look_id``. Paths are compiled once into small closures
+that walk a content dict without re-parsing, so translating a batch costs one
+pass per path plus one bulk mapping lookup per referenced content type.
+"""
+
+import functools
+import logging
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from lookervault.exceptions import ValidationError
+from lookervault.restoration.id_mapping_cache import IDMappingCache
+from lookervault.storage.models import ContentType
+
+logger = logging.getLogger(__name__)
+
+# Visitor applied to each referenced ID; returns the value to store back
+_IdVisitor = Callable[[Any], Any]
+# Compiled walker: visits every referenced ID under a content dict
+_Walker = Callable[[Any, _IdVisitor], None]
+
+
+@dataclass(frozen=True)
+class ReferencePath:
+    """Location of a foreign-key reference inside a content dict.
+
+    Attributes:
+        path: Dotted key path; a ``[]`` suffix traverses a list
+            (e.g. ``dashboard_elements[].look_id`` or ``group_ids[]``)
+        target: Content type the referenced ID belongs to
+        required: Whether an unmapped ID is a validation error. Optional
+            references (e.g. owners) keep their source ID when unmapped.
+    """
+
+    path: str
+    target: ContentType
+    required: bool = True
+
+
+# Foreign keys per content type. Query IDs are not listed: queries are not
+# backed up as content, and dashboard tiles and looks carry their query body.
+REFERENCE_PATHS: dict[ContentType, tuple[ReferencePath, ...]] = {
+    ContentType.DASHBOARD: (
+        ReferencePath("folder_id", ContentType.FOLDER),
+        ReferencePath("space_id", ContentType.FOLDER),
+        ReferencePath("user_id", ContentType.USER, required=False),
+        ReferencePath("dashboard_elements[].look_id", ContentType.LOOK),
+        ReferencePath("dashboard_elements[].look.id", ContentType.LOOK),
+    ),
+    ContentType.LOOK: (
+        ReferencePath("folder_id", ContentType.FOLDER),
+        ReferencePath("space_id", ContentType.FOLDER),
+        ReferencePath("user_id", ContentType.USER, required=False),
+    ),
+    ContentType.FOLDER: (
+        ReferencePath("parent_id", ContentType.FOLDER),
+        ReferencePath("creator_id", ContentType.USER, required=False),
+    ),
+    ContentType.BOARD: (
+        ReferencePath("board_sections[].board_items[].dashboard_id", ContentType.DASHBOARD),
+        ReferencePath("board_sections[].board_items[].look_id", ContentType.LOOK),
+    ),
+    ContentType.SCHEDULED_PLAN: (
+        ReferencePath("dashboard_id", ContentType.DASHBOARD),
+        ReferencePath("look_id", ContentType.LOOK),
+        ReferencePath("user_id", ContentType.USER, required=False),
+    ),
+    ContentType.USER: (
+        ReferencePath("group_ids[]", ContentType.GROUP),
+        ReferencePath("role_ids[]", ContentType.ROLE),
+    ),
+    ContentType.ROLE: (
+        ReferencePath("permission_set_id", ContentType.PERMISSION_SET),
+        ReferencePath("model_set_id", ContentType.MODEL_SET),
+    ),
+}
+
+
+def _leaf(key: str) -> _Walker:
+    def walk(node: Any, visit: _IdVisitor) -> None:
+        if isinstance(node, dict):
+            value = node.get(key)
+            if value is not None and value != "":
+                new_value = visit(value)
+                if new_value is not value:
+                    node[key] = new_value
+
+    return walk
+
+
+def _leaf_list(key: str) -> _Walker:
+    def walk(node: Any, visit: _IdVisitor) -> None:
+        values = node.get(key) if isinstance(node, dict) else None
+        if isinstance(values, list):
+            for index, value in enumerate(values):
+                if value is not None and value != "":
+                    new_value = visit(value)
+                    if new_value is not value:
+                        values[index] = new_value
+
+    return walk
+
+
+def _descend(key: str, inner: _Walker) -> _Walker:
+    def walk(node: Any, visit: _IdVisitor) -> None:
+        if isinstance(node, dict):
+            inner(node.get(key), visit)
+
+    return walk
+
+
+def _descend_list(key: str, inner: _Walker) -> _Walker:
+    def walk(node: Any, visit: _IdVisitor) -> None:
+        children = node.get(key) if isinstance(node, dict) else None
+        if isinstance(children, list):
+            for child in children:
+                inner(child, visit)
+
+    return walk
+
+
+def _compile_walker(path: str) -> _Walker:
+    """Compile a reference path into a walker closure.
+
+    Args:
+        path: Dotted key path with optional ``[]`` list markers
+
+    Returns:
+        Function(node, visit) calling visit on every ID at the path and storing
+        back the returned value when it differs
+    """
+    segments = path.split(".")
+    if not all(segments):
+        raise ValueError(f"Invalid reference path: {path!r}")
+
+    # Build from the leaf outwards so each closure only knows its own key
+    leaf = segments[-1]
+    walker = _leaf_list(leaf[:-2]) if leaf.endswith("[]") else _leaf(leaf)
+    for segment in reversed(segments[:-1]):
+        if segment.endswith("[]"):
+            walker = _descend_list(segment[:-2], walker)
+        else:
+            walker = _descend(segment, walker)
+    return walker
+
+
+@dataclass(frozen=True)
+class CompiledReference:
+    """A ReferencePath compiled into a walker function."""
+
+    reference: ReferencePath
+    walk: _Walker
+
+
+@functools.cache
+def compile_references(content_type: ContentType) -> tuple[CompiledReference, ...]:
+    """Compile (once per process) the reference paths of a content type.
+
+    Args:
+        content_type: Content type whose references to compile
+
+    Returns:
+        Compiled references (empty for types without foreign keys)
+    """
+    return tuple(
+        CompiledReference(reference, _compile_walker(reference.path))
+        for reference in REFERENCE_PATHS.get(content_type, ())
+    )
+
+
+class ReferenceTranslator:
+    """Translates foreign-key references using an IDMappingCache.
+
+    Implements the IDMapper protocol used by LookerContentRestorer, so
+    mappings saved during restoration become visible to later references
+    immediately (and are persisted write-behind by the cache).
+
+    Examples:
+        >>> translator = ReferenceTranslator(IDMappingCache(repo, "https://source"))
+        >>> restorer = LookerContentRestorer(client, repo, id_mapper=translator)
+        >>> errors = translator.translate_batch(ContentType.DASHBOARD, dashboards)
+    """
+
+    def __init__(self, cache: IDMappingCache):
+        """Initialize ReferenceTranslator.
+
+        Args:
+            cache: Shared ID mapping cache for the source instance
+        """
+        self.cache = cache
+
+    def save_mapping(
+        self,
+        content_type: ContentType,
+        source_id: str,
+        destination_id: str,
+        session_id: str | None = None,
+    ) -> None:
+        """Save source ID → destination ID mapping."""
+        self.cache.save_mapping(content_type, source_id, destination_id, session_id)
+
+    def get_destination_id(self, content_type: ContentType, source_id: str) -> str | None:
+        """Get destination ID for source ID."""
+        return self.cache.get_destination_id(content_type, source_id)
+
+    def flush(self) -> None:
+        """Persist any buffered mappings."""
+        self.cache.flush()
+
+    def collect_references(
+        self, content_type: ContentType, items: Iterable[dict[str, Any]]
+    ) -> dict[ContentType, set[str]]:
+        """Collect referenced source IDs per target content type.
+
+        Args:
+            content_type: Content type of the items
+            items: Content dicts from backup
+
+        Returns:
+            Target content type -> referenced source IDs
+        """
+        compiled = compile_references(content_type)
+        referenced: dict[ContentType, set[str]] = {}
+        for item in items:
+            for ref in compiled:
+                ids = referenced.setdefault(ref.reference.target, set())
+
+                def _collect(value: Any, ids: set[str] = ids) -> Any:
+                    ids.add(str(value))
+                    return value
+
+                ref.walk(item, _collect)
+        return referenced
+
+    def translate_batch(
+        self, content_type: ContentType, items: Sequence[dict[str, Any]]
+    ) -> list[list[str]]:
+        """Rewrite references of a batch of items in place.
+
+        All referenced IDs are resolved up front with one bulk lookup per
+        referenced content type.
+
+        Args:
+            content_type: Content type of the items
+            items: Content dicts from backup (modified in place)
+
+        Returns:
+            Validation errors per item (unresolved required references), in item order
+        """
+        compiled = compile_references(content_type)
+        if not compiled:
+            return [[] for _ in items]
+
+        mappings = {
+            target: self.cache.get_destination_ids(target, source_ids)
+            for target, source_ids in self.collect_references(content_type, items).items()
+            if source_ids
+        }
+
+        all_errors: list[list[str]] = []
+        for item in items:
+            errors: list[str] = []
+            for ref in compiled:
+                reference = ref.reference
+                mapping = mappings.get(reference.target, {})
+
+                def _rewrite(
+                    value: Any,
+                    mapping: dict[str, str] = mapping,
+                    reference: ReferencePath = reference,
+                    errors: list[str] = errors,
+                ) -> Any:
+                    destination_id = mapping.get(str(value))
+                    if destination_id is not None:
+                        return destination_id
+                    if reference.required:
+                        errors.append(
+                            f"Unresolved {reference.target.name.lower()} reference "
+                            f"{reference.path}={value}"
+                        )
+                    return value
+
+                ref.walk(item, _rewrite)
+            all_errors.append(errors)
+        return all_errors
+
+    def translate_references(
+        self, content_dict: dict[str, Any], content_type: ContentType
+    ) -> dict[str, Any]:
+        """Translate FK references from source IDs to destination IDs.
+
+        Args:
+            content_dict: Content dict from backup (modified in place)
+            content_type: Content type of the item
+
+        Returns:
+            The translated content dict
+
+        Raises:
+            ValidationError: If a required reference has no mapping
+        """
+        errors = self.translate_batch(content_type, [content_dict])[0]
+        if errors:
+            raise ValidationError(f"Reference translation failed: {'; '.join(errors)}")
+        return content_dict
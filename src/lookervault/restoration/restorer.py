@@ -12,6 +12,7 @@ import logging
 import time
 from typing import Any, Protocol
 
+import msgspec
 from looker_sdk import error as looker_error
 
 from lookervault.exceptions import (
@@ -25,6 +26,7 @@ from lookervault.extraction.rate_limiter import AdaptiveRateLimiter
 from lookervault.extraction.retry import retry_on_rate_limit
 from lookervault.looker.client import LookerClient
 from lookervault.restoration.deserializer import ContentDeserializer
+from lookervault.restoration.fingerprint import content_fingerprint
 from lookervault.restoration.subresource_restorer import (
     DashboardSubResourceRestorer,
     SubResourceRestorer,
@@ -32,6 +34,7 @@ from lookervault.restoration.subresource_restorer import (
 from lookervault.restoration.validation import RestorationValidator
 from lookervault.storage.models import ContentType, RestorationResult
 from lookervault.storage.repository import ContentRepository
+from lookervault.utils.tracing import traced
 
 logger = logging.getLogger(__name__)
 
@@ -59,6 +62,10 @@ class IDMapper(Protocol):
         """Translate FK references from source IDs to destination IDs."""
         ...
 
+    def flush(self) -> None:
+        """Persist any buffered mappings."""
+        ...
+
 
 class LookerContentRestorer:
     """Looker SDK-based content restorer implementation.
@@ -82,7 +89,7 @@ class LookerContentRestorer:
     4. Check if content exists in destination (GET request)
     5. If exists: update (PATCH), if not: create (POST)
     6. Restore sub-resources if applicable (e.g., dashboard elements/filters/layouts)
-    7. Record ID mapping if created and id_mapper provided
+    7. Record ID mapping (created or updated) if id_mapper provided
     8. Return RestorationResult with status, duration, errors, sub-resource metadata
 
     Examples:
@@ -99,7 +106,7 @@ class LookerContentRestorer:
         ...     print(f"Validation errors: {result.error_message}")
 
         >>> # Cross-instance migration with ID mapping
-        >>> id_mapper = IDMapper(repo, "source.looker.com", "dest.looker.com")
+        >>> id_mapper = ReferenceTranslator(IDMappingCache(repo, "https://source.looker.com"))
         >>> rate_limiter = AdaptiveRateLimiter(requests_per_minute=100)
         >>> restorer = LookerContentRestorer(client, repo, rate_limiter, id_mapper)
         >>> result = restorer.restore_single("42", ContentType.DASHBOARD)
@@ -129,6 +136,10 @@ class LookerContentRestorer:
         ContentType.MODEL_SET: ("model_set", "create_model_set", "update_model_set"),
     }
 
+    # Content types whose SDK get method has no 'fields' parameter, so
+    # fingerprint fetches must retrieve the full object
+    _GET_WITHOUT_FIELDS: frozenset[ContentType] = frozenset({ContentType.ROLE})
+
     # Mapping of content types to sub-resource restorers
     # Content types in this map will have sub-resources restored after parent restoration
     _SUBRESOURCE_RESTORER_MAP: dict[ContentType, type[SubResourceRestorer]] = {
@@ -144,6 +155,9 @@ class LookerContentRestorer:
         repository: ContentRepository,
         rate_limiter: AdaptiveRateLimiter | None = None,
         id_mapper: IDMapper | None = None,
+        subresource_concurrency: int = 1,
+        skip_unchanged: bool = False,
+        recheck_destination: bool = False,
     ):
         """Initialize LookerContentRestorer.
 
@@ -152,6 +166,15 @@ class LookerContentRestorer:
             repository: SQLite repository for reading content from backups
             rate_limiter: Optional adaptive rate limiter for API throttling
             id_mapper: Optional ID mapper for cross-instance migration
+            subresource_concurrency: Maximum concurrent sub-resource API calls per parent
+                (e.g. dashboard tiles created in parallel); 1 = sequential
+            skip_unchanged: Skip items whose destination copy already matches the
+                backup (compared by writable-field fingerprint, cached in SQLite).
+                Items that matched on an earlier run are skipped from the cache
+                without looking at the destination.
+            recheck_destination: With skip_unchanged, ignore fingerprints cached by
+                earlier runs and compare every item against the live destination
+                (refreshing the cache), e.g. after content was edited in Looker
 
         Examples:
             >>> # Basic setup
@@ -164,13 +187,17 @@ class LookerContentRestorer:
             >>> restorer = LookerContentRestorer(client, repo, rate_limiter=rate_limiter)
 
             >>> # With ID mapping for cross-instance migration
-            >>> id_mapper = IDMapper(repo, "source.looker.com", "dest.looker.com")
+            >>> id_mapper = ReferenceTranslator(IDMappingCache(repo, "https://source.looker.com"))
             >>> restorer = LookerContentRestorer(client, repo, id_mapper=id_mapper)
         """
         self.client = client
         self.repository = repository
         self.rate_limiter = rate_limiter
         self.id_mapper = id_mapper
+        self.skip_unchanged = skip_unchanged
+        self.recheck_destination = recheck_destination
+        # Fingerprints are cached per destination instance
+        self._destination = str(getattr(client, "api_url", ""))
 
         # Initialize helper components
         self.deserializer = ContentDeserializer()
@@ -179,16 +206,21 @@ class LookerContentRestorer:
         # Initialize sub-resource restorers for content types with nested structures
         self.subresource_restorers: dict[ContentType, SubResourceRestorer] = {}
         for content_type, restorer_class in self._SUBRESOURCE_RESTORER_MAP.items():
-            self.subresource_restorers[content_type] = restorer_class(client, rate_limiter)
+            self.subresource_restorers[content_type] = restorer_class(
+                client, rate_limiter, max_concurrency=subresource_concurrency
+            )
             logger.debug(f"Initialized {restorer_class.__name__} for {content_type.name}")
 
         logger.info(
             f"Initialized LookerContentRestorer: "
             f"rate_limiter={'enabled' if rate_limiter else 'disabled'}, "
             f"id_mapper={'enabled' if id_mapper else 'disabled'}, "
+            f"skip_unchanged={skip_unchanged}, "
+            f"recheck_destination={recheck_destination}, "
             f"subresource_restorers={len(self.subresource_restorers)} types"
         )
 
+    @traced("check_exists", "api", "content_id", "content_type")
     def check_exists(self, content_id: str, content_type: ContentType) -> bool:
         """Check if content exists in destination Looker instance.
 
@@ -248,7 +280,83 @@ class LookerContentRestorer:
             # Raise to caller - they should handle this appropriately
             raise
 
+    @traced("fetch_destination", "api", "content_id", "content_type")
+    def _fetch_destination(
+        self, content_id: str, content_type: ContentType, fields: list[str]
+    ) -> dict[str, Any] | None:
+        """Fetch the writable fields of a destination item for fingerprinting.
+
+        Only the requested fields are fetched where the SDK supports it, which
+        keeps the response small for content with large nested structures.
+
+        Args:
+            content_id: Content ID in the destination instance
+            content_type: ContentType enum value
+            fields: Fields to fetch (the writable fields present in the backup)
+
+        Returns:
+            Destination content as a dictionary, or None if not found (404)
+
+        Raises:
+            Exception: For unexpected API errors (non-404, non-200)
+        """
+        get_method_name, _, _ = self._SDK_METHOD_MAP[content_type]
+        get_method = getattr(self.client.sdk, get_method_name)
+
+        if self.rate_limiter:
+            self.rate_limiter.acquire()
+
+        try:
+            if content_type in self._GET_WITHOUT_FIELDS or not fields:
+                response = get_method(content_id)
+            else:
+                response = get_method(content_id, fields=",".join(fields))
+        except looker_error.SDKError as e:
+            error_str = str(e)
+            if "404" in error_str or "Not Found" in error_str:
+                logger.debug(f"{content_type.name} {content_id} not found in destination")
+                return None
+            logger.warning(
+                f"Unexpected API error fetching {content_type.name} {content_id}: {error_str}"
+            )
+            raise
+
+        if self.rate_limiter:
+            self.rate_limiter.on_success()
+
+        # Convert nested SDK models (e.g. a dashboard's appearance) the way extraction
+        # encoded them into the backup blob, so both sides compare as plain dicts
+        try:
+            converted = msgspec.to_builtins(response) if response is not None else {}
+        except TypeError:
+            # Unrecognized response shape: fingerprints will differ and the item is updated
+            return {}
+        return converted if isinstance(converted, dict) else {}
+
+    def _skipped_result(
+        self, content_id: str, content_type: ContentType, destination_id: str, start_time: float
+    ) -> RestorationResult:
+        """Build the result for an item whose destination copy is already up to date."""
+        if self.id_mapper:
+            self.id_mapper.save_mapping(
+                content_type=content_type,
+                source_id=content_id,
+                destination_id=destination_id,
+            )
+        duration_ms = (time.time() - start_time) * 1000
+        logger.info(
+            f"Skipped unchanged {content_type.name} {content_id} (destination_id={destination_id})"
+        )
+        return RestorationResult(
+            content_id=content_id,
+            content_type=content_type.value,
+            status="skipped",
+            destination_id=destination_id,
+            duration_ms=duration_ms,
+        )
+
     @retry_on_rate_limit
+    @traced("update", "api", "content_id", "content_type")
     def _call_api_update(
         self, content_type: ContentType, content_id: str, content_dict: dict[str, Any]
     ) -> dict[str, Any]:
@@ -351,6 +459,7 @@ class LookerContentRestorer:
             raise RestorationError(f"Failed to update content: {error_str}") from e
 
     @retry_on_rate_limit
+    @traced("create", "api", "content_type")
     def _call_api_create(
         self, content_type: ContentType, content_dict: dict[str, Any]
     ) -> dict[str, Any]:
@@ -451,6 +560,7 @@ class LookerContentRestorer:
             logger.error(f"API error creating {content_type.name}: {error_str}")
             raise RestorationError(f"Failed to create content: {error_str}") from e
 
+    @traced("restore_single", "restoration", "content_id", "content_type")
     def restore_single(
         self, content_id: str, content_type: ContentType, dry_run: bool = False
     ) -> RestorationResult:
@@ -459,13 +569,15 @@ class LookerContentRestorer:
         This is the main restoration method that orchestrates the complete
         restoration flow:
         1. Fetch content from SQLite repository
-        2. Deserialize binary blob to dictionary
+        2. Decode the blob's writable fields (typed schema, validated while decoding)
         3. Validate content structure and fields
         4. (Optional) Translate foreign key references if id_mapper provided
-        5. Check if content exists in destination instance
+        5. Check if content exists in destination instance (with skip_unchanged,
+           skip the PATCH when its writable-field fingerprint matches the backup)
         6. If exists: update via PATCH, if not: create via POST
-        7. Record ID mapping if created and id_mapper provided
-        8. Return RestorationResult with status, duration, errors
+        7. Record ID mapping (created or updated) if id_mapper provided
+        8. Restore sub-resources (dashboard filters, elements, layouts)
+        9. Return RestorationResult with status, duration, errors
 
         Args:
             content_id: Content ID to restore (from backup)
@@ -526,33 +638,52 @@ class LookerContentRestorer:
                     f"found type {content_item.content_type} for content_id {content_id}"
                 )
 
-            # Step 2: Deserialize binary blob to dictionary
+            # Step 2: Decode the blob's writable fields into a dictionary. The typed
+            # schema decode also validates field types (schema_errors).
             try:
-                content_dict = self.deserializer.deserialize(
-                    content_item.content_data, content_type, as_dict=True
-                )
-                logger.debug(
-                    f"Deserialized {content_type.name} {content_id} from backup:\n"
-                    f"  Keys: {list(content_dict.keys())}\n"
-                    f"  Size: {len(str(content_dict))} bytes"
+                content_dict, schema_errors = self.deserializer.deserialize_writable(
+                    content_item.content_data, content_type
                 )
                 if logger.isEnabledFor(logging.DEBUG):
                     import json
 
                     logger.debug(
-                        f"  Full backup content:\n{json.dumps(content_dict, indent=2, default=str)}"
+                        f"Deserialized {content_type.name} {content_id} from backup:\n"
+                        f"  Keys: {list(content_dict.keys())}\n"
+                        f"  Full backup content:\n"
+                        f"{json.dumps(content_dict, indent=2, default=str)}"
                     )
             except DeserializationError as e:
                 logger.error(f"Deserialization failed for {content_type.name} {content_id}: {e}")
                 raise
 
             # Step 3: Validate content structure and required fields
-            validation_errors = self.validator.validate_content(content_dict, content_type)
+            validation_errors = schema_errors + self.validator.validate_content(
+                content_dict, content_type
+            )
             if validation_errors:
                 error_msg = f"Content validation failed: {'; '.join(validation_errors)}"
                 logger.error(f"{content_type.name} {content_id}: {error_msg}")
                 raise ValidationError(error_msg)
 
+            # The writable decode drops the nested sub-resource lists, which are
+            # read-only fields of the parent; decode them from the blob for Step 8
+            subresources: dict[str, list[dict[str, Any]]] = {}
+            if content_type in self.subresource_restorers:
+                subresources = self.deserializer.deserialize_subresources(
+                    content_item.content_data, content_type
+                )
+
+            # Step 4: Translate foreign key references if id_mapper provided. Unresolved
+            # references raise ValidationError here, before any API call (and in dry runs).
+            # Sub-resources are translated with the parent: tiles reference looks.
+            if self.id_mapper:
+                translated = self.id_mapper.translate_references(
+                    {**content_dict, **subresources}, content_type
+                )
+                content_dict = {key: translated[key] for key in content_dict}
+                subresources = {key: translated[key] for key in subresources}
+
             # If dry_run, stop here after validation
             if dry_run:
                 duration_ms = (time.time() - start_time) * 1000
@@ -564,22 +695,81 @@ class LookerContentRestorer:
                     duration_ms=duration_ms,
                 )
 
-            # Step 4: Translate foreign key references if id_mapper provided
+            # Step 5: Check if content exists in destination. An item created by an
+            # earlier (possibly interrupted) run is found through its ID mapping, so
+            # re-restoring it updates that copy instead of creating a duplicate.
+            target_id = content_id
             if self.id_mapper:
-                content_dict = self.id_mapper.translate_references(content_dict, content_type)
+                mapped_id = self.id_mapper.get_destination_id(content_type, content_id)
+                target_id = mapped_id or content_id
+
+            # Step 5b: With skip_unchanged, compare writable-field fingerprints of the
+            # backup and the destination copy. The fingerprint covers the sub-resource
+            # lists too, so a fingerprint cached by an earlier run (which wrote or
+            # verified parent and sub-resources) skips the item without fetching,
+            # unless recheck_destination asks for a live comparison. Otherwise the existence check fetches the backup's fields so both sides
+            # hash over the same keys; a matching parent skips only the PATCH, and
+            # its sub-resources are still compared and restored in Step 8.
+            fingerprint = None
+            parent_unchanged = False
+            if self.skip_unchanged:
+                fingerprint = content_fingerprint({**content_dict, **subresources})
+                cached = (
+                    None
+                    if self.recheck_destination
+                    else self.repository.get_destination_fingerprint(
+                        self._destination, content_type.value, target_id
+                    )
+                )
+                if cached == fingerprint:
+                    return self._skipped_result(content_id, content_type, target_id, start_time)
 
-            # Step 5: Check if content exists in destination
-            exists = self.check_exists(content_id, content_type)
+                destination_dict = self._fetch_destination(
+                    target_id, content_type, sorted(content_dict)
+                )
+                exists = destination_dict is not None
+                parent_unchanged = destination_dict is not None and content_fingerprint(
+                    destination_dict, fields=content_dict
+                ) == content_fingerprint(content_dict)
+                if parent_unchanged and content_type not in self.subresource_restorers:
+                    self.repository.save_destination_fingerprint(
+                        self._destination, content_type.value, target_id, fingerprint
+                    )
+                    return self._skipped_result(content_id, content_type, target_id, start_time)
+            else:
+                exists = self.check_exists(target_id, content_type)
 
             # Step 6: Update existing or create new content
             response_dict: dict[str, Any]
             operation: str
 
-            if exists:
+            if parent_unchanged:
+                # The destination parent already matches; only sub-resources may differ
+                operation = "skipped"
+                response_dict = {}
+                destination_id = target_id
+
+                # Step 7: Record ID mapping so later references to this item resolve
+                if self.id_mapper:
+                    self.id_mapper.save_mapping(
+                        content_type=content_type,
+                        source_id=content_id,
+                        destination_id=destination_id,
+                    )
+
+            elif exists:
                 # Update existing content (PATCH)
                 operation = "updated"
-                response_dict = self._call_api_update(content_type, content_id, content_dict)
-                destination_id = content_id  # Same ID for updates
+                response_dict = self._call_api_update(content_type, target_id, content_dict)
+                destination_id = target_id  # Same ID for updates
+
+                # Step 7: Record ID mapping so later references to this item resolve
+                if self.id_mapper:
+                    self.id_mapper.save_mapping(
+                        content_type=content_type,
+                        source_id=content_id,
+                        destination_id=destination_id,
+                    )
 
             else:
                 # Create new content (POST)
@@ -592,8 +782,8 @@ class LookerContentRestorer:
                 # Extract destination_id from response
                 destination_id = str(response_dict.get("id", content_id))
 
-                # Step 7: Record ID mapping if created and id_mapper provided
-                if self.id_mapper and destination_id != content_id:
+                # Step 7: Record ID mapping so later references to this item resolve
+                if self.id_mapper:
                     self.id_mapper.save_mapping(
                         content_type=content_type,
                         source_id=content_id,
@@ -608,8 +798,11 @@ class LookerContentRestorer:
                 subresource_restorer = self.subresource_restorers[content_type]
                 subresource_result = subresource_restorer.restore_subresources(
                     parent_id=destination_id,
-                    parent_content=content_dict,
+                    parent_content={**content_dict, **subresources},
                     dry_run=False,  # Already validated parent in dry_run, sub-resources are real
+                    # A just-created parent's state is fully known from the create
+                    # response, so its sub-resources need no destination fetches
+                    destination_state=response_dict if operation == "created" else None,
                 )
 
                 logger.info(
@@ -627,6 +820,22 @@ class LookerContentRestorer:
                         + "\n".join(f"  - {err}" for err in subresource_result.all_errors)
                     )
 
+                if operation == "skipped" and (
+                    subresource_result.total_created
+                    or subresource_result.total_updated
+                    or subresource_result.total_deleted
+                ):
+                    operation = "updated"
+
+            # The destination now holds the backup's writable fields and sub-resources.
+            # After sub-resource errors the next run must compare again.
+            if fingerprint is not None and not (
+                subresource_result and subresource_result.total_errors
+            ):
+                self.repository.save_destination_fingerprint(
+                    self._destination, content_type.value, destination_id, fingerprint
+                )
+
             # Step 9: Return successful RestorationResult
             duration_ms = (time.time() - start_time) * 1000
 
@@ -644,18 +853,21 @@ class LookerContentRestorer:
                             "created": subresource_result.filters.created_count,
                             "updated": subresource_result.filters.updated_count,
                             "deleted": subresource_result.filters.deleted_count,
+                            "unchanged": subresource_result.filters.unchanged_count,
                             "errors": subresource_result.filters.error_count,
                         },
                         "elements": {
                             "created": subresource_result.elements.created_count,
                             "updated": subresource_result.elements.updated_count,
                             "deleted": subresource_result.elements.deleted_count,
+                            "unchanged": subresource_result.elements.unchanged_count,
                             "errors": subresource_result.elements.error_count,
                         },
                         "layouts": {
                             "created": subresource_result.layouts.created_count,
                             "updated": subresource_result.layouts.updated_count,
                             "deleted": subresource_result.layouts.deleted_count,
+                            "unchanged": subresource_result.layouts.unchanged_count,
                             "errors": subresource_result.layouts.error_count,
                         },
                     }
@@ -895,6 +1107,9 @@ class LookerContentRestorer:
                 error_count=error_count,
             )
             logger.info(f"Final checkpoint saved: {len(all_completed)} total items completed")
+        elif self.id_mapper:
+            # Items that failed after being created still have mappings to persist
+            self.id_mapper.flush()
 
         # Step 5: Calculate duration and throughput
         duration_seconds = time.time() - start_time
@@ -988,6 +1203,10 @@ class LookerContentRestorer:
         """
         from lookervault.storage.models import RestorationCheckpoint
 
+        # Persist write-behind ID mappings before recording their items as completed
+        if self.id_mapper:
+            self.id_mapper.flush()
+
         checkpoint = RestorationCheckpoint(
             session_id=session_id,
             content_type=content_type.value,
@@ -0,0 +1,102 @@
+"""Typed msgspec schemas for decoding restore payloads.
+
+Each Looker SDK Write* model is mirrored by a msgspec Struct holding only its
+writable fields. Decoding a stored msgpack blob straight into that Struct
+skips read-only and unknown keys inside the decoder (their values are never
+materialized) and type-checks the remaining fields in the same pass, which is
+far cheaper than decoding to a generic dict, filtering it in Python and
+building an SDK model to validate it.
+"""
+
+import functools
+import typing
+from collections import abc
+from typing import Any
+
+import attr
+import msgspec
+
+# Every struct field defaults to UNSET so that absent keys stay absent when the
+# struct is converted back to a dict (msgspec.to_builtins omits UNSET fields).
+_UNSET: Any = msgspec.UNSET
+
+_SCALAR_TYPES: tuple[type, ...] = (str, bool, int, float)
+
+
+def _schema_type(hint: Any) -> Any:
+    """Map a Write* model type hint to a msgspec-decodable type.
+
+    Scalars and lists of scalars keep their type, nested SDK models become
+    plain mappings (checked for shape, not contents), and anything else is
+    accepted as-is.
+    """
+    args = typing.get_args(hint)
+    origin = typing.get_origin(hint)
+
+    if origin is typing.Union and type(None) in args:
+        inner = [arg for arg in args if arg is not type(None)]
+        if len(inner) == 1:
+            return _schema_type(inner[0]) | None
+        return Any
+
+    if hint in _SCALAR_TYPES:
+        return hint
+    if attr.has(hint) or origin in (dict, abc.Mapping, abc.MutableMapping):
+        return dict[str, Any]
+    if origin in (list, abc.Sequence, abc.MutableSequence) and args:
+        item = args[0]
+        if item in _SCALAR_TYPES:
+            return list[item]
+        if attr.has(item):
+            return list[dict[str, Any]]
+        return list[Any]
+    return Any
+
+
+@functools.cache
+def build_write_schema(
+    model_class: type, exclude: frozenset[str] = frozenset()
+) -> type[msgspec.Struct]:
+    """Build (once per model) the Struct mirroring a Write* model's writable fields.
+
+    Fields without a default on the SDK model are required in the Struct.
+    An ``id`` field is always included: it is not part of Write* models but
+    the restorer needs it to address existing content.
+
+    Args:
+        model_class: Looker SDK Write* attrs model class
+        exclude: Fields to leave out (read-only fields)
+
+    Returns:
+        msgspec Struct class ignoring unknown fields at decode time
+    """
+    hints = typing.get_type_hints(model_class)
+    fields: list[tuple[str, Any, Any] | tuple[str, Any]] = [("id", str | int | None, _UNSET)]
+    for model_field in attr.fields(model_class):
+        if model_field.name in exclude or model_field.name == "id":
+            continue
+        field_type = _schema_type(hints[model_field.name])
+        if model_field.default is attr.NOTHING:
+            fields.append((model_field.name, field_type))
+        else:
+            fields.append((model_field.name, field_type, _UNSET))
+
+    return msgspec.defstruct(
+        f"{model_class.__name__}Schema", fields, kw_only=True, forbid_unknown_fields=False
+    )
+
+
+@functools.cache
+def write_schema_decoder(
+    model_class: type, exclude: frozenset[str] = frozenset()
+) -> msgspec.msgpack.Decoder:
+    """Get the cached msgpack decoder for a Write* model's schema.
+
+    Args:
+        model_class: Looker SDK Write* attrs model class
+        exclude: Fields to leave out (read-only fields)
+
+    Returns:
+        Decoder producing instances of build_write_schema(model_class, exclude)
+    """
+    return msgspec.msgpack.Decoder(build_write_schema(model_class, exclude))
@@ -17,6 +17,8 @@ Phase 1: Discovery (Fetch Existing State)
 - Fetch all existing sub-resources of the current type from the destination instance
 - Build a mapping by ID for efficient lookup during categorization
 - Example: For dashboard filters, call `sdk.dashboard_dashboard_filters(dashboard_id)`
+- When the parent was just created, its create response already describes the
+  destination state, so no fetches are made
 
 **Why this phase is needed**:
 - We cannot determine CREATE/UPDATE/DELETE operations without knowing what exists
@@ -33,12 +35,15 @@ Phase 2: Categorization (Determine Operations)
 **Purpose**: Classify each backup sub-resource into CREATE, UPDATE, or DELETE operations.
 
 **What happens**:
-- Extract IDs from backup items (e.g., `{f.get("id") for f in backup_filters}`)
-- Compare backup IDs against existing destination IDs from Phase 1
+- `plan_subresource_mutations()` diffs backup items against the destination from Phase 1
 - Categorize each item:
   * **CREATE**: Item exists in backup but not in destination (new sub-resource)
-  * **UPDATE**: Item exists in both backup and destination (modify existing)
+  * **UPDATE**: Item exists in both and a writable field differs (modify existing)
+  * **Unchanged**: Item exists in both with identical writable fields (no API call)
   * **DELETE**: Item exists in destination but not in backup (orphan cleanup)
+- Fields are compared after normalizing SDK models to plain values, ignoring
+  read-only fields (including those of nested models such as a tile's look),
+  so idempotent re-restores make no write calls
 
 **Why this phase is needed**:
 - Enables precise synchronization between backup and destination
@@ -56,12 +61,17 @@ Phase 3: Execution (Apply Changes in Dependency Order)
 **Purpose**: Execute the categorized operations in the correct dependency order.
 
 **What happens**:
-- Execute operations sequentially within each sub-resource type
+- Execute independent operations concurrently within each sub-resource type
+  (bounded by ``max_concurrency``; every call still goes through the shared
+  rate limiter), while the types themselves run in order
 - For dashboard sub-resources, the dependency order is:
   1. Filters (no dependencies)
   2. Elements (may reference filters)
   3. Layouts (reference elements via layout components)
   4. Layout components (positioning for elements within layouts)
+- Within a type, UPDATEs and CREATEs are dispatched together and DELETEs only
+  after they finish; layout components are updated only once the elements
+  they position (and their new IDs) exist
 - For each operation type (UPDATE/CREATE/DELETE):
   * Call the appropriate SDK method (create/update/delete)
   * Track success/failure in result counters
@@ -105,18 +115,28 @@ This approach is particularly important for:
 - Permission issues on specific items only
 """
 
+import json
 import logging
+import types
+from collections import abc
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Any, Protocol, cast
+from enum import Enum
+from functools import cache, partial
+from typing import Any, Protocol, Union, cast, get_args, get_origin, get_type_hints
 
+import attr
 from looker_sdk import error as looker_error
 from looker_sdk import models40 as looker_models
+from looker_sdk.rtl import model as looker_model
 
 from lookervault.exceptions import RateLimitError, RestorationError
 from lookervault.extraction.rate_limiter import AdaptiveRateLimiter
 from lookervault.extraction.retry import retry_on_rate_limit
 from lookervault.looker.client import LookerClient
 from lookervault.utils import log_and_return_error
+from lookervault.utils.tracing import span, traced
 
 logger = logging.getLogger(__name__)
 
@@ -180,6 +200,7 @@ class SubResourceResult:
     created_count: int = 0
     updated_count: int = 0
     deleted_count: int = 0
+    unchanged_count: int = 0  # Matched items whose writable fields already match the backup
     error_count: int = 0
     errors: list[str] = field(default_factory=list)
     id_mappings: dict[str, str] = field(default_factory=dict)  # old_id -> new_id (for CREATE)
@@ -232,6 +253,15 @@ class SubResourceRestorationResult:
         """Total items deleted across all sub-resource types."""
         return self.filters.deleted_count + self.elements.deleted_count + self.layouts.deleted_count
 
+    @property
+    def total_unchanged(self) -> int:
+        """Total items left untouched because they already matched the backup."""
+        return (
+            self.filters.unchanged_count
+            + self.elements.unchanged_count
+            + self.layouts.unchanged_count
+        )
+
     @property
     def total_errors(self) -> int:
         """Total errors across all sub-resource types."""
@@ -243,6 +273,193 @@ class SubResourceRestorationResult:
         return self.filters.errors + self.elements.errors + self.layouts.errors
 
 
+@dataclass
+class SubResourcePlan:
+    """Minimal set of mutations that makes destination sub-resources match the backup.
+
+    Produced by plan_subresource_mutations(). Matched items whose writable fields
+    already equal the backup are counted as unchanged and produce no API call.
+    """
+
+    creates: list[dict[str, Any]] = field(default_factory=list)
+    updates: list[tuple[str, dict[str, Any]]] = field(default_factory=list)  # (id, backup item)
+    deletes: list[str] = field(default_factory=list)
+    unchanged_count: int = 0
+
+    @property
+    def mutation_count(self) -> int:
+        """Number of write calls the plan requires."""
+        return len(self.creates) + len(self.updates) + len(self.deletes)
+
+
+def to_plain(value: Any) -> Any:
+    """Recursively convert SDK models and enums into plain JSON-compatible values.
+
+    Destination fetches return looker_sdk models (with nested models and enums)
+    while backup content is plain dicts, so both sides are converted before
+    comparison.
+
+    Args:
+        value: SDK model, enum, dict, list or scalar
+
+    Returns:
+        Equivalent structure built from dicts, lists and scalars
+    """
+    if isinstance(value, looker_model.Model):
+        return {k: to_plain(v) for k, v in dict(value).items()}
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, dict):
+        return {k: to_plain(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [to_plain(v) for v in value]
+    return value
+
+
+@cache
+def _model_field_hints(model_class: type) -> dict[str, Any]:
+    return get_type_hints(model_class)
+
+
+def _nested_model(hint: Any) -> type | None:
+    """Get the SDK model class behind an Optional/Sequence field type hint, if any."""
+    if attr.has(hint):
+        return hint
+    if get_origin(hint) in (Union, types.UnionType, list, abc.Sequence, abc.MutableSequence):
+        for arg in get_args(hint):
+            model_class = _nested_model(arg)
+            if model_class is not None:
+                return model_class
+    return None
+
+
+def _writable_projection(value: Any, model_class: type) -> Any:
+    """Restrict plain nested objects to the fields of an SDK Write* model, recursively.
+
+    Args:
+        value: Plain dict (or list of dicts) for a nested model
+        model_class: Write* model the value is sent as
+
+    Returns:
+        value without keys the model does not accept; non-dict values are unchanged
+    """
+    if isinstance(value, list):
+        return [_writable_projection(item, model_class) for item in value]
+    if not isinstance(value, dict):
+        return value
+    hints = _model_field_hints(model_class)
+    projected = {}
+    for key, item in value.items():
+        if key not in hints:
+            continue
+        nested = _nested_model(hints[key])
+        projected[key] = item if nested is None else _writable_projection(item, nested)
+    return projected
+
+
+def has_writable_changes(
+    backup_item: dict[str, Any],
+    existing_item: dict[str, Any],
+    read_only_fields: set[str],
+    write_model: type | None = None,
+) -> bool:
+    """Check whether any writable backup field differs from the destination.
+
+    Only fields present in the backup are compared, so fields the backup does
+    not carry (e.g. added by a newer API version) never force an update. A
+    missing destination field compares equal to a None backup value.
+
+    Nested objects (e.g. a tile's look or query) are compared only over the
+    fields of their Write* model, so read-only counters such as a look's
+    view_count don't force an update.
+
+    Args:
+        backup_item: Sub-resource dict from backup
+        existing_item: Matching sub-resource from the destination
+        read_only_fields: Fields ignored by the comparison
+        write_model: Write* model the sub-resource is updated with (None to
+            compare nested objects with every key)
+
+    Returns:
+        True if an update call is needed
+    """
+    existing_plain = to_plain(existing_item)
+    hints = _model_field_hints(write_model) if write_model is not None else {}
+    for key, value in backup_item.items():
+        if key in read_only_fields:
+            continue
+        backup_plain = to_plain(value)
+        existing_field = existing_plain.get(key)
+        nested = _nested_model(hints[key]) if key in hints else None
+        if nested is not None:
+            backup_plain = _writable_projection(backup_plain, nested)
+            existing_field = _writable_projection(existing_field, nested)
+        backup_value = json.dumps(backup_plain, sort_keys=True, default=str)
+        existing_value = json.dumps(existing_field, sort_keys=True, default=str)
+        if backup_value != existing_value:
+            return True
+    return False
+
+
+def plan_subresource_mutations(
+    backup_items: list[dict[str, Any]],
+    existing_items: list[dict[str, Any]],
+    read_only_fields: set[str],
+    resource_type: str,
+    write_model: type | None = None,
+) -> SubResourcePlan:
+    """Diff backup sub-resources against the destination and plan minimal mutations.
+
+    Items are matched by ID (same-instance restoration):
+    - Backup ID not in destination -> CREATE
+    - Backup ID in destination with differing writable fields -> UPDATE
+    - Backup ID in destination with identical writable fields -> unchanged (no call)
+    - Destination ID not in backup -> DELETE (orphan cleanup)
+
+    Args:
+        backup_items: Sub-resource dicts from backup
+        existing_items: Sub-resource dicts from the destination
+        read_only_fields: Fields ignored when comparing matched items
+        resource_type: Name used in log messages (e.g. "dashboard_filter")
+        write_model: Write* model used for updates; nested objects are compared
+            over its fields only
+
+    Returns:
+        SubResourcePlan with creates, updates, deletes and unchanged count
+
+    Examples:
+        >>> plan = plan_subresource_mutations(
+        ...     [{"id": "1", "title": "A"}, {"id": "2", "title": "B"}],
+        ...     [{"id": "1", "title": "A"}, {"id": "3", "title": "C"}],
+        ...     READ_ONLY_FILTER_FIELDS,
+        ...     "dashboard_filter",
+        ... )
+        >>> [c["id"] for c in plan.creates], plan.updates, plan.deletes, plan.unchanged_count
+        (['2'], [], ['3'], 1)
+    """
+    plan = SubResourcePlan()
+    existing_by_id = {item["id"]: item for item in existing_items if item.get("id")}
+    backup_ids: set[str] = set()
+
+    for backup_item in backup_items:
+        item_id = backup_item.get("id")
+        if not item_id:
+            logger.warning(f"Skipping {resource_type} without ID in backup")
+            continue
+        backup_ids.add(item_id)
+
+        existing_item = existing_by_id.get(item_id)
+        if existing_item is None:
+            plan.creates.append(backup_item)
+        elif has_writable_changes(backup_item, existing_item, read_only_fields, write_model):
+            plan.updates.append((item_id, backup_item))
+        else:
+            plan.unchanged_count += 1
+
+    plan.deletes = [existing_id for existing_id in existing_by_id if existing_id not in backup_ids]
+    return plan
+
+
 class SubResourceRestorer(Protocol):
     """Protocol for restoring sub-resources of parent content items.
 
@@ -255,6 +472,7 @@ class SubResourceRestorer(Protocol):
         parent_id: str,
         parent_content: dict[str, Any],
         dry_run: bool = False,
+        destination_state: dict[str, Any] | None = None,
     ) -> SubResourceRestorationResult:
         """Restore all sub-resources for a parent content item.
 
@@ -262,6 +480,9 @@ class SubResourceRestorer(Protocol):
             parent_id: ID of parent content in destination instance
             parent_content: Deserialized parent content from backup (contains nested sub-resources)
             dry_run: If True, validate without making API calls
+            destination_state: Known destination parent (e.g. the create response of a
+                just-created parent). When given, its nested sub-resources are used as the
+                destination state instead of fetching them.
 
         Returns:
             SubResourceRestorationResult with counts and errors
@@ -285,9 +506,17 @@ class DashboardSubResourceRestorer:
     _restore_dashboard_layouts) each implement the three-phase pattern:
 
     **Phase 1 - Discovery**: Call _fetch_existing_*() to get current state from destination
-    **Phase 2 - Categorization**: Compare backup IDs vs. destination IDs to determine operations
+    **Phase 2 - Categorization**: Diff backup vs. destination into a minimal mutation plan
     **Phase 3 - Execution**: Call _create_*/_update_*/_delete_* methods in dependency order
 
+    Concurrency
+    ===========
+    Operations without mutual dependencies (e.g. the creates within one phase, or the
+    filter and element discovery fetches) are dispatched concurrently on a short-lived
+    thread pool of up to ``max_concurrency`` threads. Every call acquires the shared
+    rate limiter, so concurrency never exceeds the configured request rate. Result
+    counters are only updated on the calling thread.
+
     Dependency Order
     ================
     Sub-resources are restored in dependency order to prevent foreign key violations:
@@ -308,34 +537,140 @@ class DashboardSubResourceRestorer:
     For same-instance restoration, items are matched by ID (not name or other attributes).
     Each sub-resource is categorized into CREATE/UPDATE/DELETE operations:
     - CREATE: Item in backup but not in destination (assigns new ID)
-    - UPDATE: Item exists in both (preserves ID)
+    - UPDATE: Item exists in both and differs (preserves ID)
     - DELETE: Item in destination but not in backup (orphan cleanup)
+    Items that exist in both and already match are left untouched.
     """
 
     def __init__(
         self,
         client: LookerClient,
         rate_limiter: AdaptiveRateLimiter | None = None,
+        max_concurrency: int = 1,
     ):
         """Initialize DashboardSubResourceRestorer.
 
         Args:
             client: LookerClient for API calls to destination instance
             rate_limiter: Optional adaptive rate limiter for API throttling
+            max_concurrency: Maximum concurrent API calls per dashboard (1 = sequential)
         """
         self.client = client
         self.rate_limiter = rate_limiter
+        self.max_concurrency = max(1, max_concurrency)
 
         logger.debug(
             "Initialized DashboardSubResourceRestorer: "
-            f"rate_limiter={'enabled' if rate_limiter else 'disabled'}"
+            f"rate_limiter={'enabled' if rate_limiter else 'disabled'}, "
+            f"max_concurrency={self.max_concurrency}"
         )
 
+    def _run_concurrently(
+        self, tasks: list[Callable[[], Any]]
+    ) -> list[tuple[Any, Exception | None]]:
+        """Run independent API calls, up to max_concurrency at a time.
+
+        A new pool is created per call because the restorer is shared by all
+        restoration workers; pools are cheap compared to the API round trips.
+
+        Args:
+            tasks: Zero-argument callables to run
+
+        Returns:
+            (return value, exception) per task, in task order
+        """
+
+        def _capture(task: Callable[[], Any]) -> tuple[Any, Exception | None]:
+            try:
+                return task(), None
+            except Exception as e:
+                return None, e
+
+        if self.max_concurrency == 1 or len(tasks) <= 1:
+            return [_capture(task) for task in tasks]
+
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_concurrency, len(tasks)),
+            thread_name_prefix="dashboard-subresource",
+        ) as executor:
+            return list(executor.map(_capture, tasks))
+
+    def _execute_plan(
+        self,
+        plan: SubResourcePlan,
+        result: SubResourceResult,
+        label: str,
+        update: Callable[[str, dict[str, Any]], Any],
+        create: Callable[[dict[str, Any]], dict[str, Any]],
+        delete: Callable[[str], None],
+    ) -> tuple[list[tuple[dict[str, Any], dict[str, Any] | None]], set[str]]:
+        """Execute a mutation plan: UPDATEs and CREATEs together, then DELETEs.
+
+        Deletes run only after every update and create has finished, so a
+        destination is never left without an item that is about to be replaced.
+
+        Args:
+            plan: Planned mutations for one sub-resource type
+            result: SubResourceResult to record counts, ID mappings and errors in
+            label: Human-readable resource name for logs (e.g. "dashboard filter")
+            update: Callable(item_id, backup_item) performing one update
+            create: Callable(backup_item) performing one create and returning the response
+            delete: Callable(item_id) performing one delete
+
+        Returns:
+            Tuple of (backup item, create response or None on failure) for each
+            planned create, and the IDs of items whose update failed
+        """
+        tasks: list[Callable[[], Any]] = [
+            partial(update, item_id, item) for item_id, item in plan.updates
+        ]
+        tasks += [partial(create, item) for item in plan.creates]
+        logger.debug(
+            f"Dispatching {len(plan.updates)} {label} updates and {len(plan.creates)} creates"
+        )
+        outcomes = self._run_concurrently(tasks)
+
+        failed_updates: set[str] = set()
+        for (item_id, _), (_, error) in zip(plan.updates, outcomes, strict=False):
+            if error is not None:
+                log_and_return_error(result, f"Failed to update {label} {item_id}", error)
+                failed_updates.add(item_id)
+            else:
+                result.updated_count += 1
+
+        created: list[tuple[dict[str, Any], dict[str, Any] | None]] = []
+        create_outcomes = outcomes[len(plan.updates) :]
+        for item, (response, error) in zip(plan.creates, create_outcomes, strict=True):
+            item_id = item["id"]
+            if error is not None:
+                log_and_return_error(result, f"Failed to create {label} {item_id}", error)
+                created.append((item, None))
+                continue
+            result.created_count += 1
+            # Track ID mapping if new ID differs from backup ID
+            new_id = response.get("id")
+            if new_id and new_id != item_id:
+                result.id_mappings[item_id] = new_id
+                logger.debug(f"{label} ID mapping: {item_id} -> {new_id}")
+            created.append((item, response))
+
+        delete_outcomes = self._run_concurrently(
+            [partial(delete, existing_id) for existing_id in plan.deletes]
+        )
+        for existing_id, (_, error) in zip(plan.deletes, delete_outcomes, strict=True):
+            if error is not None:
+                log_and_return_error(result, f"Failed to delete {label} {existing_id}", error)
+            else:
+                result.deleted_count += 1
+
+        return created, failed_updates
+
     def restore_subresources(
         self,
         parent_id: str,
         parent_content: dict[str, Any],
         dry_run: bool = False,
+        destination_state: dict[str, Any] | None = None,
     ) -> SubResourceRestorationResult:
         """Restore all dashboard sub-resources (filters, elements, layouts).
 
@@ -343,6 +678,10 @@ class DashboardSubResourceRestorer:
             parent_id: Dashboard ID in destination instance
             parent_content: Deserialized dashboard from backup (contains nested sub-resources)
             dry_run: If True, validate structure without making API calls
+            destination_state: Destination dashboard already known to the caller (e.g. the
+                create response of a just-created dashboard). Its dashboard_filters,
+                dashboard_elements and dashboard_layouts are used instead of fetching them;
+                missing keys are treated as empty.
 
         Returns:
             SubResourceRestorationResult with aggregated counts and errors
@@ -358,28 +697,53 @@ class DashboardSubResourceRestorer:
             logger.info("Dry run mode - validating sub-resource structure only")
             return self._validate_subresources(parent_content, result)
 
+        def known_state(key: str) -> list[dict[str, Any]] | None:
+            """Destination sub-resources from destination_state (None = fetch)."""
+            if destination_state is None:
+                return None
+            return [to_plain(item) for item in destination_state.get(key) or []]
+
+        existing_filters = known_state("dashboard_filters")
+        existing_elements = known_state("dashboard_elements")
+        if destination_state is None:
+            # Filter and element discovery are independent, so fetch them together.
+            # Layouts are fetched after the element phase, because creating or
+            # deleting an element adds or removes its layout components.
+            # A failed prefetch leaves None, so the phase fetches again and reports it.
+            with span("prefetch_subresources", "subresource", dashboard_id=parent_id):
+                (existing_filters, _), (existing_elements, _) = self._run_concurrently(
+                    [
+                        partial(self._fetch_existing_filters, parent_id),
+                        partial(self._fetch_existing_elements, parent_id),
+                    ]
+                )
+
         # Step 1: Restore filters first (no dependencies)
         logger.info(f"Restoring dashboard filters for dashboard {parent_id}")
         filter_result = self._restore_dashboard_filters(
-            parent_id, parent_content.get("dashboard_filters", [])
+            parent_id,
+            parent_content.get("dashboard_filters", []),
+            existing_filters=existing_filters,
         )
         result.merge(filter_result)
         logger.info(
             f"Dashboard filters restored: created={filter_result.created_count}, "
             f"updated={filter_result.updated_count}, deleted={filter_result.deleted_count}, "
-            f"errors={filter_result.error_count}"
+            f"unchanged={filter_result.unchanged_count}, errors={filter_result.error_count}"
         )
 
         # Step 2: Restore elements (may depend on filters)
         logger.info(f"Restoring dashboard elements for dashboard {parent_id}")
         element_result = self._restore_dashboard_elements(
-            parent_id, parent_content.get("dashboard_elements", [])
+            parent_id,
+            parent_content.get("dashboard_elements", []),
+            existing_elements=existing_elements,
         )
         result.merge(element_result)
         logger.info(
             f"Dashboard elements restored: created={element_result.created_count}, "
             f"updated={element_result.updated_count}, deleted={element_result.deleted_count}, "
-            f"errors={element_result.error_count}"
+            f"unchanged={element_result.unchanged_count}, errors={element_result.error_count}"
         )
 
         # Step 3: Restore layouts (depend on elements)
@@ -388,18 +752,21 @@ class DashboardSubResourceRestorer:
             parent_id,
             parent_content.get("dashboard_layouts", []),
             parent_content.get("dashboard_elements", []),
+            existing_layouts=known_state("dashboard_layouts"),
+            element_id_mappings=element_result.id_mappings,
         )
         result.merge(layout_result)
         logger.info(
             f"Dashboard layouts restored: created={layout_result.created_count}, "
             f"updated={layout_result.updated_count}, deleted={layout_result.deleted_count}, "
-            f"errors={layout_result.error_count}"
+            f"unchanged={layout_result.unchanged_count}, errors={layout_result.error_count}"
         )
 
         logger.info(
             f"Dashboard sub-resource restoration complete: "
             f"total_created={result.total_created}, total_updated={result.total_updated}, "
-            f"total_deleted={result.total_deleted}, total_errors={result.total_errors}"
+            f"total_deleted={result.total_deleted}, total_unchanged={result.total_unchanged}, "
+            f"total_errors={result.total_errors}"
         )
 
         return result
@@ -460,42 +827,50 @@ class DashboardSubResourceRestorer:
     # Dashboard Filter Restoration
     # ===========================
 
+    @traced("restore_filters", "subresource", "dashboard_id")
     def _restore_dashboard_filters(
-        self, dashboard_id: str, backup_filters: list[dict[str, Any]]
+        self,
+        dashboard_id: str,
+        backup_filters: list[dict[str, Any]],
+        existing_filters: list[dict[str, Any]] | None = None,
     ) -> SubResourceResult:
         """Restore dashboard filters with UPDATE/CREATE/DELETE logic.
 
         Implements the three-phase restoration strategy:
         1. Discovery: Fetch existing filters from destination
-        2. Categorization: Determine CREATE/UPDATE/DELETE operations
-        3. Execution: Apply operations with best-effort error handling
+        2. Categorization: Diff backup against destination into a minimal plan
+        3. Execution: Apply planned operations with best-effort error handling
 
         Phase Details
         -------------
         **Phase 1 - Discovery**: Call ``_fetch_existing_filters()`` to get all
-        existing dashboard filters from the destination instance. Build a mapping
-        by ID for efficient lookup.
+        existing dashboard filters from the destination instance, unless the
+        caller already supplied them (e.g. for a just-created dashboard).
 
-        **Phase 2 - Categorization**: Compare backup IDs against destination IDs:
-        - Backup ID in destination → UPDATE operation
+        **Phase 2 - Categorization**: ``plan_subresource_mutations()`` compares
+        backup IDs against destination IDs and writable field values:
+        - Backup ID in destination, fields differ → UPDATE operation
+        - Backup ID in destination, fields equal → unchanged (no API call)
         - Backup ID not in destination → CREATE operation
         - Destination ID not in backup → DELETE operation (orphan cleanup)
 
-        **Phase 3 - Execution**: Execute operations sequentially with best-effort
-        error handling. Failed items are logged but don't stop the restoration.
+        **Phase 3 - Execution**: Execute UPDATEs and CREATEs concurrently, then
+        DELETEs, with best-effort error handling. Failed items are logged but
+        don't stop the restoration.
 
         Example
         -------
         Given backup filters with IDs ``{1, 2, 3}`` and destination filters
-        with IDs ``{2, 3, 4}``:
+        with IDs ``{2, 3, 4}`` where only filter 2 differs:
         - Filter 1: CREATE (exists in backup, not destination)
-        - Filter 2: UPDATE (exists in both)
-        - Filter 3: UPDATE (exists in both)
+        - Filter 2: UPDATE (exists in both, fields differ)
+        - Filter 3: unchanged (exists in both, fields equal)
         - Filter 4: DELETE (exists in destination, not backup)
 
         Args:
             dashboard_id: Dashboard ID in destination instance
             backup_filters: List of dashboard filter dicts from backup
+            existing_filters: Destination filters if already known (None = fetch)
 
         Returns:
             SubResourceResult with counts and errors
@@ -508,68 +883,37 @@ class DashboardSubResourceRestorer:
 
         # ========== PHASE 1: DISCOVERY ==========
         # Fetch existing filters from destination to establish current state
-        try:
-            existing_filters = self._fetch_existing_filters(dashboard_id)
-            existing_by_id = {f["id"]: f for f in existing_filters}
-            logger.debug(f"Found {len(existing_filters)} existing filters in destination")
-        except Exception as e:
-            log_and_return_error(
-                result, f"Failed to fetch existing filters for dashboard {dashboard_id}", e
-            )
-            return result
+        if existing_filters is None:
+            try:
+                existing_filters = self._fetch_existing_filters(dashboard_id)
+            except Exception as e:
+                log_and_return_error(
+                    result, f"Failed to fetch existing filters for dashboard {dashboard_id}", e
+                )
+                return result
+        logger.debug(f"Found {len(existing_filters)} existing filters in destination")
 
         # ========== PHASE 2: CATEGORIZATION ==========
-        # Extract backup IDs for categorization (CREATE vs UPDATE vs DELETE)
-        backup_ids = {f.get("id") for f in backup_filters if f.get("id")}
+        plan = plan_subresource_mutations(
+            backup_filters,
+            existing_filters,
+            READ_ONLY_FILTER_FIELDS,
+            "dashboard_filter",
+            looker_models.WriteDashboardFilter,
+        )
+        result.unchanged_count = plan.unchanged_count
 
         # ========== PHASE 3: EXECUTION ==========
-        # Execute operations in order: UPDATE (existing), CREATE (new), DELETE (orphans)
+        # UPDATE (existing) and CREATE (new) concurrently, then DELETE (orphans)
         # Use best-effort error handling: continue on individual failures
-
-        # UPDATE: Filters that exist in both backup and destination
-        for backup_filter in backup_filters:
-            filter_id = backup_filter.get("id")
-            if not filter_id:
-                logger.warning("Skipping filter without ID in backup")
-                continue
-
-            if filter_id in existing_by_id:
-                # UPDATE existing filter
-                try:
-                    logger.debug(f"Updating dashboard filter {filter_id}")
-                    self._update_dashboard_filter(dashboard_id, filter_id, backup_filter)
-                    result.updated_count += 1
-                except Exception as e:
-                    log_and_return_error(
-                        result, f"Failed to update dashboard filter {filter_id}", e
-                    )
-            else:
-                # CREATE new filter
-                try:
-                    logger.debug(f"Creating dashboard filter {filter_id}")
-                    new_filter = self._create_dashboard_filter(dashboard_id, backup_filter)
-                    result.created_count += 1
-                    # Track ID mapping if new ID differs from backup ID
-                    new_id = new_filter.get("id")
-                    if new_id and new_id != filter_id:
-                        result.id_mappings[filter_id] = new_id
-                        logger.debug(f"Filter ID mapping: {filter_id} -> {new_id}")
-                except Exception as e:
-                    log_and_return_error(
-                        result, f"Failed to create dashboard filter {filter_id}", e
-                    )
-
-        # DELETE: Filters in destination but not in backup
-        for existing_id in existing_by_id:
-            if existing_id not in backup_ids:
-                try:
-                    logger.debug(f"Deleting orphaned dashboard filter {existing_id}")
-                    self._delete_dashboard_filter(existing_id)
-                    result.deleted_count += 1
-                except Exception as e:
-                    log_and_return_error(
-                        result, f"Failed to delete dashboard filter {existing_id}", e
-                    )
+        self._execute_plan(
+            plan,
+            result,
+            "dashboard filter",
+            update=partial(self._update_dashboard_filter, dashboard_id),
+            create=partial(self._create_dashboard_filter, dashboard_id),
+            delete=self._delete_dashboard_filter,
+        )
 
         return result
 
@@ -717,15 +1061,19 @@ class DashboardSubResourceRestorer:
     # Dashboard Element Restoration
     # ===========================
 
+    @traced("restore_elements", "subresource", "dashboard_id")
     def _restore_dashboard_elements(
-        self, dashboard_id: str, backup_elements: list[dict[str, Any]]
+        self,
+        dashboard_id: str,
+        backup_elements: list[dict[str, Any]],
+        existing_elements: list[dict[str, Any]] | None = None,
     ) -> SubResourceResult:
         """Restore dashboard elements (tiles/visualizations).
 
         Implements the three-phase restoration strategy:
         1. Discovery: Fetch existing elements from destination
-        2. Categorization: Determine CREATE/UPDATE/DELETE operations
-        3. Execution: Apply operations with best-effort error handling
+        2. Categorization: Diff backup against destination into a minimal plan
+        3. Execution: Apply planned operations with best-effort error handling
 
         Dashboard elements include:
         - Query visualizations (reference query_id)
@@ -736,30 +1084,33 @@ class DashboardSubResourceRestorer:
         Phase Details
         -------------
         **Phase 1 - Discovery**: Call ``_fetch_existing_elements()`` to get all
-        existing dashboard elements from the destination instance. Build a mapping
-        by ID for efficient lookup.
+        existing dashboard elements from the destination instance, unless the
+        caller already supplied them (e.g. for a just-created dashboard).
 
-        **Phase 2 - Categorization**: Compare backup IDs against destination IDs:
-        - Backup ID in destination → UPDATE operation
+        **Phase 2 - Categorization**: ``plan_subresource_mutations()`` compares
+        backup IDs against destination IDs and writable field values:
+        - Backup ID in destination, fields differ → UPDATE operation
+        - Backup ID in destination, fields equal → unchanged (no API call)
         - Backup ID not in destination → CREATE operation
         - Destination ID not in backup → DELETE operation (orphan cleanup)
 
-        **Phase 3 - Execution**: Execute operations sequentially with best-effort
-        error handling. Track ID mappings for CREATE operations in case Looker
-        assigns new IDs.
+        **Phase 3 - Execution**: Execute UPDATEs and CREATEs concurrently, then
+        DELETEs, with best-effort error handling. Track ID mappings for CREATE
+        operations in case Looker assigns new IDs.
 
         Example
         -------
         Given backup elements with IDs ``{101, 102, 103}`` and destination elements
-        with IDs ``{102, 103, 104}``:
+        with IDs ``{102, 103, 104}`` where only element 102 differs:
         - Element 101: CREATE (exists in backup, not destination)
-        - Element 102: UPDATE (exists in both)
-        - Element 103: UPDATE (exists in both)
+        - Element 102: UPDATE (exists in both, fields differ)
+        - Element 103: unchanged (exists in both, fields equal)
         - Element 104: DELETE (exists in destination, not backup)
 
         Args:
             dashboard_id: Dashboard ID in destination instance
             backup_elements: List of dashboard element dicts from backup
+            existing_elements: Destination elements if already known (None = fetch)
 
         Returns:
             SubResourceResult with counts and errors
@@ -772,68 +1123,37 @@ class DashboardSubResourceRestorer:
 
         # ========== PHASE 1: DISCOVERY ==========
         # Fetch existing elements from destination to establish current state
-        try:
-            existing_elements = self._fetch_existing_elements(dashboard_id)
-            existing_by_id = {e["id"]: e for e in existing_elements}
-            logger.debug(f"Found {len(existing_elements)} existing elements in destination")
-        except Exception as e:
-            log_and_return_error(
-                result, f"Failed to fetch existing elements for dashboard {dashboard_id}", e
-            )
-            return result
+        if existing_elements is None:
+            try:
+                existing_elements = self._fetch_existing_elements(dashboard_id)
+            except Exception as e:
+                log_and_return_error(
+                    result, f"Failed to fetch existing elements for dashboard {dashboard_id}", e
+                )
+                return result
+        logger.debug(f"Found {len(existing_elements)} existing elements in destination")
 
         # ========== PHASE 2: CATEGORIZATION ==========
-        # Extract backup IDs for categorization (CREATE vs UPDATE vs DELETE)
-        backup_ids = {e.get("id") for e in backup_elements if e.get("id")}
+        plan = plan_subresource_mutations(
+            backup_elements,
+            existing_elements,
+            READ_ONLY_ELEMENT_FIELDS,
+            "dashboard_element",
+            looker_models.WriteDashboardElement,
+        )
+        result.unchanged_count = plan.unchanged_count
 
         # ========== PHASE 3: EXECUTION ==========
-        # Execute operations in order: UPDATE (existing), CREATE (new), DELETE (orphans)
+        # UPDATE (existing) and CREATE (new) concurrently, then DELETE (orphans)
         # Use best-effort error handling: continue on individual failures
-
-        # UPDATE: Elements that exist in both backup and destination
-        for backup_element in backup_elements:
-            element_id = backup_element.get("id")
-            if not element_id:
-                logger.warning("Skipping element without ID in backup")
-                continue
-
-            if element_id in existing_by_id:
-                # UPDATE existing element
-                try:
-                    logger.debug(f"Updating dashboard element {element_id}")
-                    self._update_dashboard_element(dashboard_id, element_id, backup_element)
-                    result.updated_count += 1
-                except Exception as e:
-                    log_and_return_error(
-                        result, f"Failed to update dashboard element {element_id}", e
-                    )
-            else:
-                # CREATE new element
-                try:
-                    logger.debug(f"Creating dashboard element {element_id}")
-                    new_element = self._create_dashboard_element(dashboard_id, backup_element)
-                    result.created_count += 1
-                    # Track ID mapping if new ID differs from backup ID
-                    new_id = new_element.get("id")
-                    if new_id and new_id != element_id:
-                        result.id_mappings[element_id] = new_id
-                        logger.debug(f"Element ID mapping: {element_id} -> {new_id}")
-                except Exception as e:
-                    log_and_return_error(
-                        result, f"Failed to create dashboard element {element_id}", e
-                    )
-
-        # DELETE: Elements in destination but not in backup
-        for existing_id in existing_by_id:
-            if existing_id not in backup_ids:
-                try:
-                    logger.debug(f"Deleting orphaned dashboard element {existing_id}")
-                    self._delete_dashboard_element(existing_id)
-                    result.deleted_count += 1
-                except Exception as e:
-                    log_and_return_error(
-                        result, f"Failed to delete dashboard element {existing_id}", e
-                    )
+        self._execute_plan(
+            plan,
+            result,
+            "dashboard element",
+            update=partial(self._update_dashboard_element, dashboard_id),
+            create=partial(self._create_dashboard_element, dashboard_id),
+            delete=self._delete_dashboard_element,
+        )
 
         return result
 
@@ -981,11 +1301,14 @@ class DashboardSubResourceRestorer:
     # Dashboard Layout Restoration
     # ===========================
 
+    @traced("restore_layouts", "subresource", "dashboard_id")
     def _restore_dashboard_layouts(
         self,
         dashboard_id: str,
         backup_layouts: list[dict[str, Any]],
         backup_elements: list[dict[str, Any]],
+        existing_layouts: list[dict[str, Any]] | None = None,
+        element_id_mappings: dict[str, str] | None = None,
     ) -> SubResourceResult:
         """Restore dashboard layouts and layout components.
 
@@ -995,36 +1318,42 @@ class DashboardSubResourceRestorer:
         Phase Details
         -------------
         **Phase 1 - Discovery**: Call ``_fetch_existing_layouts()`` to get all
-        existing dashboard layouts from the destination instance. Build a mapping
-        by ID for efficient lookup.
+        existing dashboard layouts from the destination instance, unless the
+        caller already supplied them (e.g. for a just-created dashboard).
 
-        **Phase 2 - Categorization**: Compare backup IDs against destination IDs:
-        - Backup ID in destination → UPDATE operation (also update components)
-        - Backup ID not in destination → CREATE operation (also create components)
+        **Phase 2 - Categorization**: ``plan_subresource_mutations()`` compares
+        backup IDs against destination IDs and writable field values:
+        - Backup ID in destination, fields differ → UPDATE operation
+        - Backup ID in destination, fields equal → unchanged (no API call)
+        - Backup ID not in destination → CREATE operation
         - Destination ID not in backup → DELETE operation (orphan cleanup)
 
-        **Phase 3 - Execution**: Execute operations sequentially with best-effort
-        error handling. For each layout, also restore nested layout_components
-        which define element positioning.
+        **Phase 3 - Execution**: Execute layout UPDATEs and CREATEs concurrently,
+        then diff and update the nested layout_components of every matched or
+        created layout, then DELETE orphans. Elements have all been created by
+        the time this runs, so components can reference their new IDs.
 
         Layout Components
         ------------------
         Layout components are nested sub-resources that define row/column positioning
         for dashboard elements. They are updated (not created/deleted) as part of
-        the parent layout restoration.
+        the parent layout restoration, and only when their positioning differs.
 
         Example
         -------
         Given backup layouts with IDs ``{201, 202}`` and destination layouts
         with IDs ``{202, 203}``:
         - Layout 201: CREATE (exists in backup, not destination)
-        - Layout 202: UPDATE (exists in both)
+        - Layout 202: UPDATE if its fields differ, otherwise unchanged
         - Layout 203: DELETE (exists in destination, not backup)
 
         Args:
             dashboard_id: Dashboard ID in destination instance
             backup_layouts: List of dashboard layout dicts from backup
             backup_elements: List of dashboard elements (for reference validation)
+            existing_layouts: Destination layouts if already known (None = fetch)
+            element_id_mappings: Backup element ID -> destination element ID for
+                elements created with new IDs (used to match layout components)
 
         Returns:
             SubResourceResult with counts and errors
@@ -1036,126 +1365,194 @@ class DashboardSubResourceRestorer:
         )
 
         # Fetch existing layouts from destination
-        try:
-            existing_layouts = self._fetch_existing_layouts(dashboard_id)
-            existing_by_id = {layout["id"]: layout for layout in existing_layouts}
-            logger.debug(f"Found {len(existing_layouts)} existing layouts in destination")
-        except Exception as e:
-            log_and_return_error(
-                result, f"Failed to fetch existing layouts for dashboard {dashboard_id}", e
-            )
-            return result
-
-        # Categorize and execute operations
-        backup_ids = {layout.get("id") for layout in backup_layouts if layout.get("id")}
-
-        # UPDATE: Layouts that exist in both backup and destination
-        for backup_layout in backup_layouts:
-            layout_id = backup_layout.get("id")
-            if not layout_id:
-                logger.warning("Skipping layout without ID in backup")
-                continue
-
-            if layout_id in existing_by_id:
-                # UPDATE existing layout
-                try:
-                    logger.debug(f"Updating dashboard layout {layout_id}")
-                    self._update_dashboard_layout(dashboard_id, layout_id, backup_layout)
-                    result.updated_count += 1
-
-                    # Update layout components (nested within layout)
-                    self._restore_layout_components(layout_id, backup_layout, result)
+        if existing_layouts is None:
+            try:
+                existing_layouts = self._fetch_existing_layouts(dashboard_id)
+            except Exception as e:
+                log_and_return_error(
+                    result, f"Failed to fetch existing layouts for dashboard {dashboard_id}", e
+                )
+                return result
+        existing_by_id = {layout["id"]: layout for layout in existing_layouts if layout.get("id")}
+        logger.debug(f"Found {len(existing_layouts)} existing layouts in destination")
+
+        # Categorize into a minimal plan
+        plan = plan_subresource_mutations(
+            backup_layouts,
+            existing_layouts,
+            READ_ONLY_LAYOUT_FIELDS,
+            "dashboard_layout",
+            looker_models.WriteDashboardLayout,
+        )
+        result.unchanged_count = plan.unchanged_count
+        plan_deletes = plan.deletes
+        plan.deletes = []  # Deleted after components, below
+
+        # UPDATE and CREATE layouts concurrently
+        created, failed_updates = self._execute_plan(
+            plan,
+            result,
+            "dashboard layout",
+            update=partial(self._update_dashboard_layout, dashboard_id),
+            create=partial(self._create_dashboard_layout, dashboard_id),
+            delete=self._delete_dashboard_layout,
+        )
 
-                except Exception as e:
-                    log_and_return_error(
-                        result, f"Failed to update dashboard layout {layout_id}", e
-                    )
+        # Layouts whose components should be diffed: (destination id, backup, components).
+        # Components are diffed even when the layout itself is unchanged.
+        targets: list[tuple[str, dict[str, Any], list[Any] | None]] = [
+            (
+                backup_layout["id"],
+                backup_layout,
+                existing_by_id[backup_layout["id"]].get("dashboard_layout_components"),
+            )
+            for backup_layout in backup_layouts
+            if backup_layout.get("id") in existing_by_id
+            and backup_layout["id"] not in failed_updates
+        ]
+        targets += [
+            (
+                new_layout.get("id") or backup_layout["id"],
+                backup_layout,
+                new_layout.get("dashboard_layout_components"),
+            )
+            for backup_layout, new_layout in created
+            if new_layout is not None
+        ]
+
+        # Fetch components that were not nested in the layout response
+        to_fetch = [
+            index
+            for index, (layout_id, backup_layout, components) in enumerate(targets)
+            if components is None and backup_layout.get("dashboard_layout_components")
+        ]
+        fetched = self._run_concurrently(
+            [partial(self._fetch_existing_layout_components, targets[i][0]) for i in to_fetch]
+        )
+        skip: set[int] = set()
+        for index, (components, error) in zip(to_fetch, fetched, strict=True):
+            if error is not None:
+                log_and_return_error(
+                    result,
+                    f"Failed to fetch existing layout components for layout {targets[index][0]}",
+                    error,
+                )
+                skip.add(index)
             else:
-                # CREATE new layout
-                try:
-                    logger.debug(f"Creating dashboard layout {layout_id}")
-                    new_layout = self._create_dashboard_layout(dashboard_id, backup_layout)
-                    result.created_count += 1
-                    # Track ID mapping if new ID differs from backup ID
-                    new_id = new_layout.get("id")
-                    if new_id and new_id != layout_id:
-                        result.id_mappings[layout_id] = new_id
-                        logger.debug(f"Layout ID mapping: {layout_id} -> {new_id}")
-
-                    # Restore layout components for newly created layout
-                    self._restore_layout_components(new_id or layout_id, backup_layout, result)
-
-                except Exception as e:
-                    log_and_return_error(
-                        result, f"Failed to create dashboard layout {layout_id}", e
-                    )
+                targets[index] = (targets[index][0], targets[index][1], components)
+
+        # UPDATE changed layout components concurrently
+        component_updates: list[tuple[str, dict[str, Any]]] = []
+        for index, (layout_id, backup_layout, components) in enumerate(targets):
+            if index not in skip:
+                component_updates += self._plan_layout_components(
+                    layout_id,
+                    backup_layout,
+                    result,
+                    existing_components=components or [],
+                    element_id_mappings=element_id_mappings,
+                )
+        outcomes = self._run_concurrently(
+            [
+                partial(self._update_dashboard_layout_component, component_id, desired)
+                for component_id, desired in component_updates
+            ]
+        )
+        for (component_id, _), (_, error) in zip(component_updates, outcomes, strict=True):
+            if error is not None:
+                log_and_return_error(
+                    result, f"Failed to update layout component {component_id}", error
+                )
 
         # DELETE: Layouts in destination but not in backup
-        for existing_id in existing_by_id:
-            if existing_id not in backup_ids:
-                try:
-                    logger.debug(f"Deleting orphaned dashboard layout {existing_id}")
-                    self._delete_dashboard_layout(existing_id)
-                    result.deleted_count += 1
-                except Exception as e:
-                    log_and_return_error(
-                        result, f"Failed to delete dashboard layout {existing_id}", e
-                    )
+        delete_outcomes = self._run_concurrently(
+            [partial(self._delete_dashboard_layout, existing_id) for existing_id in plan_deletes]
+        )
+        for existing_id, (_, error) in zip(plan_deletes, delete_outcomes, strict=True):
+            if error is not None:
+                log_and_return_error(
+                    result, f"Failed to delete dashboard layout {existing_id}", error
+                )
+            else:
+                result.deleted_count += 1
 
         return result
 
-    def _restore_layout_components(
+    def _plan_layout_components(
         self,
         layout_id: str,
         backup_layout: dict[str, Any],
         result: SubResourceResult,
-    ) -> None:
-        """Restore layout components (element positioning) for a layout.
+        existing_components: list[Any],
+        element_id_mappings: dict[str, str] | None = None,
+    ) -> list[tuple[str, dict[str, Any]]]:
+        """Plan layout component (element positioning) updates for a layout.
 
         Layout components define row, column, width, height positioning for
-        dashboard elements within a specific layout.
+        dashboard elements within a specific layout. Each backup component is
+        matched to a destination component by ID, or by the (mapped) element it
+        positions, and is only updated when its positioning differs.
 
         Args:
             layout_id: Layout ID in destination instance
             backup_layout: Layout dict from backup containing dashboard_layout_components
-            result: SubResourceResult to track component restoration errors
+            result: SubResourceResult to record unmatched components in
+            existing_components: Destination components of the layout
+            element_id_mappings: Backup element ID -> destination element ID
 
-        Note: Updates result.errors in place for component restoration failures
+        Returns:
+            (destination component ID, desired component) for each changed component
         """
         backup_components = backup_layout.get("dashboard_layout_components", [])
 
         if not backup_components:
             logger.debug(f"No layout components to restore for layout {layout_id}")
-            return
+            return []
 
-        logger.debug(f"Restoring {len(backup_components)} layout components for layout {layout_id}")
+        logger.debug(f"Planning {len(backup_components)} layout components for layout {layout_id}")
 
-        # Fetch existing components for this layout (for validation)
-        try:
-            existing_components = self._fetch_existing_layout_components(layout_id)
-            logger.debug(f"Found {len(existing_components)} existing layout components")
-        except Exception as e:
-            log_and_return_error(
-                result,
-                f"Failed to fetch existing layout components for layout {layout_id}",
-                e,
-            )
-            return
+        existing_plain = [to_plain(component) for component in existing_components]
+        existing_by_id = {c["id"]: c for c in existing_plain if c.get("id")}
+        existing_by_element = {
+            c["dashboard_element_id"]: c for c in existing_plain if c.get("dashboard_element_id")
+        }
+        element_id_mappings = element_id_mappings or {}
 
-        # UPDATE each component (Looker API only supports update for layout components, not create/delete)
-        # Note: We update all components from backup without DELETE logic - layout components
-        # are automatically created/deleted when parent elements are created/deleted
+        # Looker API only supports update for layout components, not create/delete:
+        # components are automatically created/deleted with their parent elements
+        updates: list[tuple[str, dict[str, Any]]] = []
         for backup_component in backup_components:
             component_id = backup_component.get("id")
             if not component_id:
                 logger.warning("Skipping layout component without ID in backup")
                 continue
 
-            try:
-                logger.debug(f"Updating layout component {component_id}")
-                self._update_dashboard_layout_component(component_id, backup_component)
-            except Exception as e:
-                log_and_return_error(result, f"Failed to update layout component {component_id}", e)
+            element_id = backup_component.get("dashboard_element_id")
+            element_id = element_id_mappings.get(element_id, element_id)
+            target = existing_by_id.get(component_id) or existing_by_element.get(element_id)
+            if target is None:
+                result.error_count += 1
+                result.errors.append(
+                    f"No destination layout component for element {element_id} "
+                    f"in layout {layout_id}"
+                )
+                continue
+
+            desired = {
+                **backup_component,
+                "id": target["id"],
+                "dashboard_layout_id": layout_id,
+                "dashboard_element_id": element_id,
+            }
+            if has_writable_changes(
+                desired,
+                target,
+                READ_ONLY_LAYOUT_COMPONENT_FIELDS,
+                looker_models.WriteDashboardLayoutComponent,
+            ):
+                updates.append((target["id"], desired))
+
+        return updates
 
     @retry_on_rate_limit
     def _fetch_existing_layouts(self, dashboard_id: str) -> list[dict[str, Any]]:
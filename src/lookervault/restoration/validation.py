@@ -6,8 +6,9 @@ content schema compliance, and dependency availability.
 """
 
 import sqlite3
+from collections.abc import Collection, Mapping
 from pathlib import Path
-from typing import Any
+from typing import Any, cast
 
 from looker_sdk import error as looker_error
 
@@ -68,6 +69,17 @@ class RestorationValidator:
         ContentType.MODEL_SET: ["models"],
     }
 
+    # Content type each foreign key field references (for in-memory ID index checks)
+    FK_TARGET_TYPES = {
+        "folder_id": ContentType.FOLDER,
+        "parent_id": ContentType.FOLDER,
+        "user_id": ContentType.USER,
+        "dashboard_id": ContentType.DASHBOARD,
+        "look_id": ContentType.LOOK,
+        "model_name": ContentType.LOOKML_MODEL,
+        "models": ContentType.LOOKML_MODEL,
+    }
+
     def validate_pre_flight(self, db_path: Path, client: LookerClient) -> list[str]:
         """Run pre-flight validation checks before restoration.
 
@@ -258,7 +270,11 @@ class RestorationValidator:
         return errors
 
     def validate_dependencies(
-        self, content_dict: dict[str, Any], content_type: ContentType, client: LookerClient
+        self,
+        content_dict: dict[str, Any],
+        content_type: ContentType,
+        client: LookerClient | None = None,
+        id_index: Mapping[ContentType, Collection[str]] | None = None,
     ) -> list[str]:
         """Validate that content dependencies exist in destination instance.
 
@@ -266,24 +282,49 @@ class RestorationValidator:
         in the destination Looker instance. This helps identify missing
         dependencies before attempting restoration.
 
-        Note: This performs API calls and may be slow for content with
-        many dependencies. Consider using sparingly or with caching.
+        Note: With a client this performs API calls and may be slow for content
+        with many dependencies. With an id_index (e.g. the IDs present in the
+        backup) every check is an in-memory lookup; references to content types
+        missing from the index are assumed to exist.
 
         Args:
             content_dict: Content data with potential FK references
             content_type: Type of content being validated
             client: LookerClient for checking existence in destination
+            id_index: Known IDs per content type, checked instead of the API
 
         Returns:
             List of missing dependency error messages (empty if all exist)
 
+        Raises:
+            ValueError: If neither client nor id_index is given
+
         Examples:
             >>> validator = RestorationValidator()
             >>> dashboard = {"title": "My Dashboard", "folder_id": "123"}
             >>> errors = validator.validate_dependencies(dashboard, ContentType.DASHBOARD, client)
             >>> if errors:
             ...     print(f"Missing dependencies: {errors}")
+
+            >>> # Offline, against the IDs in the backup
+            >>> index = {ContentType.FOLDER: repo.get_content_ids(ContentType.FOLDER.value)}
+            >>> errors = validator.validate_dependencies(
+            ...     dashboard, ContentType.DASHBOARD, id_index=index
+            ... )
         """
+        if client is None and id_index is None:
+            raise ValueError("validate_dependencies requires a client or an id_index")
+
+        def _exists(fk_field: str, fk_id: Any) -> bool:
+            if id_index is None:
+                return self._check_dependency_exists(
+                    fk_field, fk_id, content_type, cast(LookerClient, client)
+                )
+            target_type = self.FK_TARGET_TYPES.get(fk_field)
+            known_ids = id_index.get(target_type) if target_type is not None else None
+            # Unindexed targets are assumed to exist (permissive, like the API check)
+            return known_ids is None or str(fk_id) in known_ids
+
         errors: list[str] = []
 
         # Get FK fields for this content type
@@ -299,11 +340,11 @@ class RestorationValidator:
             # Handle list of FKs (e.g., model_set.models)
             if isinstance(fk_value, list):
                 for fk_id in fk_value:
-                    if not self._check_dependency_exists(fk_field, fk_id, content_type, client):
+                    if not _exists(fk_field, fk_id):
                         errors.append(f"Dependency not found: {fk_field}={fk_id}")
             else:
                 # Single FK reference
-                if not self._check_dependency_exists(fk_field, fk_value, content_type, client):
+                if not _exists(fk_field, fk_value):
                     errors.append(f"Dependency not found: {fk_field}={fk_value}")
 
         return errors
@@ -3,11 +3,15 @@
 from lookervault.storage._mixins.base import DatabaseConnectionMixin
 from lookervault.storage._mixins.content import ContentMixin
 from lookervault.storage._mixins.dead_letter_queue import DeadLetterQueueMixin
+from lookervault.storage._mixins.destination_fingerprints import DestinationFingerprintsMixin
 from lookervault.storage._mixins.extraction_checkpoints import ExtractionCheckpointsMixin
 from lookervault.storage._mixins.extraction_sessions import ExtractionSessionsMixin
 from lookervault.storage._mixins.id_mappings import IDMappingsMixin
 from lookervault.storage._mixins.restoration_checkpoints import RestorationCheckpointsMixin
+from lookervault.storage._mixins.restoration_progress import RestorationProgressMixin
 from lookervault.storage._mixins.restoration_sessions import RestorationSessionsMixin
+from lookervault.storage._mixins.restore_latency import RestoreLatencyMixin
+from lookervault.storage._mixins.run_telemetry import RunTelemetryMixin
 from lookervault.storage._mixins.utils import StorageUtilsMixin
 
 __all__ = [
@@ -16,8 +20,12 @@ __all__ = [
     "ExtractionCheckpointsMixin",
     "ExtractionSessionsMixin",
     "RestorationCheckpointsMixin",
+    "RestorationProgressMixin",
     "RestorationSessionsMixin",
     "DeadLetterQueueMixin",
     "IDMappingsMixin",
+    "DestinationFingerprintsMixin",
+    "RestoreLatencyMixin",
+    "RunTelemetryMixin",
     "StorageUtilsMixin",
 ]
@@ -11,6 +11,7 @@ from typing import TypeVar
 from lookervault.constants import DEFAULT_MAX_RETRIES, SQLITE_BUSY_TIMEOUT_SECONDS
 from lookervault.exceptions import StorageError
 from lookervault.storage.schema import create_schema, optimize_database
+from lookervault.utils.tracing import span
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +31,9 @@ class DatabaseConnectionMixin:
 
     db_path: Path
     _local: threading.local
+    _busy_retries: int
+    _busy_retries_lock: threading.Lock
+    _busy_wait_seconds: float
 
     def __init__(self, db_path: str | Path, **kwargs: object) -> None:
         """Initialize database connection management.
@@ -41,6 +45,9 @@ class DatabaseConnectionMixin:
         super().__init__(**kwargs)
         object.__setattr__(self, "db_path", Path(db_path))
         object.__setattr__(self, "_local", threading.local())
+        object.__setattr__(self, "_busy_retries", 0)
+        object.__setattr__(self, "_busy_retries_lock", threading.Lock())
+        object.__setattr__(self, "_busy_wait_seconds", 0.0)
 
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
@@ -103,6 +110,41 @@ class DatabaseConnectionMixin:
         """
         self.close_thread_connection()
 
+    @property
+    def busy_retry_count(self) -> int:
+        """Number of SQLITE_BUSY retries performed by _retry_on_busy() so far."""
+        return self._busy_retries
+
+    @property
+    def busy_wait_seconds(self) -> float:
+        """Seconds spent waiting for the write lock or sleeping between busy retries."""
+        return self._busy_wait_seconds
+
+    def _add_busy_wait(self, seconds: float) -> None:
+        with self._busy_retries_lock:
+            object.__setattr__(self, "_busy_wait_seconds", self._busy_wait_seconds + seconds)
+
+    def _begin_immediate(self, conn: sqlite3.Connection) -> None:
+        """Start a write transaction, counting time spent waiting on the lock.
+
+        Args:
+            conn: Connection to begin the transaction on
+        """
+        start = time.monotonic()
+        try:
+            # The span shows time spent waiting on the lock under busy_timeout
+            with span("begin_immediate", "storage"):
+                conn.execute("BEGIN IMMEDIATE")
+        finally:
+            self._add_busy_wait(time.monotonic() - start)
+
+    def wal_size_bytes(self) -> int:
+        """Return the current size of the write-ahead log file (0 if absent)."""
+        try:
+            return self.db_path.with_name(self.db_path.name + "-wal").stat().st_size
+        except OSError:
+            return 0
+
     def _retry_on_busy(
         self,
         operation: Callable[[], T],
@@ -136,6 +178,8 @@ class DatabaseConnectionMixin:
                 last_error = e
                 if "database is locked" in str(e).lower() or "busy" in str(e).lower():
                     if attempt < max_retries - 1:
+                        with self._busy_retries_lock:
+                            object.__setattr__(self, "_busy_retries", self._busy_retries + 1)
                         # Exponential backoff with jitter
                         jitter: float = (
                             delay * 0.1 * (hash(threading.current_thread().name) % 10) / 10
@@ -145,7 +189,9 @@ class DatabaseConnectionMixin:
                             f"SQLITE_BUSY detected (attempt {attempt + 1}/{max_retries}), "
                             f"retrying in {sleep_time:.3f}s"
                         )
-                        time.sleep(sleep_time)
+                        with span("sqlite_busy_retry", "storage", attempt=attempt + 1):
+                            time.sleep(sleep_time)
+                        self._add_busy_wait(sleep_time)
                         delay *= 2  # Exponential backoff
                     else:
                         logger.warning(f"SQLITE_BUSY retry exhausted after {max_retries} attempts")
@@ -1,12 +1,52 @@
 """Content CRUD operations for storage mixin."""
 
 import sqlite3
-from collections.abc import Sequence
+from collections.abc import Iterable, Iterator, Sequence
 from datetime import datetime
 
 from lookervault.exceptions import NotFoundError, StorageError
 from lookervault.storage.models import ContentItem, ContentType
+from lookervault.storage.schema import active_in_folders_sql
 from lookervault.utils import transaction_rollback
+from lookervault.utils.tracing import span
+
+# Insert a content item, or overwrite every column of the stored copy
+_UPSERT_CONTENT_SQL = """
+    INSERT INTO content_items (
+        id, content_type, name, owner_id, owner_email,
+        created_at, updated_at, synced_at, deleted_at,
+        content_size, content_data, folder_id
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(id, content_type) DO UPDATE SET
+        name = excluded.name,
+        owner_id = excluded.owner_id,
+        owner_email = excluded.owner_email,
+        created_at = excluded.created_at,
+        updated_at = excluded.updated_at,
+        synced_at = excluded.synced_at,
+        deleted_at = excluded.deleted_at,
+        content_size = excluded.content_size,
+        content_data = excluded.content_data,
+        folder_id = excluded.folder_id
+"""
+
+
+def _content_row(item: ContentItem) -> tuple[object, ...]:
+    """Bind parameters of _UPSERT_CONTENT_SQL for a content item."""
+    return (
+        item.id,
+        item.content_type,
+        item.name,
+        item.owner_id,
+        item.owner_email,
+        item.created_at.isoformat(),
+        item.updated_at.isoformat(),
+        item.synced_at.isoformat() if item.synced_at else None,
+        item.deleted_at.isoformat() if item.deleted_at else None,
+        item.content_size,
+        item.content_data,
+        item.folder_id,
+    )
 
 
 class ContentMixin:
@@ -45,51 +85,49 @@ class ContentMixin:
             try:
                 conn = self._get_connection()
                 # BEGIN IMMEDIATE: Acquire write lock immediately to prevent deadlocks
-                conn.execute("BEGIN IMMEDIATE")
+                self._begin_immediate(conn)
 
                 with transaction_rollback(conn):
                     cursor = conn.cursor()
 
-                    cursor.execute(
-                        """
-                        INSERT INTO content_items (
-                            id, content_type, name, owner_id, owner_email,
-                            created_at, updated_at, synced_at, deleted_at,
-                            content_size, content_data, folder_id
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                        ON CONFLICT(id, content_type) DO UPDATE SET
-                            name = excluded.name,
-                            owner_id = excluded.owner_id,
-                            owner_email = excluded.owner_email,
-                            created_at = excluded.created_at,
-                            updated_at = excluded.updated_at,
-                            synced_at = excluded.synced_at,
-                            deleted_at = excluded.deleted_at,
-                            content_size = excluded.content_size,
-                            content_data = excluded.content_data,
-                            folder_id = excluded.folder_id
-                    """,
-                        (
-                            item.id,
-                            item.content_type,
-                            item.name,
-                            item.owner_id,
-                            item.owner_email,
-                            item.created_at.isoformat(),
-                            item.updated_at.isoformat(),
-                            item.synced_at.isoformat() if item.synced_at else None,
-                            item.deleted_at.isoformat() if item.deleted_at else None,
-                            item.content_size,
-                            item.content_data,
-                            item.folder_id,
-                        ),
-                    )
+                    cursor.execute(_UPSERT_CONTENT_SQL, _content_row(item))
                     conn.commit()
             except sqlite3.Error as e:
                 raise StorageError(f"Failed to save content: {e}") from e
 
         # Retry operation on SQLITE_BUSY
-        self._retry_on_busy(_save_operation)
+        with span("save_content", "storage", content_id=item.id):
+            self._retry_on_busy(_save_operation)
+
+    def save_contents(self, items: Sequence[ContentItem]) -> None:
+        """Save or update many content items in a single transaction.
+
+        Same upsert as save_content(), but all items share one write lock and
+        one commit, so a page of items costs one fsync instead of one per item.
+
+        Args:
+            items: ContentItems to persist
+
+        Raises:
+            StorageError: If save fails after retries
+        """
+        if not items:
+            return
+        rows = [_content_row(item) for item in items]
+
+        def _save_operation() -> None:
+            try:
+                conn = self._get_connection()
+                self._begin_immediate(conn)
+
+                with transaction_rollback(conn):
+                    conn.executemany(_UPSERT_CONTENT_SQL, rows)
+                    conn.commit()
+            except sqlite3.Error as e:
+                raise StorageError(f"Failed to save content batch: {e}") from e
+
+        with span("save_contents", "storage", items=len(rows)):
+            self._retry_on_busy(_save_operation)
 
     def get_content(self, content_id: str) -> ContentItem | None:
         """Retrieve content by ID.
@@ -242,12 +280,43 @@ class ContentMixin:
         except sqlite3.Error as e:
             raise StorageError(f"Failed to count content: {e}") from e
 
-    def delete_content(self, content_id: str, soft: bool = True) -> None:
+    def get_average_content_sizes(self) -> dict[int, float]:
+        """Get the average stored payload size of each content type.
+
+        Returns:
+            ContentType enum value -> mean content_size in bytes of active items
+
+        Raises:
+            StorageError: If the query fails
+        """
+        try:
+            conn = self._get_connection()
+            cursor = conn.execute(
+                """
+                SELECT content_type, AVG(content_size) AS avg_size
+                FROM content_items
+                WHERE deleted_at IS NULL
+                GROUP BY content_type
+                """
+            )
+            return {
+                row["content_type"]: row["avg_size"]
+                for row in cursor.fetchall()
+                if row["avg_size"] is not None
+            }
+        except sqlite3.Error as e:
+            raise StorageError(f"Failed to get average content sizes: {e}") from e
+
+    def delete_content(
+        self, content_id: str, soft: bool = True, content_type: int | None = None
+    ) -> None:
         """Delete content item.
 
         Args:
             content_id: Unique content identifier
             soft: If True, soft delete. If False, hard delete.
+            content_type: Restrict deletion to this ContentType (IDs are only unique
+                per content type). If None, all items with this ID are deleted.
 
         Raises:
             NotFoundError: If content doesn't exist
@@ -256,17 +325,25 @@ class ContentMixin:
             conn = self._get_connection()
             cursor = conn.cursor()
 
+            type_clause = "" if content_type is None else " AND content_type = ?"
+            params: list[int | str] = [content_id]
+            if content_type is not None:
+                params.append(content_type)
+
             if soft:
                 cursor.execute(
-                    """
+                    f"""
                     UPDATE content_items
                     SET deleted_at = ?
-                    WHERE id = ?
+                    WHERE id = ?{type_clause}
                 """,
-                    (datetime.now().isoformat(), content_id),
+                    [datetime.now().isoformat(), *params],
                 )
             else:
-                cursor.execute("DELETE FROM content_items WHERE id = ?", (content_id,))
+                cursor.execute(
+                    f"DELETE FROM content_items WHERE id = ?{type_clause}",
+                    params,
+                )
 
             if cursor.rowcount == 0:
                 raise NotFoundError(f"Content not found: {content_id}")
@@ -275,6 +352,80 @@ class ContentMixin:
         except sqlite3.Error as e:
             raise StorageError(f"Failed to delete content: {e}") from e
 
+    def reconcile_deleted_content(
+        self,
+        content_type: int,
+        live_ids: Iterable[str],
+        folder_ids: set[str] | None = None,
+    ) -> int:
+        """Soft-delete stored items that are absent from a live id set.
+
+        Loads the live ids into a temporary table and anti-joins it against
+        content_items, so the set difference is computed by SQLite rather than
+        in Python. All tombstones are written in a single transaction.
+
+        Args:
+            content_type: ContentType enum value
+            live_ids: Complete set of IDs currently present in Looker
+            folder_ids: Restrict reconciliation to these folders (must match the
+                scope the live ids were swept with)
+
+        Returns:
+            Number of items soft-deleted
+
+        Raises:
+            StorageError: If reconciliation fails after retries
+        """
+        live_rows = [(str(content_id),) for content_id in live_ids]
+
+        def _reconcile_operation() -> int:
+            try:
+                conn = self._get_connection()
+                # BEGIN IMMEDIATE: Temp table load + bulk tombstone in one write transaction
+                conn.execute("BEGIN IMMEDIATE")
+
+                with transaction_rollback(conn):
+                    cursor = conn.cursor()
+
+                    cursor.execute(
+                        "CREATE TEMP TABLE IF NOT EXISTS reconcile_live_ids (id TEXT PRIMARY KEY)"
+                    )
+                    cursor.execute("DELETE FROM temp.reconcile_live_ids")
+                    cursor.executemany(
+                        "INSERT OR IGNORE INTO temp.reconcile_live_ids (id) VALUES (?)",
+                        live_rows,
+                    )
+
+                    table, scope = (
+                        active_in_folders_sql(content_type, len(folder_ids))
+                        if folder_ids
+                        else ("content_items", "content_type = ? AND deleted_at IS NULL")
+                    )
+                    query = f"""
+                        UPDATE {table}
+                        SET deleted_at = ?
+                        WHERE {scope}
+                          AND NOT EXISTS (
+                              SELECT 1 FROM temp.reconcile_live_ids live
+                              WHERE live.id = content_items.id
+                          )
+                    """
+                    params: list[int | str] = [datetime.now().isoformat(), content_type]
+                    if folder_ids:
+                        params.extend(folder_ids)
+
+                    cursor.execute(query, params)
+                    deleted_count = cursor.rowcount
+
+                    cursor.execute("DELETE FROM temp.reconcile_live_ids")
+                    conn.commit()
+                    return deleted_count
+            except sqlite3.Error as e:
+                raise StorageError(f"Failed to reconcile deleted content: {e}") from e
+
+        # Retry operation on SQLITE_BUSY
+        return self._retry_on_busy(_reconcile_operation)
+
     def get_content_ids(self, content_type: int) -> set[str]:
         """Get all content IDs for a content type (excluding deleted).
 
@@ -301,6 +452,79 @@ class ContentMixin:
         except sqlite3.Error as e:
             raise StorageError(f"Failed to get content IDs: {e}") from e
 
+    def get_content_index(
+        self, content_type: int, folder_ids: set[str] | None = None
+    ) -> dict[str, datetime]:
+        """Get a lightweight id -> updated_at index of active content.
+
+        Reads only the id and updated_at columns (never content_data), so the index
+        of a large vault can be loaded cheaply for change detection.
+
+        Args:
+            content_type: ContentType enum value
+            folder_ids: Optional folder scope (dashboards, looks, boards only)
+
+        Returns:
+            Dictionary mapping content ID to its stored updated_at timestamp
+        """
+        try:
+            conn = self._get_connection()
+            cursor = conn.cursor()
+
+            table, scope = (
+                active_in_folders_sql(content_type, len(folder_ids))
+                if folder_ids
+                else ("content_items", "content_type = ? AND deleted_at IS NULL")
+            )
+            query = f"""
+                SELECT id, updated_at
+                FROM {table}
+                WHERE {scope}
+            """
+            params: list[int | str] = [content_type]
+            if folder_ids:
+                params.extend(folder_ids)
+
+            cursor.execute(query, params)
+
+            return {row["id"]: datetime.fromisoformat(row["updated_at"]) for row in cursor}
+        except sqlite3.Error as e:
+            raise StorageError(f"Failed to get content index: {e}") from e
+
+    def iter_content_data(
+        self, content_type: int, page_size: int = 500
+    ) -> Iterator[list[tuple[str, bytes]]]:
+        """Stream (id, content_data) pairs of active content in pages.
+
+        Only the id and blob columns are read, and rows are fetched page by page
+        from a single cursor, so validating a large vault never holds more than
+        one page of blobs in memory.
+
+        Args:
+            content_type: ContentType enum value
+            page_size: Rows per yielded page
+
+        Yields:
+            Lists of (content_id, content_data) tuples
+
+        Raises:
+            StorageError: If the query fails
+        """
+        try:
+            conn = self._get_connection()
+            cursor = conn.execute(
+                """
+                SELECT id, content_data
+                FROM content_items
+                WHERE content_type = ? AND deleted_at IS NULL
+                """,
+                (content_type,),
+            )
+            while page := cursor.fetchmany(page_size):
+                yield [(row["id"], row["content_data"]) for row in page]
+        except sqlite3.Error as e:
+            raise StorageError(f"Failed to stream content data: {e}") from e
+
     def get_content_ids_in_folders(
         self, content_type: int, folder_ids: set[str], include_deleted: bool = False
     ) -> set[str]:
@@ -335,18 +559,20 @@ class ContentMixin:
 
             # Parameterized query to prevent SQL injection
             placeholders: str = ",".join(["?" for _ in folder_ids])
+            table, scope = (
+                ("content_items", f"content_type = ? AND folder_id IN ({placeholders})")
+                if include_deleted
+                else active_in_folders_sql(content_type, len(folder_ids))
+            )
             # ruff: noqa: S608
             query = f"""
                 SELECT id
-                FROM content_items
-                WHERE content_type = ? AND folder_id IN ({placeholders})
+                FROM {table}
+                WHERE {scope}
             """
 
             params: list[int | str] = [content_type, *folder_ids]
 
-            if not include_deleted:
-                query += " AND deleted_at IS NULL"
-
             cursor.execute(query, params)
 
             filtered_ids: set[str] = {row["id"] for row in cursor.fetchall()}
@@ -402,21 +628,23 @@ class ContentMixin:
 
             # Parameterized query to prevent SQL injection
             placeholders: str = ",".join(["?" for _ in folder_ids])
+            table, scope = (
+                ("content_items", f"content_type = ? AND folder_id IN ({placeholders})")
+                if include_deleted
+                else active_in_folders_sql(content_type, len(folder_ids))
+            )
             # ruff: noqa: S608
             query = f"""
                 SELECT id, content_type, name, owner_id, owner_email,
                        created_at, updated_at, synced_at, deleted_at,
                        content_size, content_data, folder_id
-                FROM content_items
-                WHERE content_type = ? AND folder_id IN ({placeholders})
+                FROM {table}
+                WHERE {scope}
             """
 
             # Construct params with content_type first, then folder_ids
             params: list[int | str] = [content_type, *folder_ids]
 
-            if not include_deleted:
-                query += " AND deleted_at IS NULL"
-
             query += " ORDER BY updated_at DESC"
 
             if limit is not None:
@@ -2,7 +2,7 @@
 
 import json
 import sqlite3
-from collections.abc import Sequence
+from collections.abc import Iterator, Sequence
 from datetime import datetime
 
 from lookervault.exceptions import NotFoundError, StorageError
@@ -280,3 +280,161 @@ class DeadLetterQueueMixin:
 
         # Retry operation on SQLITE_BUSY
         self._retry_on_busy(_delete_operation)
+
+    @staticmethod
+    def _row_to_dead_letter_item(row: sqlite3.Row) -> DeadLetterItem:
+        """Build a DeadLetterItem from a dead_letter_queue row."""
+        return DeadLetterItem(
+            id=row["id"],
+            session_id=row["session_id"],
+            content_id=row["content_id"],
+            content_type=row["content_type"],
+            content_data=row["content_data"],
+            error_message=row["error_message"],
+            error_type=row["error_type"],
+            stack_trace=row["stack_trace"],
+            retry_count=row["retry_count"],
+            failed_at=datetime.fromisoformat(row["failed_at"]),
+            metadata=json.loads(row["metadata"]) if row["metadata"] else None,
+        )
+
+    def iter_dead_letter_pages(
+        self,
+        session_id: str | None = None,
+        content_type: int | None = None,
+        error_types: Sequence[str] | None = None,
+        page_size: int = 500,
+    ) -> Iterator[list[DeadLetterItem]]:
+        """Stream DLQ entries in pages ordered by ID.
+
+        Uses keyset pagination (``id > last_id``), so entries may be deleted or
+        updated between pages without skipping or repeating any.
+
+        Args:
+            session_id: Optional session filter
+            content_type: Optional content type filter
+            error_types: Optional error type filter (e.g. ["RateLimitError"])
+            page_size: Maximum entries per page
+
+        Yields:
+            Non-empty pages of DeadLetterItem objects
+
+        Raises:
+            StorageError: If a query fails
+        """
+        query = """
+            SELECT id, session_id, content_id, content_type, content_data,
+                   error_message, error_type, stack_trace, retry_count,
+                   failed_at, metadata
+            FROM dead_letter_queue
+            WHERE id > ?
+        """
+        filters: list[int | str] = []
+
+        if session_id is not None:
+            query += " AND session_id = ?"
+            filters.append(session_id)
+
+        if content_type is not None:
+            query += " AND content_type = ?"
+            filters.append(content_type)
+
+        if error_types is not None:
+            if not error_types:
+                return
+            query += f" AND error_type IN ({','.join('?' for _ in error_types)})"  # noqa: S608
+            filters.extend(error_types)
+
+        query += " ORDER BY id LIMIT ?"
+
+        last_id = 0
+        while True:
+            try:
+                conn = self._get_connection()
+                rows = conn.execute(query, [last_id, *filters, page_size]).fetchall()
+            except sqlite3.Error as e:
+                raise StorageError(f"Failed to list dead letter items: {e}") from e
+
+            if not rows:
+                return
+            yield [self._row_to_dead_letter_item(row) for row in rows]
+            last_id = rows[-1]["id"]
+
+    def delete_dead_letter_items(self, dlq_ids: Sequence[int]) -> int:
+        """Delete many DLQ entries in a single transaction.
+
+        Args:
+            dlq_ids: Dead letter queue entry IDs (missing IDs are ignored)
+
+        Returns:
+            Number of entries deleted
+
+        Raises:
+            StorageError: If deletion fails after retries
+        """
+        if not dlq_ids:
+            return 0
+
+        def _delete_operation() -> int:
+            try:
+                conn = self._get_connection()
+                conn.execute("BEGIN IMMEDIATE")
+
+                with transaction_rollback(conn):
+                    cursor = conn.executemany(
+                        "DELETE FROM dead_letter_queue WHERE id = ?",
+                        [(dlq_id,) for dlq_id in dlq_ids],
+                    )
+                    deleted: int = cursor.rowcount
+                    conn.commit()
+                    return deleted
+            except sqlite3.Error as e:
+                raise StorageError(f"Failed to delete dead letter items: {e}") from e
+
+        return self._retry_on_busy(_delete_operation)
+
+    def record_dead_letter_retries(self, failures: Sequence[tuple[int, str, str]]) -> None:
+        """Record failed retries of DLQ entries in a single transaction.
+
+        Increments retry_count and stores the latest error for each entry. If the
+        bumped retry_count collides with another entry for the same item
+        (UNIQUE(session_id, content_id, content_type, retry_count)), the older
+        duplicate is replaced.
+
+        Args:
+            failures: (dlq_id, error_message, error_type) tuples
+
+        Raises:
+            StorageError: If the update fails after retries
+        """
+        if not failures:
+            return
+
+        failed_at = datetime.now().isoformat()
+        rows = [
+            (error_message, error_type, failed_at, dlq_id)
+            for dlq_id, error_message, error_type in failures
+        ]
+
+        def _update_operation() -> None:
+            try:
+                conn = self._get_connection()
+                conn.execute("BEGIN IMMEDIATE")
+
+                with transaction_rollback(conn):
+                    conn.executemany(
+                        """
+                        UPDATE OR REPLACE dead_letter_queue
+                        SET retry_count = retry_count + 1,
+                            error_message = ?,
+                            error_type = ?,
+                            failed_at = ?
+                        WHERE id = ?
+                        """,
+                        rows,
+                    )
+                    conn.commit()
+            except sqlite3.Error as e:
+                raise StorageError(f"Failed to record dead letter retries: {e}") from e
+
+        self._retry_on_busy(_update_operation)
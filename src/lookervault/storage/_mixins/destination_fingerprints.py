@@ -0,0 +1,126 @@
+"""Destination content fingerprint operations for storage mixin."""
+
+import sqlite3
+from datetime import datetime
+
+from lookervault.exceptions import StorageError
+from lookervault.utils import transaction_rollback
+
+
+class DestinationFingerprintsMixin:
+    """Mixin caching fingerprints of content known to be on a destination.
+
+    A fingerprint is a hash of an item's writable fields (see
+    lookervault.restoration.fingerprint). Restores that skip unchanged content
+    record the fingerprint of what the destination holds after each restore,
+    so repeated runs against the same destination can skip identical items
+    without fetching them.
+    """
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Get thread-local database connection."""
+        raise NotImplementedError("Subclass must implement _get_connection")
+
+    def get_destination_fingerprint(
+        self, destination: str, content_type: int, content_id: str
+    ) -> str | None:
+        """Get the cached fingerprint of a destination item.
+
+        Args:
+            destination: Destination Looker instance URL
+            content_type: ContentType enum value
+            content_id: Item ID in the destination instance
+
+        Returns:
+            Fingerprint if cached, None otherwise
+
+        Raises:
+            StorageError: If the query fails
+        """
+        try:
+            conn = self._get_connection()
+            cursor = conn.execute(
+                """
+                SELECT fingerprint FROM destination_fingerprints
+                WHERE destination = ? AND content_type = ? AND content_id = ?
+                """,
+                (destination, content_type, content_id),
+            )
+            row = cursor.fetchone()
+            return row["fingerprint"] if row else None
+        except sqlite3.Error as e:
+            raise StorageError(f"Failed to get destination fingerprint: {e}") from e
+
+    def save_destination_fingerprint(
+        self, destination: str, content_type: int, content_id: str, fingerprint: str
+    ) -> None:
+        """Record the fingerprint of a destination item (replacing any previous one).
+
+        Args:
+            destination: Destination Looker instance URL
+            content_type: ContentType enum value
+            content_id: Item ID in the destination instance
+            fingerprint: Fingerprint of the item's writable fields
+
+        Raises:
+            StorageError: If save fails after retries
+        """
+
+        def _save_operation() -> None:
+            try:
+                conn = self._get_connection()
+                conn.execute("BEGIN IMMEDIATE")
+
+                with transaction_rollback(conn):
+                    conn.execute(
+                        """
+                        INSERT OR REPLACE INTO destination_fingerprints (
+                            destination, content_type, content_id, fingerprint, recorded_at
+                        ) VALUES (?, ?, ?, ?, ?)
+                        """,
+                        (
+                            destination,
+                            content_type,
+                            content_id,
+                            fingerprint,
+                            datetime.now().isoformat(),
+                        ),
+                    )
+                    conn.commit()
+            except sqlite3.Error as e:
+                raise StorageError(f"Failed to save destination fingerprint: {e}") from e
+
+        self._retry_on_busy(_save_operation)
+
+    def clear_destination_fingerprints(self, destination: str | None = None) -> int:
+        """Delete cached fingerprints, forcing the next restore to re-check items.
+
+        Args:
+            destination: Only clear this destination's fingerprints (default: all)
+
+        Returns:
+            Number of fingerprints deleted
+
+        Raises:
+            StorageError: If delete fails after retries
+        """
+
+        def _clear_operation() -> int:
+            try:
+                conn = self._get_connection()
+                conn.execute("BEGIN IMMEDIATE")
+
+                with transaction_rollback(conn):
+                    if destination is None:
+                        cursor = conn.execute("DELETE FROM destination_fingerprints")
+                    else:
+                        cursor = conn.execute(
+                            "DELETE FROM destination_fingerprints WHERE destination = ?",
+                            (destination,),
+                        )
+                    conn.commit()
+                    return cursor.rowcount
+            except sqlite3.Error as e:
+                raise StorageError(f"Failed to clear destination fingerprints: {e}") from e
+
+        return self._retry_on_busy(_clear_operation)
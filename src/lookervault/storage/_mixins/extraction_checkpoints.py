@@ -134,6 +134,39 @@ class ExtractionCheckpointsMixin:
         except sqlite3.Error as e:
             raise StorageError(f"Failed to get checkpoint: {e}") from e
 
+    def get_last_page_size(self, content_type: int) -> int | None:
+        """Get the most recently recorded adaptive page size for a content type.
+
+        Looks at checkpoints from any session (complete or not), so both resumes
+        and new runs start from the last tuned size instead of the configured default.
+
+        Args:
+            content_type: ContentType enum value
+
+        Returns:
+            Last recorded page size, or None if no checkpoint recorded one
+        """
+        try:
+            conn = self._get_connection()
+            cursor = conn.cursor()
+
+            cursor.execute(
+                """
+                SELECT json_extract(checkpoint_data, '$.page_size') AS page_size
+                FROM sync_checkpoints
+                WHERE content_type = ?
+                  AND json_extract(checkpoint_data, '$.page_size') IS NOT NULL
+                ORDER BY started_at DESC
+                LIMIT 1
+            """,
+                (content_type,),
+            )
+
+            row = cursor.fetchone()
+            return int(row["page_size"]) if row else None
+        except sqlite3.Error as e:
+            raise StorageError(f"Failed to get last page size: {e}") from e
+
     def update_checkpoint(self, checkpoint: Checkpoint) -> None:
         """Update existing checkpoint with thread-safe transaction control.
 
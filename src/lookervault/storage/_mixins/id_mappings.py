@@ -66,6 +66,58 @@ class IDMappingsMixin:
         # Retry operation on SQLITE_BUSY
         self._retry_on_busy(_save_operation)
 
+    def save_id_mappings(self, mappings: Sequence[IDMapping]) -> None:
+        """Save a batch of ID mappings in a single transaction.
+
+        Used by write-behind caches to persist many mappings with one commit
+        instead of one commit per created item.
+
+        Args:
+            mappings: IDMapping objects to persist (later entries win on conflict)
+
+        Raises:
+            StorageError: If save fails after retries
+        """
+        if not mappings:
+            return
+
+        rows = [
+            (
+                mapping.source_instance,
+                mapping.content_type,
+                mapping.source_id,
+                mapping.destination_id,
+                mapping.created_at.isoformat(),
+                mapping.session_id,
+            )
+            for mapping in mappings
+        ]
+
+        def _save_operation() -> None:
+            try:
+                conn = self._get_connection()
+                conn.execute("BEGIN IMMEDIATE")
+
+                with transaction_rollback(conn):
+                    conn.executemany(
+                        """
+                        INSERT INTO id_mappings (
+                            source_instance, content_type, source_id,
+                            destination_id, created_at, session_id
+                        ) VALUES (?, ?, ?, ?, ?, ?)
+                        ON CONFLICT(source_instance, content_type, source_id) DO UPDATE SET
+                            destination_id = excluded.destination_id,
+                            created_at = excluded.created_at,
+                            session_id = excluded.session_id
+                        """,
+                        rows,
+                    )
+                    conn.commit()
+            except sqlite3.Error as e:
+                raise StorageError(f"Failed to save ID mappings: {e}") from e
+
+        self._retry_on_busy(_save_operation)
+
     def get_id_mapping(
         self, source_instance: str, content_type: int, source_id: str
     ) -> IDMapping | None:
@@ -177,6 +229,33 @@ class IDMappingsMixin:
         except sqlite3.Error as e:
             raise StorageError(f"Failed to batch get mappings: {e}") from e
 
+    def load_id_mappings(self, source_instance: str, content_type: int) -> dict[str, str]:
+        """Load every mapping for a source instance and content type.
+
+        Bulk counterpart of batch_get_mappings() for preloading caches: one
+        primary-key range scan instead of a query per lookup.
+
+        Args:
+            source_instance: Source Looker instance URL
+            content_type: ContentType enum value
+
+        Returns:
+            Dictionary mapping source_id -> destination_id
+        """
+        try:
+            conn = self._get_connection()
+            cursor = conn.execute(
+                """
+                SELECT source_id, destination_id
+                FROM id_mappings
+                WHERE source_instance = ? AND content_type = ?
+                """,
+                (source_instance, content_type),
+            )
+            return {row["source_id"]: row["destination_id"] for row in cursor.fetchall()}
+        except sqlite3.Error as e:
+            raise StorageError(f"Failed to load ID mappings: {e}") from e
+
     def clear_mappings(
         self, source_instance: str | None = None, content_type: int | None = None
     ) -> int:
@@ -0,0 +1,154 @@
+"""Per-item restoration progress operations for storage mixin."""
+
+import sqlite3
+from collections.abc import Iterable, Sequence
+from datetime import datetime
+
+from lookervault.exceptions import StorageError
+from lookervault.storage.schema import active_in_folders_sql
+from lookervault.utils import transaction_rollback
+
+# Progress statuses that mark an item as done for resume purposes.
+# "failed" entries are recorded for bookkeeping but are retried on resume.
+COMPLETED_PROGRESS_STATUSES = ("created", "updated", "success", "skipped")
+
+
+class RestorationProgressMixin:
+    """Mixin providing the append-only restoration progress log.
+
+    Each restored item is recorded once as a compact
+    (session_id, content_type, content_id, status) row, so resume can rebuild
+    the remaining work with a single anti-join against content_items instead
+    of re-reading ever-growing completed_ids lists from checkpoints.
+    """
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Get thread-local database connection."""
+        raise NotImplementedError("Subclass must implement _get_connection")
+
+    def record_restoration_progress(self, entries: Sequence[tuple[str, int, str, str]]) -> None:
+        """Record a batch of per-item restoration outcomes in one transaction.
+
+        Re-recording an item (e.g. a failed item retried on resume) replaces its
+        previous status.
+
+        Args:
+            entries: (session_id, content_type, content_id, status) tuples
+
+        Raises:
+            StorageError: If the write fails after retries
+        """
+        if not entries:
+            return
+
+        recorded_at = datetime.now().isoformat()
+        rows = [
+            (session_id, content_type, content_id, status, recorded_at)
+            for session_id, content_type, content_id, status in entries
+        ]
+
+        def _record_operation() -> None:
+            try:
+                conn = self._get_connection()
+                conn.execute("BEGIN IMMEDIATE")
+
+                with transaction_rollback(conn):
+                    conn.executemany(
+                        """
+                        INSERT OR REPLACE INTO restoration_progress (
+                            session_id, content_type, content_id, status, recorded_at
+                        ) VALUES (?, ?, ?, ?, ?)
+                        """,
+                        rows,
+                    )
+                    conn.commit()
+            except sqlite3.Error as e:
+                raise StorageError(f"Failed to record restoration progress: {e}") from e
+
+        self._retry_on_busy(_record_operation)
+
+    def get_remaining_content_ids(
+        self,
+        session_id: str,
+        content_type: int,
+        folder_ids: Iterable[str] | None = None,
+    ) -> list[str]:
+        """Get stored content IDs not yet completed in a restoration session.
+
+        Uses a single anti-join of content_items against restoration_progress.
+        Items whose last recorded status is "failed" count as remaining.
+
+        Args:
+            session_id: Restoration session identifier
+            content_type: ContentType enum value
+            folder_ids: Optional folder scope (dashboards, looks and boards only)
+
+        Returns:
+            Remaining content IDs (soft-deleted items excluded)
+
+        Raises:
+            StorageError: If the query fails
+        """
+        folder_list = list(folder_ids) if folder_ids is not None else None
+        if folder_list is not None and not folder_list:
+            return []
+
+        status_placeholders = ",".join("?" for _ in COMPLETED_PROGRESS_STATUSES)
+        table, scope = (
+            active_in_folders_sql(content_type, len(folder_list), alias="c")
+            if folder_list is not None
+            else ("content_items c", "c.content_type = ? AND c.deleted_at IS NULL")
+        )
+        query = f"""
+            SELECT c.id
+            FROM {table}
+            WHERE {scope}
+              AND NOT EXISTS (
+                  SELECT 1 FROM restoration_progress p
+                  WHERE p.session_id = ?
+                    AND p.content_type = c.content_type
+                    AND p.content_id = c.id
+                    AND p.status IN ({status_placeholders})
+              )
+        """  # noqa: S608
+        params: list[int | str] = [
+            content_type,
+            *(folder_list or []),
+            session_id,
+            *COMPLETED_PROGRESS_STATUSES,
+        ]
+
+        try:
+            conn = self._get_connection()
+            cursor = conn.execute(query, params)
+            return [row["id"] for row in cursor.fetchall()]
+        except sqlite3.Error as e:
+            raise StorageError(f"Failed to get remaining content IDs: {e}") from e
+
+    def count_restoration_progress(self, session_id: str, content_type: int) -> int:
+        """Count items recorded as completed in a restoration session.
+
+        Args:
+            session_id: Restoration session identifier
+            content_type: ContentType enum value
+
+        Returns:
+            Number of completed items for the session and content type
+
+        Raises:
+            StorageError: If the query fails
+        """
+        status_placeholders = ",".join("?" for _ in COMPLETED_PROGRESS_STATUSES)
+        try:
+            conn = self._get_connection()
+            cursor = conn.execute(
+                f"""
+                SELECT COUNT(*) FROM restoration_progress
+                WHERE session_id = ? AND content_type = ?
+                  AND status IN ({status_placeholders})
+                """,  # noqa: S608
+                (session_id, content_type, *COMPLETED_PROGRESS_STATUSES),
+            )
+            return int(cursor.fetchone()[0])
+        except sqlite3.Error as e:
+            raise StorageError(f"Failed to count restoration progress: {e}") from e
@@ -0,0 +1,90 @@
+"""Historical restore latency operations for storage mixin."""
+
+import sqlite3
+from datetime import datetime
+
+from lookervault.exceptions import StorageError
+from lookervault.utils import transaction_rollback
+
+
+class RestoreLatencyMixin:
+    """Mixin recording how long restoring an item of each content type takes.
+
+    Every restore run adds its per-item timings to running totals kept per
+    destination and content type. The restore planner turns them into mean
+    per-item latencies when estimating how long a restore will take.
+    """
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Get thread-local database connection."""
+        raise NotImplementedError("Subclass must implement _get_connection")
+
+    def record_restore_latency(
+        self, destination: str, content_type: int, samples: int, total_ms: float
+    ) -> None:
+        """Add restored items' timings to a content type's latency history.
+
+        Args:
+            destination: Destination Looker instance URL
+            content_type: ContentType enum value
+            samples: Number of items restored
+            total_ms: Summed per-item restore time in milliseconds
+
+        Raises:
+            StorageError: If save fails after retries
+        """
+        if samples <= 0:
+            return
+
+        def _record_operation() -> None:
+            try:
+                conn = self._get_connection()
+                conn.execute("BEGIN IMMEDIATE")
+
+                with transaction_rollback(conn):
+                    conn.execute(
+                        """
+                        INSERT INTO restore_latency (
+                            destination, content_type, samples, total_ms, updated_at
+                        ) VALUES (?, ?, ?, ?, ?)
+                        ON CONFLICT (destination, content_type) DO UPDATE SET
+                            samples = samples + excluded.samples,
+                            total_ms = total_ms + excluded.total_ms,
+                            updated_at = excluded.updated_at
+                        """,
+                        (destination, content_type, samples, total_ms, datetime.now().isoformat()),
+                    )
+                    conn.commit()
+            except sqlite3.Error as e:
+                raise StorageError(f"Failed to record restore latency: {e}") from e
+
+        self._retry_on_busy(_record_operation)
+
+    def get_restore_latencies(self, destination: str | None = None) -> dict[int, float]:
+        """Get the mean historical per-item restore latency of each content type.
+
+        Args:
+            destination: Only use this destination's history (default: all destinations)
+
+        Returns:
+            ContentType enum value -> mean milliseconds per restored item
+
+        Raises:
+            StorageError: If the query fails
+        """
+        try:
+            conn = self._get_connection()
+            query = """
+                SELECT content_type, SUM(total_ms) / SUM(samples) AS mean_ms
+                FROM restore_latency
+            """
+            params: tuple[str, ...] = ()
+            if destination is not None:
+                query += " WHERE destination = ?"
+                params = (destination,)
+            query += " GROUP BY content_type"
+
+            cursor = conn.execute(query, params)
+            return {row["content_type"]: row["mean_ms"] for row in cursor.fetchall()}
+        except sqlite3.Error as e:
+            raise StorageError(f"Failed to get restore latencies: {e}") from e
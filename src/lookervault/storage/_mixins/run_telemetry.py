@@ -0,0 +1,142 @@
+"""Run telemetry operations for storage mixin."""
+
+import json
+import sqlite3
+from datetime import datetime
+
+from lookervault.exceptions import StorageError
+from lookervault.storage.models import RunTelemetry
+from lookervault.utils import transaction_rollback
+
+
+class RunTelemetryMixin:
+    """Mixin recording per-run performance telemetry.
+
+    One row is appended per extraction or restoration run. The auto-tuner
+    reads recent rows for the same operation and Looker instance to pick
+    settings for the next run; perf history compares the latest row against
+    earlier ones to flag regressions.
+    """
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Get thread-local database connection."""
+        raise NotImplementedError("Subclass must implement _get_connection")
+
+    def save_run_telemetry(self, telemetry: RunTelemetry) -> int:
+        """Append one run's telemetry.
+
+        Args:
+            telemetry: RunTelemetry to persist
+
+        Returns:
+            Row ID of the saved telemetry
+
+        Raises:
+            StorageError: If save fails after retries
+        """
+        details = {
+            "items_by_type": {str(k): v for k, v in telemetry.items_by_type.items()},
+            "avg_payload_bytes": {str(k): v for k, v in telemetry.avg_payload_bytes.items()},
+            "seconds_by_type": {str(k): v for k, v in telemetry.seconds_by_type.items()},
+            "bytes_transferred": telemetry.bytes_transferred,
+            "peak_rss_bytes": telemetry.peak_rss_bytes,
+        }
+
+        def _save_operation() -> int:
+            try:
+                conn = self._get_connection()
+                conn.execute("BEGIN IMMEDIATE")
+
+                with transaction_rollback(conn):
+                    cursor = conn.execute(
+                        """
+                        INSERT INTO run_telemetry (
+                            operation, instance, session_id, recorded_at, workers,
+                            batch_size, rate_limit_per_minute, rate_limit_per_second,
+                            duration_seconds, total_items, api_calls, rate_limit_429s,
+                            rate_limit_wait_seconds, busy_retries, error_count, details
+                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                        """,
+                        (
+                            telemetry.operation,
+                            telemetry.instance,
+                            telemetry.session_id,
+                            telemetry.recorded_at.isoformat(),
+                            telemetry.workers,
+                            telemetry.batch_size,
+                            telemetry.rate_limit_per_minute,
+                            telemetry.rate_limit_per_second,
+                            telemetry.duration_seconds,
+                            telemetry.total_items,
+                            telemetry.api_calls,
+                            telemetry.rate_limit_429s,
+                            telemetry.rate_limit_wait_seconds,
+                            telemetry.busy_retries,
+                            telemetry.error_count,
+                            json.dumps(details),
+                        ),
+                    )
+                    conn.commit()
+                    return cursor.lastrowid or 0
+            except sqlite3.Error as e:
+                raise StorageError(f"Failed to save run telemetry: {e}") from e
+
+        return self._retry_on_busy(_save_operation)
+
+    def list_run_telemetry(
+        self, operation: str, instance: str | None = None, limit: int = 50
+    ) -> list[RunTelemetry]:
+        """List the most recent runs of an operation, newest first.
+
+        Args:
+            operation: "extract" or "restore"
+            instance: Only runs against this Looker instance (default: any instance)
+            limit: Maximum number of runs returned
+
+        Returns:
+            RunTelemetry rows ordered by recorded_at descending
+
+        Raises:
+            StorageError: If the query fails
+        """
+        try:
+            conn = self._get_connection()
+            query = "SELECT * FROM run_telemetry WHERE operation = ?"
+            params: list[str | int] = [operation]
+            if instance is not None:
+                query += " AND instance = ?"
+                params.append(instance)
+            query += " ORDER BY recorded_at DESC, id DESC LIMIT ?"
+            params.append(limit)
+
+            cursor = conn.execute(query, params)
+            return [self._row_to_run_telemetry(row) for row in cursor.fetchall()]
+        except sqlite3.Error as e:
+            raise StorageError(f"Failed to list run telemetry: {e}") from e
+
+    @staticmethod
+    def _row_to_run_telemetry(row: sqlite3.Row) -> RunTelemetry:
+        details = json.loads(row["details"]) if row["details"] else {}
+        return RunTelemetry(
+            id=row["id"],
+            operation=row["operation"],
+            instance=row["instance"],
+            session_id=row["session_id"],
+            recorded_at=datetime.fromisoformat(row["recorded_at"]),
+            workers=row["workers"],
+            batch_size=row["batch_size"],
+            rate_limit_per_minute=row["rate_limit_per_minute"],
+            rate_limit_per_second=row["rate_limit_per_second"],
+            duration_seconds=row["duration_seconds"],
+            total_items=row["total_items"],
+            api_calls=row["api_calls"],
+            rate_limit_429s=row["rate_limit_429s"],
+            rate_limit_wait_seconds=row["rate_limit_wait_seconds"],
+            busy_retries=row["busy_retries"],
+            error_count=row["error_count"],
+            items_by_type={int(k): v for k, v in details.get("items_by_type", {}).items()},
+            avg_payload_bytes={int(k): v for k, v in details.get("avg_payload_bytes", {}).items()},
+            seconds_by_type={int(k): v for k, v in details.get("seconds_by_type", {}).items()},
+            bytes_transferred=details.get("bytes_transferred", 0),
+            peak_rss_bytes=details.get("peak_rss_bytes", 0),
+        )
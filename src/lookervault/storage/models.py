@@ -274,6 +274,56 @@ class RestorationSummary:
     error_breakdown: dict[str, int]  # Error type -> count
 
 
+@dataclass
+class RunTelemetry:
+    """Performance telemetry of one extraction or restoration run.
+
+    Recorded at the end of every parallel run and read back by the
+    auto-tuner to choose workers, batch size and rate limits for the next run,
+    and by ``lookervault perf history`` to detect performance regressions.
+    """
+
+    operation: str  # "extract" or "restore"
+    instance: str  # Looker instance URL the run talked to
+    workers: int
+    duration_seconds: float
+    total_items: int
+    session_id: str | None = None
+    batch_size: int | None = None
+    rate_limit_per_minute: int | None = None
+    rate_limit_per_second: int | None = None
+    api_calls: int = 0
+    rate_limit_429s: int = 0
+    rate_limit_wait_seconds: float = 0.0
+    busy_retries: int = 0
+    error_count: int = 0
+    items_by_type: dict[int, int] = field(default_factory=dict)  # ContentType -> count
+    avg_payload_bytes: dict[int, float] = field(default_factory=dict)  # ContentType -> bytes
+    seconds_by_type: dict[int, float] = field(default_factory=dict)  # ContentType -> seconds
+    bytes_transferred: int = 0  # Serialized payload bytes extracted or restored
+    peak_rss_bytes: int = 0  # Peak resident memory of the process
+    recorded_at: datetime = field(default_factory=datetime.now)
+    id: int | None = None
+
+    @property
+    def items_per_second(self) -> float:
+        """Average throughput of the run."""
+        return self.total_items / self.duration_seconds if self.duration_seconds > 0 else 0.0
+
+    @property
+    def rate_limit_429_ratio(self) -> float:
+        """Fraction of API calls answered with HTTP 429."""
+        return self.rate_limit_429s / self.api_calls if self.api_calls else 0.0
+
+    def items_per_second_by_type(self) -> dict[int, float]:
+        """Throughput of each content type that has a recorded duration."""
+        return {
+            content_type: self.items_by_type.get(content_type, 0) / seconds
+            for content_type, seconds in self.seconds_by_type.items()
+            if seconds > 0
+        }
+
+
 class DependencyOrder(IntEnum):
     """Defines restoration order based on Looker resource dependencies.
 
@@ -12,25 +12,31 @@ a unified API while keeping the implementation organized and maintainable.
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from collections.abc import Sequence
+from collections.abc import Iterable, Iterator, Sequence
 from datetime import datetime
 from typing import TypeVar
 
 from lookervault.storage._mixins.base import DatabaseConnectionMixin
 from lookervault.storage._mixins.content import ContentMixin
 from lookervault.storage._mixins.dead_letter_queue import DeadLetterQueueMixin
+from lookervault.storage._mixins.destination_fingerprints import DestinationFingerprintsMixin
 from lookervault.storage._mixins.extraction_checkpoints import ExtractionCheckpointsMixin
 from lookervault.storage._mixins.extraction_sessions import ExtractionSessionsMixin
 from lookervault.storage._mixins.id_mappings import IDMappingsMixin
 from lookervault.storage._mixins.restoration_checkpoints import RestorationCheckpointsMixin
+from lookervault.storage._mixins.restoration_progress import RestorationProgressMixin
 from lookervault.storage._mixins.restoration_sessions import RestorationSessionsMixin
+from lookervault.storage._mixins.restore_latency import RestoreLatencyMixin
+from lookervault.storage._mixins.run_telemetry import RunTelemetryMixin
 from lookervault.storage._mixins.utils import StorageUtilsMixin
 from lookervault.storage.models import (
     Checkpoint,
     ContentItem,
     DeadLetterItem,
     ExtractionSession,
+    IDMapping,
     RestorationCheckpoint,
+    RunTelemetry,
 )
 
 T = TypeVar("T")
@@ -72,6 +78,21 @@ class ContentRepository(ABC):
         """
         ...
 
+    @abstractmethod
+    def save_contents(self, items: Sequence[ContentItem]) -> None:
+        """Save or update many content items in a single transaction.
+
+        Equivalent to calling save_content() for each item, but the whole batch is
+        written under one lock and one commit.
+
+        Args:
+            items: ContentItem objects to persist
+
+        Raises:
+            StorageError: If the batch cannot be saved; no item of the batch is kept.
+        """
+        ...
+
     @abstractmethod
     def get_content(self, content_id: str) -> ContentItem | None:
         """Retrieve a specific content item from the storage repository by its unique identifier.
@@ -195,7 +216,14 @@ class ContentRepository(ABC):
         ...
 
     @abstractmethod
-    def delete_content(self, content_id: str, soft: bool = True) -> None:
+    def get_average_content_sizes(self) -> dict[int, float]:
+        """Get the average stored payload size in bytes of each content type."""
+        ...
+
+    @abstractmethod
+    def delete_content(
+        self, content_id: str, soft: bool = True, content_type: int | None = None
+    ) -> None:
         """Delete a content item from the storage repository.
 
         This method provides two deletion strategies:
@@ -212,6 +240,8 @@ class ContentRepository(ABC):
             soft: Deletion strategy flag:
                   - True (default): Performs a soft delete by setting a deletion timestamp
                   - False: Permanently removes the content item from the database
+            content_type: Optional ContentType value restricting the deletion. IDs are
+                  only unique per content type, so callers that know the type should pass it.
 
         Raises:
             NotFoundError: If no content item is found with the specified content_id.
@@ -305,6 +335,18 @@ class ContentRepository(ABC):
         """
         ...
 
+    @abstractmethod
+    def get_last_page_size(self, content_type: int) -> int | None:
+        """Get the most recently recorded adaptive page size for a content type.
+
+        Args:
+            content_type: ContentType enum value
+
+        Returns:
+            Last recorded page size, or None if no checkpoint recorded one
+        """
+        ...
+
     @abstractmethod
     def update_checkpoint(self, checkpoint: Checkpoint) -> None:
         """Update existing checkpoint.
@@ -351,6 +393,47 @@ class ContentRepository(ABC):
         """
         ...
 
+    @abstractmethod
+    def reconcile_deleted_content(
+        self,
+        content_type: int,
+        live_ids: Iterable[str],
+        folder_ids: set[str] | None = None,
+    ) -> int:
+        """Soft-delete stored items that are absent from a live id set.
+
+        Args:
+            content_type: ContentType enum value
+            live_ids: Complete set of IDs currently present in Looker
+            folder_ids: Restrict reconciliation to these folders
+
+        Returns:
+            Number of items soft-deleted
+        """
+        ...
+
+    @abstractmethod
+    def get_content_index(
+        self, content_type: int, folder_ids: set[str] | None = None
+    ) -> dict[str, datetime]:
+        """Get id -> updated_at index of active content for change detection.
+
+        Args:
+            content_type: ContentType enum value
+            folder_ids: Optional folder scope (dashboards, looks, boards only)
+
+        Returns:
+            Dictionary mapping content ID to stored updated_at timestamp
+        """
+        ...
+
+    @abstractmethod
+    def iter_content_data(
+        self, content_type: int, page_size: int = 500
+    ) -> Iterator[list[tuple[str, bytes]]]:
+        """Stream (id, content_data) pairs of active content in pages."""
+        ...
+
     @abstractmethod
     def get_content_ids_in_folders(
         self, content_type: int, folder_ids: set[str], include_deleted: bool = False
@@ -444,6 +527,27 @@ class ContentRepository(ABC):
         """Count DLQ entries matching filters."""
         ...
 
+    @abstractmethod
+    def iter_dead_letter_pages(
+        self,
+        session_id: str | None = None,
+        content_type: int | None = None,
+        error_types: Sequence[str] | None = None,
+        page_size: int = 500,
+    ) -> Iterator[list[DeadLetterItem]]:
+        """Stream DLQ entries matching filters in pages ordered by ID."""
+        ...
+
+    @abstractmethod
+    def delete_dead_letter_items(self, dlq_ids: Sequence[int]) -> int:
+        """Delete many DLQ entries in a single transaction."""
+        ...
+
+    @abstractmethod
+    def record_dead_letter_retries(self, failures: Sequence[tuple[int, str, str]]) -> None:
+        """Bump retry_count and store the latest error for many DLQ entries."""
+        ...
+
     # Restoration checkpoint methods
     @abstractmethod
     def save_restoration_checkpoint(self, checkpoint: RestorationCheckpoint) -> int:
@@ -457,6 +561,79 @@ class ContentRepository(ABC):
         """Get most recent incomplete checkpoint for content type."""
         ...
 
+    # Restoration progress methods
+    @abstractmethod
+    def record_restoration_progress(self, entries: Sequence[tuple[str, int, str, str]]) -> None:
+        """Record a batch of (session_id, content_type, content_id, status) outcomes."""
+        ...
+
+    @abstractmethod
+    def get_remaining_content_ids(
+        self,
+        session_id: str,
+        content_type: int,
+        folder_ids: Iterable[str] | None = None,
+    ) -> list[str]:
+        """Get stored content IDs not yet completed in a restoration session."""
+        ...
+
+    @abstractmethod
+    def count_restoration_progress(self, session_id: str, content_type: int) -> int:
+        """Count items recorded as completed in a restoration session."""
+        ...
+
+    # ID mapping methods
+    @abstractmethod
+    def save_id_mappings(self, mappings: Sequence[IDMapping]) -> None:
+        """Save a batch of source ID → destination ID mappings in one transaction."""
+        ...
+
+    @abstractmethod
+    def load_id_mappings(self, source_instance: str, content_type: int) -> dict[str, str]:
+        """Load all source_id → destination_id mappings for an instance and type."""
+        ...
+
+    # Destination fingerprint methods
+    @abstractmethod
+    def get_destination_fingerprint(
+        self, destination: str, content_type: int, content_id: str
+    ) -> str | None:
+        """Get the cached fingerprint of a destination item."""
+        ...
+
+    @abstractmethod
+    def save_destination_fingerprint(
+        self, destination: str, content_type: int, content_id: str, fingerprint: str
+    ) -> None:
+        """Record the fingerprint of a destination item."""
+        ...
+
+    # Restore latency history methods
+    @abstractmethod
+    def record_restore_latency(
+        self, destination: str, content_type: int, samples: int, total_ms: float
+    ) -> None:
+        """Add restored items' timings to a content type's latency history."""
+        ...
+
+    @abstractmethod
+    def get_restore_latencies(self, destination: str | None = None) -> dict[int, float]:
+        """Get the mean historical per-item restore latency of each content type."""
+        ...
+
+    # Run telemetry operations
+    @abstractmethod
+    def save_run_telemetry(self, telemetry: RunTelemetry) -> int:
+        """Append one run's performance telemetry."""
+        ...
+
+    @abstractmethod
+    def list_run_telemetry(
+        self, operation: str, instance: str | None = None, limit: int = 50
+    ) -> list[RunTelemetry]:
+        """List the most recent runs of an operation, newest first."""
+        ...
+
     # Thread-local connection management
     @abstractmethod
     def close_thread_connection(self) -> None:
@@ -470,9 +647,13 @@ class SQLiteContentRepository(
     ExtractionCheckpointsMixin,
     ExtractionSessionsMixin,
     RestorationCheckpointsMixin,
+    RestorationProgressMixin,
     RestorationSessionsMixin,
     DeadLetterQueueMixin,
     IDMappingsMixin,
+    DestinationFingerprintsMixin,
+    RestoreLatencyMixin,
+    RunTelemetryMixin,
     StorageUtilsMixin,
     ContentRepository,
 ):
@@ -487,9 +668,13 @@ class SQLiteContentRepository(
     - ExtractionCheckpointsMixin: Extraction checkpoint operations
     - ExtractionSessionsMixin: Extraction session operations
     - RestorationCheckpointsMixin: Restoration checkpoint operations
+    - RestorationProgressMixin: Per-item restoration progress log
     - RestorationSessionsMixin: Restoration session operations
     - DeadLetterQueueMixin: Dead letter queue operations
     - IDMappingsMixin: ID mapping operations
+    - DestinationFingerprintsMixin: Destination content fingerprint cache
+    - RestoreLatencyMixin: Historical per-item restore latency
+    - RunTelemetryMixin: Per-run performance telemetry
     - StorageUtilsMixin: Utility methods
 
     This modular architecture keeps the code organized and maintainable while
@@ -3,8 +3,11 @@
 Query Performance Analysis (EXPLAIN QUERY PLAN verified):
 - list_content: Uses idx_content_type (partial index for active records)
 - get_deleted_items_before: Uses idx_deleted_at (soft-deleted items)
-- get_last_sync_timestamp: Uses idx_updated_at DESC (latest updates)
+- get_last_sync_timestamp: Uses idx_content_type (MAX(synced_at) over one type)
 - get_latest_checkpoint: Uses idx_checkpoint_type_completed (composite index)
+- Folder-scoped queries: Use idx_folder_id (see active_in_folders_sql)
+
+tests/unit/storage/test_query_plans.py asserts these plans.
 
 All indexes are partial (WHERE deleted_at IS/IS NOT NULL) to reduce index size
 and improve performance for common queries on active records.
@@ -17,6 +20,47 @@ from lookervault.storage.models import ContentType
 
 SCHEMA_VERSION = 4
 
+# Content types whose folder_id is covered by the idx_folder_id partial index
+FOLDER_INDEXED_CONTENT_TYPES = (
+    ContentType.DASHBOARD.value,
+    ContentType.LOOK.value,
+    ContentType.BOARD.value,
+    ContentType.FOLDER.value,
+)
+_FOLDER_INDEXED_TYPES_SQL = ", ".join(str(value) for value in FOLDER_INDEXED_CONTENT_TYPES)
+
+
+def active_in_folders_sql(content_type: int, folder_count: int, alias: str = "") -> tuple[str, str]:
+    """Build the table reference and WHERE terms for active content in given folders.
+
+    Bind the content type first, then the folder IDs. idx_folder_id is a
+    partial index, which SQLite only considers when the query repeats the
+    index's WHERE terms. Without ANALYZE statistics the planner still prefers
+    idx_content_type (every item of the type) once more than a few folders
+    are listed, so folder-indexed types name the index with INDEXED BY.
+
+    Args:
+        content_type: ContentType enum value
+        folder_count: Number of folder ID placeholders
+        alias: Table alias of content_items in the query (default: none)
+
+    Returns:
+        Tuple of (table reference for FROM/UPDATE, SQL condition without a leading AND)
+    """
+    column = f"{alias}." if alias else ""
+    table = f"content_items {alias}".rstrip()
+    condition = (
+        f"{column}content_type = ? AND {column}deleted_at IS NULL"
+        f" AND {column}folder_id IN ({','.join('?' * folder_count)})"
+    )
+    if content_type not in FOLDER_INDEXED_CONTENT_TYPES:
+        return table, condition
+    return (
+        f"{table} INDEXED BY idx_folder_id",
+        f"{condition} AND {column}folder_id IS NOT NULL"
+        f" AND {column}content_type IN ({_FOLDER_INDEXED_TYPES_SQL})",
+    )
+
 
 def create_schema(conn: sqlite3.Connection) -> None:
     """Create database schema with all required tables and indexes.
@@ -92,7 +136,7 @@ def create_schema(conn: sqlite3.Connection) -> None:
         ON content_items(folder_id)
         WHERE deleted_at IS NULL
           AND folder_id IS NOT NULL
-          AND content_type IN ({ContentType.DASHBOARD.value}, {ContentType.LOOK.value}, {ContentType.BOARD.value}, {ContentType.FOLDER.value})
+          AND content_type IN ({_FOLDER_INDEXED_TYPES_SQL})
     """)
 
     # Create sync_checkpoints table
@@ -255,6 +299,70 @@ def create_schema(conn: sqlite3.Connection) -> None:
         ON dead_letter_queue(failed_at DESC)
     """)
 
+    # Create restoration_progress table (append-only per-item restore log)
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS restoration_progress (
+            session_id TEXT NOT NULL,
+            content_type INTEGER NOT NULL,
+            content_id TEXT NOT NULL,
+            status TEXT NOT NULL,
+            recorded_at TEXT NOT NULL,
+            PRIMARY KEY (session_id, content_type, content_id)
+        ) WITHOUT ROWID
+    """)
+
+    # Create destination_fingerprints table (writable-field hashes of restored content)
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS destination_fingerprints (
+            destination TEXT NOT NULL,
+            content_type INTEGER NOT NULL,
+            content_id TEXT NOT NULL,
+            fingerprint TEXT NOT NULL,
+            recorded_at TEXT NOT NULL,
+            PRIMARY KEY (destination, content_type, content_id)
+        ) WITHOUT ROWID
+    """)
+
+    # Create restore_latency table (running per-item restore timings for planning)
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS restore_latency (
+            destination TEXT NOT NULL,
+            content_type INTEGER NOT NULL,
+            samples INTEGER NOT NULL,
+            total_ms REAL NOT NULL,
+            updated_at TEXT NOT NULL,
+            PRIMARY KEY (destination, content_type)
+        ) WITHOUT ROWID
+    """)
+
+    # Create run_telemetry table (per-run performance history for auto-tuning)
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS run_telemetry (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            operation TEXT NOT NULL,
+            instance TEXT NOT NULL,
+            session_id TEXT,
+            recorded_at TEXT NOT NULL,
+            workers INTEGER NOT NULL,
+            batch_size INTEGER,
+            rate_limit_per_minute INTEGER,
+            rate_limit_per_second INTEGER,
+            duration_seconds REAL NOT NULL,
+            total_items INTEGER NOT NULL,
+            api_calls INTEGER NOT NULL DEFAULT 0,
+            rate_limit_429s INTEGER NOT NULL DEFAULT 0,
+            rate_limit_wait_seconds REAL NOT NULL DEFAULT 0,
+            busy_retries INTEGER NOT NULL DEFAULT 0,
+            error_count INTEGER NOT NULL DEFAULT 0,
+            details TEXT
+        )
+    """)
+
+    cursor.execute("""
+        CREATE INDEX IF NOT EXISTS idx_run_telemetry_operation
+        ON run_telemetry(operation, instance, recorded_at DESC)
+    """)
+
     # Run migrations after all tables are created
     _migrate_to_version_3(conn)
     _migrate_to_version_4(conn)
@@ -559,7 +667,7 @@ def _migrate_to_version_4(conn: sqlite3.Connection) -> None:
         ON content_items(folder_id)
         WHERE deleted_at IS NULL
           AND folder_id IS NOT NULL
-          AND content_type IN ({ContentType.DASHBOARD.value}, {ContentType.LOOK.value}, {ContentType.BOARD.value}, {ContentType.FOLDER.value})
+          AND content_type IN ({_FOLDER_INDEXED_TYPES_SQL})
     """)
 
     # Record migration
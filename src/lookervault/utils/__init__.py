@@ -8,6 +8,8 @@ from lookervault.utils.error_handling import (
     transaction_rollback,
     wrap_and_raise,
 )
+from lookervault.utils.profiling import RunProfiler
+from lookervault.utils.tracing import Tracer, span, start_tracing, stop_tracing, traced
 
 __all__ = [
     "parse_timestamp",
@@ -16,4 +18,10 @@ __all__ = [
     "log_and_return_error",
     "wrap_and_raise",
     "safe_execute",
+    "RunProfiler",
+    "Tracer",
+    "span",
+    "start_tracing",
+    "stop_tracing",
+    "traced",
 ]
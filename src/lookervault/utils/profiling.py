@@ -0,0 +1,252 @@
+"""Opt-in whole-run CPU profiling across every thread.
+
+cProfile only follows the thread that enabled it (and since Python 3.12 a
+single profiler is allowed per process), so it misses the worker threads
+where extraction and restoration spend their time. RunProfiler instead
+samples the stacks of all threads from a background thread via
+sys._current_frames() and merges them into one profile, written as:
+
+- a pstats file (load with ``python -m pstats`` or snakeviz); call counts
+  are sample counts and times are sampled wall-clock seconds
+- a collapsed-stack file, one ``thread;frame;frame count`` line per unique
+  stack, for flamegraph.pl, speedscope or inferno
+
+Worker threads of one pool share a root frame (``ThreadPoolExecutor``), so
+the flamegraph shows where all workers together spent their time. Samples of
+threads idling in threading or queue waits are dropped; time blocked in
+socket or SQLite calls is kept, under the Python frame that made the call.
+
+Example:
+    >>> with RunProfiler() as profiler:
+    ...     orchestrator.extract()
+    >>> pstats_path, collapsed_path = profiler.write_next_to(Path("looker.db"), "extract")
+"""
+
+import marshal
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+from types import FrameType
+
+# Seconds between stack samples (100 Hz)
+DEFAULT_SAMPLE_INTERVAL = 0.01
+
+# Deepest stack recorded per sample; deeper frames are truncated at the root
+MAX_STACK_DEPTH = 256
+
+_FunctionKey = tuple[str, int, str]
+_THREAD_SUFFIX = re.compile(r"[-_]\d+(_\d+)?$")
+# Leaf frames of threads waiting for work: condition/event waits, queue gets
+# and idle thread-pool workers blocked on their work queue
+_IDLE_FILES = ("threading.py", "queue.py")
+_IDLE_FUNCTIONS = {("thread.py", "_worker")}
+
+
+def _thread_group(name: str) -> str:
+    """Collapse numbered thread names of one pool ("ThreadPoolExecutor-0_3")."""
+    return _THREAD_SUFFIX.sub("", name) or name
+
+
+def _is_idle(leaf: _FunctionKey) -> bool:
+    filename, _, function = leaf
+    if filename.endswith(_IDLE_FILES):
+        return True
+    return (Path(filename).name, function) in _IDLE_FUNCTIONS
+
+
+def _frame_label(key: _FunctionKey) -> str:
+    filename, line, function = key
+    return f"{function} ({Path(filename).name}:{line})"
+
+
+class RunProfiler:
+    """Statistical profiler sampling every thread of the process.
+
+    Attributes:
+        interval: Seconds between samples
+        samples: Number of thread stacks recorded
+    """
+
+    def __init__(self, interval: float = DEFAULT_SAMPLE_INTERVAL):
+        """Initialize profiler (sampling starts with start()).
+
+        Args:
+            interval: Seconds between samples
+        """
+        self.interval = interval
+        self.samples = 0
+        # (thread group, stack root-first) -> [sample count, sampled seconds]
+        self._stacks: dict[tuple[str, tuple[_FunctionKey, ...]], list[float]] = {}
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        """Start sampling on a daemon thread."""
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="run-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop sampling; recorded samples are kept for writing."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        own_ident = threading.get_ident()
+        last = time.monotonic()
+        while not self._stop.wait(self.interval):
+            now = time.monotonic()
+            self._sample(own_ident, now - last)
+            last = now
+
+    def _sample(self, own_ident: int, seconds: float) -> None:
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        for ident, frame in sys._current_frames().items():
+            if ident == own_ident:
+                continue
+            stack = self._stack(frame)
+            if not stack or _is_idle(stack[-1]):
+                continue
+            key = (_thread_group(names.get(ident, "unknown")), stack)
+            entry = self._stacks.setdefault(key, [0, 0.0])
+            entry[0] += 1
+            entry[1] += seconds
+            self.samples += 1
+
+    @staticmethod
+    def _stack(frame: FrameType | None) -> tuple[_FunctionKey, ...]:
+        keys: list[_FunctionKey] = []
+        while frame is not None and len(keys) < MAX_STACK_DEPTH:
+            code = frame.f_code
+            keys.append((code.co_filename, code.co_firstlineno, code.co_name))
+            frame = frame.f_back
+        keys.reverse()
+        return tuple(keys)
+
+    def collapsed_stacks(self) -> dict[str, int]:
+        """Merged stacks in collapsed format.
+
+        Returns:
+            Mapping of ``thread;frame;...;leaf`` to sample count
+        """
+        collapsed: Counter[str] = Counter()
+        for (group, stack), (count, _) in self._stacks.items():
+            collapsed[";".join([group, *map(_frame_label, stack)])] += int(count)
+        return dict(collapsed)
+
+    def stats(self) -> dict[_FunctionKey, tuple]:
+        """Merged profile in the pstats dictionary layout.
+
+        Returns:
+            Mapping of (file, line, function) to (cc, nc, tt, ct, callers)
+        """
+        entries: dict[_FunctionKey, list] = {}
+        for (_, stack), (count, seconds) in self._stacks.items():
+            seen: set[_FunctionKey] = set()
+            for depth, key in enumerate(stack):
+                entry = entries.setdefault(key, [0, 0, 0.0, 0.0, {}])
+                if key not in seen:
+                    # Recursive frames count once toward cumulative time
+                    seen.add(key)
+                    entry[0] += count
+                    entry[1] += count
+                    entry[3] += seconds
+                if depth > 0:
+                    caller = entry[4].setdefault(stack[depth - 1], [0, 0, 0.0, 0.0])
+                    caller[0] += count
+                    caller[1] += count
+                    caller[3] += seconds
+                    if depth == len(stack) - 1:
+                        caller[2] += seconds
+            entries[stack[-1]][2] += seconds
+        return {
+            key: (
+                int(cc),
+                int(nc),
+                tt,
+                ct,
+                {caller: (int(c[0]), int(c[1]), c[2], c[3]) for caller, c in callers.items()},
+            )
+            for key, (cc, nc, tt, ct, callers) in entries.items()
+        }
+
+    def top_functions(self, limit: int = 10) -> list[str]:
+        """Functions with the most self time, formatted for display.
+
+        Args:
+            limit: Number of functions returned
+
+        Returns:
+            Lines like ``"23.5%  _dict_to_content_item (parallel_orchestrator.py:2130)"``
+        """
+        self_samples: Counter[_FunctionKey] = Counter()
+        for (_, stack), (count, _) in self._stacks.items():
+            self_samples[stack[-1]] += int(count)
+        total = sum(self_samples.values()) or 1
+        return [
+            f"{count / total:6.1%}  {_frame_label(key)}"
+            for key, count in self_samples.most_common(limit)
+        ]
+
+    def write_pstats(self, path: str | Path) -> Path:
+        """Write the merged profile as a pstats file.
+
+        Args:
+            path: Destination path
+
+        Returns:
+            The path written
+        """
+        path = Path(path)
+        with path.open("wb") as f:
+            marshal.dump(self.stats(), f)
+        return path
+
+    def write_collapsed(self, path: str | Path) -> Path:
+        """Write the merged stacks in collapsed (folded) flamegraph format.
+
+        Args:
+            path: Destination path
+
+        Returns:
+            The path written
+        """
+        path = Path(path)
+        lines = [f"{stack} {count}" for stack, count in sorted(self.collapsed_stacks().items())]
+        path.write_text("\n".join(lines) + "\n" if lines else "")
+        return path
+
+    def write_next_to(self, db_path: str | Path, operation: str) -> tuple[Path, Path]:
+        """Write pstats and collapsed files beside the database.
+
+        Files are named ``<db stem>.<operation>-<timestamp>.pstats`` and
+        ``.collapsed`` so repeated runs don't overwrite each other.
+
+        Args:
+            db_path: Database the run used
+            operation: Command being profiled (e.g., "extract")
+
+        Returns:
+            Tuple of (pstats path, collapsed path)
+        """
+        db_path = Path(db_path)
+        stamp = datetime.now().strftime("%Y%m%dT%H%M%S")
+        base = db_path.with_name(f"{db_path.stem}.{operation}-{stamp}")
+        base.parent.mkdir(parents=True, exist_ok=True)
+        return (
+            self.write_pstats(base.with_name(base.name + ".pstats")),
+            self.write_collapsed(base.with_name(base.name + ".collapsed")),
+        )
+
+    def __enter__(self) -> "RunProfiler":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
@@ -0,0 +1,276 @@
+"""Opt-in span tracing for extraction and restoration runs.
+
+Spans are timed sections of work (an API call, a database write, a
+rate-limiter wait) recorded into a bounded in-memory ring buffer and dumped
+after the run as Chrome trace-event JSON (open in https://ui.perfetto.dev or
+chrome://tracing) or as JSONL, one span per line. Each thread gets its own
+track, so worker idle time, lock convoys and rate-limit stalls show up as
+gaps and stacked waits.
+
+Tracing is off unless start_tracing() was called; span() then returns a
+shared no-op context manager, so instrumented code costs one global read.
+
+Example:
+    >>> tracer = start_tracing()
+    >>> with span("save_content", "storage", content_id="42"):
+    ...     repository.save_content(item)
+    >>> stop_tracing()
+    >>> tracer.write("run.trace.json")
+"""
+
+import functools
+import inspect
+import json
+import os
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from contextlib import AbstractContextManager, nullcontext
+from pathlib import Path
+from typing import Any, ParamSpec, TypeVar
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+# Spans kept in the ring buffer; older spans are dropped first (~40 MB when full)
+DEFAULT_TRACE_CAPACITY = 200_000
+
+_NO_SPAN = nullcontext()
+
+
+class _Span:
+    """Context manager recording one span into a Tracer on exit."""
+
+    __slots__ = ("_tracer", "_name", "_category", "_args", "_start_ns")
+
+    def __init__(self, tracer: "Tracer", name: str, category: str, args: dict[str, Any]):
+        self._tracer = tracer
+        self._name = name
+        self._category = category
+        self._args = args
+        self._start_ns = 0
+
+    def __enter__(self) -> "_Span":
+        self._start_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        if exc_type is not None:
+            self._args["error"] = exc_type.__name__
+        self._tracer.record(
+            self._name, self._category, self._start_ns, time.perf_counter_ns(), self._args
+        )
+
+
+class Tracer:
+    """Ring buffer of completed spans with Chrome trace and JSONL export.
+
+    record() appends to a bounded deque, which is thread-safe and O(1), so
+    workers never wait on each other to trace.
+
+    Attributes:
+        capacity: Maximum number of spans kept
+        recorded: Number of spans recorded, including dropped ones
+    """
+
+    def __init__(self, capacity: int = DEFAULT_TRACE_CAPACITY):
+        """Initialize an empty tracer.
+
+        Args:
+            capacity: Maximum number of spans kept (oldest are dropped first)
+        """
+        self.capacity = capacity
+        self.recorded = 0
+        self._spans: deque[tuple[str, str, int, int, str, dict[str, Any]]] = deque(maxlen=capacity)
+        self._origin_ns = time.perf_counter_ns()
+
+    def __len__(self) -> int:
+        return len(self._spans)
+
+    @property
+    def dropped(self) -> int:
+        """Number of spans pushed out of the ring buffer."""
+        return max(self.recorded - len(self._spans), 0)
+
+    def span(self, name: str, category: str = "", **args: Any) -> _Span:
+        """Return a context manager that records a span around its body.
+
+        Args:
+            name: Span name (e.g., "save_content")
+            category: Span category (e.g., "storage", "api")
+            **args: Details attached to the span
+
+        Returns:
+            Context manager; an exception leaving the body is added as args["error"]
+        """
+        return _Span(self, name, category, args)
+
+    def record(
+        self,
+        name: str,
+        category: str,
+        start_ns: int,
+        end_ns: int,
+        args: dict[str, Any] | None = None,
+    ) -> None:
+        """Record a completed span measured with time.perf_counter_ns().
+
+        Args:
+            name: Span name
+            category: Span category
+            start_ns: Start timestamp (perf_counter_ns)
+            end_ns: End timestamp (perf_counter_ns)
+            args: Optional details attached to the span
+        """
+        thread = threading.current_thread().name
+        self._spans.append((name, category, start_ns, end_ns, thread, args or {}))
+        self.recorded += 1
+
+    def spans(self) -> list[dict[str, Any]]:
+        """Return the buffered spans, oldest first, with times in microseconds.
+
+        Returns:
+            List of dicts with name, category, thread, start_us, duration_us and args
+        """
+        return [
+            {
+                "name": name,
+                "category": category,
+                "thread": thread,
+                "start_us": (start_ns - self._origin_ns) / 1000,
+                "duration_us": (end_ns - start_ns) / 1000,
+                "args": args,
+            }
+            for name, category, start_ns, end_ns, thread, args in list(self._spans)
+        ]
+
+    def chrome_trace(self) -> dict[str, Any]:
+        """Build a Chrome trace-event document ("X" complete events, one track per thread)."""
+        pid = os.getpid()
+        spans = self.spans()
+        thread_ids: dict[str, int] = {}
+        for span in spans:
+            thread_ids.setdefault(span["thread"], len(thread_ids) + 1)
+        events: list[dict[str, Any]] = [
+            {"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": name}}
+            for name, tid in thread_ids.items()
+        ]
+        for span in spans:
+            events.append(
+                {
+                    "name": span["name"],
+                    "cat": span["category"],
+                    "ph": "X",
+                    "ts": span["start_us"],
+                    "dur": span["duration_us"],
+                    "pid": pid,
+                    "tid": thread_ids[span["thread"]],
+                    "args": span["args"],
+                }
+            )
+        return {
+            "traceEvents": events,
+            "displayTimeUnit": "ms",
+            "otherData": {"recorded": self.recorded, "dropped": self.dropped},
+        }
+
+    def write(self, path: str | Path) -> Path:
+        """Write the trace to path: JSONL for a .jsonl suffix, Chrome trace JSON otherwise.
+
+        Returns:
+            The path written
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if path.suffix == ".jsonl":
+            with path.open("w") as f:
+                for span in self.spans():
+                    f.write(json.dumps(span, default=str) + "\n")
+        else:
+            path.write_text(json.dumps(self.chrome_trace(), default=str))
+        return path
+
+
+_active: Tracer | None = None
+
+
+def start_tracing(capacity: int = DEFAULT_TRACE_CAPACITY) -> Tracer:
+    """Start recording spans process-wide into a new Tracer.
+
+    Args:
+        capacity: Ring buffer size in spans
+
+    Returns:
+        The active tracer
+    """
+    global _active
+    _active = Tracer(capacity)
+    return _active
+
+
+def stop_tracing() -> Tracer | None:
+    """Stop recording spans.
+
+    Returns:
+        The tracer that was active, if any
+    """
+    global _active
+    tracer, _active = _active, None
+    return tracer
+
+
+def active_tracer() -> Tracer | None:
+    """Return the active tracer, or None when tracing is off."""
+    return _active
+
+
+def span(name: str, category: str = "", **args: Any) -> AbstractContextManager[Any]:
+    """Trace the enclosed block when tracing is on; do nothing otherwise.
+
+    Args:
+        name: Span name
+        category: Span category
+        **args: Details attached to the span
+
+    Returns:
+        Context manager recording the span, or a shared no-op one
+    """
+    tracer = _active
+    if tracer is None:
+        return _NO_SPAN
+    return tracer.span(name, category, **args)
+
+
+def traced(
+    name: str, category: str = "", *arg_names: str
+) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """Decorate a function so each call is traced as a span while tracing is on.
+
+    Args:
+        name: Span name
+        category: Span category
+        *arg_names: Parameters of the function whose values are attached to the span
+
+    Returns:
+        Decorator
+    """
+
+    def decorate(func: Callable[P, R]) -> Callable[P, R]:
+        signature = inspect.signature(func) if arg_names else None
+
+        @functools.wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            tracer = _active
+            if tracer is None:
+                return func(*args, **kwargs)
+            details: dict[str, Any] = {}
+            if signature is not None:
+                bound = signature.bind_partial(*args, **kwargs).arguments
+                details = {arg: bound[arg] for arg in arg_names if arg in bound}
+            with tracer.span(name, category, **details):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorate
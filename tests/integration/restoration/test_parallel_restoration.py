@@ -98,6 +98,7 @@ def config():
     config.max_retries = 3
     config.dry_run = False
     config.folder_ids = None
+    config.dynamic_workers = False
     return config
 
 
@@ -224,7 +225,10 @@ class TestParallelRestorationEndToEnd:
         # Verify checkpoint was saved
         checkpoint = repository.get_latest_restoration_checkpoint(ContentType.DASHBOARD.value)
         assert checkpoint is not None
-        assert len(checkpoint.checkpoint_data["completed_ids"]) > 0
+        assert (
+            repository.count_restoration_progress(config.session_id, ContentType.DASHBOARD.value)
+            > 0
+        )
 
         # Reset mock for resume
         mock_client.sdk.create_dashboard.side_effect = lambda *args, **kwargs: {"id": "new-123"}
@@ -434,6 +438,7 @@ class TestParallelRestorationPerformance:
         config_sequential.max_retries = 3
         config_sequential.dry_run = False
         config_sequential.folder_ids = None
+        config_sequential.dynamic_workers = False
 
         orchestrator_sequential = ParallelRestorationOrchestrator(
             restorer=restorer,
@@ -458,6 +463,7 @@ class TestParallelRestorationPerformance:
         config_parallel.max_retries = 3
         config_parallel.dry_run = False
         config_parallel.folder_ids = None
+        config_parallel.dynamic_workers = False
 
         orchestrator_parallel = ParallelRestorationOrchestrator(
             restorer=restorer,
@@ -511,6 +517,7 @@ class TestParallelRestorationPerformance:
         config.max_retries = 3
         config.dry_run = False
         config.folder_ids = None
+        config.dynamic_workers = False
 
         restorer = LookerContentRestorer(client=mock_client, repository=repository)
         rate_limiter = AdaptiveRateLimiter(requests_per_minute=1000)
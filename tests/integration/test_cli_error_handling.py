@@ -837,6 +837,55 @@ class TestExtractCommandErrors:
             # Restore permissions for cleanup
             readonly_dir.chmod(0o755)
 
+    def test_extract_index_profile_refuses_to_overwrite_backup(self, tmp_path, monkeypatch):
+        """Test 'index' profile does not replace stored content without an explicit flag."""
+        from datetime import datetime
+
+        from lookervault.storage.models import ContentItem, ContentType
+        from lookervault.storage.repository import SQLiteContentRepository
+
+        monkeypatch.setenv("LOOKERVAULT_API_URL", "https://looker.example.com")
+        monkeypatch.setenv("LOOKERVAULT_CLIENT_ID", "id")
+        monkeypatch.setenv("LOOKERVAULT_CLIENT_SECRET", "secret")
+        db_path = tmp_path / "looker.db"
+        repository = SQLiteContentRepository(db_path=db_path)
+        try:
+            repository.save_content(
+                ContentItem(
+                    id="1",
+                    content_type=ContentType.DASHBOARD.value,
+                    name="Sales",
+                    created_at=datetime.now(),
+                    updated_at=datetime.now(),
+                    content_data=b"full dashboard",
+                )
+            )
+        finally:
+            repository.close()
+
+        result = runner.invoke(
+            app,
+            [
+                "extract",
+                "--db",
+                str(db_path),
+                "--types",
+                "dashboards",
+                "--workers",
+                "2",
+                "--field-profile",
+                "index",
+            ],
+        )
+
+        assert result.exit_code == 2
+        assert "--allow-index-overwrite" in result.stdout + result.stderr
+        repository = SQLiteContentRepository(db_path=db_path)
+        try:
+            assert repository.get_content("1").content_data == b"full dashboard"
+        finally:
+            repository.close()
+
 
 class TestRestoreCommandErrors:
     """Test error scenarios for the restore commands."""
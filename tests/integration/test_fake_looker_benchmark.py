@@ -0,0 +1,91 @@
+"""Integration tests for the fake Looker API and the throughput benchmark suite.
+
+Runs real extraction and restoration (looker_sdk over HTTP) against
+benchmarks.fake_looker.FakeLookerServer on localhost.
+"""
+
+import json
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+import pytest
+
+from benchmarks.fake_looker import FakeLookerConfig, FakeLookerServer
+from benchmarks.run_benchmarks import compare, run_extraction, run_restoration
+
+CONFIG = FakeLookerConfig(
+    dashboards=3, looks=4, users=5, elements_per_dashboard=2, filters_per_dashboard=1
+)
+
+
+@pytest.fixture
+def source():
+    """Serve a small synthetic instance."""
+    with FakeLookerServer(CONFIG) as server:
+        yield server
+
+
+class TestFakeLookerServer:
+    """Tests for the fake API itself."""
+
+    def test_pagination_and_field_projection(self, source):
+        """Listings honour limit, offset and top-level fields."""
+        url = f"{source.url}/api/4.0/dashboards/search?limit=2&offset=1&fields=id,title"
+        with urllib.request.urlopen(url) as response:  # noqa: S310 - local http fake server
+            page = json.loads(response.read())
+
+        assert len(page) == 2
+        assert all(set(item) == {"id", "title"} for item in page)
+        assert source.request_counts() == {"GET /dashboards": 1}
+
+    def test_injected_faults(self):
+        """Configured error rates turn responses into 429s and 503s."""
+        config = FakeLookerConfig(dashboards=1, looks=0, users=0, rate_429=1.0)
+        with FakeLookerServer(config) as server:
+            with pytest.raises(urllib.error.HTTPError) as exc_info:
+                urllib.request.urlopen(f"{server.url}/api/4.0/dashboards/search")  # noqa: S310 - local http
+
+        assert exc_info.value.code == 429
+
+
+class TestBenchmarkScenarios:
+    """Tests for end-to-end extraction and restoration through the fake API."""
+
+    def test_extract_then_restore_round_trip(self, source, tmp_path: Path):
+        """Extracted content, dashboard sub-resources included, is recreated in a new instance."""
+        db_path = str(tmp_path / "bench.db")
+
+        extracted = run_extraction(source.url, db_path, workers=2)
+
+        assert extracted["items"] == CONFIG.dashboards + CONFIG.looks + CONFIG.users
+        assert extracted["errors"] == 0
+
+        with FakeLookerServer(CONFIG, populate=False) as destination:
+            restored = run_restoration(destination.url, db_path, workers=2)
+            items = destination.instance.items
+
+        assert restored["items"] == CONFIG.dashboards + CONFIG.users
+        assert restored["errors"] == 0
+        assert len(items["dashboards"]) == CONFIG.dashboards
+        assert len(items["users"]) == CONFIG.users
+        assert len(items["dashboard_elements"]) == CONFIG.dashboards * 2
+        assert len(items["dashboard_filters"]) == CONFIG.dashboards
+
+    def test_compare_flags_regressions(self):
+        """Throughput drops beyond the threshold are reported."""
+        baseline = [
+            {"scenario": "extract", "workers": 4, "items_per_second": 100.0},
+            {"scenario": "restore", "workers": 4, "items_per_second": 50.0},
+        ]
+        results = [
+            {"scenario": "extract", "workers": 4, "items_per_second": 95.0},
+            {"scenario": "restore", "workers": 4, "items_per_second": 30.0},
+            {"scenario": "restore", "workers": 8, "items_per_second": 10.0},
+        ]
+
+        regressions = compare(results, baseline, threshold=0.1)
+
+        assert len(regressions) == 1
+        assert regressions[0].startswith("restore x4")
+        assert results[0]["change"] == -0.05
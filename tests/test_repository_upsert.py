@@ -6,6 +6,7 @@ This test suite validates that all repository upsert operations are idempotent:
 - Primary keys should remain consistent across upserts
 
 Test Coverage:
+- ContentItem batch upserts (natural key: id + content_type)
 - Checkpoint upserts (natural key: session_id + content_type)
 - ExtractionSession upserts (natural key: id)
 - DeadLetterItem upserts (natural key: session_id + content_id + content_type + retry_count)
@@ -19,6 +20,7 @@ import pytest
 
 from lookervault.storage.models import (
     Checkpoint,
+    ContentItem,
     ContentType,
     DeadLetterItem,
     ExtractionSession,
@@ -35,6 +37,47 @@ def repo(tmp_path):
     return SQLiteContentRepository(db_path)
 
 
+def _content_item(item_id: str, name: str, content_type: ContentType) -> ContentItem:
+    """Build a content item with fixed timestamps."""
+    return ContentItem(
+        id=item_id,
+        content_type=content_type.value,
+        name=name,
+        created_at=datetime(2025, 1, 1),
+        updated_at=datetime(2025, 1, 2),
+        content_data=b"data",
+    )
+
+
+class TestContentBatchUpsert:
+    """Test idempotent upsert operations for save_contents."""
+
+    def test_save_contents_twice_upserts(self, repo):
+        """Saving the same batch twice should update, not duplicate."""
+        repo.save_contents(
+            [
+                _content_item("1", "First", ContentType.DASHBOARD),
+                _content_item("2", "Second", ContentType.DASHBOARD),
+            ]
+        )
+        repo.save_contents(
+            [
+                _content_item("1", "First renamed", ContentType.DASHBOARD),
+                _content_item("9", "Look one", ContentType.LOOK),
+            ]
+        )
+
+        assert repo.count_content(ContentType.DASHBOARD.value) == 2
+        assert repo.count_content(ContentType.LOOK.value) == 1
+        assert repo.get_content("1").name == "First renamed"
+
+    def test_save_contents_empty_batch_is_noop(self, repo):
+        """An empty batch writes nothing."""
+        repo.save_contents([])
+
+        assert repo.count_content(ContentType.DASHBOARD.value) == 0
+
+
 class TestCheckpointUpsert:
     """Test idempotent upsert operations for Checkpoint."""
 
@@ -0,0 +1,205 @@
+"""Unit tests for run telemetry and the telemetry-driven AutoTuner."""
+
+from datetime import datetime, timedelta
+from unittest.mock import Mock
+
+import pytest
+
+from lookervault.config.models import ParallelConfig
+from lookervault.extraction.orchestrator import ExtractionConfig, ExtractionResult
+from lookervault.extraction.parallel_orchestrator import ParallelOrchestrator
+from lookervault.extraction.performance import AutoTuner
+from lookervault.storage.models import ContentType, ExtractionSession, RunTelemetry
+from lookervault.storage.repository import SQLiteContentRepository
+
+INSTANCE = "https://looker.example.com"
+START = datetime(2026, 1, 1)
+
+
+def make_run(
+    workers: int,
+    items_per_second: float,
+    *,
+    age_hours: int = 0,
+    api_calls: int = 1000,
+    rate_limit_429s: int = 0,
+    rate_limit_wait_seconds: float = 0.0,
+    busy_retries: int = 0,
+    rate_limit_per_minute: int = 600,
+    rate_limit_per_second: int = 20,
+) -> RunTelemetry:
+    """Build a 100-second extraction run with the given throughput."""
+    return RunTelemetry(
+        operation="extract",
+        instance=INSTANCE,
+        workers=workers,
+        batch_size=100,
+        rate_limit_per_minute=rate_limit_per_minute,
+        rate_limit_per_second=rate_limit_per_second,
+        duration_seconds=100.0,
+        total_items=int(items_per_second * 100),
+        api_calls=api_calls,
+        rate_limit_429s=rate_limit_429s,
+        rate_limit_wait_seconds=rate_limit_wait_seconds,
+        busy_retries=busy_retries,
+        recorded_at=START - timedelta(hours=age_hours),
+    )
+
+
+def recommend(history: list[RunTelemetry], **overrides):
+    """Recommend from history (newest first) with default starting settings."""
+    settings = {
+        "workers": 8,
+        "batch_size": 100,
+        "rate_limit_per_minute": 600,
+        "rate_limit_per_second": 20,
+        **overrides,
+    }
+    return AutoTuner(history).recommend(**settings)
+
+
+class TestRunTelemetryStorage:
+    """Tests for RunTelemetryMixin."""
+
+    @pytest.fixture
+    def repo(self, tmp_path):
+        """Repository on a temporary database."""
+        repo = SQLiteContentRepository(db_path=tmp_path / "telemetry.db")
+        yield repo
+        repo.close()
+
+    def test_round_trip_newest_first(self, repo):
+        """Saved runs come back newest first, filtered by operation and instance."""
+        older = make_run(4, 50, age_hours=2)
+        older.items_by_type = {ContentType.DASHBOARD.value: 5000}
+        older.avg_payload_bytes = {ContentType.DASHBOARD.value: 2048.0}
+        repo.save_run_telemetry(older)
+        repo.save_run_telemetry(make_run(8, 80, age_hours=1))
+        other = make_run(8, 80)
+        other.instance = "https://other.example.com"
+        repo.save_run_telemetry(other)
+
+        runs = repo.list_run_telemetry("extract", INSTANCE)
+
+        assert [run.workers for run in runs] == [8, 4]
+        assert runs[1].items_by_type == {ContentType.DASHBOARD.value: 5000}
+        assert runs[1].avg_payload_bytes == {ContentType.DASHBOARD.value: 2048.0}
+        assert runs[1].items_per_second == pytest.approx(50)
+        assert repo.list_run_telemetry("restore") == []
+
+
+class TestAutoTuner:
+    """Tests for AutoTuner decisions."""
+
+    def test_no_history_keeps_settings(self):
+        """Without history the starting settings are returned unchanged."""
+        decision = recommend([])
+
+        assert (decision.workers, decision.batch_size) == (8, 100)
+        assert decision.runs_considered == 0
+
+    def test_picks_best_healthy_worker_count(self):
+        """The worker count with the best median throughput wins when larger ones stalled."""
+        history = [
+            make_run(16, 82, age_hours=1),
+            make_run(8, 85, age_hours=2),
+            make_run(8, 83, age_hours=3),
+            make_run(4, 45, age_hours=4),
+        ]
+
+        assert recommend(history).workers == 8
+
+    def test_probes_upward_while_still_scaling(self):
+        """The largest count tried is exceeded while it keeps paying off."""
+        history = [make_run(8, 90, age_hours=1), make_run(4, 50, age_hours=2)]
+
+        decision = recommend(history)
+
+        assert decision.workers == 12
+        assert any("probing 12" in note for note in decision.notes)
+
+    def test_throttled_counts_are_excluded(self):
+        """Runs with many 429s don't win even with higher throughput."""
+        history = [
+            make_run(16, 120, age_hours=1, rate_limit_429s=50),
+            make_run(8, 90, age_hours=2),
+            make_run(4, 80, age_hours=3),
+        ]
+
+        assert recommend(history).workers == 8
+
+    def test_all_unhealthy_steps_down(self):
+        """When every count tried hit busy retries, the next run halves the smallest."""
+        history = [make_run(8, 90, busy_retries=500), make_run(4, 60, busy_retries=300)]
+
+        assert recommend(history).workers == 2
+
+    def test_429s_lower_rate_limit_below_accepted_rate(self):
+        """Rate limits drop just below what the server accepted."""
+        latest = make_run(8, 90, api_calls=500, rate_limit_429s=40)
+
+        decision = recommend([latest])
+
+        # 500 calls in 100 s = 300/min accepted; 90% headroom
+        assert decision.rate_limit_per_minute == 270
+        assert decision.rate_limit_per_second == 9
+
+    def test_limiter_bound_raises_rate_limit_instead_of_workers(self):
+        """Long limiter waits without 429s raise the limit and stop worker probing."""
+        latest = make_run(8, 90, rate_limit_wait_seconds=400)
+
+        decision = recommend([latest])
+
+        assert decision.workers == 8
+        assert decision.rate_limit_per_minute == 750
+        assert decision.rate_limit_per_second == 25
+
+    def test_batch_size_from_payload_size(self):
+        """Large average payloads shrink the batch size."""
+        latest = make_run(8, 90)
+        latest.items_by_type = {ContentType.DASHBOARD.value: 9000}
+        latest.avg_payload_bytes = {ContentType.DASHBOARD.value: 40 * 1024}
+
+        assert recommend([latest]).batch_size == 50
+        assert recommend([latest], batch_size=None).batch_size is None
+
+
+class TestOrchestratorTelemetry:
+    """Tests for telemetry recorded by ParallelOrchestrator."""
+
+    def test_completed_extraction_records_telemetry(self):
+        """A completed run saves its settings, throughput and counters."""
+        extractor = Mock()
+        extractor.client.api_url = INSTANCE
+        repository = Mock()
+        repository.busy_retry_count = 3
+        repository.get_average_content_sizes.return_value = {ContentType.LOOK.value: 900.0}
+        orchestrator = ParallelOrchestrator(
+            extractor=extractor,
+            repository=repository,
+            serializer=Mock(),
+            progress=Mock(),
+            config=ExtractionConfig(content_types=[ContentType.LOOK.value], batch_size=50),
+            parallel_config=ParallelConfig(workers=4, queue_size=400, batch_size=50),
+        )
+        orchestrator._busy_retries_at_start = 1
+        orchestrator.metrics.increment_processed(ContentType.LOOK.value, count=200, nbytes=180_000)
+        orchestrator._seconds_by_type = {ContentType.LOOK.value: 8.0}
+
+        orchestrator._complete_extraction(
+            ExtractionSession(),
+            ExtractionResult(session_id="s", total_items=0),
+            datetime.now() - timedelta(seconds=10),
+        )
+
+        telemetry = repository.save_run_telemetry.call_args.args[0]
+        assert telemetry.operation == "extract"
+        assert telemetry.instance == INSTANCE
+        assert (telemetry.workers, telemetry.batch_size) == (4, 50)
+        assert telemetry.total_items == 200
+        assert telemetry.busy_retries == 2
+        assert telemetry.rate_limit_per_minute == orchestrator.rate_limiter.requests_per_minute
+        assert telemetry.avg_payload_bytes == {ContentType.LOOK.value: 900.0}
+        assert telemetry.seconds_by_type == {ContentType.LOOK.value: 8.0}
+        assert telemetry.bytes_transferred == 180_000
+        assert telemetry.peak_rss_bytes > 0
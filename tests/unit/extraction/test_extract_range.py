@@ -345,3 +345,67 @@ class TestExtractRange:
         assert isinstance(result, dict)
         assert result["id"] == "123"
         assert result["title"] == "Test Dashboard"
+
+
+class TestExtractRangeFieldProfiles:
+    """Tests for field profile projection in extract_range()."""
+
+    def test_index_profile_requests_minimal_fields(self):
+        """Test 'index' profile resolves to identity and timestamp fields."""
+        mock_client = Mock()
+        mock_sdk = Mock()
+        mock_client.sdk = mock_sdk
+        mock_sdk.search_dashboards.return_value = []
+
+        extractor = LookerContentExtractor(client=mock_client)
+        extractor.extract_range(
+            content_type=ContentType.DASHBOARD, offset=0, limit=100, field_profile="index"
+        )
+
+        mock_sdk.search_dashboards.assert_called_once_with(
+            fields="id,title,folder_id,user_id,created_at,updated_at", limit=100, offset=0
+        )
+
+    def test_explicit_fields_override_profile(self):
+        """Test explicit fields string takes precedence over field profile."""
+        mock_client = Mock()
+        mock_sdk = Mock()
+        mock_client.sdk = mock_sdk
+        mock_sdk.search_looks.return_value = []
+
+        extractor = LookerContentExtractor(client=mock_client)
+        extractor.extract_range(
+            content_type=ContentType.LOOK,
+            offset=0,
+            limit=50,
+            fields="id",
+            field_profile="restore-complete",
+        )
+
+        mock_sdk.search_looks.assert_called_once_with(fields="id", limit=50, offset=0)
+
+    def test_full_profile_requests_all_fields(self):
+        """Test 'full' profile passes fields=None to the API."""
+        mock_client = Mock()
+        mock_sdk = Mock()
+        mock_client.sdk = mock_sdk
+        mock_sdk.all_users.return_value = []
+
+        extractor = LookerContentExtractor(client=mock_client)
+        extractor.extract_range(
+            content_type=ContentType.USER, offset=0, limit=100, field_profile="full"
+        )
+
+        mock_sdk.all_users.assert_called_once_with(fields=None, limit=100, offset=0)
+
+    def test_unknown_profile_raises_extraction_error(self):
+        """Test unknown profile name is surfaced as ExtractionError."""
+        mock_client = Mock()
+        mock_client.sdk = Mock()
+
+        extractor = LookerContentExtractor(client=mock_client)
+
+        with pytest.raises(ExtractionError):
+            extractor.extract_range(
+                content_type=ContentType.DASHBOARD, offset=0, limit=100, field_profile="bogus"
+            )
@@ -0,0 +1,154 @@
+"""Tests for RSS memory sampling and opt-in allocation profiling."""
+
+import threading
+import time
+import tracemalloc
+
+from lookervault.extraction.batch_processor import MemoryAwareBatchProcessor
+from lookervault.extraction.memory_monitor import (
+    PRESSURE_CRITICAL,
+    PRESSURE_NORMAL,
+    PRESSURE_WARNING,
+    AllocationProfiler,
+    MemorySampler,
+    read_process_memory,
+)
+
+MB = 1024 * 1024
+
+
+class FakeReader:
+    """Memory reader returning a settable RSS, optionally growing on every read."""
+
+    def __init__(self, rss_mb: float = 100, growth_mb: float = 0):
+        self.rss = int(rss_mb * MB)
+        self.growth = int(growth_mb * MB)
+
+    def __call__(self) -> tuple[int, int]:
+        self.rss += self.growth
+        return self.rss, self.rss
+
+
+class TestReadProcessMemory:
+    """Tests for reading process memory."""
+
+    def test_parses_proc_status(self, tmp_path):
+        """VmRSS and VmHWM are read in kB and returned in bytes."""
+        status = tmp_path / "status"
+        status.write_text("Name:\tpython\nVmHWM:\t  204800 kB\nVmRSS:\t  102400 kB\nThreads:\t4\n")
+
+        assert read_process_memory(status) == (100 * MB, 200 * MB)
+
+    def test_falls_back_without_proc(self, tmp_path):
+        """Without a proc status file, the peak from getrusage is reported."""
+        rss, peak = read_process_memory(tmp_path / "missing")
+
+        assert rss == peak
+        assert peak > 0
+
+
+class TestMemorySampler:
+    """Tests for pressure levels, listeners and backpressure."""
+
+    def test_levels_and_listener_notifications(self):
+        """Listeners are notified only when the pressure level changes."""
+        reader = FakeReader(100)
+        sampler = MemorySampler(warning_mb=500, critical_mb=1000, reader=reader)
+        events = []
+        sampler.add_listener(lambda level, rss: events.append((level, rss // MB)))
+
+        for rss_mb in (100, 600, 700, 1200, 300):
+            reader.rss = rss_mb * MB
+            sampler.sample()
+
+        assert events == [
+            (PRESSURE_WARNING, 600),
+            (PRESSURE_CRITICAL, 1200),
+            (PRESSURE_NORMAL, 300),
+        ]
+        assert sampler.usage() == (300 * MB, 1200 * MB)
+
+    def test_background_thread_samples_until_stopped(self):
+        """The background thread keeps sampling at the configured interval."""
+        reader = FakeReader(100)
+        with MemorySampler(interval_seconds=0.01, reader=reader) as sampler:
+            assert sampler.running
+            reader.rss = 200 * MB
+            deadline = time.monotonic() + 2
+            while sampler.usage()[0] != 200 * MB and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+        assert sampler.usage()[0] == 200 * MB
+        assert not sampler.running
+
+    def test_wait_for_relief_blocks_while_critical_memory_rises(self):
+        """Producers wait while critical memory keeps growing and resume once it stops."""
+        reader = FakeReader(2000, growth_mb=10)
+        with MemorySampler(interval_seconds=0.01, critical_mb=1000, reader=reader) as sampler:
+            assert sampler.level == PRESSURE_CRITICAL
+            assert sampler.wait_for_relief(timeout=0.05) is False
+
+            timer = threading.Timer(0.05, lambda: setattr(reader, "growth", 0))
+            timer.start()
+            assert sampler.wait_for_relief(timeout=5) is True
+            timer.join()
+
+    def test_flat_critical_memory_does_not_block(self):
+        """RSS that stays high without growing (allocator keeps freed memory) isn't waited on."""
+        reader = FakeReader(2000)
+        with MemorySampler(interval_seconds=0.01, critical_mb=1000, reader=reader) as sampler:
+            deadline = time.monotonic() + 2
+            while not sampler.wait_for_relief(timeout=0) and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+            assert sampler.level == PRESSURE_CRITICAL
+            start = time.monotonic()
+            assert sampler.wait_for_relief(timeout=5) is True
+            assert time.monotonic() - start < 1
+
+    def test_wait_for_relief_does_not_block_when_stopped(self):
+        """Without a running sampler there is no backpressure."""
+        sampler = MemorySampler(critical_mb=1000, reader=FakeReader(2000))
+        sampler.sample()
+
+        assert sampler.wait_for_relief(timeout=5) is True
+
+
+class TestBatchProcessorMonitoring:
+    """Tests that batch processing no longer traces allocations."""
+
+    def test_thresholds_are_configurable(self):
+        """Warning and critical thresholds reach the sampler."""
+        processor = MemoryAwareBatchProcessor(warning_mb=2000, critical_mb=4000)
+
+        assert processor.sampler is not None
+        assert processor.sampler.warning_bytes == 2000 * MB
+        assert processor.sampler.critical_bytes == 4000 * MB
+
+    def test_monitoring_does_not_start_tracemalloc(self):
+        """Memory monitoring reads RSS instead of tracing every allocation."""
+        processor = MemoryAwareBatchProcessor(enable_monitoring=True)
+        processor.start_monitoring()
+        try:
+            current, peak = processor.get_memory_usage()
+            assert not tracemalloc.is_tracing()
+            assert 0 < current <= peak
+        finally:
+            processor.stop_monitoring()
+
+
+class TestAllocationProfiler:
+    """Tests for opt-in tracemalloc profiling."""
+
+    def test_reports_top_allocation_sites(self):
+        """The report lists the traced peak and the sites that allocated most."""
+        profiler = AllocationProfiler(frames=1)
+        profiler.start()
+        retained = [bytearray(64 * 1024) for _ in range(32)]
+
+        report = profiler.stop(top=5)
+
+        assert not tracemalloc.is_tracing()
+        assert report[0].startswith("Traced peak:")
+        assert "test_memory_monitor.py" in report[1]
+        assert len(retained) == 32
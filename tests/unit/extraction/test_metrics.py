@@ -0,0 +1,124 @@
+"""Unit tests for ThreadSafeMetrics and LatencyHistogram."""
+
+import random
+import threading
+from unittest.mock import Mock
+
+import pytest
+
+from lookervault.extraction.metrics import LatencyHistogram, LatencyPhase, ThreadSafeMetrics
+from lookervault.extraction.rate_limiter import AdaptiveRateLimiter
+from lookervault.looker.extractor import LookerContentExtractor
+from lookervault.storage.models import ContentType
+
+
+class TestLatencyHistogram:
+    """Tests for LatencyHistogram."""
+
+    def test_percentiles_within_relative_error(self):
+        """Reported percentiles are within ~1.6% of the exact values."""
+        rng = random.Random(7)
+        values = sorted(rng.lognormvariate(-4, 1) for _ in range(20_000))
+        histogram = LatencyHistogram()
+        for value in values:
+            histogram.record(value)
+
+        for percent in (50, 95, 99):
+            exact = values[round(len(values) * percent / 100) - 1]
+            assert histogram.percentile(percent) == pytest.approx(exact, rel=0.02)
+
+    def test_small_values_are_exact(self):
+        """Latencies below the sub-bucket count keep microsecond precision."""
+        histogram = LatencyHistogram()
+        for micros in (5, 10, 100):
+            histogram.record(micros / 1_000_000)
+
+        assert histogram.percentile(50) == pytest.approx(10 / 1_000_000)
+        assert histogram.percentile(100) == pytest.approx(100 / 1_000_000)
+
+    def test_merge_combines_counts(self):
+        """Merging yields the same distribution as recording into one histogram."""
+        left, right, combined = LatencyHistogram(), LatencyHistogram(), LatencyHistogram()
+        for i in range(1, 1001):
+            (left if i % 2 else right).record(i / 1000)
+            combined.record(i / 1000)
+
+        left.merge(right)
+
+        assert left.count == combined.count == 1000
+        assert left.summary() == combined.summary()
+
+    def test_empty_summary(self):
+        """An empty histogram reports zeros."""
+        assert LatencyHistogram().summary() == {
+            "count": 0,
+            "mean_ms": 0.0,
+            "p50_ms": 0.0,
+            "p95_ms": 0.0,
+            "p99_ms": 0.0,
+            "max_ms": 0.0,
+        }
+
+
+class TestShardedMetrics:
+    """Tests for per-thread sharding in ThreadSafeMetrics."""
+
+    def test_counts_from_many_threads_are_merged(self):
+        """Increments from concurrent threads all appear in the snapshot."""
+        metrics = ThreadSafeMetrics()
+        metrics.set_total(ContentType.DASHBOARD.value, 16_000)
+
+        def work():
+            for _ in range(1000):
+                metrics.increment_processed(ContentType.DASHBOARD.value, nbytes=100)
+                metrics.record_latency(LatencyPhase.DB_WRITE, 0.001)
+
+        threads = [threading.Thread(target=work) for _ in range(16)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        snapshot = metrics.snapshot()
+        assert snapshot["total"] == 16_000
+        assert snapshot["bytes"] == 1_600_000
+        assert snapshot["by_type"] == {ContentType.DASHBOARD.value: 16_000}
+        assert snapshot["progress_by_type"][ContentType.DASHBOARD.value] == 100.0
+        assert snapshot["latency"]["db_write"]["count"] == 16_000
+        assert snapshot["latency"]["db_write"]["p99_ms"] == pytest.approx(1.0, rel=0.02)
+        assert metrics.items_processed == 16_000
+
+    def test_endpoint_latency_in_snapshot(self):
+        """Per-endpoint latencies are reported separately from phases."""
+        metrics = ThreadSafeMetrics()
+        metrics.record_endpoint_latency("search_dashboards", 0.2)
+
+        snapshot = metrics.snapshot()
+
+        assert snapshot["latency"] == {}
+        assert snapshot["endpoint_latency"]["search_dashboards"]["p50_ms"] == pytest.approx(
+            200, rel=0.02
+        )
+
+
+class TestExtractorLatency:
+    """Tests for latencies recorded by LookerContentExtractor."""
+
+    def test_extract_range_records_phases_and_endpoint(self):
+        """API call, rate-limit wait and conversions are timed."""
+        mock_client = Mock()
+        mock_client.sdk.search_dashboards.return_value = [Mock(id="1"), Mock(id="2")]
+        metrics = ThreadSafeMetrics()
+        extractor = LookerContentExtractor(
+            client=mock_client,
+            rate_limiter=AdaptiveRateLimiter(requests_per_minute=1000, requests_per_second=100),
+            metrics=metrics,
+        )
+
+        extractor.extract_range(ContentType.DASHBOARD, offset=0, limit=10)
+
+        snapshot = metrics.snapshot()
+        assert snapshot["latency"]["api_fetch"]["count"] == 1
+        assert snapshot["latency"]["rate_limit_wait"]["count"] == 1
+        assert snapshot["latency"]["sdk_to_dict"]["count"] == 2
+        assert snapshot["endpoint_latency"]["search_dashboards"]["count"] == 1
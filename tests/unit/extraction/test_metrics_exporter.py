@@ -0,0 +1,117 @@
+"""Unit tests for the Prometheus metrics exporter."""
+
+import urllib.request
+
+import pytest
+
+from lookervault.extraction.metrics import LatencyPhase, ThreadSafeMetrics
+from lookervault.extraction.metrics_exporter import MetricsExporter
+from lookervault.extraction.rate_limiter import AdaptiveRateLimiter
+from lookervault.storage.models import ContentType
+from lookervault.storage.repository import SQLiteContentRepository
+
+
+def parse_samples(text: str) -> dict[str, float]:
+    """Map each sample line (name plus labels) to its value."""
+    samples = {}
+    for line in text.splitlines():
+        if line and not line.startswith("#"):
+            name, value = line.rsplit(" ", 1)
+            samples[name] = float(value)
+    return samples
+
+
+@pytest.fixture
+def metrics():
+    """Metrics with some processed items, an error and latencies."""
+    metrics = ThreadSafeMetrics()
+    metrics.set_total(ContentType.DASHBOARD.value, 10)
+    metrics.increment_processed(ContentType.DASHBOARD.value, count=4)
+    metrics.record_error("worker-1", "boom")
+    metrics.record_latency(LatencyPhase.DB_WRITE, 0.002)
+    return metrics
+
+
+@pytest.fixture
+def repository(tmp_path):
+    """Repository on a temporary database."""
+    repository = SQLiteContentRepository(db_path=tmp_path / "metrics.db")
+    yield repository
+    repository.close()
+
+
+class TestCollect:
+    """Tests for MetricsExporter.collect()."""
+
+    def test_run_metrics(self, metrics):
+        """Counters, totals and latency summaries are exported with the job label."""
+        samples = parse_samples(MetricsExporter(metrics, job="extract").collect())
+
+        labels = 'job="extract",content_type="dashboard"'
+        assert samples[f"lookervault_items_processed_total{{{labels}}}"] == 4
+        assert samples[f"lookervault_items_expected{{{labels}}}"] == 10
+        assert samples['lookervault_errors_total{job="extract"}'] == 1
+        count_key = 'lookervault_phase_latency_seconds_count{job="extract",phase="db_write"}'
+        assert samples[count_key] == 1
+        p99_key = (
+            'lookervault_phase_latency_seconds{job="extract",quantile="0.99",phase="db_write"}'
+        )
+        assert samples[p99_key] == pytest.approx(0.002, rel=0.02)
+
+    def test_rate_limiter_storage_and_process(self, repository):
+        """Rate limiter stats, SQLite state and RSS are exported."""
+        rate_limiter = AdaptiveRateLimiter(requests_per_minute=120, requests_per_second=10)
+        rate_limiter.on_429_detected()
+
+        samples = parse_samples(
+            MetricsExporter(
+                None, job="restore", rate_limiter=rate_limiter, repository=repository
+            ).collect()
+        )
+
+        assert samples['lookervault_rate_limit_429_total{job="restore"}'] == 1
+        assert samples['lookervault_rate_limit_requests_per_minute{job="restore"}'] == 120
+        assert samples['lookervault_sqlite_busy_retries_total{job="restore"}'] == 0
+        assert samples['lookervault_dead_letter_items{job="restore"}'] == 0
+        assert 'lookervault_sqlite_wal_bytes{job="restore"}' in samples
+        assert samples['lookervault_process_resident_memory_bytes{job="restore"}'] >= 0
+        assert not any(name.startswith("lookervault_items") for name in samples)
+
+    def test_large_counters_stay_exact(self):
+        """Counters are not rounded to scientific notation."""
+        metrics = ThreadSafeMetrics()
+        metrics.increment_processed(ContentType.LOOK.value, count=1_234_567)
+
+        text = MetricsExporter(metrics, job="extract").collect()
+
+        assert 'content_type="look"} 1234567\n' in text
+
+
+class TestPublishing:
+    """Tests for the HTTP endpoint and textfile writer."""
+
+    def test_http_endpoint_serves_live_metrics(self, metrics):
+        """Each scrape reflects the current metrics."""
+        with MetricsExporter(metrics, job="extract", port=0, host="127.0.0.1") as exporter:
+            url = f"http://127.0.0.1:{exporter.port}/metrics"
+            first = urllib.request.urlopen(url, timeout=5).read().decode()
+            metrics.increment_processed(ContentType.DASHBOARD.value, count=2)
+            second = urllib.request.urlopen(url, timeout=5).read().decode()
+
+        key = 'lookervault_items_processed_total{job="extract",content_type="dashboard"}'
+        assert parse_samples(first)[key] == 4
+        assert parse_samples(second)[key] == 6
+
+    def test_textfile_has_final_values_after_stop(self, metrics, tmp_path):
+        """The textfile is rewritten atomically and once more on stop."""
+        textfile = tmp_path / "textfile" / "lookervault.prom"
+        exporter = MetricsExporter(metrics, job="extract", textfile=textfile, interval=60)
+
+        exporter.start()
+        metrics.increment_processed(ContentType.DASHBOARD.value, count=6)
+        exporter.stop()
+
+        samples = parse_samples(textfile.read_text())
+        key = 'lookervault_items_processed_total{job="extract",content_type="dashboard"}'
+        assert samples[key] == 10
+        assert [p.name for p in textfile.parent.iterdir()] == ["lookervault.prom"]
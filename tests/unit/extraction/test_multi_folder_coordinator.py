@@ -438,3 +438,21 @@ class TestMultiFolderOffsetCoordinator:
         stats = coordinator.get_statistics()
         assert stats["123"]["total_claimed"] == 3
         assert stats["456"]["total_claimed"] == 3
+
+    def test_end_offset_exhausts_folder_without_waiting_for_all_workers(self):
+        """A known end offset stops claims for that folder after one worker reports it."""
+        coordinator = MultiFolderOffsetCoordinator(folder_ids=["A", "B"], stride=100)
+        coordinator.set_total_workers(8)
+
+        assert coordinator.claim_range() == ("A", 0, 100)
+        assert coordinator.claim_range() == ("B", 0, 100)
+
+        # Folder A returned a short page of 30 items
+        coordinator.mark_folder_complete("A", end_offset=30)
+
+        # Only folder B keeps receiving claims
+        assert coordinator.claim_range() == ("B", 100, 100)
+        assert coordinator.claim_range() == ("B", 200, 100)
+
+        coordinator.mark_folder_complete("B", end_offset=250)
+        assert coordinator.claim_range() is None
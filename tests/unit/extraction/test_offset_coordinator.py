@@ -262,3 +262,68 @@ class TestOffsetCoordinator:
         assert coordinator.all_workers_done(), (
             "Expected all_workers_done to remain True after post-completion claims"
         )
+
+    def test_mark_end_of_data_cancels_outstanding_claims(self):
+        """Once the end is observed, no further ranges are handed out."""
+        coordinator = OffsetCoordinator(stride=100)
+        coordinator.set_total_workers(4)
+
+        assert coordinator.claim_range() == (0, 100)
+        assert coordinator.claim_range() == (100, 100)
+
+        # Worker holding (0, 100) got a short page of 40 items
+        coordinator.mark_end_of_data(40)
+
+        assert coordinator.claim_range() is None
+        assert coordinator.all_workers_done()
+
+    def test_mark_end_of_data_keeps_smallest_observed_end(self):
+        """Observed ends only move down."""
+        coordinator = OffsetCoordinator(stride=100)
+        coordinator.mark_end_of_data(300)
+        coordinator.mark_end_of_data(500)
+
+        assert coordinator.get_end_offset() == 300
+
+    def test_set_total_count_balances_pages(self):
+        """Probed totals bound claims and equalize page sizes without adding pages."""
+        coordinator = OffsetCoordinator(stride=100)
+        coordinator.set_total_count(1010)
+
+        claims = []
+        while (claim := coordinator.claim_range()) is not None:
+            claims.append(claim)
+
+        assert len(claims) == 11
+        assert {limit for _, limit in claims} == {92}
+        assert claims[-1][0] + claims[-1][1] >= 1010
+
+    def test_set_total_count_zero_claims_nothing(self):
+        """An empty content type needs no requests at all."""
+        coordinator = OffsetCoordinator(stride=100)
+        coordinator.set_total_count(0)
+
+        assert coordinator.claim_range() is None
+
+    def test_full_page_reopens_probed_bound(self):
+        """If more items appear than probed, claiming continues past the estimate."""
+        coordinator = OffsetCoordinator(stride=100)
+        coordinator.set_total_count(100)
+
+        assert coordinator.claim_range() == (0, 100)
+        assert coordinator.claim_range() is None
+
+        coordinator.record_full_page(100)
+
+        assert coordinator.get_end_offset() is None
+        assert coordinator.claim_range() == (100, 100)
+
+    def test_full_page_does_not_reopen_observed_end(self):
+        """An end observed from a short page is authoritative."""
+        coordinator = OffsetCoordinator(stride=100)
+        coordinator.set_total_count(500)
+        coordinator.mark_end_of_data(250)
+
+        coordinator.record_full_page(300)
+
+        assert coordinator.get_end_offset() == 250
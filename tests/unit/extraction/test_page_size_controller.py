@@ -0,0 +1,225 @@
+"""Unit tests for AdaptivePageSizeController and adaptive offset claiming."""
+
+import threading
+from unittest.mock import Mock
+
+import pytest
+
+from lookervault.config.models import ParallelConfig
+from lookervault.extraction.multi_folder_coordinator import MultiFolderOffsetCoordinator
+from lookervault.extraction.offset_coordinator import OffsetCoordinator
+from lookervault.extraction.orchestrator import ExtractionConfig
+from lookervault.extraction.page_size_controller import AdaptivePageSizeController
+from lookervault.extraction.parallel_orchestrator import ParallelOrchestrator
+from lookervault.storage.models import Checkpoint, ContentType
+from lookervault.storage.repository import SQLiteContentRepository
+
+
+class TestAdaptivePageSizeController:
+    """Tests for page-size tuning decisions."""
+
+    def test_initial_size_is_clamped(self):
+        """Initial size outside bounds is clamped."""
+        controller = AdaptivePageSizeController(initial_size=5000, min_size=10, max_size=500)
+        assert controller.current_size == 500
+
+    def test_invalid_bounds_rejected(self):
+        """min_size must not exceed max_size."""
+        with pytest.raises(ValueError, match="Invalid page size bounds"):
+            AdaptivePageSizeController(initial_size=100, min_size=200, max_size=100)
+
+    def test_error_halves_size_down_to_minimum(self):
+        """Each error halves the page size but never below min_size."""
+        controller = AdaptivePageSizeController(initial_size=100, min_size=30, max_size=500)
+
+        controller.record_error()
+        assert controller.current_size == 50
+
+        controller.record_error()
+        assert controller.current_size == 30
+
+    def test_slow_pages_shrink_toward_latency_target(self):
+        """Pages over the latency target shrink (at most halving per observation)."""
+        controller = AdaptivePageSizeController(
+            initial_size=400, min_size=10, max_size=1000, target_latency_seconds=2.0
+        )
+
+        # 400 items in 8s -> 20ms/item -> 100 items meets 2s target, but halving caps at 200
+        controller.record_page(requested=400, received=400, latency_seconds=8.0, payload_bytes=400)
+        assert controller.current_size == 200
+
+    def test_heavy_payload_shrinks_size(self):
+        """Pages over the payload target shrink even when fast."""
+        controller = AdaptivePageSizeController(
+            initial_size=100, min_size=10, max_size=1000, max_page_bytes=100_000
+        )
+
+        # 100 items of 2KB = 200KB per page -> 50 items meets the 100KB target
+        controller.record_page(
+            requested=100, received=100, latency_seconds=0.1, payload_bytes=200_000
+        )
+        assert controller.current_size == 50
+
+    def test_fast_full_pages_grow_gradually(self):
+        """Cheap full pages grow by at most 1.5x per observation up to max_size."""
+        controller = AdaptivePageSizeController(initial_size=100, min_size=10, max_size=200)
+
+        controller.record_page(requested=100, received=100, latency_seconds=0.1, payload_bytes=1000)
+        assert controller.current_size == 150
+
+        controller.record_page(requested=150, received=150, latency_seconds=0.1, payload_bytes=1500)
+        assert controller.current_size == 200
+
+    def test_short_page_does_not_grow(self):
+        """A short (tail) page is not evidence that bigger pages are safe."""
+        controller = AdaptivePageSizeController(initial_size=100, min_size=10, max_size=1000)
+
+        controller.record_page(requested=100, received=40, latency_seconds=0.1, payload_bytes=400)
+        assert controller.current_size == 100
+
+    def test_high_error_rate_blocks_growth(self):
+        """Growth is suppressed while the recent error rate is high."""
+        controller = AdaptivePageSizeController(initial_size=100, min_size=10, max_size=1000)
+        controller.record_error()  # 50, error rate 1.0
+
+        controller.record_page(requested=50, received=50, latency_seconds=0.1, payload_bytes=500)
+        assert controller.current_size == 50
+
+    def test_snapshot_contains_page_size(self):
+        """Snapshot exposes the chosen page size for checkpoint_data."""
+        controller = AdaptivePageSizeController(initial_size=100, min_size=10, max_size=1000)
+        controller.record_error()
+
+        snapshot = controller.snapshot()
+
+        assert snapshot["page_size"] == 50
+        assert snapshot["page_size_adjustments"] == 1
+
+
+class TestAdaptiveOffsetClaiming:
+    """Offsets must stay contiguous when the page size changes."""
+
+    def test_offsets_contiguous_across_resizes(self):
+        """Each claim starts where the previous one ended."""
+        controller = AdaptivePageSizeController(initial_size=100, min_size=10, max_size=1000)
+        coordinator = OffsetCoordinator(stride=100, page_size_controller=controller)
+
+        claims = [coordinator.claim_range()]
+        controller.record_error()
+        claims.append(coordinator.claim_range())
+        controller.record_error()
+        claims.append(coordinator.claim_range())
+
+        assert claims == [(0, 100), (100, 50), (150, 25)]
+        assert coordinator.get_current_offset() == 175
+
+    def test_concurrent_claims_cover_range_without_gaps(self):
+        """Concurrent claims with a changing size tile the offset space exactly."""
+        controller = AdaptivePageSizeController(initial_size=64, min_size=1, max_size=1000)
+        coordinator = OffsetCoordinator(stride=64, page_size_controller=controller)
+        claims: list[tuple[int, int]] = []
+        lock = threading.Lock()
+
+        def worker():
+            for i in range(50):
+                claim = coordinator.claim_range()
+                if i % 10 == 0:
+                    controller.record_error()
+                with lock:
+                    claims.append(claim)
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        claims.sort()
+        expected_offset = 0
+        for offset, limit in claims:
+            assert offset == expected_offset
+            expected_offset += limit
+        assert expected_offset == coordinator.get_current_offset()
+
+    def test_multi_folder_uses_controller_size(self):
+        """Multi-folder coordinator claims use the controller size per folder."""
+        controller = AdaptivePageSizeController(initial_size=100, min_size=10, max_size=1000)
+        coordinator = MultiFolderOffsetCoordinator(
+            folder_ids=["1"], stride=100, page_size_controller=controller
+        )
+        coordinator.set_total_workers(1)
+
+        assert coordinator.claim_range() == ("1", 0, 100)
+        controller.record_error()
+        assert coordinator.claim_range() == ("1", 100, 50)
+
+
+class TestPageSizePersistence:
+    """Chosen page sizes are recorded in checkpoint_data and reused."""
+
+    def test_get_last_page_size(self, tmp_path):
+        """Repository returns the most recent recorded page size for the type."""
+        repo = SQLiteContentRepository(tmp_path / "test.db")
+        assert repo.get_last_page_size(ContentType.DASHBOARD.value) is None
+
+        repo.save_checkpoint(
+            Checkpoint(
+                session_id="s1",
+                content_type=ContentType.DASHBOARD.value,
+                checkpoint_data={"page_size": 250},
+            )
+        )
+        repo.save_checkpoint(
+            Checkpoint(
+                session_id="s1",
+                content_type=ContentType.LOOK.value,
+                checkpoint_data={"page_size": 40},
+            )
+        )
+
+        assert repo.get_last_page_size(ContentType.DASHBOARD.value) == 250
+        assert repo.get_last_page_size(ContentType.LOOK.value) == 40
+
+    def test_orchestrator_starts_from_recorded_size_and_records_choice(self):
+        """Parallel extraction reuses the last page size and records the tuned one."""
+        mock_extractor = Mock()
+        mock_repository = Mock()
+        mock_repository.save_checkpoint.return_value = 1
+        mock_repository.get_last_page_size.return_value = 250
+
+        mock_serializer = Mock()
+        mock_serializer.serialize.return_value = b"x" * 10
+
+        orchestrator = ParallelOrchestrator(
+            extractor=mock_extractor,
+            repository=mock_repository,
+            serializer=mock_serializer,
+            progress=Mock(),
+            config=ExtractionConfig(content_types=[ContentType.DASHBOARD.value], batch_size=100),
+            parallel_config=ParallelConfig(
+                workers=1, queue_size=100, adaptive_page_size=True, adaptive_rate_limiting=False
+            ),
+        )
+
+        # First page fails (page shrinks 250 -> 125); the failed range is re-fetched
+        # as two smaller pages, the second of which is the short tail page
+        mock_extractor.extract_range.side_effect = [
+            RuntimeError("502 Bad Gateway"),
+            [{"id": str(i), "title": f"Dashboard {i}"} for i in range(125)],
+            [{"id": "125", "title": "Dashboard 125"}],
+        ]
+
+        orchestrator._extract_parallel(
+            ContentType.DASHBOARD.value, "session-1", fields=None, updated_after=None
+        )
+
+        ranges = [
+            (c.kwargs["offset"], c.kwargs["limit"])
+            for c in mock_extractor.extract_range.call_args_list
+        ]
+        assert ranges == [(0, 250), (0, 125), (125, 125)]
+        assert mock_repository.save_content.call_count == 126
+
+        checkpoint = mock_repository.update_checkpoint.call_args.args[0]
+        assert checkpoint.checkpoint_data["page_size"] == 125
+        assert checkpoint.item_count == 126
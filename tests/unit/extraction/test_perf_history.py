@@ -0,0 +1,156 @@
+"""Unit tests for run history regression detection and `perf history`."""
+
+import json
+from datetime import datetime, timedelta
+
+import pytest
+from typer.testing import CliRunner
+
+from lookervault.cli.main import app
+from lookervault.extraction.perf_history import compare_runs, run_metrics
+from lookervault.storage.models import ContentType, RunTelemetry
+from lookervault.storage.repository import SQLiteContentRepository
+
+INSTANCE = "https://looker.example.com"
+NOW = datetime(2026, 3, 1, 12, 0)
+DASHBOARD = ContentType.DASHBOARD.value
+LOOK = ContentType.LOOK.value
+
+
+def make_run(
+    dashboards_per_second: float,
+    *,
+    age_days: float = 0,
+    operation: str = "extract",
+    looks_per_second: float = 50.0,
+    peak_rss_bytes: int = 200 * 1024 * 1024,
+) -> RunTelemetry:
+    """Build an extraction of 1000 dashboards and 1000 looks."""
+    dashboard_seconds = 1000 / dashboards_per_second
+    look_seconds = 1000 / looks_per_second
+    return RunTelemetry(
+        operation=operation,
+        instance=INSTANCE,
+        workers=8,
+        duration_seconds=dashboard_seconds + look_seconds,
+        total_items=2000,
+        api_calls=40,
+        bytes_transferred=20 * 1024 * 1024,
+        peak_rss_bytes=peak_rss_bytes,
+        items_by_type={DASHBOARD: 1000, LOOK: 1000},
+        seconds_by_type={DASHBOARD: dashboard_seconds, LOOK: look_seconds},
+        recorded_at=NOW - timedelta(days=age_days),
+    )
+
+
+def baseline_runs(count: int = 3, **kwargs) -> list[RunTelemetry]:
+    """Healthy runs on each of the previous days."""
+    return [make_run(20.0, age_days=day, **kwargs) for day in range(1, count + 1)]
+
+
+class TestCompareRuns:
+    """Tests for compare_runs()."""
+
+    def test_throughput_drop_is_a_regression(self):
+        """Dashboards slowing from 20 to 13 items/sec is flagged at the default 20%."""
+        comparisons = compare_runs([make_run(13.0), *baseline_runs()])
+
+        assert len(comparisons) == 1
+        regressions = comparisons[0].regressions
+        assert [metric.metric for metric in regressions if "dashboard" in metric.metric] == [
+            "dashboards items/sec"
+        ]
+        dashboards = next(m for m in regressions if m.metric == "dashboards items/sec")
+        assert dashboards.change == pytest.approx(-0.35)
+        assert dashboards.describe().startswith("dashboards items/sec down 35% vs 7-day median")
+        assert "looks items/sec" not in {metric.metric for metric in regressions}
+
+    def test_cost_increase_is_a_regression(self):
+        """Peak memory rising by half is flagged; lower memory is not."""
+        grown = compare_runs([make_run(20.0, peak_rss_bytes=300 * 1024 * 1024), *baseline_runs()])
+        shrunk = compare_runs([make_run(20.0, peak_rss_bytes=100 * 1024 * 1024), *baseline_runs()])
+
+        assert [metric.metric for metric in grown[0].regressions] == ["peak RSS MB"]
+        assert shrunk[0].regressions == []
+
+    def test_baseline_limited_to_window_and_workload(self):
+        """Old runs and other operations don't count toward the baseline."""
+        runs = [
+            make_run(13.0),
+            make_run(20.0, age_days=1),
+            make_run(20.0, age_days=10),
+            make_run(20.0, age_days=2, operation="restore"),
+        ]
+
+        comparisons = compare_runs(runs, min_baseline_runs=1)
+
+        extract = next(c for c in comparisons if c.run.operation == "extract")
+        assert extract.run.recorded_at == NOW
+        assert extract.baseline_runs == 1
+        assert extract.regressions
+
+    def test_too_few_baseline_runs_compares_nothing(self):
+        """Below min_baseline_runs the run is reported without metrics."""
+        comparisons = compare_runs([make_run(5.0), *baseline_runs(2)])
+
+        assert comparisons[0].baseline_runs == 2
+        assert comparisons[0].metrics == []
+
+    def test_unrecorded_metrics_are_skipped(self):
+        """Rows saved before byte and memory tracking don't produce those metrics."""
+        run = make_run(20.0, peak_rss_bytes=0)
+        run.bytes_transferred = 0
+
+        assert {"MB/sec", "peak RSS MB"}.isdisjoint(run_metrics(run))
+
+
+class TestPerfHistoryCommand:
+    """Tests for `lookervault perf history`."""
+
+    @pytest.fixture
+    def db_path(self, tmp_path):
+        """Database with a regressed extraction after three healthy ones."""
+        path = tmp_path / "looker.db"
+        repository = SQLiteContentRepository(db_path=path)
+        try:
+            for run in [*baseline_runs(), make_run(13.0)]:
+                repository.save_run_telemetry(run)
+        finally:
+            repository.close()
+        return path
+
+    def test_json_output_and_fail_on_regression(self, db_path):
+        """JSON lists runs and regressions; --fail-on-regression exits with code 3."""
+        result = CliRunner().invoke(
+            app,
+            ["perf", "history", "--db-path", str(db_path), "--json", "--fail-on-regression"],
+        )
+
+        assert result.exit_code == 3, result.output
+        output = json.loads(result.stdout)
+        assert len(output["runs"]) == 4
+        assert output["runs"][0]["items_per_second_by_type"]["dashboard"] == pytest.approx(13.0)
+        assert output["runs"][0]["peak_rss_bytes"] == 200 * 1024 * 1024
+        assert any(
+            message.startswith("extract: dashboards items/sec down 35%")
+            for message in output["regressions"]
+        )
+
+    def test_threshold_above_change_passes(self, db_path):
+        """A 35% drop is not a regression at a 50% threshold."""
+        result = CliRunner().invoke(
+            app,
+            [
+                "perf",
+                "history",
+                "--db-path",
+                str(db_path),
+                "--json",
+                "--threshold",
+                "50",
+                "--fail-on-regression",
+            ],
+        )
+
+        assert result.exit_code == 0, result.output
+        assert json.loads(result.stdout)["regressions"] == []
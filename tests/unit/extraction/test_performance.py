@@ -535,6 +535,7 @@ class TestMemoryUsageStability:
     def test_memory_usage_during_batch_processing(self):
         """Test that memory usage remains stable during batch processing."""
         processor = MemoryAwareBatchProcessor(enable_monitoring=True)
+        initial_mem, _ = processor.get_memory_usage()
 
         # Generate large dataset
         def item_generator(count: int) -> Iterator[int]:
@@ -568,14 +569,18 @@ class TestMemoryUsageStability:
         # Assert all items were processed
         assert len(results) == 1000
 
-        # Memory should be reasonable (less than 100MB for this simple test)
-        assert peak_mb < 100, f"Peak memory usage {peak_mb:.1f} MB exceeds 100 MB"
+        # Memory growth should be reasonable (less than 100MB for this simple test)
+        growth_mb = (current_mem - initial_mem) / (1024 * 1024)
+        assert current_mem > 0
+        assert peak_mem >= current_mem
+        assert growth_mb < 100, f"Memory growth {growth_mb:.1f} MB exceeds 100 MB"
 
         processor.stop_monitoring()
 
     def test_memory_usage_with_large_items(self):
         """Test memory usage with large content items."""
         processor = MemoryAwareBatchProcessor(enable_monitoring=True)
+        initial_mem, _ = processor.get_memory_usage()
 
         # Generate items with larger payloads
         def large_item_generator(count: int) -> Iterator[bytes]:
@@ -609,8 +614,9 @@ class TestMemoryUsageStability:
         assert len(results) == 500
 
         # Memory should still be reasonable for 500 items * 10KB
-        # Peak should be under 200MB even with large items
-        assert peak_mb < 200, f"Peak memory usage {peak_mb:.1f} MB exceeds 200 MB"
+        # Growth should be under 200MB even with large items
+        growth_mb = (current_mem - initial_mem) / (1024 * 1024)
+        assert growth_mb < 200, f"Memory growth {growth_mb:.1f} MB exceeds 200 MB"
 
         processor.stop_monitoring()
 
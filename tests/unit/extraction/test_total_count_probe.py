@@ -0,0 +1,129 @@
+"""Unit tests for total-count probing in ParallelOrchestrator."""
+
+import threading
+from datetime import UTC, datetime
+from unittest.mock import Mock
+
+import pytest
+
+from lookervault.config.models import ParallelConfig
+from lookervault.extraction.offset_coordinator import OffsetCoordinator
+from lookervault.extraction.orchestrator import ExtractionConfig
+from lookervault.extraction.parallel_orchestrator import ParallelOrchestrator
+from lookervault.storage.models import Checkpoint, ContentType
+
+
+def make_orchestrator(total_items: int, workers: int = 4):
+    """Create orchestrator whose extractor serves ``total_items`` items by offset."""
+    mock_extractor = Mock()
+
+    def extract_range(content_type, offset, limit, **kwargs):
+        return [{"id": str(i)} for i in range(offset, min(offset + limit, total_items))]
+
+    mock_extractor.extract_range.side_effect = extract_range
+
+    mock_repository = Mock()
+    orchestrator = ParallelOrchestrator(
+        extractor=mock_extractor,
+        repository=mock_repository,
+        serializer=Mock(serialize=Mock(return_value=b"data")),
+        progress=Mock(),
+        config=ExtractionConfig(content_types=[ContentType.DASHBOARD.value], batch_size=100),
+        parallel_config=ParallelConfig(
+            workers=workers, queue_size=workers * 100, adaptive_rate_limiting=False
+        ),
+    )
+    return orchestrator, mock_extractor, mock_repository
+
+
+class TestProbeTotalCount:
+    """Tests for _probe_total_count search."""
+
+    @pytest.mark.parametrize(
+        ("total", "hint"),
+        [(0, 100), (1, 100), (99, 100), (100, 100), (101, 100), (1234, 100), (1234, 1300)],
+    )
+    def test_probe_finds_exact_total(self, total, hint):
+        """Probing returns the exact count for hints below, at and above the total."""
+        orchestrator, _, _ = make_orchestrator(total)
+
+        assert orchestrator._probe_total_count(ContentType.DASHBOARD.value, hint) == total
+
+    def test_exact_hint_costs_three_requests(self):
+        """A correct stored-count hint confirms the total in three 1-item requests."""
+        orchestrator, mock_extractor, _ = make_orchestrator(5000)
+
+        assert orchestrator._probe_total_count(ContentType.DASHBOARD.value, 5000) == 5000
+        assert mock_extractor.extract_range.call_count == 3
+        for probe_call in mock_extractor.extract_range.call_args_list:
+            assert probe_call.kwargs["limit"] == 1
+
+    def test_probe_failure_returns_none(self):
+        """API failures fall back to end-of-data detection."""
+        orchestrator, mock_extractor, _ = make_orchestrator(100)
+        mock_extractor.extract_range.side_effect = RuntimeError("boom")
+
+        assert orchestrator._probe_total_count(ContentType.DASHBOARD.value, 100) is None
+
+
+class TestProbedExtraction:
+    """Probed totals bound the coordinator and avoid empty requests."""
+
+    def test_probe_bounds_coordinator_and_sets_progress_total(self):
+        """Full runs probe, bound the coordinator and record the total."""
+        orchestrator, _, mock_repository = make_orchestrator(1010)
+        mock_repository.count_content.return_value = 1000
+        coordinator = OffsetCoordinator(stride=100)
+        checkpoint = Checkpoint(content_type=ContentType.DASHBOARD.value, checkpoint_data={})
+
+        orchestrator._apply_total_count_probe(
+            ContentType.DASHBOARD.value, "dashboard", coordinator, checkpoint, None
+        )
+
+        assert coordinator.get_end_offset() == 1010
+        assert checkpoint.checkpoint_data["probed_total"] == 1010
+        totals = orchestrator.metrics.snapshot()["total_by_type"]
+        assert totals[ContentType.DASHBOARD.value] == 1010
+
+    def test_incremental_runs_skip_probe(self):
+        """Incremental runs do not probe."""
+        orchestrator, mock_extractor, _ = make_orchestrator(1010)
+        coordinator = OffsetCoordinator(stride=100)
+        checkpoint = Checkpoint(content_type=ContentType.DASHBOARD.value, checkpoint_data={})
+
+        orchestrator._apply_total_count_probe(
+            ContentType.DASHBOARD.value,
+            "dashboard",
+            coordinator,
+            checkpoint,
+            datetime(2024, 1, 1, tzinfo=UTC),
+        )
+
+        mock_extractor.extract_range.assert_not_called()
+        assert coordinator.get_end_offset() is None
+
+    def test_parallel_extraction_makes_no_empty_page_requests(self):
+        """With a probed total, workers never request a page past the end."""
+        orchestrator, mock_extractor, mock_repository = make_orchestrator(1010, workers=8)
+        mock_repository.count_content.return_value = 1010
+        mock_repository.save_checkpoint.return_value = 1
+        # Mock.call_count is not updated atomically, so track saves under a lock
+        saved_ids: set[str] = set()
+        saved_lock = threading.Lock()
+
+        def save_content(item):
+            with saved_lock:
+                saved_ids.add(item.id)
+
+        mock_repository.save_content.side_effect = save_content
+
+        orchestrator._extract_parallel(
+            ContentType.DASHBOARD.value, "session-1", fields=None, updated_after=None
+        )
+
+        page_calls = [
+            c for c in mock_extractor.extract_range.call_args_list if c.kwargs["limit"] > 1
+        ]
+        assert all(c.kwargs["offset"] < 1010 for c in page_calls)
+        assert len(page_calls) == 11
+        assert len(saved_ids) == 1010
@@ -0,0 +1,248 @@
+"""Unit tests for two-phase (index sweep + detail fetch) extraction."""
+
+from datetime import UTC, datetime
+from unittest.mock import Mock
+
+import pytest
+
+from lookervault.config.models import ParallelConfig
+from lookervault.exceptions import OrchestrationError
+from lookervault.extraction.index_diff import diff_index
+from lookervault.extraction.orchestrator import ExtractionConfig
+from lookervault.extraction.parallel_orchestrator import ParallelOrchestrator
+from lookervault.looker.field_profiles import FieldProfile
+from lookervault.storage.models import ContentItem, ContentType
+from lookervault.storage.repository import SQLiteContentRepository
+
+T1 = datetime(2024, 1, 1, tzinfo=UTC)
+T2 = datetime(2024, 6, 1, tzinfo=UTC)
+
+
+class TestDiffIndex:
+    """Tests for diff_index change detection."""
+
+    def test_classifies_new_changed_unchanged_deleted(self):
+        """Each live item lands in exactly one bucket; missing stored items are deleted."""
+        stored = {"1": T1, "2": T1, "3": T1}
+        live = [
+            {"id": "1", "updated_at": T1.isoformat()},
+            {"id": "2", "updated_at": T2.isoformat()},
+            {"id": "4", "updated_at": T2.isoformat()},
+        ]
+
+        diff = diff_index(live, stored)
+
+        assert diff.new_ids == ["4"]
+        assert diff.changed_ids == ["2"]
+        assert diff.deleted_ids == ["3"]
+        assert diff.unchanged_count == 1
+        assert diff.fetch_ids == ["4", "2"]
+        assert diff.live_count == 3
+
+    def test_missing_updated_at_counts_as_changed(self):
+        """Items without updated_at are refetched rather than assumed unchanged."""
+        diff = diff_index([{"id": "1"}], {"1": T1})
+
+        assert diff.changed_ids == ["1"]
+        assert diff.unchanged_count == 0
+
+    def test_duplicate_and_integer_ids(self):
+        """Duplicate rows from shifting pages are ignored and ids are normalized to str."""
+        live = [{"id": 7, "updated_at": T1.isoformat()}, {"id": "7", "updated_at": T1.isoformat()}]
+
+        diff = diff_index(live, {"7": T1})
+
+        assert diff.unchanged_count == 1
+        assert diff.deleted_ids == []
+
+
+class TestTwoPhaseExtraction:
+    """Tests for ParallelOrchestrator two-phase strategy."""
+
+    def create_orchestrator(self, workers: int = 2):
+        """Create orchestrator with mocked extractor and repository."""
+        mock_extractor = Mock()
+        mock_repository = Mock()
+        mock_repository.save_checkpoint = Mock(return_value=1)
+
+        mock_serializer = Mock()
+        mock_serializer.serialize = Mock(return_value=b"serialized_data")
+
+        extraction_config = ExtractionConfig(
+            content_types=[ContentType.DASHBOARD.value],
+            batch_size=100,
+            two_phase=True,
+        )
+        parallel_config = ParallelConfig(
+            workers=workers,
+            queue_size=workers * 100,
+            batch_size=100,
+            adaptive_rate_limiting=False,
+        )
+
+        orchestrator = ParallelOrchestrator(
+            extractor=mock_extractor,
+            repository=mock_repository,
+            serializer=mock_serializer,
+            progress=Mock(),
+            config=extraction_config,
+            parallel_config=parallel_config,
+        )
+        return orchestrator, mock_extractor, mock_repository
+
+    def test_fetches_only_changed_and_soft_deletes_missing(self):
+        """Only new/changed items are fetched in detail; vanished items are tombstoned."""
+        orchestrator, mock_extractor, mock_repository = self.create_orchestrator()
+
+        mock_extractor.extract_range.side_effect = [
+            [
+                {"id": "1", "title": "Same", "updated_at": T1.isoformat()},
+                {"id": "2", "title": "Changed", "updated_at": T2.isoformat()},
+                {"id": "4", "title": "New", "updated_at": T2.isoformat()},
+            ],
+            [],
+        ]
+        mock_extractor.extract_one.side_effect = lambda ct, content_id: {
+            "id": content_id,
+            "title": f"Dashboard {content_id}",
+            "updated_at": T2.isoformat(),
+        }
+        mock_repository.get_content_index.return_value = {"1": T1, "2": T1, "3": T1}
+        mock_repository.reconcile_deleted_content.return_value = 1
+
+        orchestrator._extract_two_phase(ContentType.DASHBOARD.value, "session-1")
+
+        # Sweep uses the index field profile
+        for sweep_call in mock_extractor.extract_range.call_args_list:
+            assert sweep_call.kwargs["field_profile"] == FieldProfile.INDEX
+
+        fetched = sorted(c.args[1] for c in mock_extractor.extract_one.call_args_list)
+        assert fetched == ["2", "4"]
+        assert mock_repository.save_content.call_count == 2
+
+        mock_repository.reconcile_deleted_content.assert_called_once_with(
+            ContentType.DASHBOARD.value, {"1", "2", "4"}, folder_ids=None
+        )
+        assert orchestrator._change_counts == {"new": 1, "updated": 1, "deleted": 1}
+
+        checkpoint = mock_repository.update_checkpoint.call_args.args[0]
+        assert checkpoint.checkpoint_data["strategy"] == "two_phase"
+        assert checkpoint.checkpoint_data["unchanged_items"] == 1
+
+    def test_sweep_failure_aborts_without_deleting(self):
+        """A failed sweep must never be interpreted as deletions."""
+        orchestrator, mock_extractor, mock_repository = self.create_orchestrator(workers=1)
+
+        mock_extractor.extract_range.side_effect = RuntimeError("API down")
+        mock_repository.get_content_index.return_value = {"1": T1}
+
+        with pytest.raises(OrchestrationError, match="Index sweep failed"):
+            orchestrator._extract_two_phase(ContentType.DASHBOARD.value, "session-1")
+
+        mock_repository.reconcile_deleted_content.assert_not_called()
+        mock_extractor.extract_one.assert_not_called()
+
+    def test_incremental_run_reconciles_deletions(self):
+        """Incremental runs sweep the live id set and reconcile deletions."""
+        orchestrator, mock_extractor, mock_repository = self.create_orchestrator(workers=1)
+        orchestrator.config.two_phase = False
+        orchestrator.config.incremental = True
+        orchestrator.config.content_types = [ContentType.PERMISSION_SET.value]
+
+        mock_repository.get_latest_checkpoint.return_value = None
+        mock_repository.get_last_sync_timestamp.return_value = T1
+        mock_extractor.extract_all.side_effect = [
+            iter([]),  # Incremental extraction: nothing changed
+            iter([{"id": "1"}, {"id": "2"}]),  # Index sweep
+        ]
+        mock_repository.reconcile_deleted_content.return_value = 3
+
+        orchestrator._process_single_content_type(
+            ContentType.PERMISSION_SET.value, Mock(id="session-1")
+        )
+
+        sweep_call = mock_extractor.extract_all.call_args_list[1]
+        assert sweep_call.kwargs["fields"] == "id,name"
+        mock_repository.reconcile_deleted_content.assert_called_once_with(
+            ContentType.PERMISSION_SET.value, {"1", "2"}, folder_ids=None
+        )
+        assert orchestrator._change_counts["deleted"] == 3
+
+    def test_incremental_sweep_failure_skips_reconciliation(self):
+        """A failed reconciliation sweep leaves stored content untouched."""
+        orchestrator, mock_extractor, mock_repository = self.create_orchestrator(workers=1)
+        orchestrator.config.incremental = True
+
+        mock_extractor.extract_all.side_effect = RuntimeError("API down")
+
+        orchestrator._reconcile_deletions(
+            ContentType.PERMISSION_SET.value, "permission_set", is_paginated=False
+        )
+
+        mock_repository.reconcile_deleted_content.assert_not_called()
+
+
+class TestContentIndex:
+    """Tests for repository content index and type-scoped deletion."""
+
+    @pytest.fixture
+    def repo(self, tmp_path):
+        """Create temporary repository."""
+        return SQLiteContentRepository(tmp_path / "test.db")
+
+    def _item(self, content_id: str, content_type: int, folder_id: str | None = None):
+        return ContentItem(
+            id=content_id,
+            content_type=content_type,
+            name=f"Item {content_id}",
+            created_at=T1,
+            updated_at=T2,
+            content_data=b"data",
+            folder_id=folder_id,
+        )
+
+    def test_get_content_index_excludes_deleted_and_scopes_folders(self, repo):
+        """Index returns active items only, optionally scoped to folders."""
+        repo.save_content(self._item("1", ContentType.DASHBOARD.value, folder_id="10"))
+        repo.save_content(self._item("2", ContentType.DASHBOARD.value, folder_id="20"))
+        repo.save_content(self._item("3", ContentType.DASHBOARD.value, folder_id="10"))
+        repo.delete_content("3", soft=True)
+
+        assert repo.get_content_index(ContentType.DASHBOARD.value) == {"1": T2, "2": T2}
+        assert repo.get_content_index(ContentType.DASHBOARD.value, folder_ids={"10"}) == {"1": T2}
+
+    def test_delete_content_scoped_by_type(self, repo):
+        """Raw ids shared across types only delete the requested type."""
+        repo.save_content(self._item("1", ContentType.DASHBOARD.value))
+        repo.save_content(self._item("1", ContentType.LOOK.value))
+
+        repo.delete_content("1", soft=True, content_type=ContentType.LOOK.value)
+
+        assert repo.get_content_index(ContentType.DASHBOARD.value) == {"1": T2}
+        assert repo.get_content_index(ContentType.LOOK.value) == {}
+
+    def test_reconcile_deleted_content_anti_join(self, repo):
+        """Stored items missing from the live set are soft-deleted in bulk."""
+        for content_id in ("1", "2", "3"):
+            repo.save_content(self._item(content_id, ContentType.DASHBOARD.value))
+        repo.save_content(self._item("9", ContentType.LOOK.value))
+
+        deleted = repo.reconcile_deleted_content(ContentType.DASHBOARD.value, ["1", "3", "99"])
+
+        assert deleted == 1
+        assert repo.get_content_index(ContentType.DASHBOARD.value) == {"1": T2, "3": T2}
+        # Other content types are untouched
+        assert repo.get_content_index(ContentType.LOOK.value) == {"9": T2}
+
+        # Already-deleted items are not counted again
+        assert repo.reconcile_deleted_content(ContentType.DASHBOARD.value, ["1", "3"]) == 0
+
+    def test_reconcile_deleted_content_folder_scope(self, repo):
+        """Only items in the swept folders are eligible for deletion."""
+        repo.save_content(self._item("1", ContentType.DASHBOARD.value, folder_id="10"))
+        repo.save_content(self._item("2", ContentType.DASHBOARD.value, folder_id="20"))
+
+        deleted = repo.reconcile_deleted_content(ContentType.DASHBOARD.value, [], folder_ids={"10"})
+
+        assert deleted == 1
+        assert repo.get_content_index(ContentType.DASHBOARD.value) == {"2": T2}
@@ -0,0 +1,240 @@
+"""Unit tests for DynamicWorkerScaler."""
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from lookervault.config.models import ParallelConfig, RestorationConfig
+from lookervault.extraction.metrics import ThreadSafeMetrics
+from lookervault.extraction.offset_coordinator import OffsetCoordinator
+from lookervault.extraction.orchestrator import ExtractionConfig
+from lookervault.extraction.parallel_orchestrator import ParallelOrchestrator
+from lookervault.extraction.worker_scaler import DynamicWorkerScaler, ScalingSample
+from lookervault.restoration.parallel_orchestrator import ParallelRestorationOrchestrator
+from lookervault.storage.models import ContentType, RestorationResult
+
+
+def sample(items_per_second: float, **counters) -> ScalingSample:
+    """Ten-second interval at the given throughput."""
+    return ScalingSample(elapsed_seconds=10, items=int(items_per_second * 10), **counters)
+
+
+class TestDecide:
+    """Tests for hill-climbing decisions."""
+
+    def test_probe_kept_while_throughput_rises(self):
+        """Each step up that pays off is followed by another."""
+        scaler = DynamicWorkerScaler(initial_workers=4, max_workers=8)
+
+        assert scaler.decide(sample(40)) == 5
+        assert scaler.decide(sample(50)) == 6
+        assert scaler.adjustments == 2
+
+    def test_probe_reverted_and_held_without_gain(self):
+        """A step that doesn't raise throughput by 5% is undone, then held."""
+        scaler = DynamicWorkerScaler(initial_workers=4, max_workers=8)
+        scaler.decide(sample(40))
+
+        assert scaler.decide(sample(41)) == 4
+        for _ in range(DynamicWorkerScaler.HOLD_INTERVALS):
+            assert scaler.decide(sample(40)) == 4
+        assert scaler.decide(sample(40)) == 5
+
+    def test_429s_shed_workers(self):
+        """Throttling sheds a quarter of the workers."""
+        scaler = DynamicWorkerScaler(initial_workers=8, max_workers=16)
+
+        assert scaler.decide(sample(40, requests=100, throttled=5)) == 6
+
+    def test_sqlite_lock_waits_shed_workers(self):
+        """Workers spending over 10% of their time on the write lock are shed."""
+        scaler = DynamicWorkerScaler(initial_workers=4, max_workers=16)
+
+        # 4 workers * 10 s = 40 worker-seconds, 6 s waiting on the lock
+        assert scaler.decide(sample(40, busy_seconds=6.0)) == 3
+
+    def test_idle_interval_changes_nothing(self):
+        """No processed items (startup, tail of the run) means no decision."""
+        scaler = DynamicWorkerScaler(initial_workers=4, max_workers=8)
+
+        assert scaler.decide(sample(0)) == 4
+        assert scaler.adjustments == 0
+
+    def test_bounds(self):
+        """The active count stays within min_workers and max_workers."""
+        scaler = DynamicWorkerScaler(initial_workers=2, max_workers=2, min_workers=2)
+
+        assert scaler.decide(sample(40)) == 2
+        assert scaler.decide(sample(40, requests=10, throttled=10)) == 2
+        with pytest.raises(ValueError):
+            DynamicWorkerScaler(initial_workers=2, max_workers=2, min_workers=3)
+
+    def test_sample_reads_counter_deltas(self):
+        """Samples report counter growth since the previous sample."""
+        metrics = ThreadSafeMetrics()
+        rate_limiter = MagicMock()
+        rate_limiter.get_stats.return_value = {"total_requests": 10, "total_429_count": 1}
+        repository = MagicMock(busy_wait_seconds=0.5)
+        scaler = DynamicWorkerScaler(
+            initial_workers=2,
+            max_workers=4,
+            metrics=metrics,
+            rate_limiter=rate_limiter,
+            repository=repository,
+        )
+        scaler.sample()
+
+        metrics.increment_processed(ContentType.LOOK.value, count=7)
+        rate_limiter.get_stats.return_value = {"total_requests": 25, "total_429_count": 1}
+        repository.busy_wait_seconds = 2.0
+        interval = scaler.sample()
+
+        assert (interval.items, interval.requests, interval.throttled) == (7, 15, 0)
+        assert interval.busy_seconds == pytest.approx(1.5)
+
+
+class TestParking:
+    """Tests for parking and unparking workers."""
+
+    def test_worker_parks_until_scaled_up(self):
+        """A worker outside the active set waits until the set grows."""
+        scaler = DynamicWorkerScaler(initial_workers=1, max_workers=2)
+        passed = threading.Event()
+
+        def worker():
+            scaler.checkpoint(1)
+            passed.set()
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        assert not passed.wait(0.1)
+
+        scaler.decide(sample(10))
+        thread.join(timeout=5)
+        assert passed.is_set()
+
+    def test_release_unparks_for_rest_of_run(self):
+        """After release nobody parks, even above the active count."""
+        scaler = DynamicWorkerScaler(initial_workers=1, max_workers=4)
+        scaler.release()
+
+        scaler.checkpoint(3)
+
+    def test_failed_worker_slot_passes_to_parked_worker(self):
+        """Retiring a failed worker unparks exactly one replacement."""
+        scaler = DynamicWorkerScaler(initial_workers=2, max_workers=4)
+        passed = {2: threading.Event(), 3: threading.Event()}
+
+        def worker(worker_id):
+            scaler.checkpoint(worker_id)
+            passed[worker_id].set()
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in passed]
+        for thread in threads:
+            thread.start()
+        scaler.retire(0)
+
+        assert passed[2].wait(5)
+        assert not passed[3].wait(0.1)
+        assert scaler.active_workers == 2
+        scaler.release()
+        for thread in threads:
+            thread.join(timeout=5)
+
+
+class TestExtractionWorkerExit:
+    """Tests for how extraction workers leave the scaler."""
+
+    def make_orchestrator(self, extractor):
+        """Orchestrator over mocked extractor and repository."""
+        return ParallelOrchestrator(
+            extractor=extractor,
+            repository=MagicMock(),
+            serializer=MagicMock(),
+            progress=MagicMock(),
+            config=ExtractionConfig(content_types=[ContentType.DASHBOARD.value]),
+            parallel_config=ParallelConfig(workers=2, queue_size=200, batch_size=100),
+        )
+
+    def test_end_of_work_releases(self):
+        """A worker that runs out of ranges unparks the rest of the pool."""
+        coordinator = OffsetCoordinator(stride=100)
+        coordinator.set_total_workers(1)
+        extractor = MagicMock()
+        extractor.extract_range.return_value = []
+        scaler = MagicMock()
+
+        self.make_orchestrator(extractor)._parallel_fetch_worker(
+            worker_id=0,
+            content_type=ContentType.DASHBOARD.value,
+            coordinator=coordinator,
+            fields=None,
+            updated_after=None,
+            scaler=scaler,
+        )
+
+        scaler.release.assert_called_once()
+        scaler.retire.assert_not_called()
+
+    def test_failure_retires_without_releasing(self):
+        """A worker dying on an error keeps the active set instead of unparking everyone."""
+        coordinator = MagicMock()
+        coordinator.page_size_controller = None
+        coordinator.claim_range.side_effect = RuntimeError("coordinator broken")
+        scaler = MagicMock()
+
+        with pytest.raises(RuntimeError):
+            self.make_orchestrator(MagicMock())._parallel_fetch_worker(
+                worker_id=1,
+                content_type=ContentType.DASHBOARD.value,
+                coordinator=coordinator,
+                fields=None,
+                updated_after=None,
+                scaler=scaler,
+            )
+
+        scaler.retire.assert_called_once_with(1)
+        scaler.release.assert_not_called()
+
+
+class TestRestorationScaling:
+    """Tests for dynamic scaling in ParallelRestorationOrchestrator."""
+
+    def test_parked_workers_take_no_items_and_exit(self):
+        """Only active workers restore; parked ones exit once the queue drains."""
+        threads: set[str] = set()
+        lock = threading.Lock()
+
+        def restore_single(content_id, content_type, dry_run=False):
+            with lock:
+                threads.add(threading.current_thread().name)
+            time.sleep(0.001)
+            return RestorationResult(
+                content_id=content_id, content_type=content_type.value, status="updated"
+            )
+
+        restorer = MagicMock()
+        restorer.restore_single.side_effect = restore_single
+        repository = MagicMock()
+        repository.get_content_ids.return_value = {str(i) for i in range(50)}
+        orchestrator = ParallelRestorationOrchestrator(
+            restorer=restorer,
+            repository=repository,
+            config=RestorationConfig(
+                destination_instance="https://looker.example.com",
+                workers=2,
+                max_workers=6,
+                dynamic_workers=True,
+            ),
+            rate_limiter=MagicMock(),
+            metrics=ThreadSafeMetrics(),
+            dlq=MagicMock(),
+        )
+
+        summary = orchestrator.restore(ContentType.DASHBOARD, "session")
+
+        assert summary.success_count == 50
+        assert restorer.restore_single.call_count == 50
+        assert len(threads) <= 2
@@ -0,0 +1,73 @@
+"""Unit tests for field projection profiles."""
+
+import pytest
+
+from lookervault.looker.field_profiles import (
+    INDEX_FIELDS,
+    FieldProfile,
+    get_profile_fields,
+    resolve_fields,
+)
+from lookervault.looker.write_models import WRITE_MODEL_MAP
+from lookervault.storage.models import ContentType
+
+
+class TestGetProfileFields:
+    """Tests for get_profile_fields()."""
+
+    def test_full_profile_returns_none(self):
+        """Test 'full' profile requests every field."""
+        for content_type in ContentType:
+            assert get_profile_fields(content_type, FieldProfile.FULL) is None
+
+    def test_index_profile_contains_change_detection_fields(self):
+        """Test index profile covers ids and updated_at for dashboards and looks."""
+        for content_type in (ContentType.DASHBOARD, ContentType.LOOK):
+            fields = get_profile_fields(content_type, "index").split(",")
+            assert "id" in fields
+            assert "updated_at" in fields
+            assert "folder_id" in fields
+            assert "dashboard_elements" not in fields
+
+    def test_index_profile_defined_for_all_extractable_types(self):
+        """Test every extractable content type has an index projection."""
+        for content_type in ContentType:
+            if content_type == ContentType.EXPLORE:
+                continue
+            assert content_type in INDEX_FIELDS
+
+    def test_restore_complete_includes_write_model_fields(self):
+        """Test restore-complete covers every Write* model constructor field."""
+        for content_type, model_class in WRITE_MODEL_MAP.items():
+            fields = set(get_profile_fields(content_type, "restore-complete").split(","))
+            model_fields = {a.name for a in model_class.__attrs_attrs__}
+            assert model_fields <= fields, content_type.name
+            assert "id" in fields
+
+    def test_restore_complete_keeps_dashboard_subresources(self):
+        """Test restore-complete keeps children needed by the sub-resource restorer."""
+        fields = get_profile_fields(ContentType.DASHBOARD, "restore-complete").split(",")
+        assert "dashboard_elements" in fields
+        assert "dashboard_filters" in fields
+        assert "dashboard_layouts" in fields
+
+    def test_unknown_profile_raises(self):
+        """Test unknown profile names are rejected."""
+        with pytest.raises(ValueError):
+            get_profile_fields(ContentType.DASHBOARD, "minimal")
+
+
+class TestResolveFields:
+    """Tests for resolve_fields()."""
+
+    def test_explicit_fields_win(self):
+        """Test explicit comma-separated fields override any profile."""
+        assert resolve_fields(ContentType.DASHBOARD, "id,title", "index") == "id,title"
+
+    def test_no_fields_no_profile(self):
+        """Test None profile and None fields requests every field."""
+        assert resolve_fields(ContentType.DASHBOARD, None, None) is None
+
+    def test_profile_used_when_no_fields(self):
+        """Test profile is resolved when fields not given."""
+        assert resolve_fields(ContentType.GROUP, None, "index") == "id,name"
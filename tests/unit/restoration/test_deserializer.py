@@ -670,3 +670,90 @@ class TestEdgeCases:
 
         assert len(result["description"]) == 100000
         assert result["description"] == long_string
+
+
+class TestDeserializeWritable:
+    """Test typed schema decoding of writable fields."""
+
+    def test_drops_read_only_and_unknown_fields(self, deserializer, sample_dashboard_data):
+        """Only the id and Write* model fields survive decoding."""
+        data = {**sample_dashboard_data, "custom_field": 1, "dashboard_elements": [{"id": "1"}]}
+        binary_data = msgspec.msgpack.encode(data)
+
+        content, errors = deserializer.deserialize_writable(binary_data, ContentType.DASHBOARD)
+
+        assert errors == []
+        assert content == {
+            "id": "123",
+            "title": "Test Dashboard",
+            "description": "A test dashboard",
+            "hidden": False,
+            "folder_id": "456",
+        }
+
+    def test_absent_and_null_fields(self, deserializer):
+        """Absent fields stay absent; explicit nulls are preserved."""
+        binary_data = msgspec.msgpack.encode({"id": 7, "title": "T", "description": None})
+
+        content, _ = deserializer.deserialize_writable(binary_data, ContentType.DASHBOARD)
+
+        assert content == {"id": 7, "title": "T", "description": None}
+
+    def test_type_mismatch_falls_back_to_sdk_model(self, deserializer):
+        """Blobs not matching the schema are validated by the SDK model instead."""
+        binary_data = msgspec.msgpack.encode({"id": "1", "title": 5, "can": {}})
+
+        content, errors = deserializer.deserialize_writable(binary_data, ContentType.DASHBOARD)
+
+        assert content == {"id": "1", "title": 5}
+        assert errors == []
+
+    def test_missing_required_field_reported(self, deserializer):
+        """Required Write* fields are reported as schema errors."""
+        binary_data = msgspec.msgpack.encode({"id": "1", "limit": "10"})
+
+        _, errors = deserializer.deserialize_writable(binary_data, ContentType.EXPLORE)
+
+        assert len(errors) == 1
+        assert "view" in errors[0]
+
+    def test_corrupted_and_non_dict_blobs_raise(self, deserializer):
+        """Corrupted or non-dict blobs raise DeserializationError."""
+        with pytest.raises(DeserializationError, match="Failed to deserialize"):
+            deserializer.deserialize_writable(b"\xc1", ContentType.DASHBOARD)
+        with pytest.raises(DeserializationError, match="not a dictionary"):
+            deserializer.deserialize_writable(msgspec.msgpack.encode([1]), ContentType.LOOK)
+
+
+class TestDeserializeSubresources:
+    """Tests for ContentDeserializer.deserialize_subresources()."""
+
+    def test_returns_nested_lists_dropped_by_writable_decode(self, deserializer):
+        """Dashboard filters, elements and layouts are decoded; other fields are not."""
+        binary_data = msgspec.msgpack.encode(
+            {
+                "id": "1",
+                "title": "Sales",
+                "dashboard_filters": [{"id": "10", "name": "Date"}],
+                "dashboard_elements": [{"id": "20", "title": "Tile"}],
+                "dashboard_layouts": None,
+            }
+        )
+
+        subresources = deserializer.deserialize_subresources(binary_data, ContentType.DASHBOARD)
+
+        assert subresources == {
+            "dashboard_filters": [{"id": "10", "name": "Date"}],
+            "dashboard_elements": [{"id": "20", "title": "Tile"}],
+        }
+
+    def test_types_without_subresources(self, deserializer):
+        """Content types without sub-resources decode to an empty dict."""
+        binary_data = msgspec.msgpack.encode({"id": "1", "title": "Look"})
+
+        assert deserializer.deserialize_subresources(binary_data, ContentType.LOOK) == {}
+
+    def test_corrupted_blob_raises(self, deserializer):
+        """Corrupted blobs raise DeserializationError."""
+        with pytest.raises(DeserializationError, match="sub-resources"):
+            deserializer.deserialize_subresources(b"\xc1", ContentType.DASHBOARD)
@@ -0,0 +1,120 @@
+"""Unit tests for parallel bulk DLQ replay."""
+
+import threading
+from datetime import datetime
+
+import pytest
+
+from lookervault.restoration.dlq_replay import DLQReplayer
+from lookervault.storage.models import ContentType, DeadLetterItem, RestorationResult
+from lookervault.storage.repository import SQLiteContentRepository
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """Create temporary repository."""
+    return SQLiteContentRepository(tmp_path / "test.db")
+
+
+class FakeRestorer:
+    """Restorer stand-in whose outcome is chosen per content ID."""
+
+    def __init__(self, outcomes: dict[str, str]):
+        self.outcomes = outcomes
+        self.calls: list[str] = []
+        self._lock = threading.Lock()
+
+    def restore_single(self, content_id: str, content_type: ContentType) -> RestorationResult:
+        with self._lock:
+            self.calls.append(content_id)
+        outcome = self.outcomes.get(content_id, "updated")
+        if outcome in ("created", "updated"):
+            return RestorationResult(content_id, content_type.value, outcome)
+        if outcome == "raise":
+            raise RuntimeError("connection reset")
+        return RestorationResult(content_id, content_type.value, "failed", error_message=outcome)
+
+
+def _add(repo, content_id, error_type="APIError", retry_count=0, session_id="s1"):
+    return repo.save_dead_letter_item(
+        DeadLetterItem(
+            session_id=session_id,
+            content_id=content_id,
+            content_type=ContentType.DASHBOARD.value,
+            content_data=b"",
+            error_message=f"{error_type}: boom",
+            error_type=error_type,
+            retry_count=retry_count,
+            failed_at=datetime.now(),
+        )
+    )
+
+
+class TestDLQReplayer:
+    """Tests for paging, batched bookkeeping, skipping and aborting."""
+
+    def test_successes_deleted_and_failures_bumped(self, repo):
+        """Recovered entries are removed; failing ones keep their latest error."""
+        for i in range(7):
+            _add(repo, str(i))
+        restorer = FakeRestorer({"3": "Rate limit exceeded (429)", "5": "raise"})
+
+        summary = DLQReplayer(repo, restorer, workers=4, page_size=3).replay()
+
+        assert sorted(restorer.calls, key=int) == [str(i) for i in range(7)]
+        assert (summary.attempted, summary.succeeded, summary.failed) == (7, 5, 2)
+        assert summary.error_breakdown == {"RateLimitError": 1, "APIError": 1}
+        remaining = {item.content_id: item for item in repo.list_dead_letter_items(limit=100)}
+        assert set(remaining) == {"3", "5"}
+        assert remaining["3"].retry_count == 1
+        assert remaining["3"].error_type == "RateLimitError"
+        assert remaining["5"].error_message == "connection reset"
+
+    def test_validation_errors_are_skipped(self, repo):
+        """Entries rejected as invalid content are not replayed."""
+        _add(repo, "1", error_type="ValidationError")
+        _add(repo, "2")
+        restorer = FakeRestorer({})
+
+        summary = DLQReplayer(repo, restorer).replay()
+
+        assert restorer.calls == ["2"]
+        assert (summary.skipped, summary.succeeded) == (1, 1)
+        assert [i.content_id for i in repo.list_dead_letter_items()] == ["1"]
+
+    def test_duplicate_entries_replayed_once(self, repo):
+        """Several entries for the same item share one replay."""
+        _add(repo, "1", retry_count=0)
+        _add(repo, "1", retry_count=1)
+        _add(repo, "1", retry_count=0, session_id="s2")
+        restorer = FakeRestorer({})
+
+        summary = DLQReplayer(repo, restorer).replay()
+
+        assert restorer.calls == ["1"]
+        assert summary.succeeded == 3
+        assert repo.count_dead_letter_items() == 0
+
+    def test_authentication_error_stops_replay(self, repo):
+        """A fatal error finishes the current page, then stops the run."""
+        for i in range(6):
+            _add(repo, str(i))
+        restorer = FakeRestorer({"1": "Authentication failed (401)"})
+
+        summary = DLQReplayer(repo, restorer, workers=1, page_size=2).replay()
+
+        assert summary.aborted
+        assert summary.abort_reason.startswith("AuthenticationError")
+        assert restorer.calls == ["0", "1"]
+        assert repo.count_dead_letter_items() == 5
+
+    def test_filters_by_error_type(self, repo):
+        """Only entries with the requested stored error types are replayed."""
+        _add(repo, "1", error_type="RateLimitError")
+        _add(repo, "2", error_type="APIError")
+        restorer = FakeRestorer({})
+
+        summary = DLQReplayer(repo, restorer).replay(error_types=["RateLimitError"])
+
+        assert restorer.calls == ["1"]
+        assert summary.attempted == 1
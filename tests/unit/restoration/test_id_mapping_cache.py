@@ -0,0 +1,134 @@
+"""Unit tests for the write-behind ID mapping cache."""
+
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from lookervault.exceptions import StorageError
+from lookervault.restoration.id_mapping_cache import IDMappingCache
+from lookervault.restoration.progress_writer import RestorationProgressWriter
+from lookervault.storage.models import ContentType, IDMapping
+from lookervault.storage.repository import SQLiteContentRepository
+
+SOURCE = "https://source.looker.com"
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """Create temporary repository."""
+    return SQLiteContentRepository(tmp_path / "test.db")
+
+
+class TestIDMappingCache:
+    """Tests for preloading, lookups and write-behind flushing."""
+
+    def test_preload_serves_lookups_without_queries(self, repo):
+        """Stored mappings are bulk-loaded once per type; misses need no query."""
+        repo.save_id_mappings(
+            [
+                IDMapping(SOURCE, ContentType.DASHBOARD.value, "1", "101"),
+                IDMapping(SOURCE, ContentType.DASHBOARD.value, "2", "102"),
+                IDMapping("https://other", ContentType.DASHBOARD.value, "3", "103"),
+                IDMapping(SOURCE, ContentType.LOOK.value, "1", "201"),
+            ]
+        )
+        spy = MagicMock(wraps=repo)
+        cache = IDMappingCache(spy, SOURCE)
+
+        assert cache.get_destination_id(ContentType.DASHBOARD, "1") == "101"
+        assert cache.get_destination_id(ContentType.DASHBOARD, "3") is None
+        assert cache.get_destination_ids(ContentType.DASHBOARD, ["1", "2", "9"]) == {
+            "1": "101",
+            "2": "102",
+        }
+        assert cache.get_destination_id(ContentType.LOOK, "1") == "201"
+
+        loaded = [c.args for c in spy.load_id_mappings.call_args_list]
+        assert loaded == [
+            (SOURCE, ContentType.DASHBOARD.value),
+            (SOURCE, ContentType.LOOK.value),
+        ]
+        spy.get_destination_id.assert_not_called()
+
+    def test_writes_are_batched(self, repo):
+        """Mappings are persisted once batch_size are pending, then on flush."""
+        spy = MagicMock(wraps=repo)
+        cache = IDMappingCache(spy, SOURCE, session_id="s1", batch_size=3)
+
+        for i in range(4):
+            cache.save_mapping(ContentType.DASHBOARD, str(i), f"new-{i}")
+
+        assert spy.save_id_mappings.call_count == 1
+        assert cache.pending_count == 1
+        assert cache.get_destination_id(ContentType.DASHBOARD, "3") == "new-3"
+
+        cache.close()
+        assert repo.load_id_mappings(SOURCE, ContentType.DASHBOARD.value) == {
+            str(i): f"new-{i}" for i in range(4)
+        }
+        assert repo.get_id_mapping(SOURCE, ContentType.DASHBOARD.value, "0").session_id == "s1"
+
+    def test_unflushed_entries_win_over_stored_rows(self, repo):
+        """A preload after a save does not overwrite the newer in-memory mapping."""
+        repo.save_id_mappings([IDMapping(SOURCE, ContentType.DASHBOARD.value, "1", "old")])
+        cache = IDMappingCache(repo, SOURCE)
+
+        cache.save_mapping(ContentType.DASHBOARD, "1", "new")
+
+        assert cache.get_destination_id(ContentType.DASHBOARD, "1") == "new"
+
+    def test_failed_flush_keeps_mappings_pending(self):
+        """A failed flush raises and keeps the batch for the next attempt."""
+        repository = MagicMock()
+        repository.save_id_mappings.side_effect = [StorageError("locked"), None]
+        cache = IDMappingCache(repository, SOURCE)
+        cache.save_mapping(ContentType.DASHBOARD, "1", "101")
+
+        with pytest.raises(StorageError):
+            cache.flush()
+        assert cache.pending_count == 1
+
+        cache.flush()
+        assert cache.pending_count == 0
+        assert len(repository.save_id_mappings.call_args.args[0]) == 1
+
+    def test_concurrent_saves_are_all_persisted(self, repo):
+        """Saves from many threads all reach the cache and the database."""
+        cache = IDMappingCache(repo, SOURCE, stripes=4, batch_size=50)
+
+        def worker(offset):
+            for i in range(100):
+                cache.save_mapping(ContentType.LOOK, str(offset + i), f"d{offset + i}")
+            repo.close_thread_connection()
+
+        threads = [threading.Thread(target=worker, args=(n * 100,)) for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        cache.close()
+
+        assert len(cache.get_destination_ids(ContentType.LOOK, map(str, range(800)))) == 800
+        assert len(repo.load_id_mappings(SOURCE, ContentType.LOOK.value)) == 800
+
+    def test_progress_is_written_only_after_mappings(self, repo):
+        """The progress writer flushes mappings first, so resume never skips an unmapped item."""
+        cache = IDMappingCache(repo, SOURCE, batch_size=1000)
+        repository = MagicMock()
+        stored_at_progress_write: list[dict[str, str]] = []
+        repository.record_restoration_progress.side_effect = lambda batch: (
+            stored_at_progress_write.append(
+                repo.load_id_mappings(SOURCE, ContentType.DASHBOARD.value)
+            )
+        )
+        writer = RestorationProgressWriter(
+            repository, batch_size=1, flush_interval_seconds=60, before_flush=cache.flush
+        )
+
+        cache.save_mapping(ContentType.DASHBOARD, "1", "101")
+        writer.record("s1", ContentType.DASHBOARD.value, "1", "created")
+        writer.close()
+
+        assert writer.flushed_count == 1
+        assert stored_at_progress_write == [{"1": "101"}]
@@ -21,7 +21,9 @@ import pytest
 from lookervault.extraction.metrics import ThreadSafeMetrics
 from lookervault.extraction.rate_limiter import AdaptiveRateLimiter
 from lookervault.restoration.dead_letter_queue import DeadLetterQueue
+from lookervault.restoration.id_mapping_cache import IDMappingCache
 from lookervault.restoration.parallel_orchestrator import ParallelRestorationOrchestrator
+from lookervault.restoration.reference_translation import ReferenceTranslator
 from lookervault.storage.models import (
     ContentType,
     RestorationCheckpoint,
@@ -78,6 +80,7 @@ def mock_config():
     config.max_retries = 5
     config.dry_run = False
     config.folder_ids = None
+    config.dynamic_workers = False
     return config
 
 
@@ -153,6 +156,86 @@ class TestParallelOrchestratorInit:
         assert orchestrator.id_mapper is None
 
 
+class _Abort(BaseException):
+    """Interrupt that escapes the workers' exception handling (like Ctrl-C)."""
+
+
+class TestParallelOrchestratorIDMapping:
+    """Test wiring and flushing of the shared ID mapping cache."""
+
+    @pytest.fixture
+    def id_mapper(self, mock_repository):
+        """Reference translator over a cache that never flushes on its own."""
+        return ReferenceTranslator(
+            IDMappingCache(mock_repository, "https://source", batch_size=1000)
+        )
+
+    def _orchestrator(self, restorer, repository, config, id_mapper):
+        return ParallelRestorationOrchestrator(
+            restorer=restorer,
+            repository=repository,
+            config=config,
+            rate_limiter=MagicMock(spec=AdaptiveRateLimiter),
+            metrics=ThreadSafeMetrics(),
+            dlq=MagicMock(spec=DeadLetterQueue),
+            id_mapper=id_mapper,
+        )
+
+    def test_init_should_give_id_mapper_to_restorer_without_one(
+        self, mock_restorer, mock_repository, mock_config, id_mapper
+    ):
+        """Test the restorer resolves references through the orchestrator's mapper."""
+        mock_restorer.id_mapper = None
+
+        self._orchestrator(mock_restorer, mock_repository, mock_config, id_mapper)
+
+        assert mock_restorer.id_mapper is id_mapper
+
+    def test_restore_should_flush_mappings_on_completion(
+        self, mock_restorer, mock_repository, mock_config, id_mapper
+    ):
+        """Test mappings of failed items are persisted when the content type finishes."""
+        mock_repository.get_content_ids.return_value = {"1"}
+
+        def restore_single(content_id, content_type, dry_run=False):
+            # Created, then failed while restoring sub-resources
+            id_mapper.save_mapping(content_type, content_id, "101")
+            return RestorationResult(
+                content_id=content_id,
+                content_type=content_type.value,
+                status="failed",
+                error_message="sub-resource error",
+            )
+
+        mock_restorer.restore_single.side_effect = restore_single
+        orchestrator = self._orchestrator(mock_restorer, mock_repository, mock_config, id_mapper)
+
+        orchestrator.restore(ContentType.DASHBOARD, "session")
+
+        assert id_mapper.cache.pending_count == 0
+        (saved,) = mock_repository.save_id_mappings.call_args.args
+        assert [(m.source_id, m.destination_id) for m in saved] == [("1", "101")]
+
+    def test_restore_should_flush_mappings_on_interrupt(
+        self, mock_restorer, mock_repository, mock_config, id_mapper
+    ):
+        """Test an interrupted run still persists mappings of items it created."""
+        mock_repository.get_content_ids.return_value = {"1"}
+
+        def restore_single(content_id, content_type, dry_run=False):
+            id_mapper.save_mapping(content_type, content_id, "101")
+            raise _Abort
+
+        mock_restorer.restore_single.side_effect = restore_single
+        orchestrator = self._orchestrator(mock_restorer, mock_repository, mock_config, id_mapper)
+
+        with pytest.raises(_Abort):
+            orchestrator.restore(ContentType.DASHBOARD, "session")
+
+        assert id_mapper.cache.pending_count == 0
+        mock_repository.save_id_mappings.assert_called_once()
+
+
 class TestParallelOrchestratorRestore:
     """Test ParallelRestorationOrchestrator.restore() method."""
 
@@ -243,6 +326,32 @@ class TestParallelOrchestratorRestore:
         assert result.error_count == 1
         assert result.content_type_breakdown == {ContentType.DASHBOARD.value: 3}
 
+    def test_restore_should_record_latency_of_written_items(
+        self, orchestrator, mock_repository, mock_restorer, mock_config
+    ):
+        """Test restore() adds created/updated item timings to the latency history."""
+        mock_config.destination_instance = "https://looker.example.com"
+        mock_repository.get_content_ids.return_value = {"1", "2", "3"}
+        mock_restorer.restore_single.side_effect = [
+            RestorationResult(
+                content_id=content_id,
+                content_type=ContentType.LOOK.value,
+                status=status,
+                duration_ms=duration_ms,
+            )
+            for content_id, status, duration_ms in [
+                ("1", "created", 100.0),
+                ("2", "updated", 300.0),
+                ("3", "failed", 5000.0),
+            ]
+        ]
+
+        orchestrator.restore(ContentType.LOOK, mock_config.session_id)
+
+        mock_repository.record_restore_latency.assert_called_once_with(
+            "https://looker.example.com", ContentType.LOOK.value, 2, 400.0
+        )
+
     def test_restore_should_save_checkpoints_at_intervals(
         self, orchestrator, mock_repository, mock_restorer, mock_config
     ):
@@ -729,29 +838,43 @@ class TestParallelOrchestratorCheckpointing:
         # Assert: final checkpoint saved
         assert mock_repository.save_restoration_checkpoint.call_count >= 1
 
-    def test_checkpoint_should_include_completed_ids(
+    def test_checkpoint_should_record_progress_instead_of_completed_ids(
         self, orchestrator, mock_repository, mock_restorer, mock_config
     ):
-        """Test checkpoints include list of completed content IDs."""
+        """Test per-item progress goes to the progress log, not the checkpoint row."""
         # Setup
         mock_repository.get_content_ids.return_value = {"1", "2"}
         mock_repository.get_latest_restoration_checkpoint.return_value = None
 
-        mock_restorer.restore_single.return_value = RestorationResult(
-            content_id="1",
-            content_type=ContentType.DASHBOARD.value,
-            status="created",
-            destination_id="101",
-            duration_ms=100.0,
+        mock_restorer.restore_single.side_effect = lambda content_id, *args, **kwargs: (
+            RestorationResult(
+                content_id=content_id,
+                content_type=ContentType.DASHBOARD.value,
+                status="created",
+                destination_id="101",
+                duration_ms=100.0,
+            )
         )
 
         # Execute
         orchestrator.restore(ContentType.DASHBOARD, mock_config.session_id)
 
-        # Assert: checkpoint saved with completed_ids
-        if mock_repository.save_restoration_checkpoint.called:
-            checkpoint = mock_repository.save_restoration_checkpoint.call_args[0][0]
-            assert "completed_ids" in checkpoint.checkpoint_data
+        # Assert: checkpoint rows carry counts only
+        for call in mock_repository.save_restoration_checkpoint.call_args_list:
+            assert "completed_ids" not in call[0][0].checkpoint_data
+        checkpoint = mock_repository.save_restoration_checkpoint.call_args[0][0]
+        assert checkpoint.item_count == 2
+
+        # Assert: both items recorded in the progress log
+        recorded = [
+            entry
+            for call in mock_repository.record_restoration_progress.call_args_list
+            for entry in call[0][0]
+        ]
+        assert sorted(recorded) == [
+            (mock_config.session_id, ContentType.DASHBOARD.value, "1", "created"),
+            (mock_config.session_id, ContentType.DASHBOARD.value, "2", "created"),
+        ]
 
     def test_checkpoint_should_track_error_count(
         self, orchestrator, mock_repository, mock_restorer, mock_config
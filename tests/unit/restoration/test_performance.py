@@ -75,6 +75,7 @@ def restoration_config():
     config.max_retries = 3
     config.dry_run = False
     config.folder_ids = None
+    config.dynamic_workers = False
     config.rate_limit_per_minute = 100
     config.rate_limit_per_second = 10
     return config
@@ -105,6 +106,7 @@ class TestParallelRestorationThroughput:
             test_config.max_retries = 3
             test_config.dry_run = False
             test_config.folder_ids = None
+            test_config.dynamic_workers = False
             test_config.rate_limit_per_minute = 1000  # High limit
             test_config.rate_limit_per_second = 100
 
@@ -189,6 +191,7 @@ class TestParallelRestorationThroughput:
         test_config.max_retries = 3
         test_config.dry_run = False
         test_config.folder_ids = None
+        test_config.dynamic_workers = False
         test_config.rate_limit_per_minute = 1000
         test_config.rate_limit_per_second = 100
 
@@ -265,6 +268,7 @@ class TestParallelRestorationThroughput:
             test_config.max_retries = 3
             test_config.dry_run = False
             test_config.folder_ids = None
+            test_config.dynamic_workers = False
 
             mock_repository.get_content_ids.return_value = content_ids.copy()
             mock_repository.get_latest_restoration_checkpoint.return_value = None
@@ -471,6 +475,7 @@ class TestRestorationMemoryStability:
         test_config.max_retries = 3
         test_config.dry_run = False
         test_config.folder_ids = None
+        test_config.dynamic_workers = False
         test_config.rate_limit_per_minute = 1000
         test_config.rate_limit_per_second = 100
 
@@ -551,6 +556,7 @@ class TestRestorationMemoryStability:
             test_config.max_retries = 3
             test_config.dry_run = False
             test_config.folder_ids = None
+            test_config.dynamic_workers = False
 
             mock_repository.get_content_ids.return_value = content_ids.copy()
             mock_repository.get_latest_restoration_checkpoint.return_value = None
@@ -632,6 +638,7 @@ class TestRestorationMemoryStability:
             test_config.max_retries = 3
             test_config.dry_run = False
             test_config.folder_ids = None
+            test_config.dynamic_workers = False
 
             mock_repository.get_content_ids.return_value = content_ids.copy()
             mock_repository.get_latest_restoration_checkpoint.return_value = None
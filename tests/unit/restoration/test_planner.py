@@ -0,0 +1,132 @@
+"""Unit tests for offline restore planning and ETA estimation."""
+
+from datetime import datetime
+
+import pytest
+
+from lookervault.restoration.planner import (
+    BASE_CALLS_PER_ITEM,
+    RestorePlanner,
+    dashboard_subresource_calls,
+)
+from lookervault.storage.models import ContentItem, ContentType
+from lookervault.storage.repository import SQLiteContentRepository
+from lookervault.storage.serializer import MsgpackSerializer
+
+DESTINATION = "https://looker.example.com"
+
+
+def _dashboard(content_id: str) -> dict:
+    return {
+        "id": content_id,
+        "title": f"Dashboard {content_id}",
+        "dashboard_filters": [{"id": "f1"}, {"id": "f2"}],
+        "dashboard_elements": [{"id": "e1", "title": "Tile"}],
+        "dashboard_layouts": [
+            {"id": "l1", "dashboard_layout_components": [{"id": "c1"}, {"id": "c2"}]}
+        ],
+    }
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """Backup with one folder, three looks and two dashboards."""
+    repository = SQLiteContentRepository(tmp_path / "backup.db")
+    items = [(ContentType.FOLDER, {"id": "1", "name": "Shared"})]
+    items += [(ContentType.LOOK, {"id": f"l{i}", "title": "Look"}) for i in range(3)]
+    items += [(ContentType.DASHBOARD, _dashboard(f"d{i}")) for i in range(2)]
+    for content_type, content in items:
+        repository.save_content(
+            ContentItem(
+                id=content["id"],
+                content_type=content_type.value,
+                name=content.get("title") or content["name"],
+                created_at=datetime.now(),
+                updated_at=datetime.now(),
+                content_data=MsgpackSerializer().serialize(content),
+            )
+        )
+    yield repository
+    repository.close()
+
+
+class TestDashboardSubresourceCalls:
+    """Tests for the per-dashboard sub-resource call estimate."""
+
+    def test_counts_discovery_and_writes(self):
+        """3 discovery fetches + 1 component fetch + 2 filters, 1 element, 1 layout, 2 comps."""
+        blob = MsgpackSerializer().serialize(_dashboard("1"))
+
+        assert dashboard_subresource_calls(blob) == 3 + 1 + 2 + 1 + 1 + 2
+
+    def test_dashboard_without_subresources(self):
+        """Dashboards without sub-resources only cost the discovery fetches."""
+        blob = MsgpackSerializer().serialize({"id": "1", "title": "Empty"})
+
+        assert dashboard_subresource_calls(blob) == 3
+
+
+class TestRestorePlanner:
+    """Tests for plan building and ETA estimation."""
+
+    def test_plan_follows_order_and_skips_empty_types(self, repo):
+        """Plan lists only types with content, in the given order, with call counts."""
+        planner = RestorePlanner(repo, rate_limit_per_minute=600, rate_limit_per_second=10)
+
+        plan = planner.build(
+            [ContentType.USER, ContentType.FOLDER, ContentType.LOOK, ContentType.DASHBOARD]
+        )
+
+        assert [step.content_type for step in plan.types] == ["folder", "look", "dashboard"]
+        dashboards = plan.types[-1]
+        assert dashboards.subresource_calls == 2 * 10
+        assert dashboards.api_calls == 2 * BASE_CALLS_PER_ITEM + 20
+        assert plan.total_items == 6
+        assert plan.calls_per_second == 10
+
+    def test_eta_is_bounded_by_rate_limit_and_latency(self, repo):
+        """Few workers are latency-bound; many workers hit the rate limit."""
+        planner = RestorePlanner(
+            repo, rate_limit_per_minute=60, rate_limit_per_second=10, default_call_latency_ms=1000
+        )
+        plan = planner.build([ContentType.LOOK])
+        look = plan.types[0]
+
+        # 3 looks x 2 calls at 1 call/s (60/min) => 6s; latency 2s/item
+        assert plan.estimate_seconds(1) == pytest.approx(6.0)
+        assert plan.estimate_seconds(32) == pytest.approx(6.0)
+        assert look.item_latency_ms == 2000
+        assert not look.latency_from_history
+        assert plan.recommended_workers() == 1
+
+    def test_history_latency_drives_recommendation(self, repo):
+        """Recorded latencies replace the default and shape the worker recommendation."""
+        repo.record_restore_latency(DESTINATION, ContentType.LOOK.value, 2, 8000.0)
+        repo.record_restore_latency(DESTINATION, ContentType.LOOK.value, 2, 8000.0)
+        planner = RestorePlanner(
+            repo, rate_limit_per_minute=600, rate_limit_per_second=10, destination=DESTINATION
+        )
+
+        plan = planner.build([ContentType.LOOK])
+        look = plan.types[0]
+
+        assert look.latency_from_history
+        assert look.item_latency_ms == pytest.approx(4000.0)
+        # 3 items x 4s: 12s on one worker, rate bound 6 calls / 10 per s = 0.6s
+        assert plan.estimate_seconds(1) == pytest.approx(12.0)
+        assert plan.estimate_seconds(3) == pytest.approx(4.0)
+        assert plan.recommended_workers() == 3
+
+
+class TestRestoreLatencyHistory:
+    """Tests for the restore latency history storage."""
+
+    def test_latencies_accumulate_per_destination(self, repo):
+        """Means are computed per destination, or across all destinations."""
+        repo.record_restore_latency(DESTINATION, ContentType.LOOK.value, 1, 100.0)
+        repo.record_restore_latency(DESTINATION, ContentType.LOOK.value, 1, 300.0)
+        repo.record_restore_latency("https://other", ContentType.LOOK.value, 2, 1200.0)
+        repo.record_restore_latency(DESTINATION, ContentType.FOLDER.value, 0, 0.0)
+
+        assert repo.get_restore_latencies(DESTINATION) == {ContentType.LOOK.value: 200.0}
+        assert repo.get_restore_latencies() == {ContentType.LOOK.value: 400.0}
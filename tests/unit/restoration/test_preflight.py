@@ -0,0 +1,136 @@
+"""Unit tests for process-parallel pre-flight validation."""
+
+from datetime import datetime
+
+import pytest
+
+from lookervault.restoration.preflight import PreflightValidator
+from lookervault.restoration.validation import RestorationValidator
+from lookervault.storage.models import ContentItem, ContentType
+from lookervault.storage.repository import SQLiteContentRepository
+from lookervault.storage.serializer import MsgpackSerializer
+
+
+def _save(repo: SQLiteContentRepository, content_type: ContentType, content: dict) -> None:
+    repo.save_content(
+        ContentItem(
+            id=str(content["id"]),
+            content_type=content_type.value,
+            name=str(content.get("title") or content.get("name")),
+            created_at=datetime.now(),
+            updated_at=datetime.now(),
+            content_data=MsgpackSerializer().serialize(content),
+        )
+    )
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """Backup with two folders and a mix of valid and invalid dashboards."""
+    repository = SQLiteContentRepository(tmp_path / "backup.db")
+    _save(repository, ContentType.FOLDER, {"id": "1", "name": "Shared"})
+    _save(repository, ContentType.FOLDER, {"id": "2", "name": "Sales", "parent_id": "1"})
+    for i in range(10):
+        _save(
+            repository,
+            ContentType.DASHBOARD,
+            {"id": f"d{i}", "title": f"D{i}", "folder_id": "2"},
+        )
+    _save(
+        repository,
+        ContentType.DASHBOARD,
+        {"id": "orphan", "title": "Orphan", "folder_id": "99"},
+    )
+    _save(repository, ContentType.DASHBOARD, {"id": "untitled", "folder_id": "1"})
+    yield repository
+    repository.close()
+
+
+class TestPreflightValidator:
+    """Tests for chunked validation and error aggregation."""
+
+    def test_inline_run_aggregates_per_type(self, repo):
+        """Failures are counted per type with error categories and samples."""
+        validator = PreflightValidator(repo, workers=1, chunk_size=3)
+
+        report = validator.run([ContentType.FOLDER, ContentType.DASHBOARD])
+
+        assert report.total_checked == 14
+        assert report.types["folder"].failed == 0
+        dashboards = report.types["dashboard"]
+        assert (dashboards.checked, dashboards.failed) == (12, 2)
+        assert dashboards.error_counts == {
+            "Dependency not found: folder_id": 1,
+            "Missing required field: title": 1,
+        }
+        assert sorted(content_id for content_id, _ in dashboards.samples) == [
+            "orphan",
+            "untitled",
+        ]
+        assert not report.passed
+
+    def test_dependency_checks_can_be_disabled(self, repo):
+        """Without dependency checks, only schema and required-field errors remain."""
+        validator = PreflightValidator(repo, workers=1, check_dependencies=False)
+
+        report = validator.run([ContentType.DASHBOARD])
+
+        assert report.types["dashboard"].failed == 1
+        assert report.types["dashboard"].samples[0][0] == "untitled"
+
+    def test_corrupted_blob_is_reported(self, repo):
+        """Blobs that cannot be decoded fail without aborting the run."""
+        repo.save_content(
+            ContentItem(
+                id="broken",
+                content_type=ContentType.FOLDER.value,
+                name="Broken",
+                created_at=datetime.now(),
+                updated_at=datetime.now(),
+                content_data=b"\xc1not msgpack",
+            )
+        )
+
+        report = PreflightValidator(repo, workers=1).run([ContentType.FOLDER])
+
+        assert report.types["folder"].checked == 3
+        assert [content_id for content_id, _ in report.types["folder"].samples] == ["broken"]
+
+    def test_process_pool_matches_inline_run(self, repo):
+        """Validating across worker processes gives the same report as inline."""
+        types = [ContentType.FOLDER, ContentType.DASHBOARD]
+        inline = PreflightValidator(repo, workers=1, chunk_size=2).run(types)
+
+        pooled = PreflightValidator(repo, workers=2, chunk_size=2).run(types)
+
+        assert pooled.workers == 2
+        assert pooled.total_checked == inline.total_checked
+        for name, stats in inline.types.items():
+            assert pooled.types[name].failed == stats.failed
+            assert pooled.types[name].error_counts == stats.error_counts
+
+    def test_id_index_skips_types_missing_from_backup(self, repo):
+        """Only referenced types present in the backup are indexed."""
+        index = PreflightValidator(repo).build_id_index()
+
+        assert set(index) == {ContentType.FOLDER, ContentType.DASHBOARD}
+        assert index[ContentType.FOLDER] == {"1", "2"}
+
+
+class TestValidateDependenciesWithIndex:
+    """Tests for offline dependency checks against an ID index."""
+
+    def test_checks_against_index(self):
+        """References are looked up in the index; unindexed targets pass."""
+        validator = RestorationValidator()
+        index = {ContentType.FOLDER: {"1"}}
+        look = {"title": "L", "folder_id": "2", "user_id": "7"}
+
+        errors = validator.validate_dependencies(look, ContentType.LOOK, id_index=index)
+
+        assert errors == ["Dependency not found: folder_id=2"]
+
+    def test_requires_client_or_index(self):
+        """Calling without a client or an index is an error."""
+        with pytest.raises(ValueError, match="client or an id_index"):
+            RestorationValidator().validate_dependencies({}, ContentType.LOOK)
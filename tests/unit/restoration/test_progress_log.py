@@ -0,0 +1,172 @@
+"""Unit tests for the append-only restoration progress log and resume anti-join."""
+
+from datetime import UTC, datetime
+from unittest.mock import MagicMock
+
+import pytest
+
+from lookervault.exceptions import StorageError
+from lookervault.extraction.metrics import ThreadSafeMetrics
+from lookervault.restoration.parallel_orchestrator import ParallelRestorationOrchestrator
+from lookervault.restoration.progress_writer import RestorationProgressWriter
+from lookervault.storage.models import ContentItem, ContentType, RestorationResult
+from lookervault.storage.repository import SQLiteContentRepository
+
+DASHBOARD = ContentType.DASHBOARD.value
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """Create temporary repository."""
+    return SQLiteContentRepository(tmp_path / "test.db")
+
+
+def _save_items(repo, ids, content_type=DASHBOARD, folder_id=None):
+    now = datetime.now(UTC)
+    for content_id in ids:
+        repo.save_content(
+            ContentItem(
+                id=content_id,
+                content_type=content_type,
+                name=f"Item {content_id}",
+                created_at=now,
+                updated_at=now,
+                content_data=b"data",
+                folder_id=folder_id,
+            )
+        )
+
+
+class TestRestorationProgressRepository:
+    """Tests for progress recording and the remaining-set anti-join."""
+
+    def test_remaining_ids_exclude_completed_items(self, repo):
+        """Completed items are excluded; failed items remain for retry."""
+        _save_items(repo, ["1", "2", "3", "4"])
+        repo.record_restoration_progress(
+            [
+                ("s1", DASHBOARD, "1", "created"),
+                ("s1", DASHBOARD, "2", "skipped"),
+                ("s1", DASHBOARD, "3", "failed"),
+            ]
+        )
+
+        assert sorted(repo.get_remaining_content_ids("s1", DASHBOARD)) == ["3", "4"]
+        assert repo.count_restoration_progress("s1", DASHBOARD) == 2
+
+    def test_remaining_ids_scoped_by_session_and_type(self, repo):
+        """Progress from other sessions or content types does not count."""
+        _save_items(repo, ["1", "2"])
+        _save_items(repo, ["1"], content_type=ContentType.LOOK.value)
+        repo.record_restoration_progress(
+            [
+                ("other", DASHBOARD, "1", "created"),
+                ("s1", ContentType.LOOK.value, "1", "created"),
+            ]
+        )
+
+        assert sorted(repo.get_remaining_content_ids("s1", DASHBOARD)) == ["1", "2"]
+        assert repo.get_remaining_content_ids("s1", ContentType.LOOK.value) == []
+
+    def test_rerecording_replaces_failed_status(self, repo):
+        """A failed item that later succeeds is no longer remaining."""
+        _save_items(repo, ["1"])
+        repo.record_restoration_progress([("s1", DASHBOARD, "1", "failed")])
+        repo.record_restoration_progress([("s1", DASHBOARD, "1", "updated")])
+
+        assert repo.get_remaining_content_ids("s1", DASHBOARD) == []
+
+    def test_remaining_ids_folder_scope(self, repo):
+        """Folder scope limits the remaining set to the requested folders."""
+        _save_items(repo, ["1"], folder_id="10")
+        _save_items(repo, ["2"], folder_id="20")
+
+        assert repo.get_remaining_content_ids("s1", DASHBOARD, folder_ids=["10"]) == ["1"]
+
+
+class TestRestorationProgressWriter:
+    """Tests for the background batch flusher."""
+
+    def test_close_flushes_all_entries_in_batches(self):
+        """Entries are written in batches and everything is flushed on close."""
+        repository = MagicMock()
+        writer = RestorationProgressWriter(repository, batch_size=10, flush_interval_seconds=60)
+
+        for i in range(25):
+            writer.record("s1", DASHBOARD, str(i), "created")
+        writer.close()
+
+        batches = [c.args[0] for c in repository.record_restoration_progress.call_args_list]
+        assert [len(batch) for batch in batches] == [10, 10, 5]
+        assert writer.flushed_count == 25
+        repository.close_thread_connection.assert_called_once()
+
+    def test_failed_flush_is_retried(self):
+        """A failed batch is kept and written by a later flush."""
+        repository = MagicMock()
+        repository.record_restoration_progress.side_effect = [StorageError("locked"), None]
+        writer = RestorationProgressWriter(repository, batch_size=1, flush_interval_seconds=60)
+
+        writer.record("s1", DASHBOARD, "1", "created")
+        writer.close()
+
+        assert repository.record_restoration_progress.call_count == 2
+        assert writer.flushed_count == 1
+
+
+class TestOrchestratorProgressLog:
+    """Restore records progress per item; resume uses the anti-join."""
+
+    def _orchestrator(self, repo, restorer, checkpoint_interval=2):
+        config = MagicMock()
+        config.workers = 2
+        config.checkpoint_interval = checkpoint_interval
+        config.max_retries = 5
+        config.dry_run = False
+        config.folder_ids = None
+        config.dynamic_workers = False
+        return ParallelRestorationOrchestrator(
+            restorer=restorer,
+            repository=repo,
+            config=config,
+            rate_limiter=MagicMock(),
+            metrics=ThreadSafeMetrics(),
+            dlq=MagicMock(),
+        )
+
+    def test_checkpoint_is_counts_only_and_resume_restores_remaining(self, repo):
+        """Checkpoints no longer carry id lists; resume retries failed and unseen items."""
+        _save_items(repo, ["1", "2", "3", "4", "5"])
+        restorer = MagicMock()
+
+        def first_run(content_id, content_type, dry_run=False):
+            status = "failed" if content_id == "3" else "created"
+            return RestorationResult(
+                content_id=content_id, content_type=content_type.value, status=status
+            )
+
+        restorer.restore_single.side_effect = first_run
+        orchestrator = self._orchestrator(repo, restorer)
+
+        # Simulate an interrupted run that only got through four items
+        orchestrator.restore(ContentType.DASHBOARD, "s1", content_ids=["1", "2", "3", "4"])
+
+        checkpoint = repo.get_latest_restoration_checkpoint(DASHBOARD, session_id="s1")
+        assert checkpoint is not None
+        assert "completed_ids" not in checkpoint.checkpoint_data
+        assert checkpoint.item_count == 3
+        assert checkpoint.error_count == 1
+
+        restorer.restore_single.reset_mock()
+        restorer.restore_single.side_effect = lambda content_id, content_type, dry_run=False: (
+            RestorationResult(
+                content_id=content_id, content_type=content_type.value, status="updated"
+            )
+        )
+
+        summary = orchestrator.resume(ContentType.DASHBOARD, "s1")
+
+        resumed = sorted(c.args[0] for c in restorer.restore_single.call_args_list)
+        assert resumed == ["3", "5"]
+        assert summary.updated_count == 2
+        assert repo.get_remaining_content_ids("s1", DASHBOARD) == []
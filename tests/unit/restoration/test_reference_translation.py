@@ -0,0 +1,198 @@
+"""Unit tests for compiled foreign-key reference translation."""
+
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import pytest
+
+from lookervault.exceptions import ValidationError
+from lookervault.restoration.id_mapping_cache import IDMappingCache
+from lookervault.restoration.reference_translation import (
+    ReferenceTranslator,
+    compile_references,
+)
+from lookervault.restoration.restorer import LookerContentRestorer
+from lookervault.storage.models import ContentItem, ContentType, IDMapping
+from lookervault.storage.repository import SQLiteContentRepository
+from lookervault.storage.serializer import MsgpackSerializer
+
+SOURCE = "https://source.looker.com"
+
+
+def _translator(
+    mappings: dict[ContentType, dict[str, str]],
+) -> tuple[ReferenceTranslator, MagicMock]:
+    repository = MagicMock()
+    repository.load_id_mappings.side_effect = lambda source, content_type: dict(
+        mappings.get(ContentType(content_type), {})
+    )
+    return ReferenceTranslator(IDMappingCache(repository, SOURCE)), repository
+
+
+def _dashboard(folder_id="10", look_ids=("20", "21")) -> dict:
+    return {
+        "id": "1",
+        "title": "Sales",
+        "folder_id": folder_id,
+        "user_id": "7",
+        "dashboard_elements": [
+            {"id": f"e{i}", "look_id": look_id, "look": {"id": look_id, "title": "Look"}}
+            for i, look_id in enumerate(look_ids)
+        ]
+        + [{"id": "text", "look_id": None, "body_text": "hello"}],
+    }
+
+
+class TestReferenceTranslator:
+    """Tests for batch resolution and in-place rewriting."""
+
+    def test_rewrites_nested_references(self):
+        """Folder, nested look and list references are rewritten to destination ids."""
+        translator, _ = _translator(
+            {
+                ContentType.FOLDER: {"10": "110"},
+                ContentType.LOOK: {"20": "120", "21": "121"},
+            }
+        )
+        dashboard = _dashboard()
+
+        translator.translate_references(dashboard, ContentType.DASHBOARD)
+
+        assert dashboard["folder_id"] == "110"
+        assert [e.get("look_id") for e in dashboard["dashboard_elements"]] == ["120", "121", None]
+        assert dashboard["dashboard_elements"][0]["look"]["id"] == "120"
+        # Optional owner reference keeps its source id when unmapped
+        assert dashboard["user_id"] == "7"
+
+    def test_batch_uses_one_lookup_per_referenced_type(self):
+        """A batch resolves every reference with one bulk lookup per target type."""
+        translator, repository = _translator(
+            {ContentType.FOLDER: {"10": "110"}, ContentType.LOOK: {"20": "120", "21": "121"}}
+        )
+        translator.cache.get_destination_ids = MagicMock(wraps=translator.cache.get_destination_ids)
+        items = [_dashboard() for _ in range(50)]
+
+        errors = translator.translate_batch(ContentType.DASHBOARD, items)
+
+        assert errors == [[]] * 50
+        looked_up = sorted(
+            c.args[0].name for c in translator.cache.get_destination_ids.call_args_list
+        )
+        assert looked_up == ["FOLDER", "LOOK", "USER"]
+        assert repository.load_id_mappings.call_count == 3
+
+    def test_unresolved_required_references_are_reported(self):
+        """Missing mappings for required references are validation errors."""
+        translator, _ = _translator({ContentType.LOOK: {"20": "120"}})
+        items = [_dashboard(look_ids=("20",)), _dashboard(folder_id=None, look_ids=("99",))]
+
+        errors = translator.translate_batch(ContentType.DASHBOARD, items)
+
+        assert errors[0] == ["Unresolved folder reference folder_id=10"]
+        assert errors[1] == [
+            "Unresolved look reference dashboard_elements[].look_id=99",
+            "Unresolved look reference dashboard_elements[].look.id=99",
+        ]
+        with pytest.raises(ValidationError, match="folder_id=10"):
+            translator.translate_references(_dashboard(look_ids=()), ContentType.DASHBOARD)
+
+    def test_list_of_ids_and_types_without_references(self):
+        """Scalar id lists are rewritten; types without foreign keys are untouched."""
+        translator, _ = _translator(
+            {ContentType.GROUP: {"1": "11", "2": "12"}, ContentType.ROLE: {"3": "13"}}
+        )
+        user = {"id": "5", "group_ids": ["1", "2"], "role_ids": [3]}
+        group = {"id": "1", "name": "Admins"}
+
+        assert translator.translate_batch(ContentType.USER, [user]) == [[]]
+        assert user["group_ids"] == ["11", "12"]
+        assert user["role_ids"] == ["13"]
+        assert translator.translate_batch(ContentType.GROUP, [group]) == [[]]
+        assert compile_references(ContentType.GROUP) == ()
+
+    def test_compiled_once_per_content_type(self):
+        """Compiled references are cached per content type."""
+        assert compile_references(ContentType.DASHBOARD) is compile_references(
+            ContentType.DASHBOARD
+        )
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """Repository holding the _dashboard() backup."""
+    repo = SQLiteContentRepository(tmp_path / "test.db")
+    repo.save_content(
+        ContentItem(
+            id="1",
+            content_type=ContentType.DASHBOARD.value,
+            name="Sales",
+            created_at=datetime.now(),
+            updated_at=datetime.now(),
+            content_data=MsgpackSerializer().serialize(_dashboard()),
+        )
+    )
+    return repo
+
+
+class TestRestorerReferenceValidation:
+    """Unresolved references fail an item before any API call."""
+
+    def test_unresolved_reference_fails_before_api_calls(self, repo):
+        """restore_single reports unresolved references without touching the API."""
+        repo.save_id_mappings([IDMapping(SOURCE, ContentType.LOOK.value, "20", "120")])
+        client = MagicMock()
+        restorer = LookerContentRestorer(
+            client, repo, id_mapper=ReferenceTranslator(IDMappingCache(repo, SOURCE))
+        )
+
+        result = restorer.restore_single("1", ContentType.DASHBOARD)
+
+        assert result.status == "failed"
+        assert "Unresolved folder reference folder_id=10" in result.error_message
+        assert client.sdk.method_calls == []
+
+    def test_unresolved_tile_reference_fails(self, repo):
+        """A tile's look reference without a mapping fails the dashboard."""
+        repo.save_id_mappings(
+            [
+                IDMapping(SOURCE, ContentType.FOLDER.value, "10", "110"),
+                IDMapping(SOURCE, ContentType.LOOK.value, "20", "120"),
+            ]
+        )
+        client = MagicMock()
+        restorer = LookerContentRestorer(
+            client, repo, id_mapper=ReferenceTranslator(IDMappingCache(repo, SOURCE))
+        )
+
+        result = restorer.restore_single("1", ContentType.DASHBOARD)
+
+        assert result.status == "failed"
+        assert "Unresolved look reference dashboard_elements[].look_id=21" in result.error_message
+        assert client.sdk.method_calls == []
+
+    def test_tile_references_reach_subresource_restorer(self, repo):
+        """Tiles decoded from the blob are restored with translated look IDs."""
+        repo.save_id_mappings(
+            [
+                IDMapping(SOURCE, ContentType.FOLDER.value, "10", "110"),
+                IDMapping(SOURCE, ContentType.LOOK.value, "20", "120"),
+                IDMapping(SOURCE, ContentType.LOOK.value, "21", "121"),
+            ]
+        )
+        client = MagicMock()
+        client.sdk.update_dashboard.return_value = {"id": "1"}
+        restorer = LookerContentRestorer(
+            client, repo, id_mapper=ReferenceTranslator(IDMappingCache(repo, SOURCE))
+        )
+        restorer.subresource_restorers[ContentType.DASHBOARD] = MagicMock()
+
+        result = restorer.restore_single("1", ContentType.DASHBOARD)
+
+        assert result.status == "updated"
+        assert client.sdk.update_dashboard.call_args.kwargs["body"]["folder_id"] == "110"
+        subresource_restorer = restorer.subresource_restorers[ContentType.DASHBOARD]
+        elements = subresource_restorer.restore_subresources.call_args.kwargs["parent_content"][
+            "dashboard_elements"
+        ]
+        assert [element["look_id"] for element in elements] == ["120", "121", None]
+        assert [element["look"]["id"] for element in elements[:2]] == ["120", "121"]
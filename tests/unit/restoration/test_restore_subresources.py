@@ -0,0 +1,75 @@
+"""Unit tests for restoring dashboard sub-resources from the backup blob."""
+
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import pytest
+
+from lookervault.restoration.restorer import LookerContentRestorer
+from lookervault.storage.models import ContentItem, ContentType
+from lookervault.storage.repository import SQLiteContentRepository
+from lookervault.storage.serializer import MsgpackSerializer
+
+FILTERS = [{"id": "10", "name": "Date", "title": "Date", "type": "field_filter"}]
+ELEMENTS = [{"id": "20", "title": "Revenue", "type": "vis", "look_id": "7"}]
+LAYOUTS = [{"id": "30", "type": "newspaper", "active": True}]
+BACKUP = {
+    "id": "1",
+    "title": "Sales",
+    "folder_id": "5",
+    "dashboard_filters": FILTERS,
+    "dashboard_elements": ELEMENTS,
+    "dashboard_layouts": LAYOUTS,
+}
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """Create temporary repository holding one dashboard with tiles."""
+    repo = SQLiteContentRepository(tmp_path / "test.db")
+    repo.save_content(
+        ContentItem(
+            id="1",
+            content_type=ContentType.DASHBOARD.value,
+            name="Sales",
+            created_at=datetime.now(),
+            updated_at=datetime.now(),
+            content_data=MsgpackSerializer().serialize(BACKUP),
+        )
+    )
+    return repo
+
+
+@pytest.fixture
+def restorer(repo):
+    """Restorer whose dashboard sub-resource restorer is a mock."""
+    client = MagicMock()
+    client.sdk.update_dashboard.return_value = {"id": "1"}
+    client.sdk.create_dashboard.return_value = {"id": "77"}
+    restorer = LookerContentRestorer(client, repo)
+    restorer.subresource_restorers[ContentType.DASHBOARD] = MagicMock()
+    return restorer
+
+
+class TestRestoreSubresources:
+    """Tests for Step 8 of restore_single."""
+
+    def test_nested_lists_reach_subresource_restorer(self, restorer):
+        """Filters, elements and layouts dropped by the writable decode are still restored."""
+        result = restorer.restore_single("1", ContentType.DASHBOARD)
+
+        assert result.status == "updated"
+        subresource_restorer = restorer.subresource_restorers[ContentType.DASHBOARD]
+        parent_content = subresource_restorer.restore_subresources.call_args.kwargs[
+            "parent_content"
+        ]
+        assert parent_content["dashboard_filters"] == FILTERS
+        assert parent_content["dashboard_elements"] == ELEMENTS
+        assert parent_content["dashboard_layouts"] == LAYOUTS
+
+    def test_parent_patch_excludes_nested_lists(self, restorer):
+        """The read-only lists are not sent with the parent dashboard write."""
+        restorer.restore_single("1", ContentType.DASHBOARD)
+
+        body = restorer.client.sdk.update_dashboard.call_args.kwargs["body"]
+        assert {"dashboard_filters", "dashboard_elements", "dashboard_layouts"}.isdisjoint(body)
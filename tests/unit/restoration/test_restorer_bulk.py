@@ -258,3 +258,36 @@ def test_restore_bulk_exception_handling(restorer, mock_repository, mock_config)
         assert result.error_count == 1
         assert "RuntimeError" in result.error_breakdown
         assert result.error_breakdown["RuntimeError"] == 1
+
+
+def test_restore_bulk_flushes_id_mappings(mock_client, mock_repository, mock_config):
+    """Test ID mappings are persisted before checkpoints and when every item failed."""
+    id_mapper = MagicMock()
+    restorer = LookerContentRestorer(mock_client, mock_repository, id_mapper=id_mapper)
+    mock_repository.get_content_ids.return_value = {"1"}
+    calls = MagicMock()
+    calls.attach_mock(id_mapper.flush, "flush")
+    calls.attach_mock(mock_repository.save_restoration_checkpoint, "checkpoint")
+
+    with patch.object(restorer, "restore_single") as mock_restore_single:
+        mock_restore_single.return_value = RestorationResult(
+            content_id="1",
+            content_type=ContentType.DASHBOARD.value,
+            status="created",
+            destination_id="101",
+            duration_ms=100.0,
+        )
+        restorer.restore_bulk(ContentType.DASHBOARD, mock_config)
+
+        assert [name for name, _, _ in calls.mock_calls] == ["flush", "checkpoint"]
+
+        calls.reset_mock()
+        mock_restore_single.return_value = RestorationResult(
+            content_id="1",
+            content_type=ContentType.DASHBOARD.value,
+            status="failed",
+            error_message="sub-resource error",
+        )
+        restorer.restore_bulk(ContentType.DASHBOARD, mock_config)
+
+        assert [name for name, _, _ in calls.mock_calls] == ["flush"]
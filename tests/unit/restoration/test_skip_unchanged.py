@@ -0,0 +1,273 @@
+"""Unit tests for fingerprint-based skipping of unchanged content."""
+
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import pytest
+from looker_sdk import error as looker_error
+from looker_sdk.sdk.api40 import models
+
+from lookervault.restoration.fingerprint import content_fingerprint
+from lookervault.restoration.restorer import LookerContentRestorer
+from lookervault.storage.models import ContentItem, ContentType
+from lookervault.storage.repository import SQLiteContentRepository
+from lookervault.storage.serializer import MsgpackSerializer
+
+DESTINATION = "https://dest.looker.com"
+BACKUP = {"id": "1", "title": "Sales", "description": None, "folder_id": "5", "view_count": 9}
+STYLED = {"id": "2", "title": "Ops", "folder_id": "5", "appearance": {"page_side_margins": 3}}
+TILED = {
+    "id": "4",
+    "title": "Tiles",
+    "folder_id": "5",
+    "dashboard_elements": [{"id": "40", "title": "Revenue", "type": "vis"}],
+}
+ROLE = {
+    "id": "6",
+    "name": "Analyst",
+    "permission_set": {"id": "2", "name": "Explore", "permissions": ["access_data", "explore"]},
+}
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """Create temporary repository holding one dashboard and one role."""
+    repo = SQLiteContentRepository(tmp_path / "test.db")
+    for content_id, content_type, data in [
+        ("1", ContentType.DASHBOARD, BACKUP),
+        ("2", ContentType.DASHBOARD, STYLED),
+        ("3", ContentType.ROLE, {"id": "3", "name": "Viewer", "permission_set_id": "2"}),
+        ("4", ContentType.DASHBOARD, TILED),
+        ("6", ContentType.ROLE, ROLE),
+    ]:
+        repo.save_content(
+            ContentItem(
+                id=content_id,
+                content_type=content_type.value,
+                name="item",
+                created_at=datetime.now(),
+                updated_at=datetime.now(),
+                content_data=MsgpackSerializer().serialize(data),
+            )
+        )
+    return repo
+
+
+def _restorer(repo, destination: dict | None) -> LookerContentRestorer:
+    client = MagicMock()
+    client.api_url = DESTINATION
+    if destination is None:
+        client.sdk.dashboard.side_effect = looker_error.SDKError("404 Not Found")
+    else:
+        client.sdk.dashboard.return_value = destination
+    client.sdk.update_dashboard.return_value = {"id": "1"}
+    client.sdk.create_dashboard.return_value = {"id": "77"}
+    return LookerContentRestorer(client, repo, skip_unchanged=True)
+
+
+class TestContentFingerprint:
+    """Tests for fingerprint normalization."""
+
+    def test_ignores_order_none_and_id(self):
+        """Key order, unset values and the ID do not change the fingerprint."""
+        assert content_fingerprint({"id": "1", "a": 1, "b": None, "c": {"x": None}}) == (
+            content_fingerprint({"c": {}, "a": 1, "id": "2"})
+        )
+        assert content_fingerprint({"a": 1}) != content_fingerprint({"a": 2})
+
+    def test_restricted_to_fields(self):
+        """Destination-only fields are ignored when fields are given."""
+        backup = {"title": "Sales"}
+        destination = {"title": "Sales", "slug": "abc"}
+
+        assert content_fingerprint(destination, fields=backup) == content_fingerprint(backup)
+
+    def test_nested_objects_restricted_to_backup_keys(self):
+        """Read-only fields of nested objects are ignored; nested values still count."""
+        backup = {"permission_set": {"name": "Explore", "permissions": ["explore"]}}
+        destination = {
+            "permission_set": {"name": "Explore", "permissions": ["explore"], "built_in": False}
+        }
+        changed = {"permission_set": {"name": "Explore", "permissions": ["access_data"]}}
+
+        assert content_fingerprint(destination, fields=backup) == content_fingerprint(backup)
+        assert content_fingerprint(changed, fields=backup) != content_fingerprint(backup)
+
+
+class TestSkipUnchanged:
+    """Tests for skipping unchanged items in restore_single."""
+
+    def test_identical_destination_is_skipped_and_cached(self, repo):
+        """A matching destination is not patched, and the next run does not fetch it."""
+        restorer = _restorer(repo, {"id": "1", "title": "Sales", "folder_id": "5", "slug": "x"})
+
+        result = restorer.restore_single("1", ContentType.DASHBOARD)
+
+        assert result.status == "skipped"
+        restorer.client.sdk.update_dashboard.assert_not_called()
+        restorer.client.sdk.dashboard.assert_called_once_with(
+            "1", fields="description,folder_id,id,title"
+        )
+
+        rerun = restorer.restore_single("1", ContentType.DASHBOARD)
+
+        assert rerun.status == "skipped"
+        assert restorer.client.sdk.dashboard.call_count == 1
+
+    def test_changed_destination_is_updated_then_skipped(self, repo):
+        """A differing destination is patched; the written fingerprint is cached."""
+        restorer = _restorer(repo, {"id": "1", "title": "Old title", "folder_id": "5"})
+
+        assert restorer.restore_single("1", ContentType.DASHBOARD).status == "updated"
+        assert restorer.restore_single("1", ContentType.DASHBOARD).status == "skipped"
+        assert restorer.client.sdk.update_dashboard.call_count == 1
+        assert restorer.client.sdk.dashboard.call_count == 1
+
+    def test_created_items_are_fingerprinted_under_destination_id(self, repo):
+        """Fingerprints of created items are keyed by the new destination ID."""
+        restorer = _restorer(repo, None)
+
+        assert restorer.restore_single("1", ContentType.DASHBOARD).status == "created"
+
+        expected = content_fingerprint({"title": "Sales", "folder_id": "5"})
+        assert (
+            repo.get_destination_fingerprint(DESTINATION, ContentType.DASHBOARD.value, "77")
+            == expected
+        )
+
+    def test_fingerprints_are_per_destination(self, repo):
+        """A fingerprint cached for another destination does not skip the fetch."""
+        repo.save_destination_fingerprint(
+            "https://other.looker.com",
+            ContentType.DASHBOARD.value,
+            "1",
+            content_fingerprint({"title": "Sales", "folder_id": "5"}),
+        )
+        restorer = _restorer(repo, {"id": "1", "title": "Changed", "folder_id": "5"})
+
+        assert restorer.restore_single("1", ContentType.DASHBOARD).status == "updated"
+
+    def test_recheck_destination_ignores_cached_fingerprint(self, repo):
+        """Content edited in Looker after a run is restored again when rechecking."""
+        restorer = _restorer(repo, {"id": "1", "title": "Sales", "folder_id": "5"})
+        assert restorer.restore_single("1", ContentType.DASHBOARD).status == "skipped"
+
+        restorer.client.sdk.dashboard.return_value = {
+            "id": "1",
+            "title": "Edited",
+            "folder_id": "5",
+        }
+        assert restorer.restore_single("1", ContentType.DASHBOARD).status == "skipped"
+
+        rechecking = LookerContentRestorer(
+            restorer.client, repo, skip_unchanged=True, recheck_destination=True
+        )
+        assert rechecking.restore_single("1", ContentType.DASHBOARD).status == "updated"
+        assert restorer.client.sdk.dashboard.call_count == 2
+        restorer.client.sdk.update_dashboard.assert_called_once()
+
+    def test_get_without_fields_parameter(self, repo):
+        """Types whose SDK getter lacks 'fields' are fetched whole."""
+        restorer = _restorer(repo, None)
+        restorer.client.sdk.role.return_value = {
+            "id": "3",
+            "name": "Viewer",
+            "permission_set_id": "2",
+        }
+
+        result = restorer.restore_single("3", ContentType.ROLE)
+
+        assert result.status == "skipped"
+        restorer.client.sdk.role.assert_called_once_with("3")
+
+    def test_sdk_model_destination_with_nested_models_is_skipped(self, repo):
+        """SDK model responses are compared by value, including nested models."""
+        restorer = _restorer(
+            repo,
+            models.Dashboard(
+                id="2",
+                title="Ops",
+                folder_id="5",
+                slug="x",
+                appearance=models.DashboardAppearance(page_side_margins=3),
+            ),
+        )
+        restorer.client.sdk.role.return_value = models.Role(
+            id="6",
+            name="Analyst",
+            url="https://dest.looker.com/api/4.0/roles/6",
+            permission_set=models.PermissionSet(
+                id="2",
+                name="Explore",
+                permissions=["access_data", "explore"],
+                built_in=False,
+                all_access=False,
+            ),
+        )
+
+        assert restorer.restore_single("2", ContentType.DASHBOARD).status == "skipped"
+        assert restorer.restore_single("6", ContentType.ROLE).status == "skipped"
+        restorer.client.sdk.update_dashboard.assert_not_called()
+        restorer.client.sdk.update_role.assert_not_called()
+
+    def test_changed_nested_model_is_updated(self, repo):
+        """A differing nested model value is not skipped."""
+        restorer = _restorer(
+            repo,
+            models.Dashboard(
+                id="2",
+                title="Ops",
+                folder_id="5",
+                appearance=models.DashboardAppearance(page_side_margins=8),
+            ),
+        )
+
+        assert restorer.restore_single("2", ContentType.DASHBOARD).status == "updated"
+
+    def test_unchanged_parent_still_restores_new_tile(self, repo):
+        """A new tile in the backup is restored even when the parent fields match."""
+        restorer = _restorer(repo, {"id": "4", "title": "Tiles", "folder_id": "5"})
+        subresource_restorer = MagicMock()
+        subresource_restorer.restore_subresources.return_value = MagicMock(
+            total_created=1, total_updated=0, total_deleted=0, total_errors=0, all_errors=[]
+        )
+        restorer.subresource_restorers[ContentType.DASHBOARD] = subresource_restorer
+
+        result = restorer.restore_single("4", ContentType.DASHBOARD)
+
+        assert result.status == "updated"
+        restorer.client.sdk.update_dashboard.assert_not_called()
+        parent_content = subresource_restorer.restore_subresources.call_args.kwargs[
+            "parent_content"
+        ]
+        assert parent_content["dashboard_elements"] == TILED["dashboard_elements"]
+
+    def test_cached_fingerprint_covers_subresources(self, repo):
+        """A fingerprint cached before a tile was added does not skip the dashboard."""
+        repo.save_destination_fingerprint(
+            DESTINATION,
+            ContentType.DASHBOARD.value,
+            "4",
+            content_fingerprint({"title": "Tiles", "folder_id": "5"}),
+        )
+        restorer = _restorer(repo, {"id": "4", "title": "Tiles", "folder_id": "5"})
+        subresource_restorer = MagicMock()
+        subresource_restorer.restore_subresources.return_value = MagicMock(
+            total_created=1, total_updated=0, total_deleted=0, total_errors=0, all_errors=[]
+        )
+        restorer.subresource_restorers[ContentType.DASHBOARD] = subresource_restorer
+
+        assert restorer.restore_single("4", ContentType.DASHBOARD).status == "updated"
+        subresource_restorer.restore_subresources.assert_called_once()
+
+        assert restorer.restore_single("4", ContentType.DASHBOARD).status == "skipped"
+        subresource_restorer.restore_subresources.assert_called_once()
+
+    def test_disabled_by_default(self, repo):
+        """Without skip_unchanged every existing item is patched."""
+        client = MagicMock()
+        client.sdk.update_dashboard.return_value = {"id": "1"}
+        restorer = LookerContentRestorer(client, repo)
+
+        assert restorer.restore_single("1", ContentType.DASHBOARD).status == "updated"
+        assert restorer.restore_single("1", ContentType.DASHBOARD).status == "updated"
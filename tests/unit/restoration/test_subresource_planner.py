@@ -0,0 +1,394 @@
+"""Unit tests for diff-based dashboard sub-resource mutation planning."""
+
+import threading
+from datetime import datetime
+from unittest.mock import MagicMock
+
+from looker_sdk import models40 as looker_models
+
+from lookervault.restoration.subresource_restorer import (
+    READ_ONLY_ELEMENT_FIELDS,
+    READ_ONLY_FILTER_FIELDS,
+    DashboardSubResourceRestorer,
+    has_writable_changes,
+    plan_subresource_mutations,
+)
+
+WRITE_METHODS = [
+    "create_dashboard_filter",
+    "update_dashboard_filter",
+    "delete_dashboard_filter",
+    "create_dashboard_element",
+    "update_dashboard_element",
+    "delete_dashboard_element",
+    "create_dashboard_layout",
+    "update_dashboard_layout",
+    "delete_dashboard_layout",
+    "update_dashboard_layout_component",
+]
+
+FETCH_METHODS = [
+    "dashboard_dashboard_filters",
+    "dashboard_dashboard_elements",
+    "dashboard_dashboard_layouts",
+    "dashboard_layout_dashboard_layout_components",
+]
+
+
+def _backup_dashboard() -> dict:
+    return {
+        "dashboard_filters": [
+            {"id": "1", "name": "region", "title": "Region", "type": "field_filter", "row": 0}
+        ],
+        "dashboard_elements": [
+            {
+                "id": "10",
+                "title": "Sales",
+                "type": "vis",
+                "query": {"model": "ecommerce", "view": "orders", "fields": ["orders.count"]},
+                "edit_uri": "/edit/10",
+            }
+        ],
+        "dashboard_layouts": [
+            {
+                "id": "100",
+                "type": "newspaper",
+                "active": True,
+                "dashboard_layout_components": [
+                    {
+                        "id": "1000",
+                        "dashboard_layout_id": "100",
+                        "dashboard_element_id": "10",
+                        "row": 0,
+                        "column": 0,
+                        "width": 12,
+                        "height": 6,
+                        "vis_type": "looker_line",
+                    }
+                ],
+            }
+        ],
+    }
+
+
+def _destination_client() -> MagicMock:
+    """Client whose destination dashboard matches _backup_dashboard() (as SDK models)."""
+    client = MagicMock()
+    sdk = client.sdk
+    sdk.dashboard_dashboard_filters.return_value = [
+        looker_models.DashboardFilter(
+            id="1", name="region", title="Region", type="field_filter", row=0, dashboard_id="5"
+        )
+    ]
+    sdk.dashboard_dashboard_elements.return_value = [
+        looker_models.DashboardElement(
+            id="10",
+            title="Sales",
+            type="vis",
+            dashboard_id="5",
+            query=looker_models.Query(model="ecommerce", view="orders", fields=["orders.count"]),
+            edit_uri="/other/edit/uri",
+        )
+    ]
+    sdk.dashboard_dashboard_layouts.return_value = [
+        looker_models.DashboardLayout(
+            id="100",
+            type="newspaper",
+            active=True,
+            dashboard_id="5",
+            dashboard_layout_components=[
+                looker_models.DashboardLayoutComponent(
+                    id="1000",
+                    dashboard_layout_id="100",
+                    dashboard_element_id="10",
+                    row=0,
+                    column=0,
+                    width=12,
+                    height=6,
+                    vis_type="looker_column",
+                )
+            ],
+        )
+    ]
+    return client
+
+
+class TestPlanSubresourceMutations:
+    """Tests for the normalized diff planner."""
+
+    def test_unchanged_items_produce_no_mutations(self):
+        """Matched items with equal writable fields are neither updated nor recreated."""
+        backup = [{"id": "1", "title": "A", "updated_at": "2024-01-01"}]
+        existing = [{"id": "1", "title": "A", "updated_at": "2025-01-01", "can": {}}]
+
+        plan = plan_subresource_mutations(backup, existing, READ_ONLY_FILTER_FIELDS, "filter")
+
+        assert plan.mutation_count == 0
+        assert plan.unchanged_count == 1
+
+    def test_classifies_create_update_delete(self):
+        """Differences map to the minimal set of creates, updates and deletes."""
+        backup = [{"id": "1", "title": "A"}, {"id": "2", "title": "B2"}, {"id": "4"}]
+        existing = [{"id": "2", "title": "B"}, {"id": "3", "title": "C"}]
+
+        plan = plan_subresource_mutations(backup, existing, READ_ONLY_FILTER_FIELDS, "filter")
+
+        assert [item["id"] for item in plan.creates] == ["1", "4"]
+        assert [item_id for item_id, _ in plan.updates] == ["2"]
+        assert plan.deletes == ["3"]
+
+    def test_sdk_models_and_nested_values_are_normalized(self):
+        """Nested SDK models compare equal to the plain dicts stored in the backup."""
+        backup = {"id": "10", "query": {"model": "m", "view": "v", "fields": ["a"]}}
+        existing = dict(
+            looker_models.DashboardElement(
+                id="10", query=looker_models.Query(model="m", view="v", fields=["a"])
+            )
+        )
+
+        assert not has_writable_changes(backup, existing, READ_ONLY_ELEMENT_FIELDS)
+
+        backup["query"]["fields"] = ["a", "b"]
+        assert has_writable_changes(backup, existing, READ_ONLY_ELEMENT_FIELDS)
+
+    def test_read_only_fields_of_nested_models_are_ignored(self):
+        """A look-backed tile whose look only gained views is unchanged."""
+        look = {"id": "7", "title": "Revenue", "query_id": "3", "view_count": 5}
+        backup = {
+            "id": "10",
+            "look_id": "7",
+            "look": {**look, "last_viewed_at": "2025-01-01T00:00:00"},
+        }
+        existing = dict(
+            looker_models.DashboardElement(
+                id="10",
+                look_id="7",
+                look=looker_models.LookWithQuery(
+                    **{**look, "view_count": 9}, last_viewed_at=datetime(2026, 10, 1)
+                ),
+            )
+        )
+
+        assert has_writable_changes(backup, existing, READ_ONLY_ELEMENT_FIELDS)
+        assert not has_writable_changes(
+            backup, existing, READ_ONLY_ELEMENT_FIELDS, looker_models.WriteDashboardElement
+        )
+
+        backup["look"]["title"] = "Revenue (old)"
+        assert has_writable_changes(
+            backup, existing, READ_ONLY_ELEMENT_FIELDS, looker_models.WriteDashboardElement
+        )
+
+
+class TestDashboardSubResourceRestorerDiff:
+    """Tests for minimal mutations against a destination dashboard."""
+
+    def test_idempotent_rerestore_makes_zero_write_calls(self):
+        """Restoring a dashboard that already matches the backup issues no writes."""
+        client = _destination_client()
+        restorer = DashboardSubResourceRestorer(client)
+
+        result = restorer.restore_subresources("5", _backup_dashboard())
+
+        for method in WRITE_METHODS:
+            getattr(client.sdk, method).assert_not_called()
+        # Components come nested in the layout response; no per-layout fetch
+        client.sdk.dashboard_layout_dashboard_layout_components.assert_not_called()
+        assert result.total_errors == 0
+        assert result.total_unchanged == 3
+
+    def test_look_backed_tile_with_new_views_is_not_rewritten(self):
+        """Read-only counters on a tile's look don't trigger an element update."""
+        client = _destination_client()
+        element = client.sdk.dashboard_dashboard_elements.return_value[0]
+        element.look_id = "7"
+        element.look = looker_models.LookWithQuery(
+            id="7", title="Revenue", view_count=9, last_viewed_at=datetime(2026, 10, 1)
+        )
+        backup = _backup_dashboard()
+        backup["dashboard_elements"][0]["look_id"] = "7"
+        backup["dashboard_elements"][0]["look"] = {
+            "id": "7",
+            "title": "Revenue",
+            "view_count": 5,
+            "last_viewed_at": "2025-01-01T00:00:00",
+        }
+        restorer = DashboardSubResourceRestorer(client)
+
+        result = restorer.restore_subresources("5", backup)
+
+        client.sdk.update_dashboard_element.assert_not_called()
+        assert result.elements.unchanged_count == 1
+
+    def test_only_changed_items_are_written(self):
+        """A single changed filter and moved tile produce exactly two writes."""
+        client = _destination_client()
+        backup = _backup_dashboard()
+        backup["dashboard_filters"][0]["title"] = "Sales Region"
+        backup["dashboard_layouts"][0]["dashboard_layout_components"][0]["row"] = 6
+        restorer = DashboardSubResourceRestorer(client)
+
+        result = restorer.restore_subresources("5", backup)
+
+        client.sdk.update_dashboard_filter.assert_called_once()
+        client.sdk.update_dashboard_layout_component.assert_called_once()
+        client.sdk.update_dashboard_element.assert_not_called()
+        client.sdk.update_dashboard_layout.assert_not_called()
+        assert result.filters.updated_count == 1
+
+    def test_just_created_parent_skips_destination_fetches(self):
+        """A create response is used as destination state instead of fetching."""
+        client = MagicMock()
+        client.sdk.create_dashboard_filter.return_value = {"id": "2"}
+        client.sdk.create_dashboard_element.return_value = {"id": "20"}
+        created_dashboard = {
+            "id": "5",
+            "dashboard_filters": [],
+            "dashboard_elements": [],
+            # Looker creates a default layout with every new dashboard
+            "dashboard_layouts": [
+                looker_models.DashboardLayout(id="900", type="newspaper", active=True)
+            ],
+        }
+        client.sdk.create_dashboard_layout.return_value = {
+            "id": "101",
+            "dashboard_layout_components": [
+                {"id": "2000", "dashboard_layout_id": "101", "dashboard_element_id": "20"}
+            ],
+        }
+        restorer = DashboardSubResourceRestorer(client)
+
+        result = restorer.restore_subresources(
+            "5", _backup_dashboard(), destination_state=created_dashboard
+        )
+
+        for method in FETCH_METHODS:
+            getattr(client.sdk, method).assert_not_called()
+        client.sdk.delete_dashboard_layout.assert_called_once_with("900")
+
+        # The tile's component is matched through the new element id
+        component_call = client.sdk.update_dashboard_layout_component.call_args
+        assert component_call.args[0] == "2000"
+        assert component_call.kwargs["body"]["dashboard_element_id"] == "20"
+        assert result.total_created == 3
+        assert result.total_errors == 0
+
+
+class TestDashboardSubResourceConcurrency:
+    """Tests for concurrent dispatch of independent sub-resource operations."""
+
+    def _new_dashboard_client(self, tiles: int, events: list[str]) -> MagicMock:
+        """Client for a just-created dashboard whose create calls record their order."""
+        client = MagicMock()
+        lock = threading.Lock()
+        barrier = threading.Barrier(2, timeout=5)
+
+        def create_element(body):
+            # Two creates must be in flight at once to pass the barrier
+            barrier.wait()
+            with lock:
+                events.append("element")
+            return {"id": f"new-{body['title']}"}
+
+        def create_filter(body):
+            with lock:
+                events.append("filter")
+            return {"id": f"new-{body['name']}"}
+
+        def create_layout(body):
+            with lock:
+                events.append("layout")
+            return {
+                "id": "new-layout",
+                "dashboard_layout_components": [
+                    {"id": f"c{i}", "dashboard_element_id": f"new-{i}"} for i in range(tiles)
+                ],
+            }
+
+        def update_component(component_id, body):
+            with lock:
+                events.append("component")
+            return {"id": component_id}
+
+        client.sdk.create_dashboard_element.side_effect = create_element
+        client.sdk.create_dashboard_filter.side_effect = create_filter
+        client.sdk.create_dashboard_layout.side_effect = create_layout
+        client.sdk.update_dashboard_layout_component.side_effect = update_component
+        return client
+
+    def _backup(self, tiles: int) -> dict:
+        return {
+            "dashboard_filters": [{"id": "f1", "name": "region"}, {"id": "f2", "name": "date"}],
+            "dashboard_elements": [{"id": str(i), "title": str(i)} for i in range(tiles)],
+            "dashboard_layouts": [
+                {
+                    "id": "100",
+                    "type": "newspaper",
+                    "dashboard_layout_components": [
+                        {"id": str(1000 + i), "dashboard_element_id": str(i), "row": i}
+                        for i in range(tiles)
+                    ],
+                }
+            ],
+        }
+
+    def test_creates_run_concurrently_and_phases_stay_ordered(self):
+        """Tiles are created in parallel; components are updated only after all elements."""
+        events: list[str] = []
+        client = self._new_dashboard_client(tiles=6, events=events)
+        rate_limiter = MagicMock()
+        restorer = DashboardSubResourceRestorer(client, rate_limiter, max_concurrency=4)
+
+        result = restorer.restore_subresources(
+            "5", self._backup(6), destination_state={"dashboard_layouts": []}
+        )
+
+        assert result.total_errors == 0
+        assert events == ["filter"] * 2 + ["element"] * 6 + ["layout"] + ["component"] * 6
+        # Components reference the element ids assigned by the destination
+        updated = {
+            c.kwargs["body"]["dashboard_element_id"]
+            for c in client.sdk.update_dashboard_layout_component.call_args_list
+        }
+        assert updated == {f"new-{i}" for i in range(6)}
+        # Every API call goes through the shared rate limiter
+        assert rate_limiter.acquire.call_count == 15
+
+    def test_discovery_fetches_run_concurrently(self):
+        """Filter and element discovery are fetched together before the filter phase."""
+        client = _destination_client()
+        barrier = threading.Barrier(2, timeout=5)
+        filters = client.sdk.dashboard_dashboard_filters.return_value
+        elements = client.sdk.dashboard_dashboard_elements.return_value
+
+        def fetch(value):
+            def _fetch(dashboard_id):
+                barrier.wait()
+                return value
+
+            return _fetch
+
+        client.sdk.dashboard_dashboard_filters.side_effect = fetch(filters)
+        client.sdk.dashboard_dashboard_elements.side_effect = fetch(elements)
+        restorer = DashboardSubResourceRestorer(client, max_concurrency=2)
+
+        result = restorer.restore_subresources("5", _backup_dashboard())
+
+        assert result.total_errors == 0
+        assert result.total_unchanged == 3
+        client.sdk.dashboard_dashboard_filters.assert_called_once_with("5")
+        client.sdk.dashboard_dashboard_elements.assert_called_once_with("5")
+
+    def test_failed_layout_update_skips_its_components(self):
+        """A layout whose update failed does not get its components updated."""
+        client = _destination_client()
+        client.sdk.update_dashboard_layout.side_effect = RuntimeError("boom")
+        backup = _backup_dashboard()
+        backup["dashboard_layouts"][0]["type"] = "static"
+        backup["dashboard_layouts"][0]["dashboard_layout_components"][0]["row"] = 6
+        restorer = DashboardSubResourceRestorer(client, max_concurrency=4)
+
+        result = restorer.restore_subresources("5", backup)
+
+        client.sdk.update_dashboard_layout_component.assert_not_called()
+        assert result.layouts.error_count == 1
@@ -0,0 +1,195 @@
+"""Query plan tests for SQLiteContentRepository hot paths.
+
+Each test records the statements a repository method runs, replays them
+through EXPLAIN QUERY PLAN with the same parameters, and asserts the index
+SQLite picks. Dropping or changing an index, or rewriting a query so that it
+no longer matches one, fails here instead of silently turning a lookup into
+a full table scan.
+"""
+
+import sqlite3
+from collections.abc import Callable
+from datetime import UTC, datetime
+from typing import Any
+
+import pytest
+
+from lookervault.storage.models import ContentType
+from lookervault.storage.repository import SQLiteContentRepository
+
+# Enough folders that, without INDEXED BY, SQLite would pick idx_content_type
+FOLDERS = {str(i) for i in range(100)}
+SOURCE = "https://source.looker.com"
+
+
+class _RecordingCursor:
+    """Cursor wrapper that records executed statements."""
+
+    def __init__(self, cursor: sqlite3.Cursor, statements: list[tuple[str, Any]]):
+        self._cursor = cursor
+        self._statements = statements
+
+    def execute(self, sql: str, params: Any = ()) -> "_RecordingCursor":
+        self._statements.append((sql, params))
+        self._cursor.execute(sql, params)
+        return self
+
+    def __iter__(self):
+        return iter(self._cursor)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._cursor, name)
+
+
+class _RecordingConnection:
+    """Connection wrapper that records executed statements."""
+
+    def __init__(self, conn: sqlite3.Connection, statements: list[tuple[str, Any]]):
+        self._conn = conn
+        self._statements = statements
+
+    def execute(self, sql: str, params: Any = ()) -> sqlite3.Cursor:
+        self._statements.append((sql, params))
+        return self._conn.execute(sql, params)
+
+    def cursor(self) -> _RecordingCursor:
+        return _RecordingCursor(self._conn.cursor(), self._statements)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._conn, name)
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """Create an empty repository."""
+    repository = SQLiteContentRepository(tmp_path / "plans.db")
+    yield repository
+    repository.close()
+
+
+def query_plans(repo: SQLiteContentRepository, call: Callable[[], Any]) -> list[str]:
+    """Run call against repo and return the query plan of every SELECT/UPDATE it issued.
+
+    Returns:
+        One string per statement, the plan's detail lines joined with "; "
+    """
+    conn = repo._get_connection()
+    statements: list[tuple[str, Any]] = []
+    recording = _RecordingConnection(conn, statements)
+    object.__setattr__(repo, "_get_connection", lambda: recording)
+    try:
+        result = call()
+        if hasattr(result, "__next__"):
+            list(result)
+    finally:
+        object.__delattr__(repo, "_get_connection")
+
+    plans = []
+    for sql, params in statements:
+        if not sql.lstrip().upper().startswith(("SELECT", "UPDATE")):
+            continue
+        rows = conn.execute(f"EXPLAIN QUERY PLAN {sql}", params).fetchall()
+        plans.append("; ".join(row["detail"] for row in rows))
+    assert plans, "no SELECT or UPDATE statement was recorded"
+    return plans
+
+
+def _content_type(name: str) -> int:
+    return ContentType[name].value
+
+
+PLAN_CASES = [
+    ("get_content", lambda r: r.get_content("1"), "sqlite_autoindex_content_items_1"),
+    (
+        "list_content",
+        lambda r: r.list_content(_content_type("DASHBOARD"), limit=10),
+        "idx_content_type",
+    ),
+    (
+        "get_content_ids",
+        lambda r: r.get_content_ids(_content_type("DASHBOARD")),
+        "idx_content_type",
+    ),
+    (
+        "iter_content_data",
+        lambda r: r.iter_content_data(_content_type("DASHBOARD")),
+        "idx_content_type",
+    ),
+    (
+        "get_content_ids_in_folders",
+        lambda r: r.get_content_ids_in_folders(_content_type("DASHBOARD"), FOLDERS),
+        "idx_folder_id",
+    ),
+    (
+        "list_content_in_folders",
+        lambda r: r.list_content_in_folders(_content_type("LOOK"), FOLDERS),
+        "idx_folder_id",
+    ),
+    (
+        "get_content_index_in_folders",
+        lambda r: r.get_content_index(_content_type("DASHBOARD"), FOLDERS),
+        "idx_folder_id",
+    ),
+    (
+        "reconcile_deleted_content_in_folders",
+        lambda r: r.reconcile_deleted_content(_content_type("DASHBOARD"), ["1"], FOLDERS),
+        "idx_folder_id",
+    ),
+    (
+        "get_deleted_items_before",
+        lambda r: r.get_deleted_items_before(datetime.now(UTC)),
+        "idx_deleted_at",
+    ),
+    (
+        "get_last_sync_timestamp",
+        lambda r: r.get_last_sync_timestamp(_content_type("DASHBOARD")),
+        "idx_content_type",
+    ),
+    (
+        "get_latest_checkpoint",
+        lambda r: r.get_latest_checkpoint(_content_type("DASHBOARD")),
+        "idx_checkpoint_type_completed",
+    ),
+    (
+        "get_destination_id",
+        lambda r: r.get_destination_id(SOURCE, _content_type("DASHBOARD"), "1"),
+        "sqlite_autoindex_id_mappings_1",
+    ),
+    (
+        "batch_get_mappings",
+        lambda r: r.batch_get_mappings(SOURCE, _content_type("DASHBOARD"), ["1", "2"]),
+        "sqlite_autoindex_id_mappings_1",
+    ),
+    (
+        "get_remaining_content_ids_in_folders",
+        lambda r: r.get_remaining_content_ids("session", _content_type("DASHBOARD"), FOLDERS),
+        "idx_folder_id",
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    ("call", "index"),
+    [case[1:] for case in PLAN_CASES],
+    ids=[case[0] for case in PLAN_CASES],
+)
+def test_hot_path_uses_index(repo, call, index):
+    """Each hot-path query is served by its intended index."""
+    plans = query_plans(repo, lambda: call(repo))
+
+    assert any(index in plan for plan in plans), plans
+    for plan in plans:
+        for step in plan.split("; "):
+            assert not (step.startswith("SCAN") and "USING" not in step), plan
+
+
+def test_include_deleted_folder_query_is_not_forced_onto_partial_index(repo):
+    """Including deleted items must not rely on the active-only folder index."""
+    plans = query_plans(
+        repo,
+        lambda: repo.get_content_ids_in_folders(
+            _content_type("DASHBOARD"), FOLDERS, include_deleted=True
+        ),
+    )
+
+    assert all("idx_folder_id" not in plan for plan in plans)
@@ -0,0 +1,108 @@
+"""Unit tests for whole-run CPU profiling."""
+
+import pstats
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime
+
+from typer.testing import CliRunner
+
+from lookervault.cli.main import app
+from lookervault.storage.models import ContentItem, ContentType
+from lookervault.storage.repository import SQLiteContentRepository
+from lookervault.storage.serializer import MsgpackSerializer
+from lookervault.utils.profiling import RunProfiler
+
+
+def busy_work(seconds: float) -> int:
+    """Spin the CPU for roughly the given time."""
+    deadline = datetime.now().timestamp() + seconds
+    total = 0
+    while datetime.now().timestamp() < deadline:
+        total += sum(range(100))
+    return total
+
+
+class TestRunProfiler:
+    """Tests for RunProfiler sampling and output."""
+
+    def test_worker_threads_are_merged(self):
+        """Pool workers are sampled and share one root in the collapsed stacks."""
+        with RunProfiler(interval=0.002) as profiler:
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                list(executor.map(busy_work, [0.3] * 3))
+
+        collapsed = profiler.collapsed_stacks()
+        worker_stacks = [stack for stack in collapsed if "busy_work" in stack]
+        assert worker_stacks
+        assert all(stack.startswith("ThreadPoolExecutor;") for stack in worker_stacks)
+        assert any("busy_work" in line for line in profiler.top_functions())
+
+    def test_idle_threads_are_not_sampled(self):
+        """Threads blocked waiting for work contribute no samples."""
+        release = threading.Event()
+        waiter = threading.Thread(target=release.wait, name="idle-waiter")
+        waiter.start()
+        try:
+            with RunProfiler(interval=0.002) as profiler:
+                busy_work(0.1)
+        finally:
+            release.set()
+            waiter.join()
+
+        assert not any(stack.startswith("idle-waiter") for stack in profiler.collapsed_stacks())
+
+    def test_outputs_written_next_to_database(self, tmp_path):
+        """pstats and collapsed files land beside the database and load cleanly."""
+        with RunProfiler(interval=0.002) as profiler:
+            thread = threading.Thread(target=busy_work, args=(0.2,))
+            thread.start()
+            thread.join()
+
+        pstats_path, collapsed_path = profiler.write_next_to(tmp_path / "looker.db", "extract")
+
+        assert pstats_path.parent == tmp_path
+        assert pstats_path.name.startswith("looker.extract-")
+        assert pstats_path.suffix == ".pstats"
+        assert collapsed_path.suffix == ".collapsed"
+        functions = {name for _, _, name in pstats.Stats(str(pstats_path)).stats}
+        assert "busy_work" in functions
+        for line in collapsed_path.read_text().splitlines():
+            stack, count = line.rsplit(" ", 1)
+            assert int(count) > 0
+            assert ";" in stack
+
+
+def test_unpack_profile_flag(tmp_path):
+    """`unpack --profile` writes the profile next to the database."""
+    db_path = tmp_path / "looker.db"
+    repository = SQLiteContentRepository(db_path=db_path)
+    try:
+        repository.save_content(
+            ContentItem(
+                id="1",
+                content_type=ContentType.DASHBOARD.value,
+                name="Sales",
+                created_at=datetime.now(UTC),
+                updated_at=datetime.now(UTC),
+                content_data=MsgpackSerializer().serialize({"id": "1", "title": "Sales"}),
+            )
+        )
+    finally:
+        repository.close()
+
+    result = CliRunner().invoke(
+        app,
+        [
+            "unpack",
+            "--db-path",
+            str(db_path),
+            "--output-dir",
+            str(tmp_path / "export"),
+            "--profile",
+        ],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert len(list(tmp_path.glob("looker.unpack-*.pstats"))) == 1
+    assert len(list(tmp_path.glob("looker.unpack-*.collapsed"))) == 1
@@ -0,0 +1,136 @@
+"""Unit tests for opt-in span tracing."""
+
+import json
+import threading
+from datetime import UTC, datetime
+
+import pytest
+
+from lookervault.storage.models import ContentItem, ContentType
+from lookervault.storage.repository import SQLiteContentRepository
+from lookervault.utils.tracing import (
+    Tracer,
+    active_tracer,
+    span,
+    start_tracing,
+    stop_tracing,
+    traced,
+)
+
+
+@pytest.fixture
+def tracer():
+    """Active tracer, stopped after the test."""
+    tracer = start_tracing()
+    yield tracer
+    stop_tracing()
+
+
+class TestTracer:
+    """Tests for Tracer recording and export."""
+
+    def test_span_records_name_category_and_args(self, tracer):
+        """A span records its details and a non-negative duration."""
+        with span("fetch_page", "extraction", offset=100):
+            pass
+
+        (recorded,) = tracer.spans()
+        assert recorded["name"] == "fetch_page"
+        assert recorded["category"] == "extraction"
+        assert recorded["args"] == {"offset": 100}
+        assert recorded["thread"] == threading.current_thread().name
+        assert recorded["duration_us"] >= 0
+
+    def test_span_marks_errors(self, tracer):
+        """An exception leaving a span is recorded and re-raised."""
+        with pytest.raises(ValueError), span("update", "api"):
+            raise ValueError("boom")
+
+        assert tracer.spans()[0]["args"] == {"error": "ValueError"}
+
+    def test_ring_buffer_drops_oldest(self):
+        """Only the newest capacity spans are kept."""
+        tracer = Tracer(capacity=3)
+        for i in range(5):
+            with tracer.span("step", index=i):
+                pass
+
+        assert len(tracer) == 3
+        assert tracer.recorded == 5
+        assert tracer.dropped == 2
+        assert [s["args"]["index"] for s in tracer.spans()] == [2, 3, 4]
+
+    def test_chrome_trace_has_one_track_per_thread(self, tmp_path):
+        """Chrome trace export names each thread and emits complete events."""
+        tracer = Tracer()
+
+        def work():
+            with tracer.span("save_content", "storage"):
+                pass
+
+        threads = [threading.Thread(target=work, name=f"worker-{i}") for i in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        document = json.loads(tracer.write(tmp_path / "run.trace.json").read_text())
+        events = document["traceEvents"]
+        thread_names = {e["args"]["name"] for e in events if e["ph"] == "M"}
+        complete = [e for e in events if e["ph"] == "X"]
+        assert thread_names == {"worker-0", "worker-1"}
+        assert len(complete) == 2
+        assert len({e["tid"] for e in complete}) == 2
+        assert document["otherData"] == {"recorded": 2, "dropped": 0}
+
+    def test_jsonl_export(self, tmp_path):
+        """A .jsonl path gets one span per line."""
+        tracer = Tracer()
+        for name in ("a", "b"):
+            with tracer.span(name):
+                pass
+
+        lines = tracer.write(tmp_path / "run.jsonl").read_text().splitlines()
+
+        assert [json.loads(line)["name"] for line in lines] == ["a", "b"]
+
+
+class TestModuleTracing:
+    """Tests for the process-wide span() and traced() helpers."""
+
+    def test_span_is_noop_when_off(self):
+        """Nothing is recorded while tracing is off."""
+        assert active_tracer() is None
+        with span("ignored"):
+            pass
+        assert active_tracer() is None
+
+    def test_traced_records_selected_arguments(self, tracer):
+        """The decorator attaches the named arguments to the span."""
+
+        @traced("restore_single", "restoration", "content_id")
+        def restore(content_id, payload=None):
+            return content_id
+
+        assert restore("42", payload={"large": True}) == "42"
+        assert tracer.spans()[0]["args"] == {"content_id": "42"}
+
+    def test_save_content_is_traced(self, tracer, tmp_path):
+        """Repository writes show up with their lock acquisition."""
+        repository = SQLiteContentRepository(db_path=tmp_path / "trace.db")
+        try:
+            repository.save_content(
+                ContentItem(
+                    id="1",
+                    content_type=ContentType.DASHBOARD.value,
+                    name="Sales",
+                    created_at=datetime.now(UTC),
+                    updated_at=datetime.now(UTC),
+                    content_data=b"data",
+                )
+            )
+        finally:
+            repository.close()
+
+        names = [s["name"] for s in tracer.spans()]
+        assert names == ["begin_immediate", "save_content"]